@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ANN Index Recall Benchmark
+
+Measures ANNVectorDB recall@k against brute-force search, query latency and
+build time across recall/latency settings (HNSW ef_search, IVF-PQ nprobe).
+
+Vectors are read from a .npy file (e.g. embeddings of all GEO series
+summaries) or generated as a clustered synthetic corpus of the same shape.
+
+Usage:
+    python benchmark_ann.py
+    python benchmark_ann.py --vectors geo_embeddings.npy --queries 500 --k 10
+    python benchmark_ann.py --count 200000 --dimension 384 --index ivfpq
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from omics_oracle_v2.lib.vector_db.ann_index import ANNConfig, ANNVectorDB
+
+EF_SEARCH_SWEEP = [16, 32, 64, 128, 256]
+NPROBE_SWEEP = [1, 4, 16, 64]
+
+
+def synthetic_corpus(count: int, dimension: int, clusters: int = 200, seed: int = 7) -> np.ndarray:
+    """Unit-norm vectors around topic centroids (embeddings are clustered, not uniform)."""
+    rng = np.random.default_rng(seed)
+    centroids = rng.normal(size=(clusters, dimension))
+    vectors = centroids[rng.integers(clusters, size=count)] + 0.6 * rng.normal(size=(count, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def benchmark(db: ANNVectorDB, queries: np.ndarray, k: int) -> dict:
+    """Recall and per-query latency at the current search parameters."""
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        db.search(query, k=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return {
+        "recall": db.evaluate_recall(queries, k=k),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ANN index recall vs brute force")
+    parser.add_argument("--vectors", type=Path, help=".npy file of corpus vectors")
+    parser.add_argument("--count", type=int, default=50000, help="Synthetic corpus size")
+    parser.add_argument("--dimension", type=int, default=384, help="Synthetic vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Number of held-out queries")
+    parser.add_argument("--k", type=int, default=10, help="Neighbors per query")
+    parser.add_argument("--index", choices=["hnsw", "ivfpq", "both"], default="both")
+    args = parser.parse_args()
+
+    corpus = np.load(args.vectors).astype(np.float32) if args.vectors else synthetic_corpus(
+        args.count + args.queries, args.dimension
+    )
+    corpus, queries = corpus[: -args.queries], corpus[-args.queries :]
+    ids = [f"GSE{100000 + i}" for i in range(len(corpus))]
+    dimension = corpus.shape[1]
+    print(f"Corpus: {len(corpus)} x {dimension}, {len(queries)} queries, k={args.k}")
+
+    # Brute-force baseline
+    flat = ANNVectorDB(dimension, ANNConfig(index_type="flat"))
+    flat.add_vectors(corpus, ids)
+    baseline = benchmark(flat, queries, args.k)
+    print(f"\n{'flat (exact)':<22} recall=1.000  p50={baseline['p50_ms']:.2f}ms  p95={baseline['p95_ms']:.2f}ms")
+
+    configs = []
+    if args.index in ("hnsw", "both"):
+        configs.append((ANNConfig(index_type="hnsw"), "ef_search", EF_SEARCH_SWEEP))
+    if args.index in ("ivfpq", "both"):
+        nlist = max(16, int(4 * np.sqrt(len(corpus))))
+        pq_m = next(m for m in (48, 32, 24, 16, 12, 8, 4, 2, 1) if dimension % m == 0)
+        configs.append(
+            (ANNConfig(index_type="ivfpq", ivf_nlist=nlist, pq_m=pq_m, train_size=len(corpus)), "nprobe", NPROBE_SWEEP)
+        )
+
+    for config, knob, values in configs:
+        db = ANNVectorDB(dimension, config)
+        start = time.perf_counter()
+        db.add_vectors(corpus, ids)
+        build_s = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as path:
+            db.save(path)
+            size_mb = (ANNVectorDB.current_snapshot(path) / "index.faiss").stat().st_size / 1e6
+            db = ANNVectorDB.open(path)  # benchmark the memory-mapped reader
+
+            print(f"\n{config.index_type}: build {build_s:.1f}s, index {size_mb:.1f} MB")
+            for value in values:
+                db.set_search_params(**{"ef_search" if knob == "ef_search" else "nprobe": value})
+                result = benchmark(db, queries, args.k)
+                speedup = baseline["p50_ms"] / result["p50_ms"] if result["p50_ms"] else float("inf")
+                print(
+                    f"  {knob}={value:<12} recall={result['recall']:.3f}  "
+                    f"p50={result['p50_ms']:.2f}ms  p95={result['p95_ms']:.2f}ms  ({speedup:.1f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ This module provides services for converting text into vector embeddings
 that can be used for semantic similarity search.
 """
 
+from omics_oracle_v2.lib.embeddings.cache import EmbeddingCache
 from omics_oracle_v2.lib.embeddings.service import EmbeddingService
 
-__all__ = ["EmbeddingService"]
+__all__ = ["EmbeddingService", "EmbeddingCache"]
@@ -0,0 +1,103 @@
+"""
+Embedding cache keyed by text hash.
+
+Stores float32 vectors in a single SQLite file instead of one JSON file per
+text, so re-indexing all GEO summaries only embeds texts that changed.
+
+Usage:
+    >>> cache = EmbeddingCache("data/embeddings/cache/embeddings.sqlite")
+    >>> cache.put_many("text-embedding-3-small", {"ATAC-seq": vector})
+    >>> cache.get_many("text-embedding-3-small", ["ATAC-seq", "RNA-seq"])
+    {'ATAC-seq': [...]}
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+# SQLite limits host parameters per statement
+_LOOKUP_BATCH = 500
+
+
+def text_hash(model: str, text: str) -> str:
+    """Cache key: SHA-256 of model and text (vectors differ per model)."""
+    return hashlib.sha256(f"{model}:{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache.
+
+    Example:
+        >>> cache = EmbeddingCache("embeddings.sqlite")
+        >>> cache.put("model", "text", [0.1, 0.2])
+        >>> cache.get("model", "text")
+        [0.1, 0.2]
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Open (or create) the cache file.
+
+        Args:
+            path: SQLite database path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            " key TEXT PRIMARY KEY, model TEXT NOT NULL, dimension INTEGER NOT NULL, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, model: str, text: str) -> Optional[List[float]]:
+        """Get the cached embedding for one text."""
+        return self.get_many(model, [text]).get(text)
+
+    def get_many(self, model: str, texts: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up many texts at once.
+
+        Returns:
+            Mapping of text -> embedding for the texts that are cached
+        """
+        keys = {text_hash(model, text): text for text in texts}
+        found = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), _LOOKUP_BATCH):
+            batch = key_list[i : i + _LOOKUP_BATCH]
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})", batch
+            ).fetchall()
+            for key, blob in rows:
+                found[keys[key]] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def put(self, model: str, text: str, embedding: List[float]) -> None:
+        """Cache the embedding for one text."""
+        self.put_many(model, {text: embedding})
+
+    def put_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        """Cache many embeddings in one transaction."""
+        rows = []
+        for text, embedding in embeddings.items():
+            vector = np.asarray(embedding, dtype=np.float32)
+            rows.append((text_hash(model, text), model, len(vector), vector.tobytes()))
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        with self._conn:
+            self._conn.execute("DELETE FROM embeddings")
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,11 +1,9 @@
 """
 Embedding service for generating text embeddings.
 
-Supports OpenAI embeddings with file-based caching for performance.
+Supports OpenAI embeddings with a text-hash keyed cache for performance.
 """
 
-import hashlib
-import json
 import logging
 from pathlib import Path
 from typing import List, Optional
@@ -13,6 +11,8 @@ from typing import List, Optional
 from openai import OpenAI
 from pydantic import BaseModel, Field
 
+from omics_oracle_v2.lib.embeddings.cache import EmbeddingCache, text_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +42,7 @@ class EmbeddingService:
 
     Features:
     - OpenAI text-embedding-3-small/large support
-    - File-based caching for performance
+    - SQLite cache keyed by text hash (one lookup per batch)
     - Batch processing
     - Automatic retry logic
 
@@ -65,13 +65,14 @@ class EmbeddingService:
         # Initialize OpenAI client
         self.client = OpenAI(api_key=self.config.api_key)
 
-        # Setup cache directory
+        # Setup cache
         if self.config.cache_enabled:
             self.cache_dir = Path(self.config.cache_dir)
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Embedding cache enabled at {self.cache_dir}")
+            self.cache = EmbeddingCache(self.cache_dir / "embeddings.sqlite")
+            logger.info(f"Embedding cache enabled at {self.cache.path}")
         else:
             self.cache_dir = None
+            self.cache = None
             logger.info("Embedding cache disabled")
 
     def embed_text(self, text: str) -> List[float]:
@@ -145,7 +146,8 @@ class EmbeddingService:
         for i in range(0, len(texts), self.config.batch_size):
             batch = texts[i : i + self.config.batch_size]
 
-            # Check cache for each text
+            # Check cache for the whole batch in one lookup
+            cached_batch = self.cache.get_many(self.config.model, batch) if self.cache else {}
             batch_embeddings = []
             texts_to_embed = []
             cache_indices = []
@@ -155,11 +157,9 @@ class EmbeddingService:
                     batch_embeddings.append([0.0] * self.config.dimension)
                     continue
 
-                if self.config.cache_enabled:
-                    cached = self._get_from_cache(text)
-                    if cached is not None:
-                        batch_embeddings.append(cached)
-                        continue
+                if text in cached_batch:
+                    batch_embeddings.append(cached_batch[text])
+                    continue
 
                 # Need to embed this text
                 texts_to_embed.append(text)
@@ -176,14 +176,16 @@ class EmbeddingService:
                     )
 
                     # Insert embeddings at correct positions
+                    generated = {}
                     for idx, embedding_data in enumerate(response.data):
                         embedding = embedding_data.embedding
                         position = cache_indices[idx]
                         batch_embeddings[position] = embedding
+                        generated[texts_to_embed[idx]] = embedding
 
-                        # Cache the result
-                        if self.config.cache_enabled:
-                            self._save_to_cache(texts_to_embed[idx], embedding)
+                    # Cache the results
+                    if self.cache:
+                        self.cache.put_many(self.config.model, generated)
 
                     logger.info(f"Generated {len(texts_to_embed)} embeddings in batch")
 
@@ -209,14 +211,11 @@ class EmbeddingService:
 
     def clear_cache(self) -> None:
         """Clear all cached embeddings."""
-        if not self.config.cache_enabled or not self.cache_dir:
+        if not self.cache:
             logger.warning("Cache not enabled, nothing to clear")
             return
 
-        import shutil
-
-        shutil.rmtree(self.cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache.clear()
         logger.info("Embedding cache cleared")
 
     def _get_cache_key(self, text: str) -> str:
@@ -229,9 +228,7 @@ class EmbeddingService:
         Returns:
             Hash-based cache key
         """
-        # Use model + text hash as key
-        content = f"{self.config.model}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return text_hash(self.config.model, text)
 
     def _get_from_cache(self, text: str) -> Optional[List[float]]:
         """
@@ -243,22 +240,14 @@ class EmbeddingService:
         Returns:
             Cached embedding or None if not found
         """
-        if not self.cache_dir:
+        if not self.cache:
             return None
 
-        cache_key = self._get_cache_key(text)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r") as f:
-                    data = json.load(f)
-                    return data["embedding"]
-            except Exception as e:
-                logger.warning(f"Failed to read cache file {cache_file}: {e}")
-                return None
-
-        return None
+        try:
+            return self.cache.get(self.config.model, text)
+        except Exception as e:
+            logger.warning(f"Failed to read embedding cache: {e}")
+            return None
 
     def _save_to_cache(self, text: str, embedding: List[float]) -> None:
         """
@@ -268,14 +257,10 @@ class EmbeddingService:
             text: Input text
             embedding: Generated embedding
         """
-        if not self.cache_dir:
+        if not self.cache:
             return
 
-        cache_key = self._get_cache_key(text)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
         try:
-            with open(cache_file, "w") as f:
-                json.dump({"text": text[:100], "embedding": embedding}, f)
+            self.cache.put(self.config.model, text, embedding)
         except Exception as e:
-            logger.warning(f"Failed to write cache file {cache_file}: {e}")
+            logger.warning(f"Failed to write embedding cache: {e}")
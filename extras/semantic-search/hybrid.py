@@ -4,7 +4,10 @@ Hybrid search engine combining keyword and semantic search.
 Implements result fusion with configurable ranking weights.
 """
 
+import os
+import pickle
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 import numpy as np
@@ -106,6 +109,7 @@ class HybridSearchEngine:
 
         # Keyword search state
         self._keyword_index: Dict[str, Dict[str, float]] = {}  # term -> {id: score}
+        self._doc_terms: Dict[str, List[str]] = {}  # id -> indexed terms (for removal)
         self._document_ids: Set[str] = set()
 
     def index_documents(
@@ -186,6 +190,26 @@ class HybridSearchEngine:
                 if term not in self._keyword_index:
                     self._keyword_index[term] = {}
                 self._keyword_index[term][doc_id] = score
+            self._doc_terms[doc_id] = list(term_counts)
+
+    def remove_documents(self, ids: List[str]) -> int:
+        """
+        Remove documents (e.g. withdrawn GEO series) from both indexes.
+
+        Args:
+            ids: Document IDs to remove
+
+        Returns:
+            Number of documents removed
+        """
+        for doc_id in ids:
+            for term in self._doc_terms.pop(doc_id, []):
+                postings = self._keyword_index.get(term, {})
+                postings.pop(doc_id, None)
+                if not postings:
+                    self._keyword_index.pop(term, None)
+        self._document_ids.difference_update(ids)
+        return self.vector_db.remove(ids)
 
     def search(self, query: str) -> List[SearchResult]:
         """
@@ -372,9 +396,45 @@ class HybridSearchEngine:
     def clear(self) -> None:
         """Clear all indexed data."""
         self._keyword_index.clear()
+        self._doc_terms.clear()
         self._document_ids.clear()
         self.vector_db.clear()
 
+    def save(self, path: str) -> None:
+        """
+        Persist both indexes so a restart does not re-embed every document.
+
+        Args:
+            path: Directory for the vector index and keyword index
+        """
+        self.vector_db.save(path)
+
+        keyword_file = Path(path) / "keyword_index.pkl"
+        tmp_file = keyword_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(
+                {"index": self._keyword_index, "doc_terms": self._doc_terms, "ids": self._document_ids}, f
+            )
+        os.replace(tmp_file, keyword_file)
+
+    def load(self, path: str) -> None:
+        """
+        Load indexes written by save().
+
+        Args:
+            path: Directory passed to save()
+
+        Raises:
+            FileNotFoundError: If index files don't exist
+        """
+        self.vector_db.load(path)
+
+        with open(Path(path) / "keyword_index.pkl", "rb") as f:
+            state = pickle.load(f)
+        self._keyword_index = state["index"]
+        self._doc_terms = state["doc_terms"]
+        self._document_ids = state["ids"]
+
     def size(self) -> int:
         """Get number of indexed documents."""
         return len(self._document_ids)
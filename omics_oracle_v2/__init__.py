@@ -21,8 +21,16 @@ Version: 2.0.0
 Status: Development (Phase 1: Algorithm Extraction)
 """
 
+import os as _os
+
 __version__ = "2.0.0-alpha"
 __author__ = "OmicsOracle Team"
 
 # Public API exports will be added as modules are implemented
 __all__ = []
+
+# Offline benchmarks/tests: OMICS_HTTP_REPLAY_MODE=record|replay|auto patches aiohttp and requests
+if _os.getenv("OMICS_HTTP_REPLAY_MODE", "off").lower() != "off":
+    from omics_oracle_v2.lib.utils.http_replay import install_from_settings
+
+    install_from_settings()
@@ -3,19 +3,49 @@ Batch job management for OmicsOracle API.
 
 Manages background processing of multiple workflows with job tracking,
 status monitoring, and result retrieval.
+
+Jobs are persisted in a JobStore (SQLite by default, Redis optional), so a
+deploy or crash does not lose them:
+- submit_job() stores a job with one work item per workflow
+- Counters, workflow results and the final status are recomputed from the
+  stored items in one atomic store update, so several worker processes can
+  work on the same job
+- A bounded pool of workers claims items by lease, runs them through the
+  configured executor, and checkpoints each workflow result as it finishes
+- Failed workflows are retried with backoff; each keeps a stable
+  idempotency key across retries. Every claim counts as an attempt, so a
+  workflow that keeps killing its worker is eventually failed
+- recover() reloads unfinished jobs on startup; workers then resume them
+  from the last completed workflow
+
+Usage:
+    batch_manager.configure(executor=run_search_workflow, max_concurrency=4)
+    await batch_manager.recover()
+    batch_manager.start_workers()
+    job_id = await batch_manager.submit_job([{"query": "..."}], idempotency_key="req-123")
 """
 
 import asyncio
 import logging
+import os
+import socket
+import time
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from omics_oracle_v2.api.batch_store import (DEFAULT_DB_PATH, ITEM_COMPLETED,
+                                             ITEM_FAILED, ITEM_PENDING, JobStore,
+                                             SQLiteJobStore, WorkItem)
+
 logger = logging.getLogger(__name__)
 
+# executor(workflow_spec, idempotency_key) -> result dict
+WorkflowExecutor = Callable[[Dict[str, Any], str], Awaitable[Optional[Dict[str, Any]]]]
+
 
 class JobStatus(str, Enum):
     """Status of a batch job."""
@@ -52,25 +82,163 @@ class BatchJob(BaseModel):
     workflows: List[WorkflowResult] = []
     metadata: Dict[str, Any] = {}
 
+    def apply_items(
+        self, items: List[WorkItem], now: float, status: Optional[str] = None, error: Optional[str] = None
+    ) -> None:
+        """
+        Derive counters, workflow results and status from the job's stored items.
+
+        Called by JobStore.sync_job inside its atomic update. A finished job
+        (completed, failed, cancelled) keeps its status; otherwise the requested
+        status is applied - "completed" finishes the job now - and a job whose
+        workflows have all finished is completed (failed if none succeeded).
+
+        Args:
+            items: The job's work items
+            now: Current time (epoch seconds)
+            status: Requested transition (running, cancelled, failed, completed)
+            error: Error recorded in the metadata
+        """
+        self.workflows = [
+            WorkflowResult(
+                workflow_id=item.workflow_id,
+                status=JobStatus(item.status),
+                started_at=datetime.fromtimestamp(item.started_at) if item.started_at else None,
+                completed_at=datetime.fromtimestamp(item.completed_at) if item.completed_at else None,
+                result=item.result,
+                error=item.error,
+            )
+            for item in items
+            if item.status in (ITEM_COMPLETED, ITEM_FAILED)
+        ]
+        self.completed_workflows = sum(1 for wf in self.workflows if wf.status == JobStatus.COMPLETED)
+        self.failed_workflows = len(self.workflows) - self.completed_workflows
+
+        if self.status not in (JobStatus.PENDING, JobStatus.RUNNING):
+            return
+        if error:
+            self.metadata["error"] = error
+        if status is not None:
+            self.status = JobStatus(status)
+        elif self.status == JobStatus.PENDING and any(item.status != ITEM_PENDING for item in items):
+            self.status = JobStatus.RUNNING
+
+        finished = self.completed_workflows + self.failed_workflows >= self.total_workflows
+        active = self.status in (JobStatus.PENDING, JobStatus.RUNNING)
+        if self.status == JobStatus.COMPLETED or (finished and active):
+            # Mixed results count as completed; only an all-failed job fails
+            all_failed = self.completed_workflows == 0 and self.failed_workflows > 0
+            self.status = JobStatus.FAILED if all_failed else JobStatus.COMPLETED
+
+        if self.status == JobStatus.RUNNING and self.started_at is None:
+            self.started_at = datetime.fromtimestamp(now)
+        if self.status not in (JobStatus.PENDING, JobStatus.RUNNING):
+            self.completed_at = datetime.fromtimestamp(now)
+
 
 class BatchJobManager:
     """
     Manages batch jobs for asynchronous workflow processing.
 
-    Stores job state in memory and provides methods for job submission,
-    status tracking, and result retrieval.
+    Job state is written through to a JobStore; self.jobs holds active and
+    recently used jobs in memory. Workflows submitted with submit_job() are
+    run by a bounded worker pool.
     """
 
-    def __init__(self):
-        """Initialize the batch job manager."""
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        executor: Optional[WorkflowExecutor] = None,
+        max_concurrency: int = 4,
+        max_attempts: int = 3,
+        lease_seconds: float = 60.0,
+        retry_backoff: float = 5.0,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize the batch job manager.
+
+        Args:
+            store: Job store (default: SQLite at DEFAULT_DB_PATH, opened on first use)
+            executor: Coroutine that runs one workflow spec (required for workers)
+            max_concurrency: Number of workers (workflows running at once)
+            max_attempts: Attempts per workflow before it is marked failed
+            lease_seconds: Work item lease; renewed while a workflow runs
+            retry_backoff: Base retry delay in seconds (doubles per attempt)
+            poll_interval: Idle worker poll interval in seconds
+        """
         self.jobs: Dict[str, BatchJob] = {}
         self.running_tasks: Dict[str, asyncio.Task] = {}
+
+        self._store = store
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.retry_backoff = retry_backoff
+        self.poll_interval = poll_interval
+
+        self._owner_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._workers: List[asyncio.Task] = []
+        self._work_available: Optional[asyncio.Event] = None
+        self._item_tasks: Dict[str, Dict[str, asyncio.Task]] = {}  # job_id -> item_id -> task
         logger.info("BatchJobManager initialized")
 
+    @property
+    def store(self) -> JobStore:
+        """Job store (the default SQLite store is opened on first use)."""
+        if self._store is None:
+            self._store = SQLiteJobStore(DEFAULT_DB_PATH)
+        return self._store
+
+    def configure(
+        self,
+        store: Optional[JobStore] = None,
+        executor: Optional[WorkflowExecutor] = None,
+        max_concurrency: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        """Replace the store, executor, or pool settings (call before start_workers)."""
+        if store is not None:
+            self._store = store
+        if executor is not None:
+            self.executor = executor
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        if max_attempts is not None:
+            self.max_attempts = max_attempts
+        if lease_seconds is not None:
+            self.lease_seconds = lease_seconds
+
+    async def _persist(self, job: BatchJob) -> None:
+        try:
+            await asyncio.to_thread(self.store.save_job, job)
+        except Exception as e:
+            logger.error(f"[X] Failed to persist batch job {job.job_id}: {e}")
+
+    async def _sync(
+        self, job_id: str, status: Optional[JobStatus] = None, error: Optional[str] = None
+    ) -> Optional[BatchJob]:
+        """Recompute a job from its stored items (atomically, in the store) and cache it."""
+        try:
+            job = await asyncio.to_thread(
+                self.store.sync_job, job_id, time.time(), status.value if status else None, error
+            )
+        except Exception as e:
+            logger.error(f"[X] Failed to update batch job {job_id}: {e}")
+            return self.jobs.get(job_id)
+        if job is not None:
+            self.jobs[job_id] = job
+        return job
+
     async def create_job(self, workflow_count: int, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Create a new batch job.
 
+        The caller runs the workflows and reports them with add_workflow_result();
+        use submit_job() to have the worker pool run them instead.
+
         Args:
             workflow_count: Number of workflows in the batch
             metadata: Optional metadata for the job
@@ -89,9 +257,61 @@ class BatchJobManager:
             metadata=metadata or {},
         )
         self.jobs[job_id] = job
+        await self._persist(job)
         logger.info(f"Created batch job {job_id} with {workflow_count} workflows")
         return job_id
 
+    async def submit_job(
+        self,
+        workflows: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> str:
+        """
+        Create a batch job whose workflows are run by the worker pool.
+
+        Args:
+            workflows: Workflow specs passed to the executor (an optional
+                "workflow_id" key names the workflow in results)
+            metadata: Optional metadata for the job
+            idempotency_key: Resubmitting with the same key returns the original job
+
+        Returns:
+            Job ID for tracking
+        """
+        job_id = str(uuid.uuid4())
+        job = BatchJob(
+            job_id=job_id,
+            status=JobStatus.PENDING,
+            total_workflows=len(workflows),
+            completed_workflows=0,
+            failed_workflows=0,
+            created_at=datetime.now(),
+            metadata=metadata or {},
+        )
+        key_base = idempotency_key or job_id
+        items = [
+            WorkItem(
+                item_id=f"{job_id}:{index}",
+                job_id=job_id,
+                workflow_id=str(spec.get("workflow_id") or f"{job_id}:{index}"),
+                position=index,
+                spec=spec,
+                idempotency_key=f"{key_base}:{index}",
+            )
+            for index, spec in enumerate(workflows)
+        ]
+
+        stored_id = await asyncio.to_thread(self.store.create_job_with_items, job, items, idempotency_key)
+        if stored_id != job_id:
+            logger.info(f"Batch job for idempotency key {idempotency_key} already exists: {stored_id}")
+            return stored_id
+
+        self.jobs[job_id] = job
+        self._notify_workers()
+        logger.info(f"Submitted batch job {job_id} with {len(workflows)} workflows")
+        return job_id
+
     async def start_job(self, job_id: str) -> None:
         """
         Mark a job as started.
@@ -99,12 +319,10 @@ class BatchJobManager:
         Args:
             job_id: Job ID to start
         """
-        if job_id not in self.jobs:
+        if self.get_job(job_id) is None:
             raise ValueError(f"Job {job_id} not found")
 
-        job = self.jobs[job_id]
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.now()
+        await self._sync(job_id, JobStatus.RUNNING)
         logger.info(f"Started batch job {job_id}")
 
     async def add_workflow_result(
@@ -114,52 +332,39 @@ class BatchJobManager:
         status: JobStatus,
         result: Optional[Dict[str, Any]] = None,
         error: Optional[str] = None,
+        started_at: Optional[datetime] = None,
     ) -> None:
         """
         Add a workflow result to a batch job.
 
+        The result is stored as the workflow's work item (replacing an earlier
+        result for the same workflow); the job completes once every workflow
+        has a result.
+
         Args:
             job_id: Job ID
             workflow_id: Workflow ID
             status: Workflow execution status
             result: Optional workflow result data
             error: Optional error message if failed
+            started_at: Optional workflow start time
         """
-        if job_id not in self.jobs:
+        if self.get_job(job_id) is None:
             raise ValueError(f"Job {job_id} not found")
 
-        job = self.jobs[job_id]
-
-        # Create workflow result
-        workflow_result = WorkflowResult(
-            workflow_id=workflow_id,
-            status=status,
-            completed_at=datetime.now(),
-            result=result,
-            error=error,
+        await asyncio.to_thread(
+            self.store.record_result,
+            job_id,
+            workflow_id,
+            status.value,
+            result,
+            error,
+            started_at.timestamp() if started_at else None,
+            time.time(),
         )
-
-        # Update existing workflow or add new one
-        existing = False
-        for i, wf in enumerate(job.workflows):
-            if wf.workflow_id == workflow_id:
-                job.workflows[i] = workflow_result
-                existing = True
-                break
-
-        if not existing:
-            job.workflows.append(workflow_result)
-
-        # Update job counters
-        if status == JobStatus.COMPLETED:
-            job.completed_workflows += 1
-        elif status == JobStatus.FAILED:
-            job.failed_workflows += 1
-
-        # Check if job is complete
-        total_finished = job.completed_workflows + job.failed_workflows
-        if total_finished >= job.total_workflows:
-            await self.complete_job(job_id)
+        job = await self._sync(job_id)
+        if job is not None and job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            self.running_tasks.pop(job_id, None)
 
         logger.info(f"Added workflow {workflow_id} result to job {job_id}: {status}")
 
@@ -167,29 +372,20 @@ class BatchJobManager:
         """
         Mark a job as completed.
 
+        The final status follows the workflow results: failed if none
+        succeeded, otherwise completed (possibly with some failures).
+
         Args:
             job_id: Job ID to complete
         """
-        if job_id not in self.jobs:
+        if self.get_job(job_id) is None:
             raise ValueError(f"Job {job_id} not found")
 
-        job = self.jobs[job_id]
-
-        # Determine final status based on workflow results
-        if job.failed_workflows == 0:
-            job.status = JobStatus.COMPLETED
-        elif job.completed_workflows == 0:
-            job.status = JobStatus.FAILED
-        else:
-            # Some succeeded, some failed - mark as completed with mixed results
-            job.status = JobStatus.COMPLETED
-
-        job.completed_at = datetime.now()
-
         # Clean up running task if exists
         if job_id in self.running_tasks:
             del self.running_tasks[job_id]
 
+        job = await self._sync(job_id, JobStatus.COMPLETED)
         logger.info(
             f"Completed batch job {job_id}: " f"{job.completed_workflows}/{job.total_workflows} successful"
         )
@@ -201,19 +397,28 @@ class BatchJobManager:
         Args:
             job_id: Job ID to cancel
         """
-        if job_id not in self.jobs:
+        job = self.get_job(job_id)
+        if job is None:
             raise ValueError(f"Job {job_id} not found")
 
-        job = self.jobs[job_id]
-
         # Cancel the running task if exists
         if job_id in self.running_tasks:
             task = self.running_tasks[job_id]
             task.cancel()
             del self.running_tasks[job_id]
 
+        # Mark it first so workers drop its cancelled workflows instead of retrying them
         job.status = JobStatus.CANCELLED
-        job.completed_at = datetime.now()
+        try:
+            await asyncio.to_thread(self.store.cancel_items, job_id)
+        except Exception as e:
+            logger.error(f"[X] Failed to cancel queued workflows for job {job_id}: {e}")
+
+        # Stop this job's workflows in the pool (queued ones are never claimed)
+        for task in self._item_tasks.pop(job_id, {}).values():
+            task.cancel()
+
+        await self._sync(job_id, JobStatus.CANCELLED)
         logger.info(f"Cancelled batch job {job_id}")
 
     def get_job(self, job_id: str) -> Optional[BatchJob]:
@@ -226,7 +431,16 @@ class BatchJobManager:
         Returns:
             Batch job or None if not found
         """
-        return self.jobs.get(job_id)
+        job = self.jobs.get(job_id)
+        if job is None and self._store is not None:
+            # Not in memory (e.g., trimmed by cleanup_old_jobs): read through
+            try:
+                job = self._store.load_job(job_id)
+            except Exception as e:
+                logger.warning(f"Failed to load batch job {job_id}: {e}")
+            if job is not None:
+                self.jobs[job_id] = job
+        return job
 
     def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 100) -> List[BatchJob]:
         """
@@ -279,6 +493,8 @@ class BatchJobManager:
         """
         Clean up old completed jobs to prevent memory growth.
 
+        Finished jobs stay in the store and remain available via get_job().
+
         Args:
             max_jobs: Maximum number of jobs to keep
 
@@ -309,6 +525,211 @@ class BatchJobManager:
 
         return removed
 
+    # Worker pool ------------------------------------------------------------
+
+    def start_workers(self) -> None:
+        """Start the worker pool (requires an executor)."""
+        if self.executor is None:
+            raise ValueError("BatchJobManager has no executor configured")
+        if self._workers:
+            return
+
+        self._work_available = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(f"{self._owner_prefix}:{index}"))
+            for index in range(self.max_concurrency)
+        ]
+        logger.info(f"Started {self.max_concurrency} batch workers")
+
+    async def stop_workers(self) -> None:
+        """Stop the worker pool; in-flight workflows are released for other workers."""
+        if not self._workers:
+            return
+
+        worker_ids = [f"{self._owner_prefix}:{index}" for index in range(len(self._workers))]
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        try:
+            # An orderly shutdown does not use up the interrupted workflows' attempts
+            released = await asyncio.to_thread(self.store.release_leases, worker_ids, False)
+            if released:
+                logger.info(f"Released {released} in-flight batch workflows")
+        except Exception as e:
+            logger.warning(f"Failed to release batch leases: {e}")
+
+    def _notify_workers(self) -> None:
+        if self._work_available is not None:
+            self._work_available.set()
+
+    async def _worker_loop(self, worker_id: str) -> None:
+        while True:
+            self._work_available.clear()
+            try:
+                now = time.time()
+                item = await asyncio.to_thread(
+                    self.store.claim_item, worker_id, now + self.lease_seconds, now, self.max_attempts
+                )
+            except Exception as e:
+                logger.error(f"[X] Batch worker {worker_id} failed to claim work: {e}")
+                item = None
+
+            if item is None:
+                try:
+                    await asyncio.wait_for(self._work_available.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            if item.status == ITEM_FAILED:
+                # Out of attempts after losing its worker; the store failed it instead of leasing it
+                logger.warning(f"Workflow {item.workflow_id} failed: {item.error}")
+                await self._sync(item.job_id)
+                continue
+
+            try:
+                await self._run_item(worker_id, item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[X] Batch worker {worker_id} failed on {item.item_id}: {e}")
+
+    async def _run_item(self, worker_id: str, item: WorkItem) -> None:
+        """Run one claimed workflow and checkpoint its outcome."""
+        job = self.get_job(item.job_id)
+        if job is None or job.status == JobStatus.CANCELLED:
+            await asyncio.to_thread(self.store.cancel_items, item.job_id)
+            return
+        if job.status == JobStatus.PENDING:
+            job = await self._sync(job.job_id, JobStatus.RUNNING)
+
+        task = asyncio.create_task(self.executor(item.spec, item.idempotency_key))
+        self._item_tasks.setdefault(item.job_id, {})[item.item_id] = task
+        heartbeat = asyncio.create_task(self._renew_lease(worker_id, item.item_id))
+
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if self.get_job(item.job_id).status == JobStatus.CANCELLED:
+                return  # cancel_job() already recorded it
+            raise
+        except Exception as e:
+            # item.attempts already counts this run (claims count attempts)
+            if item.attempts < self.max_attempts:
+                retry_at = time.time() + self.retry_backoff * 2 ** (item.attempts - 1)
+                await asyncio.to_thread(self.store.fail_item, item.item_id, worker_id, str(e), time.time(), retry_at)
+                logger.warning(
+                    f"Workflow {item.workflow_id} failed (attempt {item.attempts}/{self.max_attempts}), "
+                    f"retrying: {e}"
+                )
+            elif await asyncio.to_thread(self.store.fail_item, item.item_id, worker_id, str(e), time.time()):
+                await self._sync(item.job_id)
+        else:
+            if await asyncio.to_thread(self.store.complete_item, item.item_id, worker_id, result, time.time()):
+                await self._sync(item.job_id)
+            else:
+                logger.warning(f"Lease lost for workflow {item.workflow_id}; result discarded")
+        finally:
+            heartbeat.cancel()
+            self._item_tasks.get(item.job_id, {}).pop(item.item_id, None)
+            if not self._item_tasks.get(item.job_id):
+                self._item_tasks.pop(item.job_id, None)
+
+    async def _renew_lease(self, worker_id: str, item_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(
+                    self.store.renew_lease, item_id, worker_id, time.time() + self.lease_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Failed to renew lease for {item_id}: {e}")
+
+    # Recovery -----------------------------------------------------------------
+
+    async def recover(self) -> int:
+        """
+        Reload unfinished jobs from the store (call on startup).
+
+        Work items leased by dead processes on this host are released at once;
+        others become claimable when their lease expires. Jobs created with
+        create_job() have no stored workflows to resume and are marked failed.
+
+        Returns:
+            Number of unfinished jobs loaded
+        """
+        store = self.store
+        jobs = await asyncio.to_thread(store.load_jobs, [JobStatus.PENDING.value, JobStatus.RUNNING.value])
+
+        dead_owners = [owner for owner in await asyncio.to_thread(store.lease_owners) if self._is_dead_owner(owner)]
+        released = await asyncio.to_thread(store.release_leases, dead_owners)
+
+        for job in jobs:
+            self.jobs[job.job_id] = job
+            items = await asyncio.to_thread(store.load_items, job.job_id)
+            if len(items) < job.total_workflows and job.status == JobStatus.RUNNING:
+                # A create_job() job whose caller died: its remaining workflows were never stored
+                await self._sync(
+                    job.job_id, JobStatus.FAILED, error="Interrupted by restart (workflows not resumable)"
+                )
+            else:
+                await self._sync(job.job_id)
+
+        if jobs:
+            logger.info(f"Recovered {len(jobs)} unfinished batch jobs ({released} workflows released)")
+        self._notify_workers()
+        return len(jobs)
+
+    def _is_dead_owner(self, owner: str) -> bool:
+        """True if a lease owner ("host:pid:n") is a process on this host that no longer exists."""
+        parts = owner.split(":")
+        if len(parts) < 3 or ":".join(parts[:-2]) != socket.gethostname():
+            return False
+        try:
+            pid = int(parts[-2])
+        except ValueError:
+            return False
+        if pid == os.getpid():
+            return not self._workers
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            return False
+        return False
+
+
+async def run_search_workflow(spec: Dict[str, Any], idempotency_key: str) -> Dict[str, Any]:
+    """
+    Default workflow executor: run a workflow spec as a dataset search.
+
+    Searches are read-only, so retries need no deduplication by idempotency key.
+
+    Args:
+        spec: Workflow spec ("query" or "search_terms", optional "max_results",
+            "organisms" and "filters")
+        idempotency_key: Stable key of the workflow (unused)
+
+    Returns:
+        The SearchResponse as a JSON-compatible dict
+    """
+    from omics_oracle_v2.api.models.requests import SearchRequest
+    from omics_oracle_v2.services.search_service import SearchService
+
+    filters = dict(spec.get("filters") or {})
+    if spec.get("organisms"):
+        filters.setdefault("organism", spec["organisms"][0])
+    request = SearchRequest(
+        search_terms=spec.get("search_terms") or [spec["query"]],
+        filters=filters or None,
+        max_results=spec.get("max_results", 20),
+        enable_semantic=spec.get("enable_semantic", False),
+    )
+    response = await SearchService().execute_search(request)
+    return response.model_dump(mode="json")
+
 
 # Global batch job manager instance
 batch_manager = BatchJobManager()
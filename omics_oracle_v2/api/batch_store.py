@@ -0,0 +1,892 @@
+"""
+Durable storage for batch jobs.
+
+Stores BatchJob records plus one work item per workflow, so batches survive
+restarts and can be processed by a pool of workers:
+- Work items are claimed by lease (owner + expiry); a crashed worker's items
+  become claimable again once the lease expires
+- Every claim counts as an attempt; an item that keeps losing its worker
+  (e.g. it crashes the process) is failed once it runs out of attempts
+- Completion/failure is only accepted from the current lease owner, so a
+  retried item can never be recorded twice
+- Job counters and final status are derived from the items inside the store
+  (sync_job), so several workers can finish items of one job concurrently
+- Each item carries an idempotency key that executors can use to dedupe
+  external side effects across retries
+
+Backends:
+- SQLiteJobStore (default): single file, WAL, safe across processes
+- RedisJobStore: for multi-host deployments (single Redis instance; claims
+  and completions run as Lua scripts)
+
+Usage:
+    store = create_job_store("sqlite", path="data/batch/batch_jobs.db")
+    job_id = store.create_job_with_items(job, items, idempotency_key="nightly-42")
+    item = store.claim_item("host:123:0", lease_expires=time.time() + 60, now=time.time(), max_attempts=3)
+    job = store.sync_job(job_id, now=time.time())
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from omics_oracle_v2.api.batch import BatchJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "data/batch/batch_jobs.db"
+
+# Work item states
+ITEM_PENDING = "pending"
+ITEM_RUNNING = "running"
+ITEM_COMPLETED = "completed"
+ITEM_FAILED = "failed"
+ITEM_CANCELLED = "cancelled"
+
+
+@dataclass
+class WorkItem:
+    """One workflow of a batch job, as stored in the queue."""
+
+    item_id: str
+    job_id: str
+    workflow_id: str
+    position: int
+    spec: Dict[str, Any]
+    idempotency_key: str
+    status: str = ITEM_PENDING
+    attempts: int = 0
+    lease_owner: Optional[str] = None
+    lease_expires: float = 0.0
+    available_at: float = 0.0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+
+
+class JobStore(ABC):
+    """Interface for batch job stores (synchronous; call via asyncio.to_thread)."""
+
+    @abstractmethod
+    def save_job(self, job: "BatchJob") -> None:
+        """Insert or replace a job record (creation and recovery only; see sync_job)."""
+
+    @abstractmethod
+    def load_job(self, job_id: str) -> Optional["BatchJob"]:
+        """Load one job."""
+
+    @abstractmethod
+    def load_jobs(self, statuses: Optional[Sequence[str]] = None) -> List["BatchJob"]:
+        """Load jobs, oldest first, optionally filtered by status."""
+
+    @abstractmethod
+    def delete_job(self, job_id: str) -> None:
+        """Delete a job and its items."""
+
+    @abstractmethod
+    def create_job_with_items(
+        self, job: "BatchJob", items: List[WorkItem], idempotency_key: Optional[str] = None
+    ) -> str:
+        """Insert a job and its items atomically; returns the existing job ID on key reuse."""
+
+    @abstractmethod
+    def sync_job(
+        self, job_id: str, now: float, status: Optional[str] = None, error: Optional[str] = None
+    ) -> Optional["BatchJob"]:
+        """
+        Atomically recompute a job's counters, results and status from its items.
+
+        Args:
+            job_id: Job ID
+            now: Current time (epoch seconds)
+            status: Requested transition, applied unless the job already finished
+                (see BatchJob.apply_items)
+            error: Error recorded in the job metadata
+
+        Returns:
+            The updated job, or None if it does not exist
+        """
+
+    @abstractmethod
+    def record_result(
+        self,
+        job_id: str,
+        workflow_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]],
+        error: Optional[str],
+        started_at: Optional[float],
+        now: float,
+    ) -> None:
+        """Record the outcome of a workflow run by the caller (create_job jobs)."""
+
+    @abstractmethod
+    def load_items(self, job_id: str) -> List[WorkItem]:
+        """Load a job's items in position order."""
+
+    @abstractmethod
+    def claim_item(
+        self, worker_id: str, lease_expires: float, now: float, max_attempts: Optional[int] = None
+    ) -> Optional[WorkItem]:
+        """
+        Lease the next ready item (pending, or running with an expired lease).
+
+        Each claim counts as an attempt. A ready item that has already used
+        max_attempts is not leased: it is marked failed and returned with
+        status "failed" so the caller can sync its job.
+        """
+
+    @abstractmethod
+    def renew_lease(self, item_id: str, worker_id: str, lease_expires: float) -> bool:
+        """Extend a lease held by worker_id; False if it was lost."""
+
+    @abstractmethod
+    def complete_item(self, item_id: str, worker_id: str, result: Optional[Dict[str, Any]], now: float) -> bool:
+        """Checkpoint a finished item; False if the lease was lost or the item cancelled."""
+
+    @abstractmethod
+    def fail_item(
+        self, item_id: str, worker_id: str, error: str, now: float, retry_at: Optional[float] = None
+    ) -> bool:
+        """Record a failed attempt: back to pending at retry_at, or failed if None."""
+
+    @abstractmethod
+    def cancel_items(self, job_id: str) -> int:
+        """Cancel a job's pending and running items."""
+
+    @abstractmethod
+    def lease_owners(self) -> List[str]:
+        """Owners of currently running items."""
+
+    @abstractmethod
+    def release_leases(self, owners: Sequence[str], count_attempt: bool = True) -> int:
+        """
+        Make items leased by owners claimable immediately.
+
+        Args:
+            owners: Lease owners (dead processes, or workers being stopped)
+            count_attempt: False to refund the attempt of an orderly shutdown
+        """
+
+    def close(self) -> None:
+        pass
+
+
+def _job_from_json(data: str) -> "BatchJob":
+    from omics_oracle_v2.api.batch import BatchJob
+
+    return BatchJob.model_validate_json(data)
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite job store (WAL mode; claims use BEGIN IMMEDIATE)."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS batch_jobs (
+                job_id TEXT PRIMARY KEY,
+                idempotency_key TEXT UNIQUE,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_batch_jobs_status ON batch_jobs(status);
+
+            CREATE TABLE IF NOT EXISTS batch_items (
+                item_id TEXT PRIMARY KEY,
+                job_id TEXT NOT NULL,
+                workflow_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                spec TEXT NOT NULL,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner TEXT,
+                lease_expires REAL NOT NULL DEFAULT 0,
+                available_at REAL NOT NULL DEFAULT 0,
+                result TEXT,
+                error TEXT,
+                started_at REAL,
+                completed_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_batch_items_ready ON batch_items(status, available_at);
+            CREATE INDEX IF NOT EXISTS idx_batch_items_job ON batch_items(job_id, position);
+            """
+        )
+
+    # Jobs -----------------------------------------------------------------
+
+    def save_job(self, job: "BatchJob") -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO batch_jobs (job_id, status, created_at, data) VALUES (?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET status = excluded.status, data = excluded.data
+                """,
+                (job.job_id, job.status.value, job.created_at.isoformat(), job.model_dump_json()),
+            )
+
+    def load_job(self, job_id: str) -> Optional["BatchJob"]:
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM batch_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return _job_from_json(row["data"]) if row else None
+
+    def load_jobs(self, statuses: Optional[Sequence[str]] = None) -> List["BatchJob"]:
+        query = "SELECT data FROM batch_jobs"
+        params: List[Any] = []
+        if statuses:
+            query += f" WHERE status IN ({','.join('?' * len(statuses))})"
+            params = list(statuses)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_at", params).fetchall()
+        return [_job_from_json(row["data"]) for row in rows]
+
+    def delete_job(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM batch_items WHERE job_id = ?", (job_id,))
+                self._conn.execute("DELETE FROM batch_jobs WHERE job_id = ?", (job_id,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def create_job_with_items(
+        self, job: "BatchJob", items: List[WorkItem], idempotency_key: Optional[str] = None
+    ) -> str:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if idempotency_key:
+                    row = self._conn.execute(
+                        "SELECT job_id FROM batch_jobs WHERE idempotency_key = ?", (idempotency_key,)
+                    ).fetchone()
+                    if row:
+                        self._conn.execute("ROLLBACK")
+                        return row["job_id"]
+
+                self._conn.execute(
+                    "INSERT INTO batch_jobs (job_id, idempotency_key, status, created_at, data) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        job.job_id,
+                        idempotency_key,
+                        job.status.value,
+                        job.created_at.isoformat(),
+                        job.model_dump_json(),
+                    ),
+                )
+                self._conn.executemany(
+                    """
+                    INSERT INTO batch_items
+                        (item_id, job_id, workflow_id, position, spec, idempotency_key, available_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            item.item_id,
+                            item.job_id,
+                            item.workflow_id,
+                            item.position,
+                            json.dumps(item.spec, default=str),
+                            item.idempotency_key,
+                            item.available_at,
+                        )
+                        for item in items
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return job.job_id
+
+    def sync_job(
+        self, job_id: str, now: float, status: Optional[str] = None, error: Optional[str] = None
+    ) -> Optional["BatchJob"]:
+        with self._lock:
+            # BEGIN IMMEDIATE holds the write lock across processes for the read-modify-write
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM batch_jobs WHERE job_id = ?", (job_id,)).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                job = _job_from_json(row["data"])
+                rows = self._conn.execute(
+                    "SELECT * FROM batch_items WHERE job_id = ? ORDER BY position", (job_id,)
+                ).fetchall()
+                job.apply_items([self._item_from_row(r) for r in rows], now, status, error)
+                self._conn.execute(
+                    "UPDATE batch_jobs SET status = ?, data = ? WHERE job_id = ?",
+                    (job.status.value, job.model_dump_json(), job_id),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return job
+
+    def record_result(
+        self,
+        job_id: str,
+        workflow_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]],
+        error: Optional[str],
+        started_at: Optional[float],
+        now: float,
+    ) -> None:
+        result_json = json.dumps(result, default=str) if result is not None else None
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT item_id FROM batch_items WHERE job_id = ? AND workflow_id = ?",
+                    (job_id, workflow_id),
+                ).fetchone()
+                if row:
+                    self._conn.execute(
+                        """
+                        UPDATE batch_items
+                        SET status = ?, result = ?, error = ?, started_at = COALESCE(?, started_at),
+                            completed_at = ?, lease_owner = NULL
+                        WHERE item_id = ?
+                        """,
+                        (status, result_json, error, started_at, now, row["item_id"]),
+                    )
+                else:
+                    item_id = f"{job_id}:{workflow_id}"
+                    self._conn.execute(
+                        """
+                        INSERT INTO batch_items
+                            (item_id, job_id, workflow_id, position, spec, idempotency_key,
+                             status, attempts, result, error, started_at, completed_at)
+                        VALUES (?, ?, ?,
+                                (SELECT COALESCE(MAX(position) + 1, 0) FROM batch_items WHERE job_id = ?),
+                                '{}', ?, ?, 1, ?, ?, ?, ?)
+                        """,
+                        (
+                            item_id, job_id, workflow_id, job_id, item_id,
+                            status, result_json, error, started_at, now,
+                        ),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    # Items ----------------------------------------------------------------
+
+    @staticmethod
+    def _item_from_row(row: sqlite3.Row) -> WorkItem:
+        return WorkItem(
+            item_id=row["item_id"],
+            job_id=row["job_id"],
+            workflow_id=row["workflow_id"],
+            position=row["position"],
+            spec=json.loads(row["spec"]),
+            idempotency_key=row["idempotency_key"],
+            status=row["status"],
+            attempts=row["attempts"],
+            lease_owner=row["lease_owner"],
+            lease_expires=row["lease_expires"],
+            available_at=row["available_at"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            started_at=row["started_at"],
+            completed_at=row["completed_at"],
+        )
+
+    def load_items(self, job_id: str) -> List[WorkItem]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM batch_items WHERE job_id = ? ORDER BY position", (job_id,)
+            ).fetchall()
+        return [self._item_from_row(row) for row in rows]
+
+    def claim_item(
+        self, worker_id: str, lease_expires: float, now: float, max_attempts: Optional[int] = None
+    ) -> Optional[WorkItem]:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    """
+                    SELECT item_id, attempts FROM batch_items
+                    WHERE (status = 'pending' AND available_at <= ?)
+                       OR (status = 'running' AND lease_expires < ?)
+                    ORDER BY available_at, job_id, position
+                    LIMIT 1
+                    """,
+                    (now, now),
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+
+                if max_attempts and row["attempts"] >= max_attempts:
+                    # Its worker was lost on the last allowed attempt: give up instead of leasing
+                    self._conn.execute(
+                        """
+                        UPDATE batch_items
+                        SET status = 'failed', lease_owner = NULL, completed_at = ?,
+                            error = 'Worker lost after ' || attempts || ' attempts'
+                        WHERE item_id = ?
+                        """,
+                        (now, row["item_id"]),
+                    )
+                else:
+                    self._conn.execute(
+                        """
+                        UPDATE batch_items
+                        SET status = 'running', lease_owner = ?, lease_expires = ?, attempts = attempts + 1,
+                            started_at = COALESCE(started_at, ?)
+                        WHERE item_id = ?
+                        """,
+                        (worker_id, lease_expires, now, row["item_id"]),
+                    )
+                claimed = self._conn.execute(
+                    "SELECT * FROM batch_items WHERE item_id = ?", (row["item_id"],)
+                ).fetchone()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self._item_from_row(claimed)
+
+    def _update_leased(self, item_id: str, worker_id: str, assignments: str, params: Sequence[Any]) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE batch_items SET {assignments} "
+                "WHERE item_id = ? AND lease_owner = ? AND status = 'running'",
+                (*params, item_id, worker_id),
+            )
+        return cursor.rowcount == 1
+
+    def renew_lease(self, item_id: str, worker_id: str, lease_expires: float) -> bool:
+        return self._update_leased(item_id, worker_id, "lease_expires = ?", (lease_expires,))
+
+    def complete_item(self, item_id: str, worker_id: str, result: Optional[Dict[str, Any]], now: float) -> bool:
+        return self._update_leased(
+            item_id,
+            worker_id,
+            "status = 'completed', result = ?, error = NULL, completed_at = ?, lease_owner = NULL",
+            (json.dumps(result, default=str) if result is not None else None, now),
+        )
+
+    def fail_item(
+        self, item_id: str, worker_id: str, error: str, now: float, retry_at: Optional[float] = None
+    ) -> bool:
+        if retry_at is None:
+            return self._update_leased(
+                item_id,
+                worker_id,
+                "status = 'failed', error = ?, completed_at = ?, lease_owner = NULL",
+                (error, now),
+            )
+        return self._update_leased(
+            item_id,
+            worker_id,
+            "status = 'pending', error = ?, available_at = ?, lease_owner = NULL",
+            (error, retry_at),
+        )
+
+    def cancel_items(self, job_id: str) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                UPDATE batch_items SET status = 'cancelled', lease_owner = NULL
+                WHERE job_id = ? AND status IN ('pending', 'running')
+                """,
+                (job_id,),
+            )
+        return cursor.rowcount
+
+    def lease_owners(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT lease_owner FROM batch_items WHERE status = 'running' AND lease_owner IS NOT NULL"
+            ).fetchall()
+        return [row["lease_owner"] for row in rows]
+
+    def release_leases(self, owners: Sequence[str], count_attempt: bool = True) -> int:
+        if not owners:
+            return 0
+        refund = "" if count_attempt else ", attempts = MAX(attempts - 1, 0)"
+        with self._lock:
+            cursor = self._conn.execute(
+                f"""
+                UPDATE batch_items SET status = 'pending', lease_owner = NULL, lease_expires = 0{refund}
+                WHERE status = 'running' AND lease_owner IN ({','.join('?' * len(owners))})
+                """,
+                list(owners),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# Redis backend ------------------------------------------------------------
+
+# KEYS: ready zset, leased zset
+# ARGV: now, lease_expires, worker_id, item key prefix, max_attempts (0 = no limit)
+_REDIS_CLAIM = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', '(' .. ARGV[1])
+for _, id in ipairs(expired) do
+    redis.call('ZREM', KEYS[2], id)
+    redis.call('ZADD', KEYS[1], ARGV[1], id)
+end
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+if #ids == 0 then
+    return false
+end
+local id = ids[1]
+local key = ARGV[4] .. id
+redis.call('ZREM', KEYS[1], id)
+local attempts = tonumber(redis.call('HGET', key, 'attempts') or '0')
+local max_attempts = tonumber(ARGV[5])
+if max_attempts > 0 and attempts >= max_attempts then
+    redis.call('HSET', key, 'status', 'failed', 'completed_at', ARGV[1],
+               'error', 'Worker lost after ' .. attempts .. ' attempts')
+    redis.call('HDEL', key, 'lease_owner')
+    return id
+end
+redis.call('ZADD', KEYS[2], ARGV[2], id)
+redis.call('HSET', key, 'status', 'running', 'lease_owner', ARGV[3], 'lease_expires', ARGV[2])
+redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('HSETNX', key, 'started_at', ARGV[1])
+return id
+"""
+
+# KEYS: item hash, ready zset, leased zset
+# ARGV: item_id, worker_id, op (renew|complete|fail|retry), value, error, now
+_REDIS_FINISH = """
+if redis.call('HGET', KEYS[1], 'status') ~= 'running' or redis.call('HGET', KEYS[1], 'lease_owner') ~= ARGV[2] then
+    return 0
+end
+local op = ARGV[3]
+if op == 'renew' then
+    redis.call('HSET', KEYS[1], 'lease_expires', ARGV[4])
+    redis.call('ZADD', KEYS[3], ARGV[4], ARGV[1])
+    return 1
+end
+redis.call('ZREM', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[1], 'lease_owner')
+if op == 'complete' then
+    redis.call('HSET', KEYS[1], 'status', 'completed', 'result', ARGV[4], 'completed_at', ARGV[6])
+    redis.call('HDEL', KEYS[1], 'error')
+    return 1
+end
+redis.call('HSET', KEYS[1], 'error', ARGV[5])
+if op == 'retry' then
+    redis.call('HSET', KEYS[1], 'status', 'pending', 'available_at', ARGV[4])
+    redis.call('ZADD', KEYS[2], ARGV[4], ARGV[1])
+else
+    redis.call('HSET', KEYS[1], 'status', 'failed', 'completed_at', ARGV[6])
+end
+return 1
+"""
+
+
+class RedisJobStore(JobStore):
+    """
+    Redis job store.
+
+    Layout (prefix "batch"): job JSON strings, a created-at index, per-job
+    item lists, item hashes, and two sorted sets - ready items by
+    available_at and leased items by lease expiry.
+    """
+
+    def __init__(self, redis, prefix: str = "batch"):
+        """
+        Initialize store
+
+        Args:
+            redis: Synchronous redis.Redis client (decode_responses=True)
+            prefix: Key prefix
+        """
+        self.redis = redis
+        self.prefix = prefix
+        self._ready = f"{prefix}:ready"
+        self._leased = f"{prefix}:leased"
+        self._claim = redis.register_script(_REDIS_CLAIM)
+        self._finish = redis.register_script(_REDIS_FINISH)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _item_key(self, item_id: str) -> str:
+        return f"{self.prefix}:item:{item_id}"
+
+    def _items_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job_items:{job_id}"
+
+    def save_job(self, job: "BatchJob") -> None:
+        pipe = self.redis.pipeline()
+        pipe.set(self._job_key(job.job_id), job.model_dump_json())
+        pipe.zadd(f"{self.prefix}:jobs", {job.job_id: job.created_at.timestamp()})
+        pipe.execute()
+
+    def load_job(self, job_id: str) -> Optional["BatchJob"]:
+        data = self.redis.get(self._job_key(job_id))
+        return _job_from_json(data) if data else None
+
+    def load_jobs(self, statuses: Optional[Sequence[str]] = None) -> List["BatchJob"]:
+        job_ids = self.redis.zrange(f"{self.prefix}:jobs", 0, -1)
+        if not job_ids:
+            return []
+        jobs = [_job_from_json(data) for data in self.redis.mget([self._job_key(j) for j in job_ids]) if data]
+        if statuses:
+            jobs = [job for job in jobs if job.status.value in statuses]
+        return jobs
+
+    def delete_job(self, job_id: str) -> None:
+        item_ids = self.redis.lrange(self._items_key(job_id), 0, -1)
+        pipe = self.redis.pipeline()
+        for item_id in item_ids:
+            pipe.delete(self._item_key(item_id))
+            pipe.zrem(self._ready, item_id)
+            pipe.zrem(self._leased, item_id)
+        pipe.delete(self._items_key(job_id), self._job_key(job_id))
+        pipe.zrem(f"{self.prefix}:jobs", job_id)
+        pipe.execute()
+
+    def create_job_with_items(
+        self, job: "BatchJob", items: List[WorkItem], idempotency_key: Optional[str] = None
+    ) -> str:
+        if idempotency_key:
+            key = f"{self.prefix}:key:{idempotency_key}"
+            if not self.redis.set(key, job.job_id, nx=True):
+                return self.redis.get(key)
+
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.set(self._job_key(job.job_id), job.model_dump_json())
+        pipe.zadd(f"{self.prefix}:jobs", {job.job_id: job.created_at.timestamp()})
+        for item in items:
+            pipe.hset(
+                self._item_key(item.item_id),
+                mapping={
+                    "job_id": item.job_id,
+                    "workflow_id": item.workflow_id,
+                    "position": item.position,
+                    "spec": json.dumps(item.spec, default=str),
+                    "idempotency_key": item.idempotency_key,
+                    "status": ITEM_PENDING,
+                    "attempts": 0,
+                    "available_at": item.available_at,
+                },
+            )
+            pipe.rpush(self._items_key(job.job_id), item.item_id)
+            pipe.zadd(self._ready, {item.item_id: item.available_at})
+        pipe.execute()
+        return job.job_id
+
+    def sync_job(
+        self, job_id: str, now: float, status: Optional[str] = None, error: Optional[str] = None
+    ) -> Optional["BatchJob"]:
+        job_key, items_key = self._job_key(job_id), self._items_key(job_id)
+
+        def update(pipe) -> Optional["BatchJob"]:
+            # Optimistic transaction: retried if the job or any of its items changes meanwhile
+            data = pipe.get(job_key)
+            if not data:
+                return None
+            item_ids = pipe.lrange(items_key, 0, -1)
+            if item_ids:
+                pipe.watch(job_key, items_key, *[self._item_key(i) for i in item_ids])
+            items = [self._load_item(item_id, pipe) for item_id in item_ids]
+            job = _job_from_json(data)
+            job.apply_items([item for item in items if item is not None], now, status, error)
+            pipe.multi()
+            pipe.set(job_key, job.model_dump_json())
+            return job
+
+        return self.redis.transaction(update, job_key, items_key, value_from_callable=True)
+
+    def record_result(
+        self,
+        job_id: str,
+        workflow_id: str,
+        status: str,
+        result: Optional[Dict[str, Any]],
+        error: Optional[str],
+        started_at: Optional[float],
+        now: float,
+    ) -> None:
+        fields: Dict[str, Any] = {"status": status, "completed_at": now, "attempts": 1}
+        if result is not None:
+            fields["result"] = json.dumps(result, default=str)
+        if error is not None:
+            fields["error"] = error
+        if started_at is not None:
+            fields["started_at"] = started_at
+
+        item_ids = self.redis.lrange(self._items_key(job_id), 0, -1)
+        for item_id in item_ids:
+            if self.redis.hget(self._item_key(item_id), "workflow_id") == workflow_id:
+                pipe = self.redis.pipeline()
+                pipe.hset(self._item_key(item_id), mapping=fields)
+                pipe.hdel(self._item_key(item_id), "lease_owner")
+                pipe.zrem(self._ready, item_id)
+                pipe.zrem(self._leased, item_id)
+                pipe.execute()
+                return
+
+        item_id = f"{job_id}:{workflow_id}"
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.hset(
+            self._item_key(item_id),
+            mapping={
+                "job_id": job_id,
+                "workflow_id": workflow_id,
+                "position": len(item_ids),
+                "spec": "{}",
+                "idempotency_key": item_id,
+                **fields,
+            },
+        )
+        pipe.rpush(self._items_key(job_id), item_id)
+        pipe.execute()
+
+    def _load_item(self, item_id: str, client=None) -> Optional[WorkItem]:
+        data = (client or self.redis).hgetall(self._item_key(item_id))
+        if not data:
+            return None
+        return WorkItem(
+            item_id=item_id,
+            job_id=data["job_id"],
+            workflow_id=data["workflow_id"],
+            position=int(data["position"]),
+            spec=json.loads(data["spec"]),
+            idempotency_key=data["idempotency_key"],
+            status=data["status"],
+            attempts=int(data.get("attempts", 0)),
+            lease_owner=data.get("lease_owner"),
+            lease_expires=float(data.get("lease_expires", 0)),
+            available_at=float(data.get("available_at", 0)),
+            result=json.loads(data["result"]) if data.get("result") else None,
+            error=data.get("error"),
+            started_at=float(data["started_at"]) if data.get("started_at") else None,
+            completed_at=float(data["completed_at"]) if data.get("completed_at") else None,
+        )
+
+    def load_items(self, job_id: str) -> List[WorkItem]:
+        items = [self._load_item(item_id) for item_id in self.redis.lrange(self._items_key(job_id), 0, -1)]
+        return [item for item in items if item is not None]
+
+    def claim_item(
+        self, worker_id: str, lease_expires: float, now: float, max_attempts: Optional[int] = None
+    ) -> Optional[WorkItem]:
+        item_id = self._claim(
+            keys=[self._ready, self._leased],
+            args=[now, lease_expires, worker_id, f"{self.prefix}:item:", max_attempts or 0],
+        )
+        return self._load_item(item_id) if item_id else None
+
+    def _finish_item(self, item_id: str, worker_id: str, op: str, value: Any = "", error: str = "", now: float = 0):
+        return bool(
+            self._finish(
+                keys=[self._item_key(item_id), self._ready, self._leased],
+                args=[item_id, worker_id, op, value, error, now],
+            )
+        )
+
+    def renew_lease(self, item_id: str, worker_id: str, lease_expires: float) -> bool:
+        return self._finish_item(item_id, worker_id, "renew", lease_expires)
+
+    def complete_item(self, item_id: str, worker_id: str, result: Optional[Dict[str, Any]], now: float) -> bool:
+        return self._finish_item(item_id, worker_id, "complete", json.dumps(result, default=str), now=now)
+
+    def fail_item(
+        self, item_id: str, worker_id: str, error: str, now: float, retry_at: Optional[float] = None
+    ) -> bool:
+        if retry_at is None:
+            return self._finish_item(item_id, worker_id, "fail", "", error, now)
+        return self._finish_item(item_id, worker_id, "retry", retry_at, error, now)
+
+    def cancel_items(self, job_id: str) -> int:
+        cancelled = 0
+        for item in self.load_items(job_id):
+            if item.status in (ITEM_PENDING, ITEM_RUNNING):
+                pipe = self.redis.pipeline()
+                pipe.zrem(self._ready, item.item_id)
+                pipe.zrem(self._leased, item.item_id)
+                pipe.hset(self._item_key(item.item_id), "status", ITEM_CANCELLED)
+                pipe.hdel(self._item_key(item.item_id), "lease_owner")
+                pipe.execute()
+                cancelled += 1
+        return cancelled
+
+    def lease_owners(self) -> List[str]:
+        owners = set()
+        for item_id in self.redis.zrange(self._leased, 0, -1):
+            owner = self.redis.hget(self._item_key(item_id), "lease_owner")
+            if owner:
+                owners.add(owner)
+        return sorted(owners)
+
+    def release_leases(self, owners: Sequence[str], count_attempt: bool = True) -> int:
+        released = 0
+        now = time.time()
+        for item_id in self.redis.zrange(self._leased, 0, -1):
+            if self.redis.hget(self._item_key(item_id), "lease_owner") in owners:
+                # Expire the lease; the next claim moves it back to ready
+                pipe = self.redis.pipeline()
+                pipe.zadd(self._leased, {item_id: now - 1})
+                if not count_attempt:
+                    pipe.hincrby(self._item_key(item_id), "attempts", -1)
+                pipe.execute()
+                released += 1
+        return released
+
+
+def create_job_store(backend: str = "sqlite", path: str = DEFAULT_DB_PATH, redis_url: Optional[str] = None) -> JobStore:
+    """
+    Create a job store.
+
+    Args:
+        backend: "sqlite" or "redis"
+        path: SQLite database path
+        redis_url: Redis URL (backend="redis")
+
+    Returns:
+        JobStore instance
+    """
+    if backend == "redis":
+        from redis import Redis
+
+        return RedisJobStore(Redis.from_url(redis_url or "redis://localhost:6379/0", decode_responses=True))
+    return SQLiteJobStore(path)
+
+
+# Export public API
+__all__ = [
+    "DEFAULT_DB_PATH",
+    "JobStore",
+    "RedisJobStore",
+    "SQLiteJobStore",
+    "WorkItem",
+    "create_job_store",
+]
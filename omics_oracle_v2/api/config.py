@@ -4,7 +4,7 @@ API Configuration
 Configuration settings specific to the FastAPI application.
 """
 
-from typing import List
+from typing import List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -56,6 +56,35 @@ class APISettings(BaseSettings):
         default=True, description="Enable request/response logging"
     )
 
+    # WebSocket fan-out
+    websocket_bus: Literal["memory", "redis"] = Field(
+        default="memory",
+        description="Workflow event bus: memory (single worker) or redis (pub/sub across workers)",
+    )
+    websocket_send_queue_size: int = Field(
+        default=100, ge=1, description="Per-connection WebSocket send queue size"
+    )
+    websocket_send_timeout: float = Field(
+        default=10.0, gt=0, description="Seconds before a stalled WebSocket send drops the client"
+    )
+
+    # Batch jobs
+    batch_store: Literal["sqlite", "redis"] = Field(
+        default="sqlite", description="Batch job store: sqlite (single host) or redis"
+    )
+    batch_db_path: str = Field(
+        default="data/batch/batch_jobs.db", description="SQLite batch job database path"
+    )
+    batch_max_concurrency: int = Field(
+        default=4, ge=1, description="Batch workflows run concurrently per process"
+    )
+    batch_max_attempts: int = Field(
+        default=3, ge=1, description="Attempts per batch workflow before it is marked failed"
+    )
+    batch_lease_seconds: float = Field(
+        default=60.0, gt=0, description="Batch work item lease (renewed while running)"
+    )
+
     # Timeouts
     request_timeout_seconds: int = 300  # 5 minutes
     workflow_timeout_seconds: int = 600  # 10 minutes
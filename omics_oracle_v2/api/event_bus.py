@@ -0,0 +1,212 @@
+"""
+Workflow Event Bus
+
+Carries workflow events from the process that emits them to the processes
+holding the subscribed WebSocket connections:
+- InMemoryEventBus: single process, events are delivered directly
+- RedisEventBus: Redis pub/sub, one channel per workflow, so every uvicorn
+  worker receives events for the workflows its clients are watching
+
+Subscriptions are reference counted: each local connection subscribes and
+unsubscribes once, and a worker listens on a workflow channel only while at
+least one of its connections is watching it.
+
+Usage:
+    bus = create_event_bus("redis", redis_client)
+    await bus.start(handler)          # handler(workflow_id, message, message_json)
+    await bus.subscribe("wf-123")
+    await bus.publish("wf-123", message, json.dumps(message))
+"""
+
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# handler(workflow_id, message, message_json)
+EventHandler = Callable[[str, Dict[str, Any], str], Awaitable[None]]
+
+
+class EventBus(ABC):
+    """Interface for workflow event buses."""
+
+    def __init__(self):
+        self._handler: Optional[EventHandler] = None
+
+    async def start(self, handler: EventHandler) -> None:
+        """Register the local delivery handler."""
+        self._handler = handler
+
+    @abstractmethod
+    async def publish(self, workflow_id: str, message: Dict[str, Any], message_json: str) -> None:
+        """Deliver a workflow event to every worker's local handler."""
+
+    async def subscribe(self, workflow_id: str) -> None:
+        """Add a local subscriber for a workflow (the first one starts receiving)."""
+
+    async def unsubscribe(self, workflow_id: str) -> None:
+        """Remove a local subscriber for a workflow (the last one stops receiving)."""
+
+    async def close(self) -> None:
+        self._handler = None
+
+
+class InMemoryEventBus(EventBus):
+    """Single-process bus: publish delivers straight to the local handler."""
+
+    async def publish(self, workflow_id: str, message: Dict[str, Any], message_json: str) -> None:
+        if self._handler:
+            await self._handler(workflow_id, message, message_json)
+
+
+class RedisEventBus(EventBus):
+    """
+    Redis pub/sub bus for multi-worker deployments.
+
+    If a publish fails, the event is still delivered to local connections.
+    """
+
+    def __init__(self, redis, channel_prefix: str = "omics:ws", reconnect_delay: float = 1.0):
+        """
+        Initialize bus
+
+        Args:
+            redis: redis.asyncio client (decode_responses=True)
+            channel_prefix: Channel name prefix (channel = prefix:workflow_id)
+            reconnect_delay: Seconds to wait before re-subscribing after an error
+        """
+        super().__init__()
+        self.redis = redis
+        self.channel_prefix = channel_prefix
+        self.reconnect_delay = reconnect_delay
+
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._channels: Set[str] = set()
+        self._refs: Dict[str, int] = {}  # channel -> local subscribers
+        self._lock = asyncio.Lock()
+
+    def _channel(self, workflow_id: str) -> str:
+        return f"{self.channel_prefix}:{workflow_id}"
+
+    async def publish(self, workflow_id: str, message: Dict[str, Any], message_json: str) -> None:
+        try:
+            await self.redis.publish(self._channel(workflow_id), message_json)
+        except Exception as e:
+            logger.warning(f"Redis publish failed for workflow {workflow_id}, delivering locally: {e}")
+            if self._handler:
+                await self._handler(workflow_id, message, message_json)
+
+    async def subscribe(self, workflow_id: str) -> None:
+        channel = self._channel(workflow_id)
+        async with self._lock:
+            self._refs[channel] = self._refs.get(channel, 0) + 1
+            if channel in self._channels:
+                return
+            self._channels.add(channel)
+            if self._pubsub is None:
+                self._pubsub = self.redis.pubsub()
+            try:
+                await self._pubsub.subscribe(channel)
+            except Exception as e:
+                # The reader re-subscribes every tracked channel on reconnect
+                logger.warning(f"Redis subscribe failed for {channel}: {e}")
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+
+    async def unsubscribe(self, workflow_id: str) -> None:
+        channel = self._channel(workflow_id)
+        async with self._lock:
+            refs = self._refs.get(channel, 0) - 1
+            if refs > 0:
+                self._refs[channel] = refs
+                return
+            self._refs.pop(channel, None)
+            if channel not in self._channels:
+                return
+            self._channels.discard(channel)
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except Exception as e:
+                logger.debug(f"Redis unsubscribe failed for {channel}: {e}")
+
+    async def _read_loop(self) -> None:
+        prefix_length = len(self.channel_prefix) + 1
+        while True:
+            try:
+                if not self._channels:
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+                raw = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis event bus read failed, resubscribing: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+                await self._resubscribe()
+                continue
+
+            if not raw or raw.get("type") != "message" or not self._handler:
+                continue
+
+            channel, data = raw["channel"], raw["data"]
+            try:
+                await self._handler(channel[prefix_length:], json.loads(data), data)
+            except Exception as e:
+                logger.error(f"Error delivering event from {channel}: {e}")
+
+    async def _resubscribe(self) -> None:
+        async with self._lock:
+            try:
+                if self._pubsub is not None:
+                    await self._pubsub.aclose()
+                self._pubsub = self.redis.pubsub()
+                if self._channels:
+                    await self._pubsub.subscribe(*self._channels)
+            except Exception as e:
+                logger.warning(f"Redis resubscribe failed: {e}")
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.debug(f"Error closing Redis pubsub: {e}")
+            self._pubsub = None
+        self._channels.clear()
+        self._refs.clear()
+        await super().close()
+
+
+def create_event_bus(backend: str = "memory", redis=None) -> EventBus:
+    """
+    Create an event bus.
+
+    Args:
+        backend: "memory" or "redis"
+        redis: redis.asyncio client (required for "redis"; falls back to memory if None)
+
+    Returns:
+        EventBus instance
+    """
+    if backend == "redis":
+        if redis is not None:
+            return RedisEventBus(redis)
+        logger.warning("Redis unavailable - WebSocket events limited to this worker")
+    return InMemoryEventBus()
+
+
+# Export public API
+__all__ = [
+    "EventBus",
+    "InMemoryEventBus",
+    "RedisEventBus",
+    "create_event_bus",
+]
@@ -1,5 +1,14 @@
 """API helper utilities."""
 
 from .llm import call_openai
+from .llm_gateway import (LLMGateway, LLMProvider, LLMRequest, StubProvider,
+                          get_llm_gateway)
 
-__all__ = ["call_openai"]
+__all__ = [
+    "call_openai",
+    "LLMGateway",
+    "LLMProvider",
+    "LLMRequest",
+    "StubProvider",
+    "get_llm_gateway",
+]
@@ -0,0 +1,519 @@
+"""
+Async LLM gateway for API endpoints.
+
+One long-lived gateway sits in front of a pluggable LLM provider:
+- Pooled async client: one AsyncOpenAI client (and HTTP pool) per API key,
+  never a blocking call on the event loop
+- Single-flight: identical in-flight prompts share one provider call
+- Streaming: token chunks are yielded as the provider produces them
+- Per-model budgets: max concurrent calls and max estimated spend per window
+- Response cache: one shared RedisCache, same keys/format as before (7 days)
+
+Providers:
+- OpenAIProvider: OpenAI chat completions (optional `openai` dependency)
+- StubProvider: deterministic local responses with simulated latency, for
+  offline development and load-testing AnalysisService
+
+Usage:
+    gateway = get_llm_gateway(settings.ai)
+    text = await gateway.complete(LLMRequest(prompt="...", model="gpt-4"))
+    async for chunk in gateway.stream(LLMRequest(prompt="...")):
+        print(chunk, end="")
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+
+from omics_oracle_v2.core.exceptions import AIError
+
+logger = logging.getLogger(__name__)
+
+# Optional OpenAI dependency
+try:
+    from openai import AsyncOpenAI
+
+    HAS_OPENAI = True
+except ImportError:
+    HAS_OPENAI = False
+    AsyncOpenAI = None  # type: ignore
+
+CACHE_TTL = 604800  # 7 days
+
+# Estimated USD per 1K tokens (input, output); matched by longest model prefix
+MODEL_PRICES_PER_1K: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4o": (0.005, 0.015),
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4-1106": (0.01, 0.03),
+    "gpt-4": (0.03, 0.06),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+    "stub": (0.0, 0.0),
+}
+DEFAULT_PRICE_PER_1K = (0.03, 0.06)
+
+
+class LLMBudgetExceeded(AIError):
+    """Raised when a call would exceed a model's cost budget."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """A single chat completion request."""
+
+    prompt: str
+    system_message: str = "You are a helpful genomics data analysis assistant."
+    model: str = "gpt-4"
+    max_tokens: int = 800
+    temperature: float = 0.7
+    timeout: int = 30
+
+    @property
+    def cache_key(self) -> str:
+        """Cache key; includes model and temperature to avoid serving wrong responses."""
+        cache_input = f"{self.prompt}|{self.system_message}|{self.model}|{self.temperature}"
+        return f"ai_summary:{hashlib.sha256(cache_input.encode()).hexdigest()[:16]}"
+
+    def estimate_cost(self, output_tokens: Optional[int] = None) -> float:
+        """Estimated USD cost (1 token ~= 4 chars; max_tokens if output unknown)."""
+        input_price, output_price = _model_price(self.model)
+        input_tokens = (len(self.prompt) + len(self.system_message)) // 4
+        if output_tokens is None:
+            output_tokens = self.max_tokens
+        return (input_tokens * input_price + output_tokens * output_price) / 1000
+
+
+def _fail(future: asyncio.Future, error: BaseException) -> None:
+    """Fail a single-flight future; callers that joined it get the error."""
+    future.set_exception(error if isinstance(error, Exception) else AIError("LLM call cancelled"))
+    future.exception()  # mark retrieved so an unjoined failure doesn't log a warning
+
+
+def _model_price(model: str) -> Tuple[float, float]:
+    model = model.lower()
+    for prefix in sorted(MODEL_PRICES_PER_1K, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_PRICES_PER_1K[prefix]
+    return DEFAULT_PRICE_PER_1K
+
+
+class LLMProvider(ABC):
+    """Backend that turns an LLMRequest into text."""
+
+    name = "provider"
+
+    @abstractmethod
+    async def complete(self, request: LLMRequest) -> str:
+        """Return the full response text."""
+
+    @abstractmethod
+    def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Yield response text chunks as they are generated."""
+
+    async def close(self) -> None:
+        """Release pooled connections."""
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI chat completions through one pooled AsyncOpenAI client."""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, max_retries: int = 2):
+        if not HAS_OPENAI:
+            raise AIError("OpenAI library not installed. Install with: pip install openai")
+        if not api_key:
+            raise AIError("OpenAI API key not provided")
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=max_retries)
+
+    def _messages(self, request: LLMRequest):
+        return [
+            {"role": "system", "content": request.system_message},
+            {"role": "user", "content": request.prompt},
+        ]
+
+    async def complete(self, request: LLMRequest) -> str:
+        response = await self.client.chat.completions.create(
+            model=request.model,
+            messages=self._messages(request),
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            timeout=request.timeout,
+        )
+        return response.choices[0].message.content or ""
+
+    async def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        response = await self.client.chat.completions.create(
+            model=request.model,
+            messages=self._messages(request),
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            timeout=request.timeout,
+            stream=True,
+        )
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class StubProvider(LLMProvider):
+    """
+    Deterministic local backend for offline development and load tests.
+
+    The response is derived from a hash of the request, so identical
+    requests always get identical text. Latency is simulated per token.
+    """
+
+    name = "stub"
+
+    def __init__(self, latency: float = 0.0, token_latency: float = 0.0, tokens: int = 60):
+        """
+        Args:
+            latency: Seconds before the first token
+            token_latency: Seconds between tokens
+            tokens: Response length in words (capped by max_tokens)
+        """
+        self.latency = latency
+        self.token_latency = token_latency
+        self.tokens = tokens
+        self.calls = 0
+
+    def _words(self, request: LLMRequest):
+        digest = hashlib.sha256(f"{request.system_message}|{request.prompt}".encode()).hexdigest()
+        gse_ids = sorted(set(re.findall(r"\bGSE\d+\b", request.prompt)))
+        words = [
+            "# Overview\n",
+            f"Stub analysis {digest[:8]} of {len(gse_ids)} dataset(s).\n",
+            "# Key Insights\n",
+        ]
+        words += [f"- {gse_id} is relevant to the query.\n" for gse_id in gse_ids]
+        words += ["# Recommendations\n", f"- Start with {gse_ids[0] if gse_ids else 'the top dataset'}.\n"]
+        for i in range(max(0, min(self.tokens, request.max_tokens) - len(words))):
+            words.append(f"{digest[i % 60:i % 60 + 4]} ")
+        return words
+
+    async def complete(self, request: LLMRequest) -> str:
+        return "".join([chunk async for chunk in self.stream(request)])
+
+    async def stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        for word in self._words(request):
+            if self.token_latency:
+                await asyncio.sleep(self.token_latency)
+            yield word
+
+
+class ModelBudget:
+    """
+    Concurrency and cost limits for one model.
+
+    Cost is reserved from the request's worst-case estimate before the call
+    and settled with the actual output length afterwards.
+    """
+
+    def __init__(self, max_concurrency: int = 4, max_cost_usd: Optional[float] = None, window_seconds: int = 86400):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_cost_usd = max_cost_usd
+        self.window_seconds = window_seconds
+        self._spend: Deque[Tuple[float, float]] = deque()
+
+    @property
+    def spent_usd(self) -> float:
+        """Estimated spend within the current window."""
+        cutoff = time.monotonic() - self.window_seconds
+        while self._spend and self._spend[0][0] < cutoff:
+            self._spend.popleft()
+        return sum(cost for _, cost in self._spend)
+
+    def reserve(self, cost: float) -> None:
+        if self.max_cost_usd is not None and self.spent_usd + cost > self.max_cost_usd:
+            raise LLMBudgetExceeded(
+                f"LLM cost budget exceeded: ${self.spent_usd:.2f} of ${self.max_cost_usd:.2f} "
+                f"spent in the last {self.window_seconds}s"
+            )
+        self._spend.append((time.monotonic(), cost))
+
+    def settle(self, reserved: float, actual: float) -> None:
+        self._spend.append((time.monotonic(), actual - reserved))
+
+
+class LLMGateway:
+    """
+    Shared entry point for LLM calls.
+
+    Adds caching, single-flight deduplication and per-model budgets on top
+    of a provider. Create once per process (see get_llm_gateway()).
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        cache=None,
+        max_concurrency: int = 4,
+        max_cost_usd: Optional[float] = None,
+        budget_window_seconds: int = 86400,
+        budgets: Optional[Dict[str, ModelBudget]] = None,
+    ):
+        """
+        Args:
+            provider: LLM backend
+            cache: Optional RedisCache for responses
+            max_concurrency: Default concurrent calls per model
+            max_cost_usd: Default estimated spend limit per model and window
+            budget_window_seconds: Cost budget window
+            budgets: Explicit per-model budgets (override the defaults)
+        """
+        self.provider = provider
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.max_cost_usd = max_cost_usd
+        self.budget_window_seconds = budget_window_seconds
+        self.budgets: Dict[str, ModelBudget] = dict(budgets or {})
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def budget(self, model: str) -> ModelBudget:
+        """Get (or create) the budget for a model."""
+        if model not in self.budgets:
+            self.budgets[model] = ModelBudget(self.max_concurrency, self.max_cost_usd, self.budget_window_seconds)
+        return self.budgets[model]
+
+    async def complete(self, request: LLMRequest, use_cache: bool = True) -> str:
+        """
+        Get the response text for a request.
+
+        Raises:
+            AIError: If the provider fails, returns nothing, or the budget is exhausted
+        """
+        key = request.cache_key
+        if use_cache:
+            cached = await self._cache_get(key)
+            if cached:
+                return cached
+
+        # Single-flight: share an identical in-flight call
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info(f"[SINGLE-FLIGHT] Joining in-flight LLM call [key={key[:12]}...]")
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            text = await self._call(request)
+        except BaseException as e:
+            _fail(future, e)
+            raise
+        else:
+            future.set_result(text)
+        finally:
+            del self._inflight[key]
+        if use_cache:
+            await self._cache_set(key, text, request.model)
+        return text
+
+    async def stream(self, request: LLMRequest, use_cache: bool = True) -> AsyncIterator[str]:
+        """
+        Yield response text chunks as they are generated.
+
+        Cache hits and requests already in flight yield the full text as one chunk.
+
+        Raises:
+            AIError: If the provider fails, returns nothing, or the budget is exhausted
+        """
+        key = request.cache_key
+        if use_cache:
+            cached = await self._cache_get(key)
+            if cached:
+                yield cached
+                return
+        if key in self._inflight:
+            yield await self.complete(request, use_cache=use_cache)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        budget = self.budget(request.model)
+        chunks = []
+        try:
+            async with budget.semaphore:
+                reserved = request.estimate_cost()
+                budget.reserve(reserved)
+                try:
+                    async for chunk in self.provider.stream(request):
+                        chunks.append(chunk)
+                        yield chunk
+                except AIError:
+                    raise
+                except Exception as e:
+                    raise AIError(f"{self.provider.name} streaming call failed: {e}") from e
+                finally:
+                    budget.settle(reserved, request.estimate_cost(len("".join(chunks)) // 4))
+            text = "".join(chunks).strip()
+            if not text:
+                raise AIError(f"{self.provider.name} returned empty response")
+            future.set_result(text)
+        except BaseException as e:
+            _fail(future, e)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        if use_cache:
+            await self._cache_set(key, text, request.model)
+
+    async def _call(self, request: LLMRequest) -> str:
+        budget = self.budget(request.model)
+        async with budget.semaphore:
+            reserved = request.estimate_cost()
+            budget.reserve(reserved)
+            text = ""
+            try:
+                text = await self.provider.complete(request)
+            except AIError:
+                raise
+            except Exception as e:
+                raise AIError(f"{self.provider.name} call failed: {e}") from e
+            finally:
+                budget.settle(reserved, request.estimate_cost(len(text) // 4))
+        if not text or not text.strip():
+            raise AIError(f"{self.provider.name} returned empty response")
+        return text.strip()
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        if not self.cache:
+            return None
+        try:
+            cached_response = await self.cache.get(key)
+        except Exception as e:
+            logger.warning(f"Cache check failed: {e}, proceeding with API call")
+            return None
+        if not cached_response:
+            logger.info(f"[CACHE MISS] AI summary cache MISS, calling {self.provider.name}... [key={key[:12]}...]")
+            return None
+
+        # Parse JSON if it's a string
+        if isinstance(cached_response, str):
+            try:
+                cached_text = json.loads(cached_response).get("response", "")
+            except (json.JSONDecodeError, AttributeError):
+                # Old cache format - plain text
+                cached_text = cached_response
+        else:
+            cached_text = cached_response
+
+        logger.info(f"[CACHE HIT] AI summary cache HIT [key={key[:12]}...]")
+        return cached_text.strip() if cached_text and cached_text.strip() else None
+
+    async def _cache_set(self, key: str, text: str, model: str) -> None:
+        if not self.cache:
+            return
+        try:
+            await self.cache.set(key, json.dumps({"response": text, "model": model}), ttl=CACHE_TTL)
+            logger.info(f"[CACHED] Cached AI summary for 7 days [key={key[:12]}...]")
+        except Exception as e:
+            logger.warning(f"Failed to cache AI response: {e}")
+
+    async def close(self) -> None:
+        await self.provider.close()
+
+
+# Process-wide gateways, one per provider configuration
+_gateways: Dict[tuple, LLMGateway] = {}
+
+
+def _default_cache():
+    try:
+        from omics_oracle_v2.cache.redis_cache import RedisCache
+
+        cache = RedisCache()
+        return cache if cache.enabled else None
+    except Exception as e:
+        logger.warning(f"LLM response cache unavailable: {e}")
+        return None
+
+
+def get_llm_gateway(
+    ai_settings=None,
+    api_key: Optional[str] = None,
+    provider: Optional[str] = None,
+) -> LLMGateway:
+    """
+    Get the shared gateway for the configured provider.
+
+    Args:
+        ai_settings: AISettings (defaults to get_settings().ai)
+        api_key: Override the configured OpenAI API key
+        provider: Override the configured provider ("openai" or "stub")
+
+    Returns:
+        LLMGateway, created on first use
+
+    Raises:
+        AIError: If the provider cannot be created
+    """
+    if ai_settings is None:
+        from omics_oracle_v2.core.config import get_settings
+
+        ai_settings = get_settings().ai
+
+    provider = provider or ai_settings.provider
+    api_key = api_key or ai_settings.openai_api_key
+    config_key = (provider, api_key if provider == "openai" else None)
+
+    gateway = _gateways.get(config_key)
+    if gateway is None:
+        if provider == "openai":
+            backend: LLMProvider = OpenAIProvider(api_key)
+        elif provider == "stub":
+            backend = StubProvider(latency=ai_settings.stub_latency, token_latency=ai_settings.stub_token_latency)
+        else:
+            raise AIError(f"Unknown LLM provider: {provider}")
+
+        gateway = LLMGateway(
+            backend,
+            cache=_default_cache(),
+            max_concurrency=ai_settings.max_concurrency_per_model,
+            max_cost_usd=ai_settings.cost_budget_usd,
+            budget_window_seconds=ai_settings.cost_budget_window,
+        )
+        _gateways[config_key] = gateway
+        logger.info(f"[OK] LLM gateway initialized (provider={provider})")
+    return gateway
+
+
+async def close_llm_gateways() -> None:
+    """Close all shared gateways (call on application shutdown)."""
+    gateways = list(_gateways.values())
+    _gateways.clear()
+    for gateway in gateways:
+        try:
+            await gateway.close()
+        except Exception as e:
+            logger.warning(f"Failed to close LLM gateway: {e}")
+
+
+# Export public API
+__all__ = [
+    "LLMBudgetExceeded",
+    "LLMGateway",
+    "LLMProvider",
+    "LLMRequest",
+    "ModelBudget",
+    "OpenAIProvider",
+    "StubProvider",
+    "close_llm_gateways",
+    "get_llm_gateway",
+]
@@ -30,17 +30,23 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
+from omics_oracle_v2.api.batch import batch_manager, run_search_workflow
+from omics_oracle_v2.api.batch_store import create_job_store
 from omics_oracle_v2.api.config import APISettings
+from omics_oracle_v2.api.event_bus import create_event_bus
+from omics_oracle_v2.api.helpers.llm_gateway import close_llm_gateways
 from omics_oracle_v2.api.metrics import PrometheusMetricsMiddleware
 from omics_oracle_v2.api.middleware import ErrorHandlingMiddleware, RequestLoggingMiddleware
 from omics_oracle_v2.api.routes import (
     agents_router,
     auth_router,
+    batch_router,
     health_router,
     metrics_router,
     users_router,
     websocket_router,
 )
+from omics_oracle_v2.api.websocket import connection_manager
 from omics_oracle_v2.cache import close_redis_client, get_redis_client
 from omics_oracle_v2.core import Settings
 from omics_oracle_v2.database import close_db, init_db
@@ -90,6 +96,23 @@ async def lifespan(app: FastAPI):
         else:
             logger.warning("Redis unavailable - using in-memory cache for rate limiting")
 
+        # WebSocket fan-out (per-connection queues; Redis pub/sub across workers)
+        connection_manager.max_queue = api_settings.websocket_send_queue_size
+        connection_manager.send_timeout = api_settings.websocket_send_timeout
+        connection_manager.use_bus(create_event_bus(api_settings.websocket_bus, redis))
+        logger.info(f"WebSocket event bus: {type(connection_manager.bus).__name__}")
+
+        # Batch jobs: reload unfinished jobs, then resume them on the worker pool
+        batch_manager.configure(
+            store=create_job_store(api_settings.batch_store, api_settings.batch_db_path, settings.redis.url),
+            executor=run_search_workflow,
+            max_concurrency=api_settings.batch_max_concurrency,
+            max_attempts=api_settings.batch_max_attempts,
+            lease_seconds=api_settings.batch_lease_seconds,
+        )
+        await batch_manager.recover()
+        batch_manager.start_workers()
+
     except Exception as e:
         logger.error(f"Failed to initialize: {e}", exc_info=True)
         raise
@@ -101,6 +124,18 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down OmicsOracle Agent API...")
 
+    # Stop batch workers (in-flight workflows are released for the next start)
+    try:
+        await batch_manager.stop_workers()
+    except Exception as e:
+        logger.error(f"Error stopping batch workers: {e}", exc_info=True)
+
+    # Close pooled LLM clients
+    try:
+        await close_llm_gateways()
+    except Exception as e:
+        logger.error(f"Error closing LLM gateway: {e}", exc_info=True)
+
     # Close database connections
     try:
         await close_db()
@@ -108,6 +143,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing database: {e}", exc_info=True)
 
+    # Stop WebSocket writers and event bus (before Redis goes away)
+    try:
+        await connection_manager.close()
+    except Exception as e:
+        logger.error(f"Error closing WebSocket manager: {e}", exc_info=True)
+
     # Close Redis connections
     try:
         await close_redis_client()
@@ -207,12 +248,14 @@ def create_app(settings: Settings = None, api_settings: APISettings = None) -> F
     app.include_router(auth_router, prefix="/api")
     app.include_router(users_router, prefix="/api")
     app.include_router(agents_router, prefix="/api/agents", tags=["Agents"])
+    app.include_router(batch_router, prefix="/api/batch", tags=["Batch"])
     app.include_router(websocket_router, prefix="/ws", tags=["WebSocket"])
     app.include_router(metrics_router, tags=["Metrics"])
 
     # Legacy v1 routes for backwards compatibility (will be removed after frontend updates)
     app.include_router(auth_router, prefix="/api/v1")
     app.include_router(agents_router, prefix="/api/v1/agents")
+    app.include_router(batch_router, prefix="/api/v1/batch")
 
     # Mount static files
     static_dir = Path(__file__).parent / "static"
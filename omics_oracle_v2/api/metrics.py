@@ -6,7 +6,7 @@ Provides metrics collection and exposure for monitoring with Prometheus.
 
 import logging
 import time
-from typing import Callable
+from typing import Callable, List, Optional
 
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -95,6 +95,76 @@ websocket_messages_sent = Counter(
     ["message_type"],
 )
 
+# Citation discovery metrics
+citation_discovery_sessions_total = Counter(
+    "omicsoracle_citation_discovery_sessions_total",
+    "Total citation discovery sessions",
+    ["cache"],
+)
+
+citation_source_requests_total = Counter(
+    "omicsoracle_citation_source_requests_total",
+    "Total citation source requests",
+    ["source", "status"],
+)
+
+citation_source_duration_seconds = Histogram(
+    "omicsoracle_citation_source_duration_seconds",
+    "Citation source response time in seconds",
+    ["source"],
+)
+
+citation_source_papers_found_total = Counter(
+    "omicsoracle_citation_source_papers_found_total",
+    "Total papers found per citation source",
+    ["source"],
+)
+
+citation_discovery_errors_total = Counter(
+    "omicsoracle_citation_discovery_errors_total",
+    "Total citation discovery errors",
+    ["error_type"],
+)
+
+# PDF integrity scrub metrics
+pdf_scrub_files_total = Counter(
+    "omicsoracle_pdf_scrub_files_total",
+    "Total PDFs checked by the integrity scrubber",
+    ["result"],
+)
+
+pdf_scrub_bytes_hashed_total = Counter(
+    "omicsoracle_pdf_scrub_bytes_hashed_total",
+    "Total bytes hashed by the integrity scrubber",
+)
+
+pdf_scrub_failures = Gauge(
+    "omicsoracle_pdf_scrub_failures",
+    "Corrupt or missing PDFs found by the last completed scrub pass",
+)
+
+pdf_scrub_last_completed_timestamp = Gauge(
+    "omicsoracle_pdf_scrub_last_completed_timestamp_seconds",
+    "Unix time the last scrub pass completed",
+)
+
+# Request tracing metrics (one observation per finished span)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+pipeline_stage_duration_seconds = Histogram(
+    "omicsoracle_pipeline_stage_duration_seconds",
+    "Search/enrichment stage duration in seconds (span name)",
+    ["stage", "status"],
+    buckets=STAGE_BUCKETS,
+)
+
+upstream_request_duration_seconds = Histogram(
+    "omicsoracle_upstream_request_duration_seconds",
+    "Time spent waiting on an upstream service in seconds",
+    ["upstream", "stage", "status"],
+    buckets=STAGE_BUCKETS,
+)
+
 # Error metrics
 errors_total = Counter(
     "omicsoracle_errors_total",
@@ -269,6 +339,83 @@ def track_websocket_message(message_type: str) -> None:
     websocket_messages_sent.labels(message_type=message_type).inc()
 
 
+def track_citation_source_request(
+    source: str, success: bool, response_time: float, papers_found: int = 0
+) -> None:
+    """
+    Track one citation source request.
+
+    Args:
+        source: Source name (e.g., "OpenAlex")
+        success: Whether the request succeeded
+        response_time: Response time in seconds
+        papers_found: Number of papers returned
+    """
+    status = "success" if success else "failure"
+    citation_source_requests_total.labels(source=source, status=status).inc()
+    citation_source_duration_seconds.labels(source=source).observe(response_time)
+    if papers_found:
+        citation_source_papers_found_total.labels(source=source).inc(papers_found)
+
+
+def track_discovery_session(cache_hit: bool, error_types: Optional[List[str]] = None) -> None:
+    """
+    Track a citation discovery session.
+
+    Args:
+        cache_hit: Whether the session was served from cache
+        error_types: Types of errors encountered during the session
+    """
+    citation_discovery_sessions_total.labels(cache="hit" if cache_hit else "miss").inc()
+    for error_type in error_types or []:
+        citation_discovery_errors_total.labels(error_type=error_type).inc()
+
+
+def track_pdf_scrub(
+    verified: int, unchanged: int, corrupt: int, missing: int, bytes_hashed: int, completed: bool
+) -> None:
+    """
+    Track one PDF integrity scrub run.
+
+    Args:
+        verified: Files hashed and matching their manifest
+        unchanged: Files skipped because size and mtime were unchanged
+        corrupt: Files whose size or hash did not match
+        missing: Manifest entries without a file
+        bytes_hashed: Bytes read
+        completed: Whether the run finished its pass (not interrupted)
+    """
+    for result, count in (
+        ("verified", verified),
+        ("unchanged", unchanged),
+        ("corrupt", corrupt),
+        ("missing", missing),
+    ):
+        if count:
+            pdf_scrub_files_total.labels(result=result).inc(count)
+    pdf_scrub_bytes_hashed_total.inc(bytes_hashed)
+    if completed:
+        pdf_scrub_failures.set(corrupt + missing)
+        pdf_scrub_last_completed_timestamp.set_to_current_time()
+
+
+def track_span(stage: str, upstream: Optional[str], duration: float, status: str) -> None:
+    """
+    Track one finished tracing span.
+
+    Args:
+        stage: Span name (e.g., "geo.fetch")
+        upstream: External service the span waited on, if any (e.g., "ncbi")
+        duration: Span duration in seconds
+        status: "ok", "error" or "cancelled"
+    """
+    pipeline_stage_duration_seconds.labels(stage=stage, status=status).observe(duration)
+    if upstream:
+        upstream_request_duration_seconds.labels(upstream=upstream, stage=stage, status=status).observe(
+            duration
+        )
+
+
 def get_metrics() -> bytes:
     """
     Get Prometheus metrics in text format.
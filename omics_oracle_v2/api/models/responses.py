@@ -179,6 +179,9 @@ class SearchResponse(BaseResponse):
     query_processing: Optional[QueryProcessingResponse] = Field(
         None, description="Query processing context for RAG enhancement"
     )
+    trace_id: Optional[str] = Field(
+        None, description="Request trace (GET /metrics/traces/{trace_id} for the stage breakdown)"
+    )
 
 
 class QualityMetricsResponse(BaseModel):
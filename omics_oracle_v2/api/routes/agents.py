@@ -6,16 +6,21 @@ REST endpoints for executing search and analysis operations.
 Note: Individual agent endpoints (query, validate, report) have been removed.
       All agents archived to extras/agents/. Main functionality:
       - /search: SearchOrchestrator for dataset/publication search
+      - /search/stream: same search, streamed as NDJSON or SSE events
       - /enrich-fulltext: FullTextManager for PDF download
       - /analyze: SummarizationClient for AI analysis
+      - /analyze/stream: same analysis, LLM tokens streamed as NDJSON or SSE events
 """
 
+import json
 import logging
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from omics_oracle_v2.api.models.requests import SearchRequest
@@ -24,7 +29,8 @@ from omics_oracle_v2.api.models.responses import (DatasetResponse,
 from omics_oracle_v2.lib.pipelines.citation_discovery.geo_discovery import \
     GEOCitationDiscovery
 from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
-from omics_oracle_v2.services.search_service import SearchService
+from omics_oracle_v2.services.search_service import (STREAM_ERROR,
+                                                     SearchService)
 
 # TODO: DatabaseQueries deleted - use UnifiedDatabase directly if needed
 # from omics_oracle_v2.lib.pipelines.storage.queries import DatabaseQueries
@@ -77,6 +83,77 @@ async def execute_search(
         )
 
 
+@router.post(
+    "/search/stream",
+    summary="Stream Search Results",
+    response_class=StreamingResponse,
+)
+async def execute_search_stream(
+    request: SearchRequest,
+    format: str = Query(
+        "ndjson",
+        pattern="^(ndjson|sse)$",
+        description="Stream format: ndjson (one JSON event per line) or sse",
+    ),
+):
+    """
+    Search for datasets and publications, streaming results as they arrive.
+
+    Same search as /search, but GEO datasets and publications are sent as
+    soon as each source returns them, instead of after the slowest source.
+
+    Event types:
+    - **started** / **plan**: query after filters, then query type and optimization
+    - **dataset**: scored dataset (id = GEO ID), before database metrics
+    - **dataset_enriched**: the same dataset with database metrics
+    - **publication**: one publication (id = PMID, DOI, or position)
+    - **complete**: the full SearchResponse, identical to /search
+    - **error**: search failed; the stream ends
+
+    NDJSON lines are {"event", "id", "data"} objects; SSE frames use the
+    event type and id as the SSE event and id fields.
+
+    Args:
+        request: Search request with terms, filters, result limit, and semantic flag
+        format: ndjson or sse
+
+    Returns:
+        StreamingResponse of search events
+    """
+    service = SearchService()
+    encode = _encode_sse if format == "sse" else _encode_ndjson
+
+    async def stream():
+        try:
+            async for event in service.execute_search_stream(request):
+                yield encode(event)
+        except Exception as e:
+            logger.error(f"Search stream failed: {e}", exc_info=True)
+            yield encode(
+                {
+                    "event": STREAM_ERROR,
+                    "id": "error",
+                    "data": {"detail": f"Search error: {str(e)}"},
+                }
+            )
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _encode_ndjson(event: Dict) -> str:
+    return json.dumps(jsonable_encoder(event)) + "\n"
+
+
+def _encode_sse(event: Dict) -> str:
+    data = json.dumps(jsonable_encoder(event["data"]))
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {data}\n\n"
+
+
 @router.post(
     "/enrich-fulltext",
     response_model=List[DatasetResponse],
@@ -272,6 +349,65 @@ async def analyze_datasets(
         )
 
 
+@router.post(
+    "/analyze/stream",
+    summary="Stream AI Analysis of Datasets",
+    response_class=StreamingResponse,
+)
+async def analyze_datasets_stream(
+    request: AIAnalysisRequest,
+    format: str = Query(
+        "ndjson",
+        pattern="^(ndjson|sse)$",
+        description="Stream format: ndjson (one JSON event per line) or sse",
+    ),
+):
+    """
+    Same analysis as /analyze, streaming the LLM output as it is generated.
+
+    Event types:
+    - **token**: next chunk of analysis text (id = chunk number)
+    - **complete**: the full AIAnalysisResponse, identical to /analyze
+    - **error**: analysis failed; the stream ends
+
+    Args:
+        request: Analysis request with datasets and query context
+        format: ndjson or sse
+
+    Returns:
+        StreamingResponse of analysis events
+    """
+    from omics_oracle_v2.api.dependencies import get_settings
+    from omics_oracle_v2.services.analysis_service import AnalysisService
+
+    settings = get_settings()
+    service = AnalysisService()
+    encode = _encode_sse if format == "sse" else _encode_ndjson
+
+    async def stream():
+        try:
+            async for event in service.analyze_datasets_stream(request, settings):
+                yield encode(event)
+        except HTTPException as e:
+            yield encode({"event": STREAM_ERROR, "id": "error", "data": {"detail": e.detail}})
+        except Exception as e:
+            logger.error(f"AI analysis stream failed: {e}", exc_info=True)
+            yield encode(
+                {
+                    "event": STREAM_ERROR,
+                    "id": "error",
+                    "data": {"detail": f"Analysis error: {str(e)}"},
+                }
+            )
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/geo/{geo_id}/complete",
     summary="Get Complete GEO Data",
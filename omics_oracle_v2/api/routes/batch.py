@@ -0,0 +1,154 @@
+"""
+Batch Job Routes
+
+Submit workflows to run in the background on the batch worker pool, and
+track, inspect and cancel the resulting jobs.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from pydantic import BaseModel, Field
+
+from omics_oracle_v2.api.batch import BatchJob, JobStatus, WorkflowResult, batch_manager
+from omics_oracle_v2.api.models.workflow import WorkflowRequest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Batch"])
+
+
+class BatchJobRequest(BaseModel):
+    """Request model for submitting a batch job."""
+
+    workflows: List[WorkflowRequest] = Field(..., description="Workflows to run")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Optional job metadata")
+    idempotency_key: Optional[str] = Field(
+        default=None, description="Resubmitting with the same key returns the original job"
+    )
+
+
+class BatchJobSubmitResponse(BaseModel):
+    """Response model for a submitted batch job."""
+
+    job_id: str
+    status: JobStatus
+    total_workflows: int
+    message: str
+
+
+class BatchJobStatusResponse(BaseModel):
+    """Response model for batch job progress."""
+
+    job_id: str
+    status: JobStatus
+    total_workflows: int
+    completed_workflows: int
+    failed_workflows: int
+    progress_percentage: float
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+class BatchJobResultsResponse(BatchJobStatusResponse):
+    """Response model for batch job results."""
+
+    workflows: List[WorkflowResult]
+    metadata: Dict[str, Any]
+
+
+class BatchJobListResponse(BaseModel):
+    """Response model for listing batch jobs."""
+
+    jobs: List[BatchJobStatusResponse]
+    total: int
+
+
+def _status_fields(job: BatchJob) -> Dict[str, Any]:
+    finished = job.completed_workflows + job.failed_workflows
+    progress = 100.0 * finished / job.total_workflows if job.total_workflows else 0.0
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "total_workflows": job.total_workflows,
+        "completed_workflows": job.completed_workflows,
+        "failed_workflows": job.failed_workflows,
+        "progress_percentage": round(progress, 1),
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "completed_at": job.completed_at,
+    }
+
+
+def _get_job_or_404(job_id: str) -> BatchJob:
+    job = batch_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Batch job {job_id} not found")
+    return job
+
+
+@router.post("/jobs", response_model=BatchJobSubmitResponse, summary="Submit Batch Job")
+async def submit_batch_job(request: BatchJobRequest):
+    """
+    Submit workflows to run in the background.
+
+    Each workflow runs as a search on the batch worker pool and is retried on
+    failure. Poll /jobs/{job_id}/status for progress.
+    """
+    if not request.workflows:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No workflows provided")
+
+    job_id = await batch_manager.submit_job(
+        [workflow.model_dump(mode="json") for workflow in request.workflows],
+        metadata=request.metadata,
+        idempotency_key=request.idempotency_key,
+    )
+    job = _get_job_or_404(job_id)
+    return BatchJobSubmitResponse(
+        job_id=job_id,
+        status=job.status,
+        total_workflows=job.total_workflows,
+        message=f"Batch job submitted with {job.total_workflows} workflows",
+    )
+
+
+@router.get("/jobs", response_model=BatchJobListResponse, summary="List Batch Jobs")
+async def list_batch_jobs(
+    job_status: Optional[JobStatus] = Query(None, alias="status", description="Filter by job status"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum jobs to return"),
+):
+    """List batch jobs, newest first."""
+    jobs = batch_manager.list_jobs(status=job_status, limit=limit)
+    return BatchJobListResponse(
+        jobs=[BatchJobStatusResponse(**_status_fields(job)) for job in jobs],
+        total=batch_manager.get_job_count(status=job_status),
+    )
+
+
+@router.get("/jobs/{job_id}/status", response_model=BatchJobStatusResponse, summary="Batch Job Status")
+async def get_batch_job_status(job_id: str):
+    """Progress of a batch job."""
+    return BatchJobStatusResponse(**_status_fields(_get_job_or_404(job_id)))
+
+
+@router.get("/jobs/{job_id}/results", response_model=BatchJobResultsResponse, summary="Batch Job Results")
+async def get_batch_job_results(job_id: str):
+    """Per-workflow results of a batch job (finished workflows only)."""
+    job = _get_job_or_404(job_id)
+    return BatchJobResultsResponse(**_status_fields(job), workflows=job.workflows, metadata=job.metadata)
+
+
+@router.delete("/jobs/{job_id}", summary="Cancel Batch Job")
+async def cancel_batch_job(job_id: str):
+    """Cancel a pending or running batch job."""
+    job = _get_job_or_404(job_id)
+    if job.status not in (JobStatus.PENDING, JobStatus.RUNNING):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot cancel batch job in status {job.status.value}",
+        )
+    await batch_manager.cancel_job(job_id)
+    return {"job_id": job_id, "message": f"Batch job {job_id} cancelled"}
@@ -1,14 +1,15 @@
 """
 Metrics endpoints for Prometheus monitoring.
 
-Provides endpoints for exposing Prometheus metrics.
+Provides endpoints for exposing Prometheus metrics and recent request traces.
 """
 
 import logging
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, HTTPException, Query, Response
 
 from omics_oracle_v2.api.metrics import get_metrics, get_metrics_content_type
+from omics_oracle_v2.lib.utils.tracing import recent_traces, trace_tree
 
 logger = logging.getLogger(__name__)
 
@@ -24,3 +25,29 @@ async def metrics():
     This endpoint is excluded from OpenAPI docs.
     """
     return Response(content=get_metrics(), media_type=get_metrics_content_type())
+
+
+@router.get("/traces")
+async def list_traces(
+    limit: int = Query(20, ge=1, le=200, description="Maximum traces to return"),
+    min_duration_ms: float = Query(0.0, ge=0, description="Only traces at least this slow"),
+):
+    """
+    Summaries of recent search/enrichment traces, most recent first.
+
+    Each summary breaks the request time down by stage (span name).
+    """
+    return {"traces": recent_traces(limit=limit, min_duration_ms=min_duration_ms)}
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """
+    One recent trace as a span tree with per-span self time.
+
+    The trace ID is returned as ``trace_id`` in search responses.
+    """
+    tree = trace_tree(trace_id)
+    if tree is None:
+        raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found (evicted or unknown)")
+    return tree
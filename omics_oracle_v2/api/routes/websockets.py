@@ -44,7 +44,9 @@ async def workflow_updates(websocket: WebSocket, workflow_id: str):
 
     try:
         # Send initial connection confirmation
-        await websocket.send_json(
+        await connection_manager.send_personal(
+            websocket,
+            workflow_id,
             {
                 "type": "connected",
                 "workflow_id": workflow_id,
@@ -59,7 +61,7 @@ async def workflow_updates(websocket: WebSocket, workflow_id: str):
 
             # Echo back for ping/pong
             if data == "ping":
-                await websocket.send_json({"type": "pong"})
+                await connection_manager.send_personal(websocket, workflow_id, {"type": "pong"})
 
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket, workflow_id)
@@ -87,7 +89,9 @@ async def workflow_updates_dynamic(websocket: WebSocket):
 
     try:
         # Send workflow ID to client
-        await websocket.send_json(
+        await connection_manager.send_personal(
+            websocket,
+            workflow_id,
             {
                 "type": "connected",
                 "workflow_id": workflow_id,
@@ -99,7 +103,7 @@ async def workflow_updates_dynamic(websocket: WebSocket):
         while True:
             data = await websocket.receive_text()
             if data == "ping":
-                await websocket.send_json({"type": "pong"})
+                await connection_manager.send_personal(websocket, workflow_id, {"type": "pong"})
 
     except WebSocketDisconnect:
         connection_manager.disconnect(websocket, workflow_id)
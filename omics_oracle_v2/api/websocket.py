@@ -2,24 +2,160 @@
 WebSocket Connection Manager
 
 Manages WebSocket connections for real-time workflow updates.
+
+Publishing never waits on a client socket:
+- Events go through an EventBus (in-memory, or Redis pub/sub across workers)
+- Each connection has a bounded send queue drained by its own writer task,
+  so one slow client cannot stall the others
+- Under backpressure, queued progress updates are coalesced (latest wins)
+  and dropped before stage/completion events; a client whose queue is full
+  of undroppable events is disconnected
 """
 
+import asyncio
 import json
 import logging
-from typing import Dict, List
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
 
 from fastapi import WebSocket
 
+from omics_oracle_v2.api.event_bus import EventBus, InMemoryEventBus
+
 logger = logging.getLogger(__name__)
 
+# Message types where only the latest queued message matters
+COALESCE_TYPES = {"progress"}
+
+# Close code sent to clients that cannot keep up (RFC 6455 "try again later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+class ClientConnection:
+    """One WebSocket connection with its bounded send queue and writer task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        workflow_id: str,
+        max_queue: int = 100,
+        send_timeout: float = 10.0,
+        on_error: Optional[Callable[["ClientConnection"], None]] = None,
+    ):
+        self.websocket = websocket
+        self.workflow_id = workflow_id
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+        self.on_error = on_error
+
+        self.queue: Deque[Tuple[str, str]] = deque()  # (message_type, message_json)
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, message_type: str, message_json: str) -> bool:
+        """
+        Queue a message without blocking.
+
+        Returns:
+            False if the queue is full of undroppable messages (client too slow)
+        """
+        if message_type in COALESCE_TYPES and self._remove_queued(message_type):
+            self.coalesced += 1
+        elif len(self.queue) >= self.max_queue:
+            if not self._drop_oldest_droppable():
+                return False
+            self.dropped += 1
+
+        self.queue.append((message_type, message_json))
+        self._ready.set()
+        return True
+
+    def _remove_queued(self, message_type: str) -> bool:
+        """Remove the queued message of this type (newer one goes to the back)."""
+        for index in range(len(self.queue) - 1, -1, -1):
+            if self.queue[index][0] == message_type:
+                del self.queue[index]
+                return True
+        return False
+
+    def _drop_oldest_droppable(self) -> bool:
+        for index, (message_type, _) in enumerate(self.queue):
+            if message_type in COALESCE_TYPES:
+                del self.queue[index]
+                return True
+        return False
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                while not self.queue:
+                    self._ready.clear()
+                    await self._ready.wait()
+                _, message_json = self.queue.popleft()
+                await asyncio.wait_for(self.websocket.send_text(message_json), self.send_timeout)
+                self.sent += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error sending message: {e}")
+            if self.on_error:
+                self.on_error(self)
+
+    async def close(self, code: Optional[int] = None) -> None:
+        """Stop the writer; optionally close the socket with a close code."""
+        self.stop()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception as e:
+                logger.debug(f"Error closing WebSocket: {e}")
+
+    def stop(self) -> Optional[asyncio.Task]:
+        """Cancel the writer (returns it so callers can await it)."""
+        self.queue.clear()
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+            return self._writer
+        return None
+
 
 class ConnectionManager:
     """Manages WebSocket connections for workflow updates."""
 
-    def __init__(self):
-        """Initialize connection manager."""
-        # workflow_id -> list of websocket connections
-        self.active_connections: Dict[str, List[WebSocket]] = {}
+    def __init__(self, bus: Optional[EventBus] = None, max_queue: int = 100, send_timeout: float = 10.0):
+        """
+        Initialize connection manager.
+
+        Args:
+            bus: Event bus (default: in-memory, single process)
+            max_queue: Per-connection send queue size
+            send_timeout: Seconds a single send may take before the client is dropped
+        """
+        # workflow_id -> {websocket: connection}
+        self.active_connections: Dict[str, Dict[WebSocket, ClientConnection]] = {}
+        self.max_queue = max_queue
+        self.send_timeout = send_timeout
+
+        self.bus: EventBus = bus or InMemoryEventBus()
+        self._bus_started = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def use_bus(self, bus: EventBus) -> None:
+        """Replace the event bus (call before the first connection/event)."""
+        self.bus = bus
+        self._bus_started = False
+
+    async def _ensure_bus(self) -> None:
+        if not self._bus_started:
+            self._bus_started = True
+            await self.bus.start(self._deliver_local)
 
     async def connect(self, websocket: WebSocket, workflow_id: str):
         """
@@ -30,9 +166,19 @@ class ConnectionManager:
             workflow_id: Workflow ID to associate with connection
         """
         await websocket.accept()
-        if workflow_id not in self.active_connections:
-            self.active_connections[workflow_id] = []
-        self.active_connections[workflow_id].append(websocket)
+        await self._ensure_bus()
+
+        connection = ClientConnection(
+            websocket,
+            workflow_id,
+            max_queue=self.max_queue,
+            send_timeout=self.send_timeout,
+            on_error=self._on_connection_error,
+        )
+        self.active_connections.setdefault(workflow_id, {})[websocket] = connection
+        connection.start()
+
+        await self.bus.subscribe(workflow_id)
         logger.info(f"WebSocket connected for workflow {workflow_id}")
 
     def disconnect(self, websocket: WebSocket, workflow_id: str):
@@ -43,39 +189,89 @@ class ConnectionManager:
             websocket: WebSocket connection to unregister
             workflow_id: Associated workflow ID
         """
-        if workflow_id in self.active_connections:
-            if websocket in self.active_connections[workflow_id]:
-                self.active_connections[workflow_id].remove(websocket)
-            if not self.active_connections[workflow_id]:
+        connections = self.active_connections.get(workflow_id)
+        if connections is not None:
+            connection = connections.pop(websocket, None)
+            if connection is not None:
+                connection.stop()
+                # Reference counted, so a reconnect racing this task stays subscribed
+                self._spawn(self.bus.unsubscribe(workflow_id))
+            if not connections:
                 del self.active_connections[workflow_id]
         logger.info(f"WebSocket disconnected for workflow {workflow_id}")
 
+    def _on_connection_error(self, connection: ClientConnection) -> None:
+        self.disconnect(connection.websocket, connection.workflow_id)
+
+    def _spawn(self, coro) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            return
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     async def send_message(self, workflow_id: str, message: dict):
         """
-        Send a message to all connections for a workflow.
+        Publish a message to all connections for a workflow (on any worker).
+
+        Returns once the message is queued; delivery happens in per-connection
+        writer tasks.
 
         Args:
             workflow_id: Workflow ID
             message: Message dictionary to send
         """
-        if workflow_id not in self.active_connections:
+        await self._ensure_bus()
+        await self.bus.publish(workflow_id, message, json.dumps(message))
+
+    async def send_personal(self, websocket: WebSocket, workflow_id: str, message: dict):
+        """
+        Queue a message for one connection (keeps ordering with broadcasts).
+
+        Args:
+            websocket: Target connection
+            workflow_id: Workflow the connection is registered under
+            message: Message dictionary to send
+        """
+        connection = self.active_connections.get(workflow_id, {}).get(websocket)
+        if connection is None:
+            await websocket.send_text(json.dumps(message))
             return
+        self._enqueue(connection, message.get("type", ""), json.dumps(message))
 
-        # Convert message to JSON
-        message_json = json.dumps(message)
+    async def _deliver_local(self, workflow_id: str, message: Dict[str, Any], message_json: str) -> None:
+        """Bus handler: queue a message on every local connection for the workflow."""
+        connections = self.active_connections.get(workflow_id)
+        if not connections:
+            return
+        message_type = message.get("type", "")
+        for connection in list(connections.values()):
+            self._enqueue(connection, message_type, message_json)
 
-        # Send to all connections for this workflow
-        disconnected = []
-        for connection in self.active_connections[workflow_id]:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.error(f"Error sending message: {e}")
-                disconnected.append(connection)
+    def _enqueue(self, connection: ClientConnection, message_type: str, message_json: str) -> None:
+        if not connection.enqueue(message_type, message_json):
+            logger.warning(
+                f"Disconnecting slow WebSocket client for workflow {connection.workflow_id} "
+                f"({len(connection.queue)} messages queued)"
+            )
+            self.disconnect(connection.websocket, connection.workflow_id)
+            self._spawn(connection.close(code=SLOW_CLIENT_CLOSE_CODE))
 
-        # Clean up disconnected clients
-        for connection in disconnected:
-            self.disconnect(connection, workflow_id)
+    async def close(self):
+        """Stop all writers and close the event bus (application shutdown)."""
+        writers = [
+            connection.stop()
+            for connections in self.active_connections.values()
+            for connection in connections.values()
+        ]
+        self.active_connections.clear()
+        pending = [task for task in writers if task is not None] + list(self._tasks)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self.bus.close()
+        self._bus_started = False
 
     async def broadcast_stage_start(self, workflow_id: str, stage: str, agent_name: str):
         """
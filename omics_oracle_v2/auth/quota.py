@@ -10,8 +10,6 @@ import time
 from dataclasses import dataclass
 from typing import Literal
 
-from omics_oracle_v2.cache import (check_redis_health, memory_incr, memory_ttl,
-                                   redis_incr, redis_ttl)
 from omics_oracle_v2.core.config import Settings
 
 logger = logging.getLogger(__name__)
@@ -39,6 +37,7 @@ class RateLimitInfo:
     reset_at: int
     retry_after: int | None = None
     quota_exceeded: bool = False
+    window: str = "hour"
 
 
 def get_tier_quota(tier: str, settings: Settings | None = None) -> QuotaLimits:
@@ -96,88 +95,55 @@ async def check_rate_limit(
     user_id: int | None,
     ip_address: str | None,
     tier: str = "free",
-    window: str = "hour",
+    window: str | None = None,
+    cost: int = 1,
+    limiter=None,
 ) -> RateLimitInfo:
     """
     Check rate limit for a user or IP address.
 
+    Hourly and daily quotas are checked and consumed together in one atomic
+    step (see omics_oracle_v2.auth.rate_limiter).
+
     Args:
         user_id: User ID (None for anonymous)
         ip_address: Client IP address (used for anonymous users)
         tier: User tier (free, pro, enterprise)
-        window: Time window (hour or day)
+        window: Only enforce this window (hour or day); None enforces both
+        cost: Request credits consumed (see get_endpoint_cost)
+        limiter: RateLimiter to use (default: shared process-wide limiter)
 
     Returns:
-        RateLimitInfo with current quota status
+        RateLimitInfo for the most constrained window
 
     Example:
         >>> info = await check_rate_limit(user_id=123, ip_address="1.2.3.4", tier="pro")
         >>> if info.quota_exceeded:
         >>>     return 429  # Too Many Requests
     """
-    settings = Settings()
-    quota = get_tier_quota(tier if user_id else "anonymous", settings)
+    from omics_oracle_v2.auth.rate_limiter import WINDOWS, get_rate_limiter
 
-    # Determine limit based on window
-    limit = quota.requests_per_hour if window == "hour" else quota.requests_per_day
-    window_seconds = 3600 if window == "hour" else 86400
+    limiter = limiter or get_rate_limiter()
+    windows = (window,) if window else tuple(WINDOWS)
 
-    # Build cache key
+    # Build client identity
     if user_id:
-        key = f"ratelimit:user:{user_id}:{window}"
+        subject = f"user:{user_id}"
     elif ip_address:
-        key = f"ratelimit:ip:{ip_address}:{window}"
+        subject = f"ip:{ip_address}"
     else:
         # Shouldn't happen, but handle gracefully
         logger.warning("check_rate_limit called with no user_id or ip_address")
+        quota = limiter.get_quota("anonymous")
         return RateLimitInfo(
-            limit=limit,
+            limit=quota.requests_per_hour,
             remaining=0,
-            reset_at=int(time.time()) + window_seconds,
+            reset_at=int(time.time()) + WINDOWS[windows[0]],
             quota_exceeded=True,
+            window=windows[0],
         )
 
-    # Try Redis first, fall back to memory
-    redis_available = await check_redis_health()
-
-    if redis_available:
-        # Use Redis
-        count = await redis_incr(key, expire=window_seconds)
-        ttl = await redis_ttl(key)
-
-        if count is None or ttl is None:
-            # Redis error, fall back to memory
-            logger.warning("Redis operation failed, using memory fallback")
-            count = await memory_incr(key, expire=window_seconds)
-            ttl = await memory_ttl(key)
-            if ttl is None:
-                ttl = window_seconds
-    else:
-        # Use memory fallback
-        count = await memory_incr(key, expire=window_seconds)
-        ttl = await memory_ttl(key)
-        if ttl is None:
-            ttl = window_seconds
-
-    # Calculate reset time
-    reset_at = int(time.time()) + max(ttl, 0)
-
-    # Calculate remaining requests
-    remaining = max(0, limit - count)
-
-    # Check if quota exceeded
-    quota_exceeded = count > limit
-
-    # Calculate retry_after if quota exceeded
-    retry_after = ttl if quota_exceeded else None
-
-    return RateLimitInfo(
-        limit=limit,
-        remaining=remaining,
-        reset_at=reset_at,
-        retry_after=retry_after,
-        quota_exceeded=quota_exceeded,
-    )
+    return await limiter.check(subject, tier=tier if user_id else "anonymous", cost=cost, windows=windows)
 
 
 def get_endpoint_cost(path: str, method: str = "GET") -> int:
@@ -0,0 +1,399 @@
+"""
+Rate limiting engine.
+
+Enforces the hourly and daily quotas of a client in one atomic step using
+GCRA (generic cell rate algorithm):
+- Redis: a single EVALSHA of a Lua script checks and updates every window
+- Local: the same algorithm in-process (local-only mode, or Redis fallback)
+- CircuitBreaker: after repeated Redis failures Redis is skipped for a
+  cool-down period instead of being probed on every request
+- IdentityCache: short-TTL cache of credential -> (user_id, tier), so
+  authenticated requests do not hit the database every time
+
+GCRA keeps one "theoretical arrival time" per client and window. Capacity
+refills continuously (a limit of 100/hour frees one request every 36s),
+so there is no fixed-window edge where a client can send 2x its quota.
+Rejected requests do not consume quota.
+
+Usage:
+    limiter = get_rate_limiter()
+    info = await limiter.check("user:42", tier="pro", cost=2)
+    if info.quota_exceeded:
+        ...  # 429 with Retry-After: info.retry_after
+"""
+
+import hashlib
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from omics_oracle_v2.auth.quota import QuotaLimits, RateLimitInfo, get_tier_quota
+from omics_oracle_v2.cache import get_redis_client
+from omics_oracle_v2.core.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+# Window name -> length in seconds
+WINDOWS: Dict[str, int] = {"hour": 3600, "day": 86400}
+
+# KEYS[i]: GCRA state (theoretical arrival time, ms) for window i
+# ARGV[1]: now (ms), ARGV[2]: cost, then (limit, period_ms) for each key
+# Returns: {allowed, retry_after_ms, remaining_1, reset_after_ms_1, ...}
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local allowed = 1
+local retry_after = 0
+local tats = {}
+
+for i = 1, #KEYS do
+    local limit = tonumber(ARGV[1 + 2 * i])
+    local period = tonumber(ARGV[2 + 2 * i])
+    local tat = tonumber(redis.call('GET', KEYS[i]) or now)
+    if tat < now then
+        tat = now
+    end
+    tats[i] = tat
+    local allow_at = tat + cost * period / limit - period
+    if allow_at > now then
+        allowed = 0
+        retry_after = math.max(retry_after, allow_at - now)
+    end
+end
+
+local result = {allowed, math.ceil(retry_after)}
+for i = 1, #KEYS do
+    local limit = tonumber(ARGV[1 + 2 * i])
+    local period = tonumber(ARGV[2 + 2 * i])
+    local interval = period / limit
+    local tat = tats[i]
+    if allowed == 1 then
+        tat = tat + cost * interval
+        redis.call('SET', KEYS[i], tostring(tat), 'PX', math.ceil(tat - now))
+    end
+    -- Small epsilon absorbs floating-point error in the division
+    result[#result + 1] = math.floor((period - (tat - now)) / interval + 1e-6)
+    result[#result + 1] = math.ceil(tat - now)
+end
+return result
+"""
+
+# (key, limit, period_seconds)
+WindowSpec = Tuple[str, int, int]
+
+
+@dataclass
+class GCRAResult:
+    """Outcome of one rate limit check across all windows."""
+
+    allowed: bool
+    retry_after: float  # Seconds until the request would be allowed
+    windows: List[Tuple[int, float]]  # (remaining, seconds until fully reset) per window
+
+
+class LocalGCRA:
+    """
+    In-process GCRA state (mirrors GCRA_SCRIPT).
+
+    Per-process only: in multi-instance deployments each instance enforces
+    its own copy of the quota.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._tats: Dict[str, float] = {}
+
+    def check(self, specs: Sequence[WindowSpec], cost: int, now: float) -> GCRAResult:
+        """Check and (if allowed) consume cost in every window."""
+        tats = []
+        allowed = True
+        retry_after = 0.0
+
+        for key, limit, period in specs:
+            tat = max(self._tats.get(key, now), now)
+            tats.append(tat)
+            allow_at = tat + cost * period / limit - period
+            if allow_at > now:
+                allowed = False
+                retry_after = max(retry_after, allow_at - now)
+
+        windows = []
+        for (key, limit, period), tat in zip(specs, tats):
+            interval = period / limit
+            if allowed:
+                tat += cost * interval
+                self._tats[key] = tat
+            windows.append((math.floor((period - (tat - now)) / interval + 1e-6), tat - now))
+
+        if len(self._tats) > self.max_keys:
+            self._evict(now)
+
+        return GCRAResult(allowed=allowed, retry_after=retry_after, windows=windows)
+
+    def _evict(self, now: float) -> None:
+        """Drop fully replenished keys (equivalent to absent keys)."""
+        self._tats = {key: tat for key, tat in self._tats.items() if tat > now}
+
+    def clear(self) -> None:
+        self._tats.clear()
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after failure_threshold failures; open -> half-open after
+    reset_timeout seconds, when a single trial call is let through. A
+    successful trial closes the breaker, a failed one re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        """Return True if the protected call should be attempted."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self._opened_at is not None:
+            logger.info("[OK] Redis rate limiting recovered, circuit closed")
+        self.failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_in_flight or (self._opened_at is None and self.failures >= self.failure_threshold):
+            logger.warning(
+                f"[X] Redis rate limiting unavailable, using local limits for {self.reset_timeout:.0f}s"
+            )
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+class IdentityCache:
+    """
+    Short-TTL LRU cache of credential -> identity.
+
+    Keys are SHA-256 digests, so raw tokens and API keys are not kept in memory.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(credential: str) -> str:
+        return hashlib.sha256(credential.encode()).hexdigest()
+
+    def get(self, credential: str) -> Tuple[bool, Any]:
+        """
+        Look up a credential.
+
+        Returns:
+            (found, identity) - identity may be None for cached negative lookups
+        """
+        key = self._key(credential)
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[0]
+
+    def set(self, credential: str, identity: Any, ttl: Optional[float] = None) -> None:
+        """Cache an identity (ttl defaults to self.ttl; values <= 0 skip caching)."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        key = self._key(credential)
+        self._entries[key] = (identity, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RateLimiter:
+    """
+    Tier-aware rate limiter over hour and day windows.
+
+    Uses Redis (one script call per check) unless local_only is set or the
+    circuit breaker is open, in which case the in-process GCRA is used.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        redis: Any = None,
+        local_only: Optional[bool] = None,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            settings: Application settings (default: get_settings())
+            redis: Redis client to use (default: shared client from get_redis_client)
+            local_only: Override settings.rate_limit.local_only
+        """
+        self.settings = settings or get_settings()
+        rate_limit = self.settings.rate_limit
+        self.local_only = rate_limit.local_only if local_only is None else local_only
+
+        self._redis = redis
+        self._script = None
+        self._script_client = None
+        self._local = LocalGCRA()
+        self._quotas: Dict[str, QuotaLimits] = {}
+
+        self.breaker = CircuitBreaker(
+            failure_threshold=rate_limit.circuit_breaker_failures,
+            reset_timeout=rate_limit.circuit_breaker_reset_seconds,
+        )
+        self.identities = IdentityCache(
+            ttl=rate_limit.identity_cache_ttl,
+            max_size=rate_limit.identity_cache_size,
+        )
+
+    def get_quota(self, tier: str) -> QuotaLimits:
+        """Quota limits for a tier (computed once per tier)."""
+        quota = self._quotas.get(tier)
+        if quota is None:
+            quota = self._quotas[tier] = get_tier_quota(tier, self.settings)
+        return quota
+
+    async def check(
+        self,
+        subject: str,
+        tier: str = "free",
+        cost: int = 1,
+        windows: Sequence[str] = ("hour", "day"),
+    ) -> RateLimitInfo:
+        """
+        Check and consume quota for a client.
+
+        Args:
+            subject: Client identity (e.g., "user:<id>" or "ip:<address>")
+            tier: User tier (selects limits)
+            cost: Request credits this request consumes
+            windows: Windows to enforce (all are checked atomically)
+
+        Returns:
+            RateLimitInfo for the most constrained window
+        """
+        quota = self.get_quota(tier)
+        limits = {"hour": quota.requests_per_hour, "day": quota.requests_per_day}
+        # Hash tag keeps all windows of a subject in one Redis Cluster slot
+        specs = [(f"ratelimit:{{{subject}}}:{window}", limits[window], WINDOWS[window]) for window in windows]
+
+        now = time.time()
+        result = None
+        if not self.local_only and self.breaker.allow_request():
+            result = await self._check_redis(specs, cost, now)
+        if result is None:
+            result = self._local.check(specs, cost, now)
+
+        return self._to_info(windows, specs, result, now)
+
+    async def _check_redis(self, specs: Sequence[WindowSpec], cost: int, now: float) -> Optional[GCRAResult]:
+        """Run GCRA_SCRIPT (one round trip); None if Redis is unavailable."""
+        try:
+            redis = self._redis or await get_redis_client()
+            if redis is None:
+                self.breaker.record_failure()
+                return None
+
+            if self._script is None or self._script_client is not redis:
+                self._script = redis.register_script(GCRA_SCRIPT)
+                self._script_client = redis
+
+            args: List[Any] = [int(now * 1000), cost]
+            for _, limit, period in specs:
+                args.extend([limit, period * 1000])
+            raw = await self._script(keys=[key for key, _, _ in specs], args=args)
+        except Exception as e:
+            logger.warning(f"Redis rate limit check failed: {e}")
+            self.breaker.record_failure()
+            return None
+
+        self.breaker.record_success()
+        values = [int(value) for value in raw]
+        return GCRAResult(
+            allowed=bool(values[0]),
+            retry_after=values[1] / 1000,
+            windows=[(values[i], values[i + 1] / 1000) for i in range(2, len(values), 2)],
+        )
+
+    @staticmethod
+    def _to_info(
+        windows: Sequence[str], specs: Sequence[WindowSpec], result: GCRAResult, now: float
+    ) -> RateLimitInfo:
+        # Report the window with the fewest remaining requests
+        index = min(range(len(specs)), key=lambda i: result.windows[i][0])
+        remaining, reset_after = result.windows[index]
+        return RateLimitInfo(
+            limit=specs[index][1],
+            remaining=max(0, remaining),
+            reset_at=int(math.ceil(now + reset_after)),
+            retry_after=None if result.allowed else max(1, math.ceil(result.retry_after)),
+            quota_exceeded=not result.allowed,
+            window=windows[index],
+        )
+
+    def reset_local(self) -> None:
+        """Clear in-process limiter and identity state (tests)."""
+        self._local.clear()
+        self.identities.clear()
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the shared process-wide RateLimiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+# Export public API
+__all__ = [
+    "GCRA_SCRIPT",
+    "WINDOWS",
+    "CircuitBreaker",
+    "IdentityCache",
+    "LocalGCRA",
+    "RateLimiter",
+    "get_rate_limiter",
+]
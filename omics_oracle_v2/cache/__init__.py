@@ -7,8 +7,10 @@ Provides unified caching system:
 - fallback: In-memory cache when Redis unavailable
 - parsed_cache: 2-tier cache for parsed PDF/XML content (Redis + Disk)
 - discovery_cache: Citation discovery results cache (Memory + SQLite)
+- url_cache: Per-source URL collection results cache (Memory + Redis)
 - cache_db: Metadata index for full-text cache analytics
 - smart_cache: Multi-directory file locator for PDFs/XMLs
+- soft_cache: Byte-budgeted LRU manager for GEOparse SOFT files
 
 Architecture:
 - API layer -> redis_client (simple key-value operations)
@@ -31,8 +33,10 @@ from omics_oracle_v2.cache.redis_client import (check_redis_health,
 # Lazy imports to avoid circular dependencies
 # Use: from omics_oracle_v2.cache.parsed_cache import ParsedCache
 # Use: from omics_oracle_v2.cache.discovery_cache import DiscoveryCache
+# Use: from omics_oracle_v2.cache.url_cache import URLCollectionCache
 # Use: from omics_oracle_v2.cache.cache_db import FullTextCacheDB
 # Use: from omics_oracle_v2.cache.smart_cache import SmartCache
+# Use: from omics_oracle_v2.cache.soft_cache import SOFTCacheManager
 
 __all__ = [
     # Domain cache (search, GEO, publications)
@@ -57,5 +61,6 @@ __all__ = [
     "memory_size",
     "memory_cleanup",
     # Pipeline caches (use direct imports to avoid circular dependencies)
-    # "ParsedCache", "DiscoveryCache", "FullTextCacheDB", "SmartCache"
+    # "ParsedCache", "DiscoveryCache", "URLCollectionCache", "FullTextCacheDB", "SmartCache",
+    # "SOFTCacheManager"
 ]
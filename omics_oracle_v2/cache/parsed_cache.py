@@ -35,6 +35,7 @@ Author: OmicsOracle Team
 Date: October 11, 2025
 """
 
+import asyncio
 import gzip
 import json
 import logging
@@ -238,12 +239,8 @@ class ParsedCache:
                 return None
 
         try:
-            # Load cache file
-            if cache_file.suffix == ".gz":
-                with gzip.open(cache_file, "rt", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = json.loads(cache_file.read_text(encoding="utf-8"))
+            # Load cache file (off the event loop, so concurrent gets overlap)
+            data = await asyncio.to_thread(self._read_cache_file, cache_file)
 
             # Check if stale
             if self._is_stale(data):
@@ -667,6 +664,14 @@ class ParsedCache:
             "redis_hot_tier": redis_stats,  # PHASE 4
         }
 
+    @staticmethod
+    def _read_cache_file(cache_file: Path) -> Dict[str, Any]:
+        """Read a (possibly gzip-compressed) JSON cache file."""
+        if cache_file.suffix == ".gz":
+            with gzip.open(cache_file, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+
     def _get_cache_path(self, publication_id: str, compressed: bool = True) -> Path:
         """Get path for cache file."""
         filename = f"{publication_id}.json"
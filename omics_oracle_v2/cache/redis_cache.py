@@ -20,7 +20,7 @@ Benefits:
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     import redis
@@ -538,12 +538,17 @@ class RedisCache:
             logger.error(f"Error batch caching GEO datasets: {e}")
             return 0
 
-    async def get_optimized_query(self, query: str) -> Optional[Dict[str, Any]]:
+    def _optimized_query_key(self, query: str, version: str = "") -> str:
+        content = f"{version}:{query}" if version else query
+        return self._make_key("query_opt", hashlib.md5(content.encode()).hexdigest())
+
+    async def get_optimized_query(self, query: str, version: str = "") -> Optional[Dict[str, Any]]:
         """
         Get cached query optimization result.
 
         Args:
             query: Original query
+            version: Optimizer model version tag (part of the cache key)
 
         Returns:
             Cached optimization or None
@@ -552,24 +557,60 @@ class RedisCache:
             return None
 
         try:
-            query_hash = hashlib.md5(query.encode()).hexdigest()
-            key = self._make_key("query_opt", query_hash)
+            key = self._optimized_query_key(query, version)
 
             result = self.client.get(key)
             if result:
+                self.metrics.record_hit()
                 logger.debug(f"Cache HIT for query optimization: {query[:50]}")
                 return json.loads(result)
             else:
+                self.metrics.record_miss()
                 return None
         except Exception as e:
+            self.metrics.record_error()
             logger.error(f"Error getting cached query optimization: {e}")
             return None
 
+    async def get_optimized_queries_batch(
+        self, queries: List[str], version: str = ""
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached optimization results for many queries in one round trip.
+
+        Args:
+            queries: Original queries
+            version: Optimizer model version tag (part of the cache key)
+
+        Returns:
+            Dict mapping query to cached optimization (hits only)
+        """
+        if not self.enabled or not self.client or not queries:
+            return {}
+
+        try:
+            keys = [self._optimized_query_key(query, version) for query in queries]
+            values = self.client.mget(keys)
+
+            results = {}
+            for query, value in zip(queries, values):
+                if value:
+                    self.metrics.record_hit()
+                    results[query] = json.loads(value)
+                else:
+                    self.metrics.record_miss()
+            return results
+        except Exception as e:
+            self.metrics.record_error()
+            logger.error(f"Error batch getting cached query optimizations: {e}")
+            return {}
+
     async def set_optimized_query(
         self,
         query: str,
         optimization: Any,
         ttl: Optional[int] = None,
+        version: str = "",
     ) -> bool:
         """
         Cache query optimization result.
@@ -578,6 +619,7 @@ class RedisCache:
             query: Original query
             optimization: OptimizedQuery object
             ttl: Time to live in seconds
+            version: Optimizer model version tag (part of the cache key)
 
         Returns:
             True if cached successfully
@@ -586,8 +628,7 @@ class RedisCache:
             return False
 
         try:
-            query_hash = hashlib.md5(query.encode()).hexdigest()
-            key = self._make_key("query_opt", query_hash)
+            key = self._optimized_query_key(query, version)
 
             # Convert to JSON
             if hasattr(optimization, "to_dict"):
@@ -600,10 +641,12 @@ class RedisCache:
             # Set with TTL
             ttl = ttl or self.TTL_QUERY_OPTIMIZATION
             self.client.setex(key, ttl, opt_json)
+            self.metrics.record_set()
 
             logger.debug(f"Cached query optimization: {query[:50]} (TTL={ttl}s)")
             return True
         except Exception as e:
+            self.metrics.record_error()
             logger.error(f"Error caching query optimization: {e}")
             return False
 
@@ -733,6 +776,79 @@ class RedisCache:
             logger.error(f"Error caching value for key {key}: {e}")
             return False
 
+    async def get_many(self, keys: list[str]) -> Dict[str, Optional[Any]]:
+        """
+        Generic batch get (single MGET round trip).
+
+        Args:
+            keys: Cache keys (used as-is, like get())
+
+        Returns:
+            Dict mapping key -> cached value (None if not cached)
+        """
+        if not self.enabled or not self.client or not keys:
+            return {key: None for key in keys}
+
+        try:
+            results = self.client.mget(keys)
+
+            values = {}
+            for key, result in zip(keys, results):
+                if result:
+                    self.metrics.record_hit()
+                    values[key] = json.loads(result)
+                else:
+                    self.metrics.record_miss()
+                    values[key] = None
+            return values
+        except Exception as e:
+            self.metrics.record_error()
+            logger.error(f"Error batch getting {len(keys)} keys: {e}")
+            return {key: None for key in keys}
+
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        ttls: Optional[Dict[str, int]] = None,
+    ) -> int:
+        """
+        Generic batch set (single pipelined round trip).
+
+        Args:
+            items: Dict mapping key -> value (JSON serialized)
+            ttl: Default TTL in seconds (default: self.default_ttl)
+            ttls: Optional per-key TTL overrides
+
+        Returns:
+            Number of values successfully queued and written
+        """
+        if not self.enabled or not self.client or not items:
+            return 0
+
+        try:
+            ttls = ttls or {}
+            default_ttl = ttl or self.default_ttl
+            pipe = self.client.pipeline()
+            count = 0
+
+            for key, value in items.items():
+                try:
+                    value_json = json.dumps(value, default=str)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Failed to serialize value for key {key}: {e}")
+                    continue
+                pipe.setex(key, ttls.get(key, default_ttl), value_json)
+                self.metrics.record_set()
+                count += 1
+
+            pipe.execute()
+            return count
+        except Exception as e:
+            self.metrics.record_error()
+            logger.error(f"Error batch caching {len(items)} values: {e}")
+            return 0
+
     def close(self):
         """Close Redis connection."""
         if self.client:
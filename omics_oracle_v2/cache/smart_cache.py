@@ -11,6 +11,8 @@ Key Features:
 - Source-specific file organization
 - Automatic file type detection
 - Extensible for future parsed content caching
+- Filesystem index: one directory scan instead of per-lookup stat() probes,
+  optionally persisted to SQLite (unchanged directories are not rescanned)
 
 Storage Structure:
     data/fulltext/
@@ -37,6 +39,9 @@ Example:
     >>> if result.found:
     >>>     print(f"Found {result.file_type} at {result.file_path}")
     >>>     print(f"Source: {result.source}, Size: {result.size_bytes}")
+    >>>
+    >>> # Batch lookup (index built once, no filesystem access per paper)
+    >>> results = cache.find_local_files(publications)
 
 Author: OmicsOracle Team
 Date: October 11, 2025
@@ -44,9 +49,12 @@ Date: October 11, 2025
 
 import hashlib
 import logging
+import os
+import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -86,20 +94,39 @@ class SmartCache:
     - XML parsing is more accurate (99-100% vs 95-99% for PDFs)
     - XML is faster to parse (no OCR, no table detection needed)
 
+    Lookups go through an in-memory index of cached files (per directory:
+    filename -> size) built by a single scan of the storage tree. Each
+    lookup stats the candidate directories once (as the exists() checks
+    did) and rescans only those whose mtime changed, so files written or
+    removed by the download manager or another process are seen, and no
+    file is stat'ed. With index_db set, the index is persisted to SQLite
+    and directories whose mtime has not changed are not rescanned on the
+    next start.
+
     Attributes:
         base_dir: Base directory for fulltext storage (default: data/fulltext)
         pdf_dir: Directory for PDF storage
         xml_dir: Directory for XML storage
         parsed_dir: Directory for parsed content cache (future)
+        use_index: Whether lookups use the filesystem index
+        index_db: Optional SQLite file for persisting the index
     """
 
-    def __init__(self, base_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        use_index: bool = True,
+        index_db: Optional[Path] = None,
+    ):
         """
         Initialize SmartCache.
 
         Args:
             base_dir: Base directory for fulltext storage.
                      Defaults to 'data/fulltext' in project root.
+            use_index: Use the filesystem index for lookups (default: True).
+                      When False, every lookup probes the filesystem.
+            index_db: SQLite file to persist the index (default: in-memory only)
         """
         if base_dir is None:
             # Default to data/fulltext in project root
@@ -115,6 +142,317 @@ class SmartCache:
         self.xml_dir.mkdir(parents=True, exist_ok=True)
         self.parsed_dir.mkdir(parents=True, exist_ok=True)
 
+        self.use_index = use_index
+        self.index_db = Path(index_db) if index_db else None
+
+        # Filesystem index: relative directory ("pdf/arxiv") -> {filename: size},
+        # with the directory mtime each listing was taken at. Built lazily on
+        # first lookup; only non-empty files are indexed.
+        self._index: Optional[Dict[str, Dict[str, int]]] = None
+        self._dir_mtimes: Dict[str, float] = {}
+        self._index_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Filesystem index
+    # ------------------------------------------------------------------
+
+    def build_index(self, force: bool = False) -> int:
+        """
+        Build the filesystem index (no-op if already built).
+
+        Scans xml/, pdf/ and their source subdirectories once. When index_db
+        is set, the persisted index is loaded first and only directories whose
+        mtime changed since the last scan are listed again.
+
+        Args:
+            force: Rebuild even if the index is already loaded
+
+        Returns:
+            Number of indexed files
+        """
+        with self._index_lock:
+            if self._index is not None and not force:
+                return self._indexed_count()
+
+            stored_files, stored_dirs = {}, {}
+            if self.index_db and not force:
+                stored_files, stored_dirs = self._load_persisted_index()
+
+            index: Dict[str, Dict[str, int]] = {}
+            dir_mtimes: Dict[str, float] = {}
+            rescanned = 0
+
+            for top in (self.xml_dir, self.pdf_dir):
+                pending = [(top, True)]
+                while pending:
+                    directory, descend = pending.pop()
+                    rel_dir = directory.relative_to(self.base_dir).as_posix()
+                    try:
+                        mtime = directory.stat().st_mtime
+                    except OSError:
+                        continue
+                    dir_mtimes[rel_dir] = mtime
+
+                    if stored_dirs.get(rel_dir) == mtime:
+                        files = stored_files.get(rel_dir, {})
+                        subdirs = [
+                            self.base_dir / d
+                            for d in stored_dirs
+                            if d.rpartition("/")[0] == rel_dir
+                        ]
+                    else:
+                        files, subdirs = self._scan_directory(directory)
+                        rescanned += 1
+
+                    index[rel_dir] = files
+                    if descend:
+                        pending.extend((subdir, False) for subdir in subdirs)
+
+            self._index = index
+            self._dir_mtimes = dir_mtimes
+
+            if self.index_db:
+                self._persist_index(index, dir_mtimes)
+
+            logger.debug(
+                f"SmartCache index built: {self._indexed_count()} files, "
+                f"{rescanned}/{len(dir_mtimes)} directories scanned"
+            )
+            return self._indexed_count()
+
+    def refresh_index(self) -> int:
+        """
+        Rebuild the whole index (lookups already refresh changed directories).
+
+        Returns:
+            Number of indexed files
+        """
+        if self.index_db:
+            # Persisted directory mtimes let unchanged directories be skipped
+            with self._index_lock:
+                self._index = None
+            return self.build_index()
+        return self.build_index(force=True)
+
+    def _indexed_count(self) -> int:
+        return sum(len(files) for files in self._index.values())
+
+    def _scan_directory(self, directory: Path) -> Tuple[Dict[str, int], List[Path]]:
+        """List one directory: non-empty files with sizes, and subdirectories."""
+        files: Dict[str, int] = {}
+        subdirs: List[Path] = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            subdirs.append(Path(entry.path))
+                        elif entry.is_file():
+                            size = entry.stat().st_size
+                            if size > 0:
+                                files[entry.name] = size
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Could not scan {directory}: {e}")
+        return files, subdirs
+
+    def _connect_index_db(self) -> sqlite3.Connection:
+        self.index_db.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_db))
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS file_index (
+                path TEXT PRIMARY KEY,
+                dir TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS dir_state (
+                dir TEXT PRIMARY KEY,
+                mtime REAL NOT NULL
+            );
+            """
+        )
+        return conn
+
+    def _load_persisted_index(
+        self,
+    ) -> Tuple[Dict[str, Dict[str, int]], Dict[str, float]]:
+        """Load persisted index as ({dir: {name: size}}, {dir: mtime})."""
+        files: Dict[str, Dict[str, int]] = {}
+        dirs: Dict[str, float] = {}
+        try:
+            conn = self._connect_index_db()
+            try:
+                for path, rel_dir, size in conn.execute(
+                    "SELECT path, dir, size_bytes FROM file_index"
+                ):
+                    files.setdefault(rel_dir, {})[path.rpartition("/")[2]] = size
+                dirs = dict(conn.execute("SELECT dir, mtime FROM dir_state"))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load SmartCache index from {self.index_db}: {e}")
+            return {}, {}
+        return files, dirs
+
+    def _persist_index(
+        self, index: Dict[str, Dict[str, int]], dir_mtimes: Dict[str, float]
+    ):
+        """Replace the persisted index in a single transaction."""
+        try:
+            conn = self._connect_index_db()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM file_index")
+                    conn.execute("DELETE FROM dir_state")
+                    conn.executemany(
+                        "INSERT INTO file_index (path, dir, size_bytes) VALUES (?, ?, ?)",
+                        [
+                            (f"{rel_dir}/{name}", rel_dir, size)
+                            for rel_dir, files in index.items()
+                            for name, size in files.items()
+                        ],
+                    )
+                    conn.executemany(
+                        "INSERT INTO dir_state (dir, mtime) VALUES (?, ?)",
+                        list(dir_mtimes.items()),
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not persist SmartCache index to {self.index_db}: {e}")
+
+    def _persist_directory(
+        self, rel_dir: str, files: Optional[Dict[str, int]], mtime: Optional[float]
+    ):
+        """Replace the persisted entries of one directory (files=None drops it)."""
+        try:
+            conn = self._connect_index_db()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM file_index WHERE dir = ?", (rel_dir,))
+                    conn.execute("DELETE FROM dir_state WHERE dir = ?", (rel_dir,))
+                    if files is not None:
+                        conn.executemany(
+                            "INSERT INTO file_index (path, dir, size_bytes) VALUES (?, ?, ?)",
+                            [(f"{rel_dir}/{name}", rel_dir, size) for name, size in files.items()],
+                        )
+                        conn.execute(
+                            "INSERT INTO dir_state (dir, mtime) VALUES (?, ?)", (rel_dir, mtime)
+                        )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Could not persist index for {rel_dir}: {e}")
+
+    def _index_file(self, file_path: Path, size: int) -> None:
+        """Add a newly written file to the index (and persisted index)."""
+        if self._index is None:
+            return  # Will be picked up by the first scan
+
+        try:
+            rel_path = Path(file_path).relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return  # Outside the cache tree
+        rel_dir, _, name = rel_path.rpartition("/")
+        with self._index_lock:
+            self._index.setdefault(rel_dir, {})[name] = size
+
+        if self.index_db:
+            try:
+                conn = self._connect_index_db()
+                try:
+                    with conn:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO file_index (path, dir, size_bytes) "
+                            "VALUES (?, ?, ?)",
+                            (rel_path, rel_dir, size),
+                        )
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                logger.debug(f"Could not persist index entry {rel_path}: {e}")
+
+    def _dir_files(self, directory: Path) -> Optional[Dict[str, int]]:
+        """
+        Indexed files of one directory (name -> size), or None if it is missing.
+
+        Costs one stat() of the directory, like the exists() check it
+        replaces. A directory whose mtime changed since it was indexed (files
+        added, removed or renamed by anyone) is rescanned; one that can no
+        longer be stat'ed is dropped from the index. Without the index this
+        is only the exists() check, and an existing directory gives {}.
+        """
+        if not self.use_index:
+            return {} if directory.exists() else None
+
+        if self._index is None:
+            self.build_index()
+        try:
+            rel_dir = directory.relative_to(self.base_dir).as_posix()
+        except ValueError:
+            return None
+
+        try:
+            mtime = directory.stat().st_mtime
+        except OSError:
+            with self._index_lock:
+                dropped = self._index.pop(rel_dir, None) is not None
+                self._dir_mtimes.pop(rel_dir, None)
+            if dropped and self.index_db:
+                self._persist_directory(rel_dir, None, None)
+            return None
+
+        with self._index_lock:
+            files = self._index.get(rel_dir)
+            if files is not None and self._dir_mtimes.get(rel_dir) == mtime:
+                return files
+
+        files, _ = self._scan_directory(directory)
+        with self._index_lock:
+            self._index[rel_dir] = files
+            self._dir_mtimes[rel_dir] = mtime
+        if self.index_db:
+            self._persist_directory(rel_dir, files, mtime)
+        return files
+
+    def _file_size(self, path: Path, files: Optional[Dict[str, int]] = None) -> Optional[int]:
+        """
+        Get size of a cached file, or None if missing/empty.
+
+        With the index this is an in-memory lookup in `files` (the result of
+        _dir_files() for path's directory, looked up if not given). Without
+        it, the file is stat'ed.
+        """
+        if self.use_index:
+            if files is None:
+                files = self._dir_files(path.parent) or {}
+            return files.get(path.name)
+
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return None
+        return size if size > 0 else None
+
+    def find_local_files(self, publications: List) -> List[LocalFileResult]:
+        """
+        Batch lookup of local files for many publications.
+
+        The index is built once up front, so the whole batch is resolved
+        in memory.
+
+        Args:
+            publications: List of Publication objects
+
+        Returns:
+            List of LocalFileResult in the same order as publications
+        """
+        if self.use_index:
+            self.build_index()
+        return [self.find_local_file(publication) for publication in publications]
+
     def find_local_file(self, publication) -> LocalFileResult:
         """
         Search for any locally stored file for this publication.
@@ -196,7 +534,8 @@ class SmartCache:
 
         # PMC XML files
         pmc_xml_dir = self.xml_dir / "pmc"
-        if pmc_xml_dir.exists():
+        xml_files = self._dir_files(pmc_xml_dir)
+        if xml_files is not None:
             for id_type, id_value in ids_to_check:
                 # Only check PMC/PMID identifiers for PMC XML
                 if id_type in ["pmc", "pmid"]:
@@ -211,16 +550,17 @@ class SmartCache:
 
                     for pattern in patterns:
                         xml_path = pmc_xml_dir / pattern
-                        if xml_path.exists() and xml_path.stat().st_size > 0:
+                        size = self._file_size(xml_path, xml_files)
+                        if size:
                             logger.info(
-                                f"[OK] Found local PMC XML: {xml_path.name} ({xml_path.stat().st_size // 1024} KB)"
+                                f"[OK] Found local PMC XML: {xml_path.name} ({size // 1024} KB)"
                             )
                             return LocalFileResult(
                                 found=True,
                                 file_path=xml_path,
                                 file_type="nxml",
                                 source="pmc_xml",
-                                size_bytes=xml_path.stat().st_size,
+                                size_bytes=size,
                             )
 
         # Future: Check other XML sources (bioRxiv, etc.)
@@ -264,7 +604,8 @@ class SmartCache:
 
         # Check each location
         for source, location in pdf_locations:
-            if not location.exists():
+            files = self._dir_files(location)
+            if files is None:
                 continue
 
             # Try each identifier in this location
@@ -278,31 +619,33 @@ class SmartCache:
 
                 # Check if file exists
                 pdf_path = location / f"{id_value}.pdf"
-                if pdf_path.exists() and pdf_path.stat().st_size > 0:
+                size = self._file_size(pdf_path, files)
+                if size:
                     logger.info(
-                        f"[OK] Found local PDF: {source}/{pdf_path.name} ({pdf_path.stat().st_size // 1024} KB)"
+                        f"[OK] Found local PDF: {source}/{pdf_path.name} ({size // 1024} KB)"
                     )
                     return LocalFileResult(
                         found=True,
                         file_path=pdf_path,
                         file_type="pdf",
                         source=source,
-                        size_bytes=pdf_path.stat().st_size,
+                        size_bytes=size,
                     )
 
         # FALLBACK: Check hash-based cache (legacy system)
         # This is for backwards compatibility with old cached files
         hash_path = self._get_hash_cache_path(publication)
-        if hash_path and hash_path.exists() and hash_path.stat().st_size > 0:
+        size = self._file_size(hash_path) if hash_path else None
+        if size:
             logger.info(
-                f"[OK] Found legacy cached PDF: {hash_path.name} ({hash_path.stat().st_size // 1024} KB)"
+                f"[OK] Found legacy cached PDF: {hash_path.name} ({size // 1024} KB)"
             )
             return LocalFileResult(
                 found=True,
                 file_path=hash_path,
                 file_type="pdf",
                 source="cache",
-                size_bytes=hash_path.stat().st_size,
+                size_bytes=size,
             )
 
         return LocalFileResult(found=False)
@@ -381,6 +724,8 @@ class SmartCache:
         # Save file
         file_path = base_dir / filename
         file_path.write_bytes(content)
+        if content:
+            self._index_file(file_path, len(content))
 
         logger.info(
             f"[SAVED] Saved {file_type.upper()} to: {source}/{filename} ({len(content) // 1024} KB)"
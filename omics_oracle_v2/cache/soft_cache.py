@@ -0,0 +1,284 @@
+"""
+GEOparse SOFT File Cache Manager
+
+GEOparse get_GEO(destdir=...) leaves a multi-MB GSE*_family.soft.gz behind
+for every dataset it parses. This manager keeps that directory within a
+byte budget:
+
+- Entries are tracked in a small SQLite index (no directory globbing)
+- LRU eviction by last access once the budget is exceeded
+- Datasets being downloaded or parsed are pinned and never evicted
+- Eviction runs in a background thread after inserts
+- Free disk space is respected as well as the byte budget
+
+Usage:
+    cache = SOFTCacheManager(".cache/geo", max_bytes=5 * 1024**3)
+
+    with cache.pin("GSE12345"):
+        gse = get_GEO("GSE12345", destdir=str(cache.cache_dir))
+        cache.record("GSE12345")      # index the file, evict in background
+"""
+
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# File names GEOparse writes for an accession, by accession type
+SOFT_FILE_PATTERNS = {
+    "GSE": ["{geo_id}_family.soft.gz", "{geo_id}.txt"],
+    "GDS": ["{geo_id}.soft.gz"],
+    "GPL": ["{geo_id}.txt", "{geo_id}.annot.gz"],
+    "GSM": ["{geo_id}.txt"],
+}
+
+# Evict down to this fraction of the budget, so eviction is not re-triggered on every insert
+EVICT_TARGET_RATIO = 0.9
+
+
+class SOFTCacheManager:
+    """
+    Byte-budgeted LRU cache for GEOparse SOFT files.
+
+    Features:
+    - SQLite index of cached files (size, last access)
+    - LRU eviction to a byte budget and a minimum of free disk space
+    - In-process pinning of datasets in use
+    - Coalesced background eviction
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        max_bytes: int = 5 * 1024**3,
+        min_free_bytes: int = 1024**3,
+        index_path: Optional[str | Path] = None,
+    ):
+        """
+        Initialize cache manager.
+
+        Args:
+            cache_dir: Directory passed to GEOparse as destdir
+            max_bytes: Byte budget for cached SOFT files (0 disables eviction)
+            min_free_bytes: Evict further if the disk has less free space than this
+            index_path: SQLite index (default: {cache_dir}/.soft_index.db)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.min_free_bytes = min_free_bytes
+        self.index_path = Path(index_path or self.cache_dir / ".soft_index.db")
+
+        self._pins: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        self._evict_requested = threading.Event()
+        self._evictor: Optional[threading.Thread] = None
+
+        self._init_index()
+        logger.info(f"Initialized SOFTCacheManager: dir={self.cache_dir}, max_bytes={max_bytes}")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(str(self.index_path), timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _init_index(self):
+        """Create the index; adopt files cached before the index existed."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS soft_files (
+                    filename TEXT PRIMARY KEY,
+                    geo_id TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_soft_last_access ON soft_files(last_access)")
+            conn.execute("CREATE TABLE IF NOT EXISTS soft_meta (key TEXT PRIMARY KEY, value TEXT)")
+            adopted = conn.execute("SELECT 1 FROM soft_meta WHERE key = 'adopted'").fetchone()
+
+        if not adopted:
+            self._adopt_existing()
+
+    def _adopt_existing(self):
+        """One-time scan of files already in the directory (last access = mtime)."""
+        rows = []
+        for path in self.cache_dir.iterdir():
+            geo_id = path.name.split("_")[0].split(".")[0]
+            patterns = SOFT_FILE_PATTERNS.get(geo_id[:3], [])
+            if path.name in (pattern.format(geo_id=geo_id) for pattern in patterns):
+                info = path.stat()
+                rows.append((path.name, geo_id, info.st_size, info.st_mtime))
+
+        with self._connect() as conn:
+            conn.executemany("INSERT OR IGNORE INTO soft_files VALUES (?, ?, ?, ?)", rows)
+            conn.execute("INSERT OR REPLACE INTO soft_meta VALUES ('adopted', ?)", (str(time.time()),))
+
+        if rows:
+            logger.info(f"Indexed {len(rows)} existing SOFT files in {self.cache_dir}")
+            self._schedule_eviction()
+
+    # =========================================================================
+    # PINNING
+    # =========================================================================
+
+    @contextmanager
+    def pin(self, geo_id: str):
+        """Protect a dataset's files from eviction while it is downloaded or parsed."""
+        geo_id = geo_id.upper()
+        with self._lock:
+            self._pins[geo_id] = self._pins.get(geo_id, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pins[geo_id] -= 1
+                if not self._pins[geo_id]:
+                    del self._pins[geo_id]
+
+    def is_pinned(self, geo_id: str) -> bool:
+        with self._lock:
+            return geo_id.upper() in self._pins
+
+    # =========================================================================
+    # INDEX
+    # =========================================================================
+
+    def _candidate_paths(self, geo_id: str) -> List[Path]:
+        patterns = SOFT_FILE_PATTERNS.get(geo_id[:3], [])
+        return [self.cache_dir / pattern.format(geo_id=geo_id) for pattern in patterns]
+
+    def record(self, geo_id: str) -> int:
+        """
+        Index (or touch) the files GEOparse wrote for a dataset.
+
+        Call after every get_GEO(); on a cache hit this refreshes the LRU
+        position, on a miss it adds the new file and schedules eviction.
+
+        Args:
+            geo_id: GEO accession
+
+        Returns:
+            Bytes recorded for the dataset
+        """
+        geo_id = geo_id.upper()
+        now = time.time()
+        rows = []
+        for path in self._candidate_paths(geo_id):
+            try:
+                rows.append((path.name, geo_id, path.stat().st_size, now))
+            except FileNotFoundError:
+                continue
+
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO soft_files VALUES (?, ?, ?, ?)
+                ON CONFLICT(filename) DO UPDATE SET
+                    size_bytes = excluded.size_bytes, last_access = excluded.last_access
+                """,
+                rows,
+            )
+
+        self._schedule_eviction()
+        return sum(row[2] for row in rows)
+
+    def total_bytes(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM soft_files").fetchone()[0]
+
+    def _budget(self, total: int) -> int:
+        """Bytes the cache may use: the byte budget, capped by free disk space."""
+        budget = self.max_bytes
+        if self.min_free_bytes:
+            free = shutil.disk_usage(self.cache_dir).free
+            budget = min(budget, max(0, total + free - self.min_free_bytes))
+        return budget
+
+    # =========================================================================
+    # EVICTION
+    # =========================================================================
+
+    def _schedule_eviction(self):
+        """Wake the background evictor (one thread; requests coalesce)."""
+        if not self.max_bytes:
+            return
+        self._evict_requested.set()
+        with self._lock:
+            if self._evictor is None:
+                self._evictor = threading.Thread(
+                    target=self._evict_loop, name="soft-cache-evictor", daemon=True
+                )
+                self._evictor.start()
+
+    def _evict_loop(self):
+        while True:
+            if not self._evict_requested.wait(timeout=60):
+                with self._lock:
+                    if not self._evict_requested.is_set():
+                        self._evictor = None
+                        return
+                continue
+            self._evict_requested.clear()
+            try:
+                self.evict()
+            except Exception as e:
+                logger.warning(f"SOFT cache eviction failed: {e}")
+
+    def evict(self) -> Dict[str, int]:
+        """
+        Evict least recently used files until the cache fits its budget.
+
+        Returns:
+            Dictionary with "evicted" file count and "freed_bytes"
+        """
+        with self._evict_lock:
+            with self._connect() as conn:
+                total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM soft_files").fetchone()[0]
+                budget = self._budget(total)
+                if total <= budget:
+                    return {"evicted": 0, "freed_bytes": 0}
+
+                target = int(budget * EVICT_TARGET_RATIO)
+                evicted = []
+                freed = 0
+                for filename, geo_id, size in conn.execute(
+                    "SELECT filename, geo_id, size_bytes FROM soft_files ORDER BY last_access"
+                ).fetchall():
+                    if total - freed <= target:
+                        break
+                    if self.is_pinned(geo_id):
+                        continue
+                    (self.cache_dir / filename).unlink(missing_ok=True)
+                    evicted.append((filename,))
+                    freed += size
+
+                conn.executemany("DELETE FROM soft_files WHERE filename = ?", evicted)
+
+        logger.info(f"Evicted {len(evicted)} SOFT files ({freed / 1024**2:.1f} MB) from {self.cache_dir}")
+        return {"evicted": len(evicted), "freed_bytes": freed}
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and budget."""
+        with self._connect() as conn:
+            files, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM soft_files"
+            ).fetchone()
+        return {"files": files, "size_bytes": total, "max_bytes": self.max_bytes}
@@ -0,0 +1,361 @@
+"""
+URL Collection Cache
+
+Caches per-source URL lookups made by FullTextManager.get_all_fulltext_urls()
+so that re-enriching a dataset does not repeat every Unpaywall / Crossref /
+CORE / bioRxiv / arXiv / PMC request.
+
+Two layers:
+1. Memory cache (fast, per-process) - LRU with per-entry expiry
+2. Redis (shared, persistent) - one key per (source, publication), native TTL
+
+Entries are stored per source rather than per ranked list, so each source
+can have its own TTL and a "source had nothing" answer can be cached
+(negative caching) with a shorter TTL than a found URL. The ranked
+SourceURL list is rebuilt from the per-source entries by the manager.
+
+Keys are built from the normalized DOI (preferred) or PMID/PMC ID:
+    url_collection:{source}:doi:10.1038/nature12373
+    url_collection:{source}:pmid:12345678
+
+Usage:
+    cache = URLCollectionCache()
+
+    # Batch-load a whole dataset's entries (single Redis round trip)
+    await cache.prefetch(publication_keys, ["unpaywall", "crossref"])
+
+    entry = await cache.get(publication_key, "unpaywall")
+    if entry is None:
+        entry = {"success": False, "error": "Not Open Access in Unpaywall"}
+        await cache.set(publication_key, "unpaywall", entry)
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from omics_oracle_v2.cache.redis_cache import RedisCache
+
+logger = logging.getLogger(__name__)
+
+
+# Positive TTLs per source (seconds). Publisher/preprint links are stable,
+# OA aggregator answers change as repositories deposit new copies.
+DEFAULT_SOURCE_TTLS: Dict[str, int] = {
+    "unpaywall": 7 * 86400,
+    "core": 7 * 86400,
+    "crossref": 30 * 86400,
+    "biorxiv": 30 * 86400,
+    "arxiv": 30 * 86400,
+    "pmc": 14 * 86400,
+    "scihub": 3 * 86400,
+    "libgen": 3 * 86400,
+}
+
+# TTL for "source had nothing" answers (papers become OA over time)
+DEFAULT_NEGATIVE_TTL = 86400  # 1 day
+
+
+@dataclass
+class URLCacheStats:
+    """Statistics for URL cache performance monitoring"""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    memory_entries: int = 0
+
+
+def make_publication_key(publication: Any) -> Optional[str]:
+    """
+    Build a stable cache key for a publication.
+
+    DOI is preferred because most OA sources are DOI-keyed; PMID / PMC ID
+    are used for papers without a DOI. Publications without any of these
+    are not cached (title-only lookups are too ambiguous).
+
+    Args:
+        publication: Publication object (doi, pmid, pmcid attributes)
+
+    Returns:
+        Key such as "doi:10.1234/abc" or "pmid:12345", or None
+    """
+    doi = getattr(publication, "doi", None)
+    if doi and doi.strip():
+        doi = doi.strip().lower()
+        for prefix in ("https://doi.org/", "http://doi.org/", "doi:"):
+            if doi.startswith(prefix):
+                doi = doi[len(prefix) :]
+        return f"doi:{doi}"
+
+    pmid = getattr(publication, "pmid", None)
+    if pmid and str(pmid).strip():
+        return f"pmid:{str(pmid).strip()}"
+
+    pmcid = getattr(publication, "pmcid", None)
+    if pmcid and pmcid.strip():
+        return f"pmc:{pmcid.strip().upper().replace('PMC', '')}"
+
+    return None
+
+
+class URLCollectionCache:
+    """
+    Two-layer cache for per-source URL lookup results.
+
+    Layer 1: In-memory LRU (also the only layer when Redis is unavailable)
+    Layer 2: Redis via RedisCache (shared across workers, TTL per key)
+
+    Entry format (JSON-serializable dict):
+        {
+            "success": true,
+            "url": "https://...",
+            "source": "unpaywall",
+            "metadata": {...},
+            "error": null,
+            "cached_at": 1729000000
+        }
+    """
+
+    def __init__(
+        self,
+        source_ttls: Optional[Dict[str, int]] = None,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+        memory_cache_size: int = 10000,
+        use_redis: bool = True,
+        redis_cache: Optional[RedisCache] = None,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            source_ttls: Positive TTL overrides per source name (seconds)
+            negative_ttl: TTL for negative ("not found") entries (seconds)
+            memory_cache_size: Max entries in memory layer
+            use_redis: Whether to use Redis as shared layer
+            redis_cache: Optional pre-configured RedisCache instance
+        """
+        self.source_ttls = {**DEFAULT_SOURCE_TTLS, **(source_ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.memory_cache_size = memory_cache_size
+
+        self.redis_cache: Optional[RedisCache] = None
+        if use_redis:
+            self.redis_cache = redis_cache or RedisCache(prefix="url_collection")
+
+        # Memory layer: key -> (expires_at, entry)
+        self._memory_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+        self._stats = URLCacheStats()
+
+        logger.info(
+            f"Initialized URLCollectionCache: redis={'enabled' if self._redis_enabled else 'disabled'}, "
+            f"negative_ttl={negative_ttl}s"
+        )
+
+    @property
+    def _redis_enabled(self) -> bool:
+        return bool(self.redis_cache and self.redis_cache.enabled)
+
+    def ttl_for(self, source: str, success: bool) -> int:
+        """Get TTL for an entry of the given source and outcome."""
+        if not success:
+            return self.negative_ttl
+        return self.source_ttls.get(source, self.negative_ttl)
+
+    def _make_key(self, publication_key: str, source: str) -> str:
+        """Generate full cache key (namespaced like RedisCache keys)"""
+        return f"url_collection:{source}:{publication_key}"
+
+    # ------------------------------------------------------------------
+    # Memory layer
+    # ------------------------------------------------------------------
+
+    def _memory_get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._memory_cache.get(key)
+        if item is None:
+            return None
+
+        expires_at, entry = item
+        if time.time() > expires_at:
+            del self._memory_cache[key]
+            return None
+
+        self._memory_cache.move_to_end(key)
+        return entry
+
+    def _memory_set(self, key: str, entry: Dict[str, Any], ttl: int) -> None:
+        self._memory_cache[key] = (time.time() + ttl, entry)
+        self._memory_cache.move_to_end(key)
+
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def _record_hit(self, entry: Dict[str, Any]) -> None:
+        if entry.get("success"):
+            self._stats.hits += 1
+        else:
+            self._stats.negative_hits += 1
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def get(self, publication_key: str, source: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached entry for one source/publication.
+
+        Args:
+            publication_key: Key from make_publication_key()
+            source: Source name (e.g., "unpaywall")
+
+        Returns:
+            Cached entry dict (positive or negative) or None if not cached
+        """
+        entries = await self.get_many([publication_key], [source])
+        return entries.get(publication_key, {}).get(source)
+
+    async def get_many(
+        self, publication_keys: Iterable[str], sources: Iterable[str]
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Batch lookup of entries for many publications and sources.
+
+        Memory layer is checked first; remaining keys are fetched from Redis
+        in a single MGET and promoted to the memory layer.
+
+        Args:
+            publication_keys: Keys from make_publication_key()
+            sources: Source names to look up
+
+        Returns:
+            Dict of publication_key -> {source: entry} (only cached entries)
+        """
+        sources = list(sources)
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        missing: List[Tuple[str, str, str]] = []
+
+        for pub_key in dict.fromkeys(publication_keys):
+            for source in sources:
+                key = self._make_key(pub_key, source)
+                entry = self._memory_get(key)
+                if entry is not None:
+                    results.setdefault(pub_key, {})[source] = entry
+                    self._record_hit(entry)
+                else:
+                    missing.append((pub_key, source, key))
+
+        if missing and self._redis_enabled:
+            fetched = await self.redis_cache.get_many([key for _, _, key in missing])
+            still_missing = []
+            for pub_key, source, key in missing:
+                entry = fetched.get(key)
+                if entry is None:
+                    still_missing.append((pub_key, source, key))
+                    continue
+                results.setdefault(pub_key, {})[source] = entry
+                self._record_hit(entry)
+                # Promote with the remaining lifetime unknown - use source TTL
+                self._memory_set(
+                    key, entry, self.ttl_for(source, bool(entry.get("success")))
+                )
+            missing = still_missing
+
+        self._stats.misses += len(missing)
+        return results
+
+    async def prefetch(
+        self, publication_keys: Iterable[str], sources: Iterable[str]
+    ) -> int:
+        """
+        Warm the memory layer for a whole dataset's publications.
+
+        Args:
+            publication_keys: Keys from make_publication_key()
+            sources: Source names to load
+
+        Returns:
+            Number of cached entries found
+        """
+        results = await self.get_many(publication_keys, sources)
+        found = sum(len(entries) for entries in results.values())
+        logger.debug(f"Prefetched {found} URL cache entries")
+        return found
+
+    async def set(
+        self, publication_key: str, source: str, entry: Dict[str, Any]
+    ) -> None:
+        """
+        Cache one entry.
+
+        Args:
+            publication_key: Key from make_publication_key()
+            source: Source name
+            entry: Entry dict (must contain "success")
+        """
+        await self.set_many({publication_key: {source: entry}})
+
+    async def set_many(self, entries: Dict[str, Dict[str, Dict[str, Any]]]) -> int:
+        """
+        Cache many entries (single pipelined Redis round trip).
+
+        Args:
+            entries: Dict of publication_key -> {source: entry}
+
+        Returns:
+            Number of entries cached
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        ttls: Dict[str, int] = {}
+        now = int(time.time())
+
+        for pub_key, by_source in entries.items():
+            for source, entry in by_source.items():
+                key = self._make_key(pub_key, source)
+                entry = {**entry, "cached_at": now}
+                ttl = self.ttl_for(source, bool(entry.get("success")))
+                if ttl <= 0:
+                    continue  # TTL of 0 disables caching for this outcome
+                items[key] = entry
+                ttls[key] = ttl
+                self._memory_set(key, entry, ttl)
+
+        if items and self._redis_enabled:
+            await self.redis_cache.set_many(items, ttls=ttls)
+
+        self._stats.sets += len(items)
+        return len(items)
+
+    def invalidate(self, publication_key: str) -> int:
+        """
+        Remove all source entries for a publication.
+
+        Args:
+            publication_key: Key from make_publication_key()
+
+        Returns:
+            Number of memory entries removed
+        """
+        suffix = f":{publication_key}"
+        keys = [k for k in self._memory_cache if k.endswith(suffix)]
+        for key in keys:
+            del self._memory_cache[key]
+
+        if self._redis_enabled:
+            self.redis_cache.invalidate_pattern(f"*:{publication_key}")
+
+        return len(keys)
+
+    def clear_memory(self) -> None:
+        """Clear the in-process layer (Redis entries are kept)."""
+        self._memory_cache.clear()
+
+    def get_stats(self) -> URLCacheStats:
+        """Get cache performance statistics"""
+        self._stats.memory_entries = len(self._memory_cache)
+        return self._stats
@@ -26,6 +26,8 @@ Environment Variables:
     OMICS_GEO_CACHE_TTL=3600
     OMICS_GEO_MAX_RETRIES=3
 
+    OMICS_HTTP_REPLAY_MODE=replay
+
     OPENAI_API_KEY=your_key
     OMICS_AI_MODEL=gpt-4
     OMICS_AI_MAX_TOKENS=1000
@@ -34,7 +36,7 @@ Environment Variables:
 
 import os
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 try:
     from pydantic import BaseModel, Field
@@ -61,6 +63,10 @@ class NLPSettings(BaseSettings):
     max_entities: int = Field(
         default=100, ge=1, le=10000, description="Max entities to extract per document"
     )
+    gazetteer_files: List[str] = Field(
+        default_factory=list,
+        description="Extra gazetteer term files merged over the bundled entity terms",
+    )
 
     class Config:
         env_prefix = "OMICS_NLP_"
@@ -91,6 +97,16 @@ class GEOSettings(BaseSettings):
         default=3600, ge=0, description="Cache time-to-live in seconds"
     )
     use_cache: bool = Field(default=True, description="Enable caching of API responses")
+    soft_cache_max_bytes: int = Field(
+        default=5 * 1024**3,
+        ge=0,
+        description="Byte budget for GEOparse SOFT files in cache_dir, LRU-evicted (0 = unlimited)",
+    )
+    soft_cache_min_free_bytes: int = Field(
+        default=1024**3,
+        ge=0,
+        description="Evict SOFT files early to keep this much disk space free",
+    )
     rate_limit: int = Field(
         default=3,
         ge=1,
@@ -155,6 +171,49 @@ class AISettings(BaseSettings):
         description="Request timeout in seconds",
         env="OMICS_AI_TIMEOUT",
     )
+    max_prompt_tokens: int = Field(
+        default=12000,
+        ge=1000,
+        description="Token budget for an analysis prompt (also capped by the model's "
+        "context window minus max_tokens)",
+        env="OMICS_AI_MAX_PROMPT_TOKENS",
+    )
+    provider: str = Field(
+        default="openai",
+        description="LLM provider: openai, or stub (deterministic, offline)",
+        env="OMICS_AI_PROVIDER",
+    )
+    max_concurrency_per_model: int = Field(
+        default=4,
+        ge=1,
+        le=100,
+        description="Maximum concurrent LLM calls per model",
+        env="OMICS_AI_MAX_CONCURRENCY",
+    )
+    cost_budget_usd: Optional[float] = Field(
+        default=None,
+        ge=0.0,
+        description="Maximum estimated LLM spend per model per budget window (None = unlimited)",
+        env="OMICS_AI_COST_BUDGET_USD",
+    )
+    cost_budget_window: int = Field(
+        default=86400,
+        ge=60,
+        description="Cost budget window in seconds",
+        env="OMICS_AI_COST_BUDGET_WINDOW",
+    )
+    stub_latency: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Stub provider: seconds before the first token",
+        env="OMICS_AI_STUB_LATENCY",
+    )
+    stub_token_latency: float = Field(
+        default=0.01,
+        ge=0.0,
+        description="Stub provider: seconds between tokens",
+        env="OMICS_AI_STUB_TOKEN_LATENCY",
+    )
 
 
 class RedisSettings(BaseSettings):
@@ -232,6 +291,24 @@ class RateLimitSettings(BaseSettings):
         default=100, ge=1, description="Enterprise tier concurrent limit"
     )
 
+    # Engine
+    local_only: bool = Field(
+        default=False,
+        description="Keep limiter state in-process only (tests, single-instance dev)",
+    )
+    identity_cache_ttl: int = Field(
+        default=60, ge=0, description="Seconds to cache credential -> user/tier lookups"
+    )
+    identity_cache_size: int = Field(
+        default=10000, ge=1, description="Max cached credential lookups"
+    )
+    circuit_breaker_failures: int = Field(
+        default=3, ge=1, description="Consecutive Redis failures before skipping Redis"
+    )
+    circuit_breaker_reset_seconds: float = Field(
+        default=30.0, gt=0, description="Seconds before retrying Redis after the breaker opens"
+    )
+
     class Config:
         env_prefix = "OMICS_RATE_LIMIT_"
         case_sensitive = False
@@ -661,6 +738,15 @@ class SearchSettings(BaseSettings):
         default="data",
         description="Base path for file storage"
     )
+    enable_local_index: bool = Field(
+        default=True,
+        description="Serve GEO datasets from the local full-text index when NCBI fails"
+    )
+    local_index_deadline: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds NCBI gets before GEO results come from the local index (0 = no deadline)"
+    )
 
     # Feature flags
     enable_citations: bool = Field(
@@ -675,6 +761,39 @@ class SearchSettings(BaseSettings):
         case_sensitive = False
 
 
+class HTTPReplaySettings(BaseSettings):
+    """Configuration for the offline HTTP record/replay layer (benchmarks and tests)."""
+
+    mode: str = Field(
+        default="off",
+        description="off, record (always hit the network), replay (cassette only), or auto (record misses)",
+    )
+    cassette_dir: Path = Field(
+        default=Path("tests/cassettes"), description="Directory holding cassette files"
+    )
+    cassette: str = Field(
+        default="default", description="Cassette name; bump it to keep an older recording alongside"
+    )
+    latency_scale: float = Field(
+        default=1.0, ge=0.0, description="Multiplier on recorded response times during replay (0 = instant)"
+    )
+    latency_ms: float = Field(default=0.0, ge=0.0, description="Fixed latency added to every replay")
+    error_rate: float = Field(
+        default=0.0, ge=0.0, le=1.0, description="Fraction of replayed requests that fail"
+    )
+    error_status: int = Field(
+        default=503, ge=0, description="HTTP status for injected failures (0 = raise a timeout)"
+    )
+    seed: int = Field(default=0, description="Seed for error injection")
+    passthrough_hosts: str = Field(
+        default="localhost,127.0.0.1", description="Comma-separated hosts never recorded or replayed"
+    )
+
+    class Config:
+        env_prefix = "OMICS_HTTP_REPLAY_"
+        case_sensitive = False
+
+
 class Settings(BaseSettings):
     """Main application settings."""
 
@@ -720,6 +839,9 @@ class Settings(BaseSettings):
     search: SearchSettings = Field(
         default_factory=SearchSettings, description="Search orchestration configuration"
     )
+    http_replay: HTTPReplaySettings = Field(
+        default_factory=HTTPReplaySettings, description="HTTP record/replay configuration"
+    )
 
     # Computed properties for convenience
     @property
@@ -11,6 +11,11 @@ Provides append-only JSON logging of discovery sessions for:
 Log Format: JSONL (JSON Lines - one JSON object per line)
 Storage: data/analytics/metrics_log.jsonl
 
+Records are buffered in memory and appended in batches by a background
+MetricsSink, so logging a session does no file I/O on the request path.
+Optionally, sessions are also exported to the Prometheus registry in
+api/metrics.py.
+
 Usage:
     logger = MetricsLogger()
 
@@ -33,6 +38,9 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from omics_oracle_v2.lib.pipelines.citation_discovery.metrics_sink import \
+    MetricsSink
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +50,8 @@ class MetricsLogger:
 
     Features:
     - Simple JSONL format (one JSON per line)
-    - No database overhead (just file append)
+    - No database overhead (buffered file append, flushed in background)
+    - Optional Prometheus export (no disk write needed for monitoring)
     - Easy to analyze with standard tools (jq, Python, etc.)
     - Automatic log rotation (optional)
     - Built-in analysis methods
@@ -54,6 +63,10 @@ class MetricsLogger:
         enable_logging: bool = True,
         auto_rotate: bool = False,
         max_log_size_mb: int = 100,
+        buffered: bool = True,
+        flush_interval: float = 5.0,
+        max_buffer: int = 100,
+        prometheus_export: bool = False,
     ):
         """
         Initialize metrics logger
@@ -63,15 +76,28 @@ class MetricsLogger:
             enable_logging: Enable/disable logging
             auto_rotate: Automatically rotate logs when size exceeds max
             max_log_size_mb: Maximum log file size before rotation
+            buffered: Write through a background MetricsSink (default: True)
+            flush_interval: Maximum seconds a record stays buffered
+            max_buffer: Records buffered before an early flush
+            prometheus_export: Also export sessions to the Prometheus registry
         """
         self.log_file = Path(log_file)
         self.enable_logging = enable_logging
         self.auto_rotate = auto_rotate
         self.max_log_size_mb = max_log_size_mb
+        self.prometheus_export = prometheus_export
 
+        self._sink: Optional[MetricsSink] = None
         if self.enable_logging:
             # Create directory if needed
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            if buffered:
+                self._sink = MetricsSink(
+                    str(self.log_file),
+                    max_buffer=max_buffer,
+                    flush_interval=flush_interval,
+                    max_file_size_mb=max_log_size_mb if auto_rotate else None,
+                )
             logger.info(f"MetricsLogger initialized: {self.log_file}")
 
     def log_discovery_session(
@@ -96,6 +122,9 @@ class MetricsLogger:
             errors: List of errors encountered
             custom_data: Any additional custom metrics
         """
+        if self.prometheus_export:
+            self._export_prometheus(sources, cache, errors)
+
         if not self.enable_logging:
             return
 
@@ -122,6 +151,10 @@ class MetricsLogger:
         if custom_data:
             session_data["custom"] = custom_data
 
+        if self._sink:
+            self._sink.write(session_data)
+            return
+
         # Check for log rotation
         if self.auto_rotate:
             self._rotate_if_needed()
@@ -136,6 +169,47 @@ class MetricsLogger:
         except Exception as e:
             logger.warning(f"Failed to log metrics: {e}")
 
+    def _export_prometheus(
+        self,
+        sources: Dict[str, Dict[str, Any]],
+        cache: Optional[Dict[str, Any]],
+        errors: Optional[List[Dict[str, Any]]],
+    ):
+        """Export a session to the Prometheus registry (if available)"""
+        try:
+            from omics_oracle_v2.api.metrics import (
+                track_citation_source_request, track_discovery_session)
+        except ImportError as e:
+            logger.debug(f"Prometheus export unavailable: {e}")
+            self.prometheus_export = False
+            return
+
+        for source_name, source_data in (sources or {}).items():
+            track_citation_source_request(
+                source=source_name,
+                success=source_data.get("success", False),
+                response_time=source_data.get("response_time", 0),
+                papers_found=source_data.get("papers_found", 0),
+            )
+        track_discovery_session(
+            cache_hit=bool((cache or {}).get("hit")),
+            error_types=[error.get("type", "unknown") for error in errors or []],
+        )
+
+    def flush(self) -> int:
+        """
+        Write buffered sessions to the log now
+
+        Returns:
+            Number of sessions written
+        """
+        return self._sink.flush() if self._sink else 0
+
+    def close(self):
+        """Flush buffered sessions and stop the background writer"""
+        if self._sink:
+            self._sink.close()
+
     def _rotate_if_needed(self):
         """Rotate log file if it exceeds max size"""
         if not self.log_file.exists():
@@ -163,6 +237,9 @@ class MetricsLogger:
         Returns:
             List of session dictionaries
         """
+        # Make buffered sessions visible to readers
+        self.flush()
+
         if not self.log_file.exists():
             return []
 
@@ -0,0 +1,298 @@
+"""
+Buffered Metrics Sinks for Citation Discovery
+
+Moves metrics file I/O off the request path:
+- MetricsSink: buffers JSONL records in memory and appends them in batches
+  (on buffer size or flush interval) from a background writer thread, with
+  size-based rotation checked once per batch instead of once per record
+- SnapshotWriter: keeps only the latest JSON snapshot and writes it atomically
+  (temp file + rename) at most once per interval
+
+Both flush on close() and at interpreter exit. Appends and rotations take an
+exclusive file lock (where available) so several workers can share one log.
+
+Usage:
+    sink = MetricsSink("data/analytics/metrics_log.jsonl")
+    sink.write({"geo_id": "GSE52564", ...})   # returns immediately
+    sink.close()                              # flush remaining records
+
+    snapshots = SnapshotWriter("data/analytics/source_metrics.json")
+    snapshots.submit(summary_dict)            # latest wins, written in background
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def _lock(f) -> None:
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+def _unlock(f) -> None:
+    if fcntl:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# Live writers, flushed by one exit hook without keeping them alive
+_writers: "weakref.WeakSet[_BackgroundWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_writers() -> None:
+    for writer in list(_writers):
+        writer.close()
+
+
+class _BackgroundWriter(ABC):
+    """
+    Daemon thread that calls flush() on demand or every flush_interval.
+
+    The thread only runs while there is something to write: it exits after a
+    flush that leaves nothing pending and is restarted by the next write, so
+    idle writers (e.g., one per discovery instance) hold no threads.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        _writers.add(self)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=type(self).__name__, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning(f"{type(self).__name__} flush failed: {e}")
+
+            with self._start_lock:
+                if not self._has_pending():
+                    self._thread = None
+                    return
+
+    @abstractmethod
+    def _has_pending(self) -> bool:
+        """Whether records are buffered and not yet written."""
+
+    @abstractmethod
+    def flush(self) -> int:
+        """Write buffered records now."""
+
+    def close(self) -> None:
+        """Stop the writer thread and flush anything still buffered."""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        try:
+            self.flush()
+        except Exception as e:
+            logger.warning(f"{type(self).__name__} final flush failed: {e}")
+
+
+class MetricsSink(_BackgroundWriter):
+    """
+    Buffered, rotating JSONL sink.
+
+    write() only appends to an in-memory buffer. A background thread writes
+    the buffer in one append when it reaches max_buffer records or every
+    flush_interval seconds.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_buffer: int = 100,
+        flush_interval: float = 5.0,
+        max_file_size_mb: Optional[float] = 100,
+    ):
+        """
+        Initialize sink
+
+        Args:
+            path: JSONL file to append to
+            max_buffer: Records buffered before an early flush
+            flush_interval: Maximum seconds a record stays buffered
+            max_file_size_mb: Rotate when the file exceeds this size (None = never)
+        """
+        super().__init__(flush_interval)
+        self.path = Path(path)
+        self.max_buffer = max_buffer
+        self.max_file_size_mb = max_file_size_mb
+
+        self._buffer: List[str] = []
+        self._buffer_lock = threading.Lock()
+        self._io_lock = threading.Lock()
+
+        self.records_written = 0
+        self.flushes = 0
+        self.dropped = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Buffer one record (never blocks on file I/O)."""
+        try:
+            line = json.dumps(record, default=str)
+        except (TypeError, ValueError) as e:
+            self.dropped += 1
+            logger.warning(f"Dropping unserializable metrics record: {e}")
+            return
+
+        if self._stopped.is_set():
+            # Sink closed: fall back to a direct append
+            with self._buffer_lock:
+                self._buffer.append(line)
+            self.flush()
+            return
+
+        with self._buffer_lock:
+            self._buffer.append(line)
+            full = len(self._buffer) >= self.max_buffer
+
+        self._ensure_started()
+        if full:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records not yet written."""
+        return len(self._buffer)
+
+    def _has_pending(self) -> bool:
+        return bool(self._buffer)
+
+    def flush(self) -> int:
+        """
+        Write buffered records now (called by the writer thread, close(), or
+        readers that need to see recent records).
+
+        Returns:
+            Number of records written
+        """
+        with self._io_lock:
+            with self._buffer_lock:
+                lines, self._buffer = self._buffer, []
+            if not lines:
+                return 0
+
+            data = "\n".join(lines) + "\n"
+            with open(self.path, "a", encoding="utf-8") as f:
+                _lock(f)
+                try:
+                    f.write(data)
+                    f.flush()
+                    size = os.fstat(f.fileno()).st_size
+                    if self.max_file_size_mb and size > self.max_file_size_mb * 1024 * 1024:
+                        self._rotate(size)
+                finally:
+                    _unlock(f)
+
+            self.records_written += len(lines)
+            self.flushes += 1
+            return len(lines)
+
+    def _rotate(self, size: int) -> None:
+        """Rename the current file to a timestamped archive (lock held)."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        archive_path = self.path.parent / f"{self.path.stem}_{timestamp}{self.path.suffix}"
+        self.path.rename(archive_path)
+        logger.info(f"Rotated metrics log: {archive_path} ({size / (1024 * 1024):.1f}MB)")
+
+
+class SnapshotWriter(_BackgroundWriter):
+    """
+    Debounced, atomic JSON snapshot writer.
+
+    submit() replaces the pending snapshot; the background thread writes the
+    latest one at most once per flush_interval.
+    """
+
+    def __init__(self, path: str, flush_interval: float = 30.0):
+        """
+        Initialize writer
+
+        Args:
+            path: JSON file to (re)write
+            flush_interval: Minimum seconds between writes
+        """
+        super().__init__(flush_interval)
+        self.path = Path(path)
+        self._pending: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self.writes = 0
+
+    def _has_pending(self) -> bool:
+        return self._pending is not None
+
+    def submit(self, snapshot: Dict[str, Any]) -> None:
+        """Queue a snapshot (replaces any snapshot not yet written)."""
+        with self._lock:
+            self._pending = snapshot
+        if self._stopped.is_set():
+            self.flush()
+        else:
+            self._ensure_started()
+
+    def flush(self) -> int:
+        """
+        Write the pending snapshot atomically.
+
+        Returns:
+            1 if a snapshot was written, 0 otherwise
+        """
+        with self._lock:
+            snapshot, self._pending = self._pending, None
+        if snapshot is None:
+            return 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(snapshot, f, indent=2, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        self.writes += 1
+        return 1
@@ -13,6 +13,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional
 
+from omics_oracle_v2.lib.pipelines.citation_discovery.metrics_sink import \
+    SnapshotWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -172,6 +175,7 @@ class SourceManagerConfig:
     # Metrics persistence
     save_metrics: bool = True
     metrics_file: str = "data/analytics/source_metrics.json"
+    metrics_flush_interval: float = 30.0  # Min seconds between snapshot writes
 
 
 class SourceManager:
@@ -182,6 +186,15 @@ class SourceManager:
     def __init__(self, config: Optional[SourceManagerConfig] = None):
         self.config = config or SourceManagerConfig()
         self.sources: Dict[str, SourceMetrics] = {}
+
+        # Snapshots are written in the background (debounced, atomic)
+        self._snapshot_writer: Optional[SnapshotWriter] = None
+        if self.config.save_metrics:
+            self._snapshot_writer = SnapshotWriter(
+                self.config.metrics_file,
+                flush_interval=self.config.metrics_flush_interval,
+            )
+
         self._load_metrics()
 
     def register_source(
@@ -296,6 +309,9 @@ class SourceManager:
                     f"{unique_count/total_unique:.1%} of total"
                 )
 
+        # End of a discovery run: queue a metrics snapshot
+        self._save_metrics()
+
     def get_summary(self) -> Dict:
         """Get summary of all source metrics"""
         summary = {"total_sources": len(self.sources), "sources": {}}
@@ -362,30 +378,19 @@ class SourceManager:
             logger.warning(f"Could not load metrics: {e}")
 
     def _save_metrics(self):
-        """Save metrics to persistent storage"""
-        if not self.config.save_metrics:
+        """Queue a metrics snapshot for the background writer (non-blocking)"""
+        if not self._snapshot_writer:
             return
 
         try:
-            import json
-            from pathlib import Path
-
-            metrics_path = Path(self.config.metrics_file)
-            metrics_path.parent.mkdir(parents=True, exist_ok=True)
-
             summary = self.get_summary()
             summary["timestamp"] = datetime.now().isoformat()
-
-            with open(metrics_path, "w") as f:
-                json.dump(summary, f, indent=2)
-
-            logger.info(f"✓ Saved metrics to {metrics_path}")
+            self._snapshot_writer.submit(summary)
         except Exception as e:
             logger.warning(f"Could not save metrics: {e}")
 
-    def __del__(self):
-        """Save metrics on cleanup"""
-        try:
+    def close(self):
+        """Write the latest metrics snapshot and stop the background writer"""
+        if self._snapshot_writer:
             self._save_metrics()
-        except Exception:
-            pass
+            self._snapshot_writer.close()
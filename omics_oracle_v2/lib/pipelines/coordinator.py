@@ -18,13 +18,19 @@ Example:
 
     # Process entire GEO dataset
     results = coordinator.process_geo_dataset("GSE12345")
+
+    # Write many stage results in one transaction
+    with coordinator.batch("GSE12345") as uow:
+        uow.add_content_extraction("12345678", extraction_data)
 """
 
 import json
 import logging
+import sqlite3
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from omics_oracle_v2.lib.pipelines.storage.geo_storage import GEOStorage
 from omics_oracle_v2.lib.pipelines.storage.models import (
@@ -32,6 +38,7 @@ from omics_oracle_v2.lib.pipelines.storage.models import (
     EnrichedContent,
     GEODataset,
     PDFAcquisition,
+    ProcessingLog,
     UniversalIdentifier,
     URLDiscovery,
     now_iso,
@@ -40,6 +47,9 @@ from omics_oracle_v2.lib.pipelines.storage.unified_db import UnifiedDatabase
 
 logger = logging.getLogger(__name__)
 
+# Records a PipelineBatch buffers before flushing (bounds memory on long runs)
+DEFAULT_BATCH_SIZE = 500
+
 
 class PipelineCoordinator:
     """
@@ -192,32 +202,7 @@ class PipelineCoordinator:
         start_time = time.time()
 
         try:
-            # Count URLs by source
-            pubmed_urls = sum(1 for u in urls if u.get("source") == "pubmed")
-            unpaywall_urls = sum(1 for u in urls if u.get("source") == "unpaywall")
-            europepmc_urls = sum(1 for u in urls if u.get("source") == "europepmc")
-            other_urls = len(urls) - pubmed_urls - unpaywall_urls - europepmc_urls
-
-            # Determine best URL type
-            has_pdf = any(u.get("type") == "pdf" for u in urls)
-            has_html = any(u.get("type") == "html" for u in urls)
-            best_url_type = "pdf" if has_pdf else ("html" if has_html else "none")
-
-            # Create discovery record
-            discovery = URLDiscovery(
-                geo_id=geo_id,
-                pmid=pmid,
-                urls_json=json.dumps(urls),
-                sources_queried=json.dumps(sources_queried),
-                url_count=len(urls),
-                pubmed_urls=pubmed_urls,
-                unpaywall_urls=unpaywall_urls,
-                europepmc_urls=europepmc_urls,
-                other_urls=other_urls,
-                has_pdf_url=has_pdf,
-                has_html_url=has_html,
-                best_url_type=best_url_type,
-            )
+            discovery = self._build_url_discovery(geo_id, pmid, urls, sources_queried)
 
             # Save to database
             self.db.insert_url_discovery(discovery)
@@ -279,23 +264,8 @@ class PipelineCoordinator:
         start_time = time.time()
 
         try:
-            # Save PDF to GEO-organized storage
-            pdf_info = self.storage.save_pdf(
-                geo_id=geo_id, pmid=pmid, source_path=pdf_path, verify_after_save=True
-            )
-
-            # Create acquisition record
-            acquisition = PDFAcquisition(
-                geo_id=geo_id,
-                pmid=pmid,
-                pdf_path=pdf_info["pdf_path"],
-                pdf_hash_sha256=pdf_info["sha256"],
-                pdf_size_bytes=pdf_info["size_bytes"],
-                source_url=source_url,
-                source_type=source_type,
-                download_method=download_method,
-                status="downloaded" if pdf_info["verified"] else "failed",
-                verified_at=now_iso() if pdf_info["verified"] else None,
+            acquisition, pdf_info = self._build_pdf_acquisition(
+                geo_id, pmid, pdf_path, source_url, source_type, download_method
             )
 
             # Save to database
@@ -352,26 +322,7 @@ class PipelineCoordinator:
         start_time = time.time()
 
         try:
-            # Calculate word_count if not provided
-            word_count = extraction_data.get("word_count")
-            if word_count is None and extraction_data.get("full_text"):
-                word_count = len(extraction_data["full_text"].split())
-
-            # Create extraction record
-            extraction = ContentExtraction(
-                geo_id=geo_id,
-                pmid=pmid,
-                full_text=extraction_data.get("full_text"),
-                page_count=extraction_data.get("page_count"),
-                word_count=word_count,
-                char_count=extraction_data.get("char_count"),
-                extractor_used=extraction_data.get("extractor_used", "pypdf"),
-                extraction_method=extraction_data.get("extraction_method", "text"),
-                extraction_quality=extraction_data.get("extraction_quality"),
-                extraction_grade=extraction_data.get("extraction_grade"),
-                has_readable_text=extraction_data.get("has_readable_text", False),
-                needs_ocr=extraction_data.get("needs_ocr", False),
-            )
+            extraction = self._build_content_extraction(geo_id, pmid, extraction_data)
 
             # Save to database
             self.db.insert_content_extraction(extraction)
@@ -424,23 +375,7 @@ class PipelineCoordinator:
         start_time = time.time()
 
         try:
-            # Create enriched content record
-            enriched = EnrichedContent(
-                geo_id=geo_id,
-                pmid=pmid,
-                sections_json=json.dumps(enriched_data.get("sections", [])),
-                tables_json=json.dumps(enriched_data.get("tables", [])),
-                references_json=json.dumps(enriched_data.get("references", [])),
-                figures_json=json.dumps(enriched_data.get("figures", [])),
-                chatgpt_prompt=enriched_data.get("chatgpt_prompt"),
-                chatgpt_metadata=json.dumps(enriched_data.get("chatgpt_metadata", {})),
-                grobid_xml=enriched_data.get("grobid_xml"),
-                grobid_tei_json=json.dumps(enriched_data.get("grobid_tei", {}))
-                if enriched_data.get("grobid_tei")
-                else None,
-                enrichers_applied=json.dumps(enriched_data.get("enrichers_applied", [])),
-                enrichment_quality=enriched_data.get("enrichment_quality"),
-            )
+            enriched = self._build_enriched_content(geo_id, pmid, enriched_data)
 
             # Save to database
             self.db.insert_enriched_content(enriched)
@@ -476,6 +411,145 @@ class PipelineCoordinator:
             logger.error(f"Error saving enriched content: {e}")
             raise
 
+    # =========================================================================
+    # RECORD BUILDERS (shared by save_* and PipelineBatch)
+    # =========================================================================
+
+    def _build_url_discovery(
+        self, geo_id: str, pmid: str, urls: List[Dict], sources_queried: List[str]
+    ) -> URLDiscovery:
+        # Count URLs by source
+        pubmed_urls = sum(1 for u in urls if u.get("source") == "pubmed")
+        unpaywall_urls = sum(1 for u in urls if u.get("source") == "unpaywall")
+        europepmc_urls = sum(1 for u in urls if u.get("source") == "europepmc")
+        other_urls = len(urls) - pubmed_urls - unpaywall_urls - europepmc_urls
+
+        # Determine best URL type
+        has_pdf = any(u.get("type") == "pdf" for u in urls)
+        has_html = any(u.get("type") == "html" for u in urls)
+        best_url_type = "pdf" if has_pdf else ("html" if has_html else "none")
+
+        return URLDiscovery(
+            geo_id=geo_id,
+            pmid=pmid,
+            urls_json=json.dumps(urls),
+            sources_queried=json.dumps(sources_queried),
+            url_count=len(urls),
+            pubmed_urls=pubmed_urls,
+            unpaywall_urls=unpaywall_urls,
+            europepmc_urls=europepmc_urls,
+            other_urls=other_urls,
+            has_pdf_url=has_pdf,
+            has_html_url=has_html,
+            best_url_type=best_url_type,
+        )
+
+    def _build_pdf_acquisition(
+        self,
+        geo_id: str,
+        pmid: str,
+        pdf_path: Path,
+        source_url: Optional[str],
+        source_type: Optional[str],
+        download_method: Optional[str],
+    ) -> Tuple[PDFAcquisition, Dict]:
+        """Save the PDF to GEO-organized storage and build its acquisition record."""
+        pdf_info = self.storage.save_pdf(
+            geo_id=geo_id, pmid=pmid, source_path=pdf_path, verify_after_save=True
+        )
+
+        acquisition = PDFAcquisition(
+            geo_id=geo_id,
+            pmid=pmid,
+            pdf_path=pdf_info["pdf_path"],
+            pdf_hash_sha256=pdf_info["sha256"],
+            pdf_size_bytes=pdf_info["size_bytes"],
+            source_url=source_url,
+            source_type=source_type,
+            download_method=download_method,
+            status="downloaded" if pdf_info["verified"] else "failed",
+            verified_at=now_iso() if pdf_info["verified"] else None,
+        )
+        return acquisition, pdf_info
+
+    def _build_content_extraction(
+        self, geo_id: str, pmid: str, extraction_data: Dict
+    ) -> ContentExtraction:
+        # Calculate word_count if not provided
+        word_count = extraction_data.get("word_count")
+        if word_count is None and extraction_data.get("full_text"):
+            word_count = len(extraction_data["full_text"].split())
+
+        return ContentExtraction(
+            geo_id=geo_id,
+            pmid=pmid,
+            full_text=extraction_data.get("full_text"),
+            page_count=extraction_data.get("page_count"),
+            word_count=word_count,
+            char_count=extraction_data.get("char_count"),
+            extractor_used=extraction_data.get("extractor_used", "pypdf"),
+            extraction_method=extraction_data.get("extraction_method", "text"),
+            extraction_quality=extraction_data.get("extraction_quality"),
+            extraction_grade=extraction_data.get("extraction_grade"),
+            has_readable_text=extraction_data.get("has_readable_text", False),
+            needs_ocr=extraction_data.get("needs_ocr", False),
+        )
+
+    def _build_enriched_content(self, geo_id: str, pmid: str, enriched_data: Dict) -> EnrichedContent:
+        return EnrichedContent(
+            geo_id=geo_id,
+            pmid=pmid,
+            sections_json=json.dumps(enriched_data.get("sections", [])),
+            tables_json=json.dumps(enriched_data.get("tables", [])),
+            references_json=json.dumps(enriched_data.get("references", [])),
+            figures_json=json.dumps(enriched_data.get("figures", [])),
+            chatgpt_prompt=enriched_data.get("chatgpt_prompt"),
+            chatgpt_metadata=json.dumps(enriched_data.get("chatgpt_metadata", {})),
+            grobid_xml=enriched_data.get("grobid_xml"),
+            grobid_tei_json=json.dumps(enriched_data.get("grobid_tei", {}))
+            if enriched_data.get("grobid_tei")
+            else None,
+            enrichers_applied=json.dumps(enriched_data.get("enrichers_applied", [])),
+            enrichment_quality=enriched_data.get("enrichment_quality"),
+        )
+
+    # =========================================================================
+    # BATCHED WRITES
+    # =========================================================================
+
+    @contextmanager
+    def batch(self, geo_id: str, max_pending: int = DEFAULT_BATCH_SIZE):
+        """
+        Stage P2-P4 results for a dataset and write them in few transactions.
+
+        Each staged record is written together with its processing_log entry;
+        the buffer is flushed every max_pending records and when the block
+        exits (also on error, since staged PDFs are already in storage).
+
+        Example:
+            with coordinator.batch("GSE12345") as uow:
+                for pmid, text in extracted.items():
+                    uow.add_content_extraction(pmid, {"full_text": text})
+            print(uow.written, uow.errors)
+
+        Args:
+            geo_id: GEO dataset ID
+            max_pending: Records buffered before an automatic flush
+
+        Yields:
+            PipelineBatch
+        """
+        uow = PipelineBatch(self, geo_id, max_pending=max_pending)
+        try:
+            yield uow
+        except BaseException:
+            try:
+                uow.flush()
+            except Exception as e:
+                logger.error(f"Could not flush batch for {geo_id} after error: {e}")
+            raise
+        uow.flush()
+
     # =========================================================================
     # HIGH-LEVEL OPERATIONS
     # =========================================================================
@@ -501,11 +575,14 @@ class PipelineCoordinator:
         """
         Get processing progress for a GEO dataset.
 
+        Counts come from the trigger-maintained geo_statistics table, so this
+        is one row lookup however many publications the dataset has.
+
         Returns:
             Dictionary with counts for each stage
         """
-        pubs = self.db.get_publications_by_geo(geo_id)
-        total = len(pubs)
+        counts = self.db.get_geo_counts(geo_id)
+        total = counts.get("publication_count", 0)
 
         if total == 0:
             return {
@@ -518,19 +595,225 @@ class PipelineCoordinator:
                 "enriched": 0,
             }
 
-        # Count completions for each stage
-        urls_count = sum(1 for p in pubs if self.db.get_url_discovery(geo_id, p.pmid))
-        pdfs_count = sum(1 for p in pubs if self.db.get_pdf_acquisition(geo_id, p.pmid))
-        extracted_count = sum(1 for p in pubs if self.db.get_content_extraction(geo_id, p.pmid))
-        enriched_count = sum(1 for p in pubs if self.db.get_enriched_content(geo_id, p.pmid))
+        enriched_count = counts["enriched_count"]
 
         return {
             "geo_id": geo_id,
             "total_publications": total,
             "citations": total,  # All have citations if in database
-            "urls": urls_count,
-            "pdfs": pdfs_count,
-            "extracted": extracted_count,
+            "urls": counts["urls_discovered"],
+            "pdfs": counts["pdfs_downloaded"],
+            "extracted": counts["pdfs_extracted"],
             "enriched": enriched_count,
             "completion_rate": (enriched_count / total * 100) if total > 0 else 0.0,
         }
+
+
+class PipelineBatch:
+    """
+    Unit of work for pipeline stage writes (see PipelineCoordinator.batch).
+
+    Features:
+    - Stage records and their success log entries in memory
+    - Flush with one executemany per table in a single transaction
+    - Per-record error isolation: a record that fails to build or insert
+      is skipped and logged as an error event; the rest are written
+    - Bounded buffer (automatic flush every max_pending records)
+    """
+
+    def __init__(self, coordinator: PipelineCoordinator, geo_id: str, max_pending: int = DEFAULT_BATCH_SIZE):
+        """
+        Initialize batch.
+
+        Args:
+            coordinator: Coordinator whose database and storage are used
+            geo_id: GEO dataset ID for all staged records
+            max_pending: Records buffered before an automatic flush
+        """
+        self.coordinator = coordinator
+        self.db = coordinator.db
+        self.geo_id = geo_id
+        self.max_pending = max(1, max_pending)
+
+        # (record, success log) pairs awaiting flush
+        self._pending: List[Tuple[object, ProcessingLog]] = []
+        # error log entries for records that failed before reaching the buffer
+        self._error_logs: List[ProcessingLog] = []
+
+        self.written = 0
+        self.errors: List[Dict] = []
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    # =========================================================================
+    # STAGING
+    # =========================================================================
+
+    def add_url_discovery(self, pmid: str, urls: List[Dict], sources_queried: List[str]) -> bool:
+        """Stage URL discovery results (see save_url_discovery). Returns False on error."""
+        start_time = time.time()
+        try:
+            record = self.coordinator._build_url_discovery(self.geo_id, pmid, urls, sources_queried)
+        except Exception as e:
+            self._record_error(pmid, "P2", e, start_time)
+            return False
+        return self._stage(
+            record, "P2", f"Found {len(urls)} URLs from {len(sources_queried)} sources", start_time
+        )
+
+    def add_pdf_acquisition(
+        self,
+        pmid: str,
+        pdf_path: Path,
+        source_url: Optional[str] = None,
+        source_type: Optional[str] = None,
+        download_method: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        Save a PDF to storage now and stage its acquisition record.
+
+        Returns:
+            Storage info (see save_pdf_acquisition), or None on error
+        """
+        start_time = time.time()
+        try:
+            record, pdf_info = self.coordinator._build_pdf_acquisition(
+                self.geo_id, pmid, pdf_path, source_url, source_type, download_method
+            )
+        except Exception as e:
+            self._record_error(pmid, "P3", e, start_time)
+            return None
+        self._stage(record, "P3", f"Saved PDF ({pdf_info['size_bytes']} bytes)", start_time)
+        return pdf_info
+
+    def add_content_extraction(self, pmid: str, extraction_data: Dict) -> bool:
+        """Stage content extraction results (see save_content_extraction). Returns False on error."""
+        start_time = time.time()
+        try:
+            record = self.coordinator._build_content_extraction(self.geo_id, pmid, extraction_data)
+        except Exception as e:
+            self._record_error(pmid, "P4", e, start_time)
+            return False
+        message = f"Extracted {record.word_count or 0} words (grade: {record.extraction_grade or 'N/A'})"
+        return self._stage(record, "P4", message, start_time)
+
+    def add_enriched_content(self, pmid: str, enriched_data: Dict) -> bool:
+        """Stage enriched content and write its JSON backup (see save_enriched_content)."""
+        start_time = time.time()
+        try:
+            record = self.coordinator._build_enriched_content(self.geo_id, pmid, enriched_data)
+            self.coordinator.storage.save_enriched(self.geo_id, pmid, enriched_data)
+        except Exception as e:
+            self._record_error(pmid, "P4", e, start_time)
+            return False
+        enrichers_count = len(enriched_data.get("enrichers_applied", []))
+        return self._stage(record, "P4", f"Applied {enrichers_count} enrichers", start_time)
+
+    def _stage(self, record, pipeline: str, message: str, start_time: float) -> bool:
+        log = ProcessingLog(
+            geo_id=self.geo_id,
+            pmid=record.pmid,
+            pipeline=pipeline,
+            event_type="success",
+            message=message,
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        self._pending.append((record, log))
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+        return True
+
+    def _record_error(self, pmid: str, pipeline: str, error: Exception, start_time: float) -> None:
+        logger.error(f"Error staging {pipeline} record {self.geo_id}/{pmid}: {error}")
+        self.errors.append({"pmid": pmid, "pipeline": pipeline, "error": str(error)})
+        self._error_logs.append(
+            ProcessingLog(
+                geo_id=self.geo_id,
+                pmid=pmid,
+                pipeline=pipeline,
+                event_type="error",
+                message=str(error),
+                duration_ms=int((time.time() - start_time) * 1000),
+                error_type=type(error).__name__,
+            )
+        )
+
+    # =========================================================================
+    # FLUSH
+    # =========================================================================
+
+    def flush(self) -> int:
+        """
+        Write staged records and log entries in one transaction.
+
+        The whole buffer is tried with executemany first; if any row is
+        rejected (e.g. a missing universal_identifiers row), the transaction
+        falls back to a savepoint per record so only the bad records are
+        dropped, each replaced by an error log entry.
+
+        If the transaction itself fails (e.g. "database is locked"), nothing
+        is written and the buffer is kept, so flush() can be retried.
+
+        Returns:
+            Number of stage records written
+        """
+        if not self._pending and not self._error_logs:
+            return 0
+
+        pending = list(self._pending)
+        error_logs = list(self._error_logs)
+        errors_before = len(self.errors)
+        written = 0
+
+        try:
+            with self.db.transaction() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute("SAVEPOINT batch_flush")
+                try:
+                    rows = [row for pair in pending for row in pair]
+                    self.db.insert_records(rows + error_logs, conn)
+                    written = len(pending)
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO batch_flush")
+                    logger.warning(f"Batch insert for {self.geo_id} failed ({e}); retrying per record")
+                    written = self._insert_isolated(conn, pending, error_logs)
+                conn.execute("RELEASE batch_flush")
+        except Exception:
+            # Rolled back: keep the buffer (the PDFs are already in storage) for a retry
+            del self.errors[errors_before:]
+            raise
+
+        # Committed: drop only what this flush wrote
+        del self._pending[: len(pending)]
+        del self._error_logs[: len(error_logs)]
+        self.written += written
+        logger.info(f"Flushed {written}/{len(pending)} stage records for {self.geo_id}")
+        return written
+
+    def _insert_isolated(self, conn: sqlite3.Connection, pending: List[Tuple], error_logs: List) -> int:
+        written = 0
+        for record, log in pending:
+            conn.execute("SAVEPOINT batch_record")
+            try:
+                self.db.insert_records([record, log], conn)
+                written += 1
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK TO batch_record")
+                logger.error(f"Error saving {log.pipeline} record {self.geo_id}/{record.pmid}: {e}")
+                self.errors.append({"pmid": record.pmid, "pipeline": log.pipeline, "error": str(e)})
+                error_logs.append(
+                    ProcessingLog(
+                        geo_id=self.geo_id,
+                        pmid=record.pmid,
+                        pipeline=log.pipeline,
+                        event_type="error",
+                        message=str(e),
+                        error_type=type(e).__name__,
+                    )
+                )
+            conn.execute("RELEASE batch_record")
+
+        self.db.insert_records(error_logs, conn)
+        return written
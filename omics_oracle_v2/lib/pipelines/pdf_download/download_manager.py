@@ -20,6 +20,7 @@ from omics_oracle_v2.lib.pipelines.pdf_download.utils import \
     validate_pdf_content
 from omics_oracle_v2.lib.search_engines.citations.models import Publication
 from omics_oracle_v2.lib.utils.identifiers import UniversalIdentifier
+from omics_oracle_v2.lib.utils.tracing import current_span, span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -467,6 +468,7 @@ class PDFDownloadManager:
 
         return sorted_urls
 
+    @traced("download.pdf")
     async def download_with_fallback(
         self,
         publication: Publication,
@@ -510,6 +512,7 @@ class PDFDownloadManager:
             >>> if download_result.success:
             >>>     print(f"Downloaded from {download_result.source}")
         """
+        current_span().set(pmid=publication.pmid, urls=len(all_urls))
         if not all_urls:
             return DownloadResult(
                 publication=publication, success=False, error="No URLs provided"
@@ -549,7 +552,15 @@ class PDFDownloadManager:
             for attempt in range(max_retries_per_url):
                 try:
                     # Attempt download
-                    result = await self._download_single(publication, url, output_dir)
+                    with span(
+                        "download.attempt",
+                        upstream=source_name,
+                        attempt=attempt + 1,
+                        url_type=url_type_str,
+                    ) as attempt_span:
+                        result = await self._download_single(publication, url, output_dir)
+                        if not result.success:
+                            attempt_span.fail(result.error)
 
                     if result.success and result.pdf_path:
                         # SUCCESS! Return immediately
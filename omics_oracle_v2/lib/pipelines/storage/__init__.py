@@ -45,14 +45,16 @@ Legacy:
 
 from omics_oracle_v2.lib.pipelines.pdf_download import PDFDownloadManager
 
+from .blob_store import BlobStore
 from .geo_storage import GEOStorage
 from .integrity import (IntegrityVerifier, calculate_sha256,
-                        verify_file_integrity)
+                        copy_with_sha256, verify_file_integrity)
 from .models import (CacheMetadata, ContentExtraction, EnrichedContent,
                      GEODataset, PDFAcquisition, ProcessingLog,
                      UniversalIdentifier, URLDiscovery, expires_at_iso,
                      now_iso)
 from .registry import GEORegistry, get_registry
+from .scrubber import IntegrityScrubber
 from .unified_db import UnifiedDatabase
 
 __all__ = [
@@ -60,6 +62,7 @@ __all__ = [
     "UnifiedDatabase",
     # Storage
     "GEOStorage",
+    "BlobStore",
     # Registry
     "GEORegistry",
     "get_registry",
@@ -74,8 +77,10 @@ __all__ = [
     "CacheMetadata",
     # Integrity
     "calculate_sha256",
+    "copy_with_sha256",
     "verify_file_integrity",
     "IntegrityVerifier",
+    "IntegrityScrubber",
     # Utilities
     "now_iso",
     "expires_at_iso",
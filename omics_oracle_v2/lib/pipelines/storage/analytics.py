@@ -0,0 +1,539 @@
+"""
+Columnar Analytics Export
+
+Incrementally exports the unified SQLite database to Parquet so yield
+analysis (acquisition rate by source, extraction quality by journal, time
+to PDF) runs against local files instead of the production database.
+
+- Append-only tables (processing_log, url_discovery, content_extraction,
+  enriched_content) are exported past a rowid watermark into Hive
+  partitions by month: {export_dir}/{table}/month=2025-10/part-*.parquet
+- Tables whose rows are updated in place (geo_datasets, universal_identifiers,
+  pdf_acquisition, geo_statistics) are rewritten as one snapshot file
+- The database is opened read-only and read in short rowid-range queries,
+  so the export never holds a lock for long
+- Large text/JSON columns are left out (full text is exported as its length)
+
+Directory Structure:
+    data/analytics/
+    +-- _export_state.json           (watermarks; written after each part)
+    +-- processing_log/month=2025-10/part-000000000001-000000050000.parquet
+    +-- pdf_acquisition/snapshot.parquet
+
+Usage:
+    AnalyticsExporter("data/database/omics_oracle.db", "data/analytics").export()
+
+    store = AnalyticsStore("data/analytics")
+    store.acquisition_by_source()
+    store.query("SELECT pipeline, COUNT(*) FROM processing_log GROUP BY 1")  # needs duckdb
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .models import now_iso
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "_export_state.json"
+STATE_VERSION = 1
+SNAPSHOT_FILE = "snapshot.parquet"
+PARTITION_COLUMN = "month"
+
+TIMESTAMP_TYPE = pa.timestamp("us", tz="UTC")
+DOWNLOADED_STATUSES = ("downloaded", "success")
+
+
+@dataclass(frozen=True)
+class TableExport:
+    """How one database table is exported."""
+
+    mode: str  # 'append' (rowid watermark) or 'snapshot' (rewritten each run)
+    time_column: Optional[str] = None  # partition by month of this column (append mode)
+    exclude: Tuple[str, ...] = ()
+    # Extra columns computed in SQL: name -> (expression, arrow type)
+    derived: Dict[str, Tuple[str, pa.DataType]] = field(default_factory=dict)
+
+
+EXPORT_TABLES: Dict[str, TableExport] = {
+    "processing_log": TableExport("append", time_column="logged_at"),
+    "url_discovery": TableExport("append", time_column="discovered_at", exclude=("urls_json",)),
+    "content_extraction": TableExport(
+        "append",
+        time_column="extracted_at",
+        exclude=("full_text",),
+        derived={"full_text_chars": ("length(full_text)", pa.int64())},
+    ),
+    "enriched_content": TableExport(
+        "append",
+        time_column="enriched_at",
+        exclude=(
+            "sections_json", "tables_json", "references_json", "figures_json",
+            "chatgpt_prompt", "chatgpt_metadata", "grobid_xml", "grobid_tei_json",
+        ),
+        derived={
+            "has_chatgpt_prompt": ("chatgpt_prompt IS NOT NULL", pa.bool_()),
+            "has_grobid": ("grobid_xml IS NOT NULL", pa.bool_()),
+        },
+    ),
+    # pdf_acquisition rows change status after integrity scrubs
+    "pdf_acquisition": TableExport("snapshot"),
+    "universal_identifiers": TableExport("snapshot"),
+    "geo_datasets": TableExport("snapshot", exclude=("summary",)),
+    "geo_statistics": TableExport("snapshot"),
+}
+
+
+def _arrow_type(name: str, declared: str) -> pa.DataType:
+    """Arrow type for a SQLite column (ISO *_at text columns become timestamps)."""
+    declared = declared.upper()
+    if "INT" in declared:
+        return pa.int64()
+    if "REAL" in declared or "FLOA" in declared or "DOUB" in declared:
+        return pa.float64()
+    if "BOOL" in declared:
+        return pa.bool_()
+    if name.endswith("_at"):
+        return TIMESTAMP_TYPE
+    return pa.string()
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _column_array(values: List[Any], arrow_type: pa.DataType) -> pa.Array:
+    """Build a column, coercing SQLite's dynamically typed values to the declared type."""
+    if arrow_type == pa.string():
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+    if arrow_type == pa.bool_():
+        return pa.array([None if v is None else bool(v) for v in values], pa.bool_())
+    if arrow_type == TIMESTAMP_TYPE:
+        text = pa.array([None if v is None else str(v) for v in values], pa.string())
+        try:
+            return text.cast(TIMESTAMP_TYPE)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return pa.array([None if v is None else _parse_timestamp(v) for v in values], TIMESTAMP_TYPE)
+    try:
+        return pa.array(values, arrow_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(values, pa.string()).cast(arrow_type, safe=False)
+
+
+def _write_parquet_atomic(table: pa.Table, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    os.close(fd)
+    try:
+        pq.write_table(table, tmp_name, compression="zstd")
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+class AnalyticsExporter:
+    """
+    Incremental SQLite -> Parquet exporter for the unified database.
+
+    Features:
+    - Rowid watermarks for append-only tables, snapshots for mutable ones
+    - Monthly Hive partitions, zstd-compressed Parquet parts
+    - Crash-safe: parts are published atomically and parts past the
+      recorded watermark (from an interrupted run) are discarded
+    - Full re-export of a table when its columns change
+
+    Example:
+        exporter = AnalyticsExporter("data/database/omics_oracle.db", "data/analytics")
+        exporter.export()  # {"processing_log": 1200, "url_discovery": 0, ...}
+    """
+
+    def __init__(self, db_path: str | Path, export_dir: str | Path, chunk_size: int = 50_000):
+        """
+        Initialize exporter.
+
+        Args:
+            db_path: Unified SQLite database (opened read-only)
+            export_dir: Parquet output directory
+            chunk_size: Rows read per query (and at most per part file)
+        """
+        self.db_path = Path(db_path)
+        self.export_dir = Path(export_dir)
+        self.chunk_size = chunk_size
+        self.state_path = self.export_dir / STATE_FILE
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=30)
+
+    # =========================================================================
+    # STATE
+    # =========================================================================
+
+    def load_state(self) -> Dict[str, Dict]:
+        """Per-table export state (watermark, columns, rows, exported_at)."""
+        try:
+            with open(self.state_path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        if data.get("version") != STATE_VERSION:
+            return {}
+        return data.get("tables", {})
+
+    def _save_state(self, state: Dict[str, Dict]) -> None:
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.export_dir, prefix=f".{STATE_FILE}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": STATE_VERSION, "tables": state}, f, indent=2)
+            os.replace(tmp_name, self.state_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    # =========================================================================
+    # EXPORT
+    # =========================================================================
+
+    def export(self, tables: Optional[List[str]] = None) -> Dict[str, int]:
+        """
+        Export new rows (append tables) and fresh snapshots (mutable tables).
+
+        Args:
+            tables: Table names to export (default: all of EXPORT_TABLES
+                present in the database)
+
+        Returns:
+            Rows written per table
+        """
+        state = self.load_state()
+        results = {}
+
+        with closing(self._connect()) as conn:
+            existing = {
+                row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            }
+            for name in tables or list(EXPORT_TABLES):
+                if name not in existing:
+                    logger.debug(f"Skipping {name}: not in database")
+                    continue
+                spec = EXPORT_TABLES[name]
+                if spec.mode == "append":
+                    results[name] = self._export_append(conn, name, spec, state)
+                else:
+                    results[name] = self._export_snapshot(conn, name, spec, state)
+
+        logger.info(f"Analytics export to {self.export_dir}: {results}")
+        return results
+
+    def _columns(self, conn: sqlite3.Connection, name: str, spec: TableExport) -> List[Tuple]:
+        """(output name, SQL expression, arrow type) for each exported column."""
+        columns = [
+            (row[1], f'"{row[1]}"', _arrow_type(row[1], row[2] or ""))
+            for row in conn.execute(f'PRAGMA table_info("{name}")')
+            if row[1] not in spec.exclude
+        ]
+        columns += [(column, expr, arrow_type) for column, (expr, arrow_type) in spec.derived.items()]
+        return columns
+
+    def _read_chunks(self, conn, name: str, columns, after: int, upto: int):
+        """Yield (last rowid, rows) in rowid order; each chunk is its own short read."""
+        select = ", ".join(expr for _, expr, _ in columns)
+        sql = f'SELECT rowid, {select} FROM "{name}" WHERE rowid > ? AND rowid <= ? ORDER BY rowid LIMIT ?'
+        while after < upto:
+            rows = conn.execute(sql, (after, upto, self.chunk_size)).fetchall()
+            if not rows:
+                break
+            after = rows[-1][0]
+            yield rows
+
+    @staticmethod
+    def _to_table(rows: List[tuple], columns, schema: pa.Schema) -> pa.Table:
+        arrays = [
+            _column_array([row[i + 1] for row in rows], arrow_type)
+            for i, (_, _, arrow_type) in enumerate(columns)
+        ]
+        return pa.Table.from_arrays(arrays, schema=schema)
+
+    def _export_append(self, conn, name: str, spec: TableExport, state: Dict) -> int:
+        columns = self._columns(conn, name, spec)
+        column_names = [column for column, _, _ in columns]
+        schema = pa.schema([(column, arrow_type) for column, _, arrow_type in columns])
+        table_dir = self.export_dir / name
+
+        entry = state.get(name, {})
+        if entry.get("columns") != column_names:
+            if entry:
+                logger.info(f"Columns of {name} changed; re-exporting it")
+            self._remove_parts(table_dir, after=0)
+            entry = {"watermark": 0, "rows": 0, "columns": column_names}
+        else:
+            self._remove_parts(table_dir, after=entry["watermark"])  # interrupted run
+
+        upto = conn.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM "{name}"').fetchone()[0]
+        time_index = column_names.index(spec.time_column) + 1 if spec.time_column else None
+        written = 0
+
+        for rows in self._read_chunks(conn, name, columns, entry["watermark"], upto):
+            partitions: Dict[str, List[tuple]] = {}
+            for row in rows:
+                stamp = row[time_index] if time_index else None
+                month = str(stamp)[:7] if stamp else "unknown"
+                partitions.setdefault(month, []).append(row)
+
+            for month, part_rows in partitions.items():
+                first, last = part_rows[0][0], part_rows[-1][0]
+                path = table_dir / f"{PARTITION_COLUMN}={month}" / f"part-{first:012d}-{last:012d}.parquet"
+                _write_parquet_atomic(self._to_table(part_rows, columns, schema), path)
+
+            written += len(rows)
+            entry.update(watermark=rows[-1][0], rows=entry["rows"] + len(rows), exported_at=now_iso())
+            state[name] = entry
+            self._save_state(state)
+
+        if name not in state:
+            state[name] = entry
+            self._save_state(state)
+        return written
+
+    @staticmethod
+    def _remove_parts(table_dir: Path, after: int) -> None:
+        """Delete part files whose first rowid is past `after`."""
+        if not table_dir.exists():
+            return
+        for path in table_dir.glob("*/part-*.parquet"):
+            first = int(path.stem.split("-")[1])
+            if first > after:
+                path.unlink()
+
+    def _export_snapshot(self, conn, name: str, spec: TableExport, state: Dict) -> int:
+        columns = self._columns(conn, name, spec)
+        schema = pa.schema([(column, arrow_type) for column, _, arrow_type in columns])
+        path = self.export_dir / name / SNAPSHOT_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        upto = conn.execute(f'SELECT COALESCE(MAX(rowid), 0) FROM "{name}"').fetchone()[0]
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        os.close(fd)
+        written = 0
+        try:
+            with pq.ParquetWriter(tmp_name, schema, compression="zstd") as writer:
+                for rows in self._read_chunks(conn, name, columns, 0, upto):
+                    writer.write_table(self._to_table(rows, columns, schema))
+                    written += len(rows)
+                if not written:
+                    writer.write_table(schema.empty_table())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        state[name] = {
+            "rows": written,
+            "columns": [column for column, _, _ in columns],
+            "exported_at": now_iso(),
+        }
+        self._save_state(state)
+        return written
+
+
+class AnalyticsStore:
+    """
+    Read-only query layer over an analytics export.
+
+    Reports use pyarrow compute; ad-hoc SQL goes through DuckDB when it is
+    installed (optional dependency).
+
+    Example:
+        store = AnalyticsStore("data/analytics")
+        for row in store.acquisition_by_source():
+            print(row["source_type"], row["success_rate"])
+    """
+
+    def __init__(self, export_dir: str | Path):
+        self.export_dir = Path(export_dir)
+
+    def tables(self) -> List[str]:
+        return sorted(name for name in EXPORT_TABLES if (self.export_dir / name).exists())
+
+    def table(self, name: str, columns: Optional[List[str]] = None, filter=None) -> pa.Table:
+        """
+        Load an exported table.
+
+        Args:
+            name: Table name (see EXPORT_TABLES)
+            columns: Columns to read (default: all)
+            filter: pyarrow.compute expression (pushed down to partitions and row groups)
+
+        Returns:
+            pyarrow.Table (empty if the table was never exported)
+
+        Raises:
+            KeyError: If name is not an exported table
+        """
+        spec = EXPORT_TABLES[name]
+        table_dir = self.export_dir / name
+        if spec.mode == "snapshot":
+            path = table_dir / SNAPSHOT_FILE
+            if not path.exists():
+                return pa.table({})
+            return pq.read_table(path, columns=columns, filters=filter)
+
+        if not table_dir.exists():
+            return pa.table({})
+        dataset = ds.dataset(
+            table_dir,
+            format="parquet",
+            partitioning=ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive"),
+            exclude_invalid_files=True,
+        )
+        return dataset.to_table(columns=columns, filter=filter)
+
+    def query(self, sql: str) -> pa.Table:
+        """
+        Run SQL over the export with DuckDB (tables are exposed as views).
+
+        Raises:
+            ImportError: If duckdb is not installed
+        """
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("AnalyticsStore.query needs duckdb (pip install duckdb)") from e
+
+        conn = duckdb.connect()
+        try:
+            for name in self.tables():
+                if EXPORT_TABLES[name].mode == "snapshot":
+                    source = f"read_parquet('{self.export_dir / name / SNAPSHOT_FILE}')"
+                else:
+                    source = f"read_parquet('{self.export_dir / name}/*/*.parquet', hive_partitioning = true)"
+                conn.execute(f"CREATE VIEW {name} AS SELECT * FROM {source}")
+            return conn.execute(sql).fetch_arrow_table()
+        finally:
+            conn.close()
+
+    # =========================================================================
+    # REPORTS
+    # =========================================================================
+
+    def acquisition_by_source(self) -> List[Dict[str, Any]]:
+        """PDF acquisition attempts and success rate per source_type."""
+        pdfs = self.table("pdf_acquisition", columns=["source_type", "status"])
+        if not pdfs.num_rows:
+            return []
+        pdfs = pdfs.append_column(
+            "ok", pc.cast(pc.is_in(pdfs["status"], pa.array(DOWNLOADED_STATUSES)), pa.int64())
+        )
+        grouped = pdfs.group_by("source_type").aggregate([("ok", "count"), ("ok", "sum")])
+
+        rows = [
+            {
+                "source_type": row["source_type"],
+                "attempts": row["ok_count"],
+                "downloaded": row["ok_sum"],
+                "success_rate": round(row["ok_sum"] / row["ok_count"], 4) if row["ok_count"] else 0.0,
+            }
+            for row in grouped.to_pylist()
+        ]
+        return sorted(rows, key=lambda row: row["attempts"], reverse=True)
+
+    def extraction_quality_by_journal(self, min_papers: int = 1) -> List[Dict[str, Any]]:
+        """Mean extraction quality and A/B share per journal."""
+        extractions = self.table(
+            "content_extraction", columns=["geo_id", "pmid", "extraction_quality", "extraction_grade"]
+        )
+        papers = self.table("universal_identifiers", columns=["geo_id", "pmid", "journal"])
+        if not extractions.num_rows or not papers.num_rows:
+            return []
+
+        joined = extractions.join(papers, keys=["geo_id", "pmid"], join_type="inner")
+        joined = joined.append_column(
+            "high_quality", pc.cast(pc.is_in(joined["extraction_grade"], pa.array(["A", "B"])), pa.int64())
+        )
+        grouped = joined.group_by("journal").aggregate(
+            [("extraction_quality", "mean"), ("high_quality", "sum"), ("high_quality", "count")]
+        )
+
+        rows = [
+            {
+                "journal": row["journal"],
+                "extractions": row["high_quality_count"],
+                "avg_quality": row["extraction_quality_mean"],
+                "high_quality_rate": round(row["high_quality_sum"] / row["high_quality_count"], 4),
+            }
+            for row in grouped.to_pylist()
+            if row["high_quality_count"] >= min_papers
+        ]
+        return sorted(rows, key=lambda row: row["extractions"], reverse=True)
+
+    def time_to_pdf(self) -> Dict[str, Any]:
+        """Hours from a paper's discovery to its first successful PDF download."""
+        pdfs = self.table(
+            "pdf_acquisition",
+            columns=["geo_id", "pmid", "downloaded_at"],
+            filter=pc.is_in(pc.field("status"), pa.array(DOWNLOADED_STATUSES)),
+        )
+        papers = self.table("universal_identifiers", columns=["geo_id", "pmid", "first_discovered_at"])
+        if not pdfs.num_rows or not papers.num_rows:
+            return {"papers": 0}
+
+        first_pdf = pdfs.group_by(["geo_id", "pmid"]).aggregate([("downloaded_at", "min")])
+        joined = first_pdf.join(papers, keys=["geo_id", "pmid"], join_type="inner")
+        delay = pc.subtract(joined["downloaded_at_min"], joined["first_discovered_at"])
+        hours = pc.divide(pc.cast(pc.cast(delay, pa.duration("us")), pa.int64()), 3_600_000_000.0)
+        hours = pc.drop_null(hours)
+        if not len(hours):
+            return {"papers": 0}
+
+        median, p90 = pc.quantile(hours, q=[0.5, 0.9]).to_pylist()
+        return {
+            "papers": len(hours),
+            "mean_hours": pc.mean(hours).as_py(),
+            "median_hours": median,
+            "p90_hours": p90,
+        }
+
+    def pipeline_events(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Event counts and mean duration per pipeline and event type."""
+        log_filter = None
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            log_filter = pc.field("logged_at") >= pa.scalar(since, TIMESTAMP_TYPE)
+        events = self.table(
+            "processing_log", columns=["pipeline", "event_type", "duration_ms"], filter=log_filter
+        )
+        if not events.num_rows:
+            return []
+
+        grouped = events.group_by(["pipeline", "event_type"]).aggregate(
+            [("event_type", "count"), ("duration_ms", "mean")]
+        )
+        rows = [
+            {
+                "pipeline": row["pipeline"],
+                "event_type": row["event_type"],
+                "events": row["event_type_count"],
+                "avg_duration_ms": row["duration_ms_mean"],
+            }
+            for row in grouped.to_pylist()
+        ]
+        return sorted(rows, key=lambda row: (row["pipeline"], row["event_type"]))
@@ -0,0 +1,253 @@
+"""
+Content-Addressed Blob Store
+
+Write-once storage for PDFs keyed by SHA256, so a paper cited by many GEO
+datasets is stored once. GEOStorage exposes blobs under per-GEO paths as
+hardlinks (or manifest references where hardlinks are unavailable).
+
+Directory Structure:
+    data/pdfs/blobs/
+    +-- ab/cd/abcd1234....pdf   (read-only; link count - 1 = hardlink references)
+    +-- .tmp/                   (in-flight writes, published with os.replace;
+                                 {sha256}.pin touch files protect reused blobs from GC)
+
+Usage:
+    store = BlobStore(Path("data/pdfs/blobs"))
+    blob = store.put(Path("download.pdf"))      # hash + copy in one pass
+    store.link(blob["sha256"], Path("data/pdfs/by_geo/GSE1/pmid_1.pdf"))
+"""
+
+import errno
+import logging
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .integrity import calculate_sha256, copy_with_sha256, verify_file_integrity
+
+logger = logging.getLogger(__name__)
+
+# Blobs younger than this are never garbage collected: a concurrent save may
+# have published the blob but not linked it yet.
+GC_GRACE_SECONDS = 3600
+
+# os.link() failures meaning "no hardlinks here" (cross-device, unsupported
+# filesystem, link limit) rather than a real error
+LINK_UNSUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+
+
+class BlobStore:
+    """
+    Content-addressed, write-once file store.
+
+    Features:
+    - SHA256 computed while streaming the copy (single read of the source)
+    - Atomic publish (temp file + os.replace); duplicates are dropped
+    - Hardlink references with filesystem-maintained reference counts
+    - Garbage collection of unreferenced blobs
+
+    Example:
+        store = BlobStore(Path("data/pdfs/blobs"))
+        blob = store.put(Path("paper.pdf"))
+        store.refcount(blob["sha256"])  # 0 until linked
+    """
+
+    def __init__(self, root: str | Path, suffix: str = ".pdf"):
+        """
+        Initialize blob store.
+
+        Args:
+            root: Blob directory (e.g., "data/pdfs/blobs")
+            suffix: File extension for blobs
+        """
+        self.root = Path(root)
+        self.suffix = suffix
+        self.tmp_dir = self.root / ".tmp"
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    def blob_path(self, sha256: str) -> Path:
+        """Path of a blob: {root}/ab/cd/{sha256}{suffix}."""
+        return self.root / sha256[:2] / sha256[2:4] / f"{sha256}{self.suffix}"
+
+    def exists(self, sha256: str) -> bool:
+        return self.blob_path(sha256).exists()
+
+    def _pin_path(self, sha256: str) -> Path:
+        # Not the blob itself: its mtime is shared by every hardlink
+        return self.tmp_dir / f"{sha256}.pin"
+
+    def put(self, source_path: Path, verify: bool = True) -> Dict[str, Any]:
+        """
+        Store a file, deduplicating by content.
+
+        Args:
+            source_path: File to store
+            verify: Re-hash a newly written blob before publishing it
+
+        Returns:
+            Dictionary with blob info:
+            {
+                "sha256": "hash...",
+                "size_bytes": 1234567,
+                "path": Path to blob,
+                "created": False if the content was already stored,
+                "verified": True
+            }
+
+        Raises:
+            ValueError: If the written copy does not match the source hash
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self.tmp_dir, suffix=self.suffix)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+
+        try:
+            sha256, size = copy_with_sha256(source_path, tmp_path)
+            dest = self.blob_path(sha256)
+
+            # Pin before checking: a GC between the check and the pin could
+            # otherwise delete the blob we are about to reuse
+            self._pin_path(sha256).touch()
+            if dest.exists():
+                logger.debug(f"Blob already stored: {sha256}")
+                return {"sha256": sha256, "size_bytes": size, "path": dest, "created": False, "verified": verify}
+
+            if verify and not verify_file_integrity(tmp_path, sha256):
+                raise ValueError(f"Integrity verification failed writing blob {sha256}")
+
+            # Blobs are immutable: hardlinked per-GEO paths must not be edited in place
+            os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, dest)
+            logger.info(f"Stored blob {sha256} ({size} bytes)")
+            return {"sha256": sha256, "size_bytes": size, "path": dest, "created": True, "verified": verify}
+
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def adopt(self, file_path: Path, sha256: Optional[str] = None) -> str:
+        """
+        Move an existing file into the store without copying it.
+
+        The file becomes a hardlink of the blob; if identical content is
+        already stored, the file is replaced by a link to that blob instead.
+
+        Args:
+            file_path: File already on disk (e.g., a legacy per-GEO copy)
+            sha256: Known hash of the file (calculated if None)
+
+        Returns:
+            SHA256 of the file
+        """
+        sha256 = sha256 or calculate_sha256(file_path)
+        dest = self.blob_path(sha256)
+
+        if dest.exists():
+            if not os.path.samefile(dest, file_path):
+                self.link(sha256, file_path)
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(file_path, dest)
+            except OSError:
+                copy_with_sha256(file_path, dest)
+            os.chmod(dest, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+
+        return sha256
+
+    def link(self, sha256: str, dest_path: Path) -> bool:
+        """
+        Point dest_path at a blob with a hardlink (replacing dest_path atomically).
+
+        Args:
+            sha256: Blob hash
+            dest_path: Path to create
+
+        Returns:
+            False if the filesystem cannot hardlink (caller should reference the blob)
+
+        Raises:
+            OSError: For any other link failure (missing blob, permissions, ...)
+        """
+        tmp_link = dest_path.with_name(f".{dest_path.name}.link")
+        tmp_link.unlink(missing_ok=True)
+        try:
+            os.link(self.blob_path(sha256), tmp_link)
+        except OSError as e:
+            if e.errno not in LINK_UNSUPPORTED_ERRNOS:
+                raise
+            logger.debug(f"Hardlink unavailable for {dest_path}: {e}")
+            return False
+        os.replace(tmp_link, dest_path)
+        return True
+
+    def refcount(self, sha256: str) -> int:
+        """Number of hardlinks to a blob besides the blob itself (0 if missing)."""
+        try:
+            return self.blob_path(sha256).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def iter_blobs(self) -> Iterator[str]:
+        """Yield the hash of every stored blob."""
+        for path in self.root.glob(f"*/*/*{self.suffix}"):
+            yield path.name[: -len(self.suffix)] if self.suffix else path.name
+
+    def remove(self, sha256: str) -> bool:
+        """Delete a blob (hardlinked copies elsewhere stay intact)."""
+        path = self.blob_path(sha256)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
+
+    def collect_garbage(
+        self, referenced: set, grace_seconds: int = GC_GRACE_SECONDS, dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Remove blobs with no hardlinks that are not in `referenced`.
+
+        Args:
+            referenced: Hashes referenced by manifests (non-hardlink references)
+            grace_seconds: Skip blobs stored or reused more recently than this
+            dry_run: Report without deleting
+
+        Returns:
+            Dictionary with "removed" hashes and "freed_bytes"
+        """
+        cutoff = time.time() - grace_seconds
+        removed = []
+        freed = 0
+
+        for sha256 in list(self.iter_blobs()):
+            path = self.blob_path(sha256)
+            info = path.stat()
+            if info.st_nlink > 1 or sha256 in referenced or info.st_mtime > cutoff:
+                continue
+            pin = self._pin_path(sha256)
+            if pin.exists() and pin.stat().st_mtime > cutoff:
+                continue
+            removed.append(sha256)
+            freed += info.st_size
+            if not dry_run:
+                path.unlink()
+
+        # Writes abandoned by crashed processes, and expired pins
+        for tmp_path in self.tmp_dir.iterdir():
+            if tmp_path.stat().st_mtime < cutoff and not dry_run:
+                tmp_path.unlink(missing_ok=True)
+
+        logger.info(f"Blob GC: {len(removed)} unreferenced blobs, {freed} bytes" + (" (dry run)" if dry_run else ""))
+        return {"removed": removed, "freed_bytes": freed, "dry_run": dry_run}
+
+    def stats(self) -> Dict[str, Any]:
+        """Physical storage used by the store."""
+        sizes = [self.blob_path(sha256).stat().st_size for sha256 in self.iter_blobs()]
+        return {
+            "blobs": len(sizes),
+            "size_bytes": sum(sizes),
+            "size_mb": round(sum(sizes) / (1024 * 1024), 2),
+        }
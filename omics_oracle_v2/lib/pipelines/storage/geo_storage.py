@@ -4,13 +4,20 @@ GEO-Centric Storage Manager
 Organizes PDFs and other files by GEO dataset ID.
 Provides manifest management and integrity verification.
 
+PDF content is stored once in a content-addressed blob store; per-GEO
+paths are hardlinks to the blob (or, where the filesystem cannot hardlink,
+manifest references to it).
+
 Directory Structure:
     data/
+    +-- pdfs/blobs/
+    |   +-- ab/cd/abcd1234....pdf
     +-- pdfs/by_geo/
     |   +-- GSE12345/
-    |   |   +-- pmid_12345678.pdf
+    |   |   +-- pmid_12345678.pdf   (hardlink to a blob)
     |   |   +-- pmid_87654321.pdf
-    |   |   +-- .manifest.json
+    |   |   +-- .manifest.json      (compacted snapshot)
+    |   |   +-- .manifest.journal   (one JSON line per mutation since)
     |   +-- GSE67890/
     |       +-- ...
     +-- enriched/by_geo/
@@ -20,15 +27,27 @@ Directory Structure:
 
 import json
 import logging
+import os
 import shutil
+import tempfile
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .blob_store import GC_GRACE_SECONDS, BlobStore
 from .integrity import calculate_sha256, get_file_info, verify_file_integrity
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Compact once the journal outgrows the snapshot (amortized O(N) bytes written)
+MANIFEST_COMPACT_MIN_BYTES = 64 * 1024
+
 
 class GEOStorage:
     """
@@ -37,8 +56,9 @@ class GEOStorage:
     Features:
     - Organize files by GEO dataset ID
     - Automatic directory creation
+    - Content-addressed PDF deduplication across datasets
     - SHA256 hash calculation
-    - Manifest file management
+    - Append-only journaled manifests (locked appends, atomic compaction)
     - Integrity verification
 
     Example:
@@ -71,6 +91,8 @@ class GEOStorage:
         self.base_dir = Path(base_dir)
         self.pdfs_dir = self.base_dir / "pdfs" / "by_geo"
         self.enriched_dir = self.base_dir / "enriched" / "by_geo"
+        self.blobs = BlobStore(self.base_dir / "pdfs" / "blobs")
+        self._manifest_cache: Dict[str, tuple] = {}  # geo_id -> (file signature, manifest)
 
         # Create base directories
         self.pdfs_dir.mkdir(parents=True, exist_ok=True)
@@ -99,27 +121,171 @@ class GEOStorage:
         geo_dir.mkdir(parents=True, exist_ok=True)
         return geo_dir
 
+    # =========================================================================
+    # MANIFESTS
+    # =========================================================================
+    #
+    # A manifest is a snapshot (.manifest.json) plus an append-only journal
+    # (.manifest.journal) of {"op": "put"|"delete", "pmid", "entry", "at"}
+    # records. Writers append under an exclusive lock; compaction folds the
+    # journal into a new snapshot and then swaps in an empty journal, both by
+    # atomic rename. Readers take no lock: they read the journal before the
+    # snapshot, and replaying a journal onto a snapshot that already contains
+    # it is idempotent.
+
     def _get_manifest_path(self, geo_id: str) -> Path:
-        """Get path to manifest file for a GEO dataset."""
+        """Get path to manifest snapshot for a GEO dataset."""
         return self._get_geo_dir(geo_id, "pdfs") / ".manifest.json"
 
+    def _get_journal_path(self, geo_id: str) -> Path:
+        """Get path to manifest journal for a GEO dataset."""
+        return self._get_geo_dir(geo_id, "pdfs") / ".manifest.journal"
+
+    @contextmanager
+    def _manifest_lock(self, geo_id: str):
+        """Exclusive lock serializing manifest writers across threads and processes."""
+        with open(self._get_geo_dir(geo_id, "pdfs") / ".manifest.lock", "a") as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[tuple]:
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            return None
+        return (info.st_ino, info.st_mtime_ns, info.st_size)
+
+    @staticmethod
+    def _copy_manifest(manifest: dict) -> dict:
+        return {**manifest, "files": {pmid: dict(entry) for pmid, entry in manifest["files"].items()}}
+
     def _load_manifest(self, geo_id: str) -> dict:
-        """Load manifest file for a GEO dataset."""
+        """
+        Load manifest for a GEO dataset (snapshot + journal), cached by file signature.
+
+        Returns a copy; callers may modify it freely.
+        """
         manifest_path = self._get_manifest_path(geo_id)
+        journal_path = self._get_journal_path(geo_id)
 
-        if not manifest_path.exists():
-            return {"geo_id": geo_id, "files": {}, "created_at": datetime.utcnow().isoformat()}
+        signature = (self._file_signature(journal_path), self._file_signature(manifest_path))
+        cached = self._manifest_cache.get(geo_id)
+        if cached and cached[0] == signature:
+            return self._copy_manifest(cached[1])
 
-        with open(manifest_path) as f:
-            return json.load(f)
+        # Journal first: see class comment on MANIFESTS
+        records = self._read_journal(journal_path)
 
-    def _save_manifest(self, geo_id: str, manifest: dict):
-        """Save manifest file for a GEO dataset."""
-        manifest_path = self._get_manifest_path(geo_id)
+        if manifest_path.exists():
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+        else:
+            manifest = {"geo_id": geo_id, "files": {}, "created_at": datetime.utcnow().isoformat()}
+
+        self._apply_records(manifest, records)
+        self._manifest_cache[geo_id] = (signature, manifest)
+        return self._copy_manifest(manifest)
+
+    @staticmethod
+    def _read_journal(journal_path: Path) -> List[dict]:
+        records = []
+        try:
+            with open(journal_path) as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return records
+
+        for line_no, line in enumerate(lines, 1):
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A crash mid-append leaves at most one torn record
+                logger.warning(f"Skipping corrupt manifest journal record {journal_path}:{line_no}")
+        return records
+
+    @staticmethod
+    def _apply_records(manifest: dict, records: List[dict]) -> None:
+        for record in records:
+            if record["op"] == "put":
+                manifest["files"][record["pmid"]] = record["entry"]
+            elif record["op"] == "delete":
+                manifest["files"].pop(record["pmid"], None)
+            manifest["updated_at"] = record["at"]
+
+    def _append_manifest(self, geo_id: str, records: List[dict]) -> None:
+        """
+        Append mutation records to the journal; compact when it gets large.
+
+        Args:
+            geo_id: GEO dataset ID
+            records: {"op": "put", "pmid", "entry"} or {"op": "delete", "pmid"}
+        """
+        now = datetime.utcnow().isoformat()
+        data = "".join(json.dumps({**record, "at": now}) + "\n" for record in records)
+
+        with self._manifest_lock(geo_id):
+            journal_path = self._get_journal_path(geo_id)
+            with open(journal_path, "a") as f:
+                f.write(data)
+
+            manifest_path = self._get_manifest_path(geo_id)
+            snapshot_size = manifest_path.stat().st_size if manifest_path.exists() else 0
+            if journal_path.stat().st_size > max(MANIFEST_COMPACT_MIN_BYTES, snapshot_size):
+                self._compact_locked(geo_id)
+
+    def _put_manifest_entry(self, geo_id: str, pmid: str, entry: dict) -> None:
+        self._append_manifest(geo_id, [{"op": "put", "pmid": pmid, "entry": entry}])
+
+    def _delete_manifest_entry(self, geo_id: str, pmid: str) -> None:
+        self._append_manifest(geo_id, [{"op": "delete", "pmid": pmid}])
+
+    def _write_json_atomic(self, path: Path, data: dict) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _compact_locked(self, geo_id: str, manifest: Optional[dict] = None) -> dict:
+        """Write a new snapshot (caller holds the lock), then swap in an empty journal."""
+        if manifest is None:
+            manifest = self._load_manifest(geo_id)
         manifest["updated_at"] = datetime.utcnow().isoformat()
 
-        with open(manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
+        self._write_json_atomic(self._get_manifest_path(geo_id), manifest)
+
+        journal_path = self._get_journal_path(geo_id)
+        empty = journal_path.with_name(f"{journal_path.name}.new")
+        empty.write_text("")
+        os.replace(empty, journal_path)
+        return manifest
+
+    def compact_manifest(self, geo_id: str) -> dict:
+        """
+        Fold the journal into the snapshot.
+
+        Args:
+            geo_id: GEO dataset ID
+
+        Returns:
+            Compacted manifest
+        """
+        with self._manifest_lock(geo_id):
+            return self._compact_locked(geo_id)
+
+    def _save_manifest(self, geo_id: str, manifest: dict):
+        """Replace the whole manifest for a GEO dataset (snapshot + empty journal)."""
+        with self._manifest_lock(geo_id):
+            self._compact_locked(geo_id, manifest)
 
     # =========================================================================
     # PDF OPERATIONS
@@ -135,6 +301,10 @@ class GEOStorage:
         """
         Save PDF to GEO-organized directory.
 
+        The PDF is hashed while it is copied into the blob store (one read of
+        the source); identical content already stored is reused. The per-GEO
+        path is then hardlinked to the blob.
+
         Args:
             geo_id: GEO dataset ID
             pmid: PubMed ID
@@ -148,7 +318,8 @@ class GEOStorage:
                 "full_path": Path object,
                 "sha256": "hash...",
                 "size_bytes": 1234567,
-                "verified": True
+                "verified": True,
+                "deduplicated": False  # True if the content was already stored
             }
 
         Raises:
@@ -163,31 +334,38 @@ class GEOStorage:
         dest_filename = f"pmid_{pmid}.pdf"
         dest_path = geo_dir / dest_filename
 
-        # Calculate hash before copying
-        source_hash = calculate_sha256(source_path)
-        source_size = source_path.stat().st_size
+        # Hash + copy into the blob store in one pass (raises if verification fails)
+        blob = self.blobs.put(source_path, verify=verify_after_save)
+        source_hash = blob["sha256"]
+        source_size = blob["size_bytes"]
+        verified = blob["verified"]
 
-        # Copy file
-        shutil.copy2(source_path, dest_path)
-        logger.info(f"Saved PDF: {dest_path}")
-
-        # Verify after save
-        verified = False
-        if verify_after_save:
-            verified = verify_file_integrity(dest_path, source_hash)
-            if not verified:
-                raise ValueError(f"Integrity verification failed for {dest_path}")
+        # Expose the blob under the per-GEO path
+        if self.blobs.link(source_hash, dest_path):
+            storage = "hardlink"
+        else:
+            storage = "reference"
+            dest_path.unlink(missing_ok=True)  # Stale copy from an earlier save
+            dest_path = blob["path"]
+        logger.info(
+            f"Saved PDF: {geo_dir / dest_filename} "
+            f"({'deduplicated' if not blob['created'] else 'new blob'}, {storage})"
+        )
 
-        # Update manifest
-        manifest = self._load_manifest(geo_id)
-        manifest["files"][pmid] = {
-            "filename": dest_filename,
-            "sha256": source_hash,
-            "size_bytes": source_size,
-            "saved_at": datetime.utcnow().isoformat(),
-            "verified": verified,
-        }
-        self._save_manifest(geo_id, manifest)
+        # Update manifest (one journal line, not a rewrite)
+        self._put_manifest_entry(
+            geo_id,
+            pmid,
+            {
+                "filename": dest_filename,
+                "sha256": source_hash,
+                "size_bytes": source_size,
+                "saved_at": datetime.utcnow().isoformat(),
+                "verified": verified,
+                "blob": source_hash,
+                "storage": storage,
+            },
+        )
 
         # Return relative path for database storage
         relative_path = dest_path.relative_to(self.base_dir)
@@ -198,6 +376,7 @@ class GEOStorage:
             "sha256": source_hash,
             "size_bytes": source_size,
             "verified": verified,
+            "deduplicated": not blob["created"],
         }
 
     def get_pdf_path(self, geo_id: str, pmid: str, absolute: bool = True) -> Optional[Path]:
@@ -216,7 +395,11 @@ class GEOStorage:
         pdf_path = geo_dir / f"pmid_{pmid}.pdf"
 
         if not pdf_path.exists():
-            return None
+            # Saved as a manifest reference (no hardlink support)
+            entry = self._load_manifest(geo_id)["files"].get(pmid, {})
+            if entry.get("storage") != "reference" or not self.blobs.exists(entry["blob"]):
+                return None
+            pdf_path = self.blobs.blob_path(entry["blob"])
 
         if absolute:
             return pdf_path
@@ -251,6 +434,9 @@ class GEOStorage:
         """
         Delete PDF file and remove from manifest.
 
+        The blob itself is reclaimed by collect_garbage() once no dataset
+        references it.
+
         Args:
             geo_id: GEO dataset ID
             pmid: PubMed ID
@@ -262,15 +448,14 @@ class GEOStorage:
         if not pdf_path:
             return False
 
-        # Remove file
-        pdf_path.unlink()
-        logger.info(f"Deleted PDF: {pdf_path}")
+        # Remove the per-GEO link (never the shared blob)
+        if pdf_path.parent == self._get_geo_dir(geo_id, "pdfs"):
+            pdf_path.unlink()
+        logger.info(f"Deleted PDF: {geo_id}/{pmid}")
 
         # Update manifest
-        manifest = self._load_manifest(geo_id)
-        if pmid in manifest["files"]:
-            del manifest["files"][pmid]
-            self._save_manifest(geo_id, manifest)
+        if pmid in self._load_manifest(geo_id)["files"]:
+            self._delete_manifest_entry(geo_id, pmid)
 
         return True
 
@@ -343,11 +528,10 @@ class GEOStorage:
                 "has_manifest": True
             }
         """
-        geo_dir = self._get_geo_dir(geo_id, "pdfs")
-        pdf_files = list(geo_dir.glob("pmid_*.pdf"))
+        pdf_files = self._list_pdfs(geo_id)
 
-        total_size = sum(f.stat().st_size for f in pdf_files)
-        pmids = [f.stem.replace("pmid_", "") for f in pdf_files]
+        total_size = sum(path.stat().st_size for path in pdf_files.values())
+        pmids = list(pdf_files)
 
         manifest_path = self._get_manifest_path(geo_id)
 
@@ -357,9 +541,20 @@ class GEOStorage:
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "files": sorted(pmids),
-            "has_manifest": manifest_path.exists(),
+            "has_manifest": manifest_path.exists() or self._get_journal_path(geo_id).exists(),
         }
 
+    def _list_pdfs(self, geo_id: str) -> Dict[str, Path]:
+        """PMID -> PDF path for a GEO dataset (hardlinked files and blob references)."""
+        geo_dir = self._get_geo_dir(geo_id, "pdfs")
+        pdfs = {f.stem.replace("pmid_", ""): f for f in geo_dir.glob("pmid_*.pdf")}
+
+        for pmid, entry in self._load_manifest(geo_id)["files"].items():
+            if pmid not in pdfs and entry.get("storage") == "reference" and self.blobs.exists(entry["blob"]):
+                pdfs[pmid] = self.blobs.blob_path(entry["blob"])
+
+        return pdfs
+
     def list_all_geo_ids(self) -> List[str]:
         """
         Get list of all GEO dataset IDs with stored files.
@@ -406,7 +601,10 @@ class GEOStorage:
         """
         Rebuild manifest from existing PDF files.
 
-        Useful for recovery if manifest is lost or corrupted.
+        Useful for recovery if manifest is lost or corrupted. Writes a fresh
+        snapshot and discards the journal. Blob references (saved where the
+        filesystem could not hardlink) have no per-GEO file, so they are
+        carried over from the old manifest while their blob still exists.
 
         Args:
             geo_id: GEO dataset ID
@@ -431,6 +629,23 @@ class GEOStorage:
                 "verified": True,
             }
 
+            blob_path = self.blobs.blob_path(file_info["sha256"])
+            if blob_path.exists() and blob_path.samefile(pdf_path):
+                manifest["files"][pmid].update(blob=file_info["sha256"], storage="hardlink")
+
+        try:
+            previous = self._load_manifest(geo_id)["files"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Old manifest for {geo_id} unreadable, blob references not recovered: {e}")
+            previous = {}
+        for pmid, entry in previous.items():
+            if (
+                pmid not in manifest["files"]
+                and entry.get("storage") == "reference"
+                and self.blobs.exists(entry["blob"])
+            ):
+                manifest["files"][pmid] = entry
+
         self._save_manifest(geo_id, manifest)
         logger.info(f"Rebuilt manifest for {geo_id}: {len(manifest['files'])} files")
 
@@ -451,17 +666,16 @@ class GEOStorage:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy PDFs
-        geo_dir = self._get_geo_dir(geo_id, "pdfs")
-        pdf_files = list(geo_dir.glob("pmid_*.pdf"))
+        pdf_files = self._list_pdfs(geo_id)
 
-        for pdf_file in pdf_files:
-            dest_path = output_dir / pdf_file.name
-            shutil.copy2(pdf_file, dest_path)
+        for pmid, pdf_file in pdf_files.items():
+            dest_path = output_dir / f"pmid_{pmid}.pdf"
+            shutil.copyfile(pdf_file, dest_path)  # Plain copy: not read-only, not a link
 
-        # Copy manifest
-        manifest_path = self._get_manifest_path(geo_id)
-        if manifest_path.exists():
-            shutil.copy2(manifest_path, output_dir / ".manifest.json")
+        # Write manifest (snapshot with the journal folded in)
+        if self._get_manifest_path(geo_id).exists() or self._get_journal_path(geo_id).exists():
+            with open(output_dir / ".manifest.json", "w") as f:
+                json.dump(self._load_manifest(geo_id), f, indent=2)
 
         # Copy enriched content if available
         enriched_dir = self._get_geo_dir(geo_id, "enriched")
@@ -478,3 +692,100 @@ class GEOStorage:
             "pdfs_exported": len(pdf_files),
             "output_dir": str(output_dir),
         }
+
+    # =========================================================================
+    # BLOB STORE MAINTENANCE
+    # =========================================================================
+
+    def collect_garbage(self, grace_seconds: int = GC_GRACE_SECONDS, dry_run: bool = False) -> Dict[str, any]:
+        """
+        Delete blobs no longer referenced by any GEO dataset.
+
+        Hardlinked references are counted by the filesystem (link count);
+        manifest references are collected from every manifest.
+
+        Args:
+            grace_seconds: Skip blobs stored or reused more recently than this
+            dry_run: Report without deleting
+
+        Returns:
+            Dictionary with "removed" hashes and "freed_bytes"
+        """
+        referenced = set()
+        for geo_id in self.list_all_geo_ids():
+            for entry in self._load_manifest(geo_id)["files"].values():
+                if entry.get("storage") == "reference":
+                    referenced.add(entry["blob"])
+
+        return self.blobs.collect_garbage(referenced, grace_seconds=grace_seconds, dry_run=dry_run)
+
+    def deduplicate_existing(self) -> Dict[str, any]:
+        """
+        Move PDFs saved before the blob store into it.
+
+        Each legacy per-GEO copy becomes a hardlink to its blob, so identical
+        papers across datasets share one copy on disk. Safe to re-run.
+
+        Returns:
+            Dictionary with counts and bytes reclaimed
+        """
+        migrated = 0
+        reclaimed = 0
+
+        for geo_id in self.list_all_geo_ids():
+            manifest = self._load_manifest(geo_id)
+            records = []
+
+            for pdf_path in self._get_geo_dir(geo_id, "pdfs").glob("pmid_*.pdf"):
+                pmid = pdf_path.stem.replace("pmid_", "")
+                entry = manifest["files"].get(pmid)
+                if entry and entry.get("blob") and pdf_path.stat().st_nlink > 1:
+                    continue  # Already linked to a blob
+
+                # Hash the actual bytes: a stale manifest hash must not name a blob
+                size = pdf_path.stat().st_size
+                sha256 = calculate_sha256(pdf_path)
+                if self.blobs.exists(sha256):
+                    reclaimed += size  # This copy becomes a link to the stored blob
+                self.blobs.adopt(pdf_path, sha256)
+
+                entry = entry or {
+                    "filename": pdf_path.name,
+                    "sha256": sha256,
+                    "size_bytes": size,
+                    "saved_at": datetime.utcnow().isoformat(),
+                    "verified": True,
+                }
+                entry.update(blob=sha256, storage="hardlink")
+                records.append({"op": "put", "pmid": pmid, "entry": entry})
+                migrated += 1
+
+            if records:
+                self._append_manifest(geo_id, records)
+
+        stats = self.blobs.stats()
+        logger.info(f"Deduplicated {migrated} PDFs into {stats['blobs']} blobs ({reclaimed} bytes reclaimed)")
+        return {"migrated": migrated, "reclaimed_bytes": reclaimed, **stats}
+
+    def get_storage_stats(self) -> Dict[str, any]:
+        """
+        Logical vs physical PDF storage across all datasets.
+
+        Returns:
+            Dictionary with per-GEO (logical) and blob (physical) sizes
+        """
+        logical = 0
+        references = 0
+        for geo_id in self.list_all_geo_ids():
+            for entry in self._load_manifest(geo_id)["files"].values():
+                logical += entry.get("size_bytes", 0)
+                references += 1
+
+        physical = self.blobs.stats()
+        return {
+            "references": references,
+            "logical_bytes": logical,
+            "physical_bytes": physical["size_bytes"],
+            "unique_blobs": physical["blobs"],
+            "dedup_ratio": round(logical / physical["size_bytes"], 2) if physical["size_bytes"] else 1.0,
+        }
@@ -11,12 +11,13 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 
-def calculate_sha256(file_path: Path) -> str:
+def calculate_sha256(file_path: Path, chunk_size: int = 8192) -> str:
     """
     Calculate SHA256 hash of a file.
 
     Args:
         file_path: Path to file
+        chunk_size: Read block size (larger blocks for bulk scrubbing)
 
     Returns:
         Hexadecimal SHA256 hash string
@@ -28,13 +29,40 @@ def calculate_sha256(file_path: Path) -> str:
     sha256_hash = hashlib.sha256()
 
     with open(file_path, "rb") as f:
-        # Read in 8KB chunks for memory efficiency
-        for byte_block in iter(lambda: f.read(8192), b""):
+        # Read in chunks (8KB default) for memory efficiency
+        for byte_block in iter(lambda: f.read(chunk_size), b""):
             sha256_hash.update(byte_block)
 
     return sha256_hash.hexdigest()
 
 
+def copy_with_sha256(source_path: Path, dest_path: Path, chunk_size: int = 1024 * 1024) -> tuple:
+    """
+    Copy a file and calculate its SHA256 hash in a single read pass.
+
+    Args:
+        source_path: File to copy
+        dest_path: Destination path (overwritten)
+        chunk_size: Read/write block size
+
+    Returns:
+        (sha256, size_bytes) of the copied content
+
+    Example:
+        sha256, size = copy_with_sha256(Path("download.pdf"), Path("tmp/blob"))
+    """
+    sha256_hash = hashlib.sha256()
+    size = 0
+
+    with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+        for block in iter(lambda: src.read(chunk_size), b""):
+            sha256_hash.update(block)
+            dst.write(block)
+            size += len(block)
+
+    return sha256_hash.hexdigest(), size
+
+
 def verify_file_integrity(file_path: Path, expected_hash: str) -> bool:
     """
     Verify file integrity by comparing SHA256 hash.
@@ -371,6 +371,9 @@ LEFT JOIN enriched_content ec ON ui.geo_id = ec.geo_id AND ui.pmid = ec.pmid;
 
 
 -- View: GEO dataset statistics (aggregated from all tables)
+-- Reference definition only: it joins on geo_id alone, so its cost grows with
+-- the product of per-dataset row counts. Reads use the trigger-maintained
+-- geo_statistics table (schema_stats.sql), which is tested against this view.
 CREATE VIEW IF NOT EXISTS v_geo_statistics AS
 SELECT
     g.geo_id,
@@ -0,0 +1,50 @@
+-- Full-text search index for OmicsOracle (SQLite FTS5)
+-- Applied after schema.sql; skipped (with a warning) when SQLite lacks FTS5.
+-- Version: 1.0.0
+
+-- =============================================================================
+-- FTS INDEX: GEO Datasets (BM25 local search)
+-- =============================================================================
+-- External-content index over geo_datasets: the text lives only in
+-- geo_datasets, the index stores postings keyed by its rowid.
+-- geo_id is carried UNINDEXED so results can be returned without a join.
+CREATE VIRTUAL TABLE IF NOT EXISTS geo_datasets_fts USING fts5(
+    geo_id UNINDEXED,
+    title,
+    summary,
+    organism,
+    platform,
+    content='geo_datasets',
+    content_rowid='rowid',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+
+-- Keep the index in sync with geo_datasets
+CREATE TRIGGER IF NOT EXISTS trg_geo_datasets_fts_insert
+AFTER INSERT ON geo_datasets
+BEGIN
+    INSERT INTO geo_datasets_fts(rowid, geo_id, title, summary, organism, platform)
+    VALUES (new.rowid, new.geo_id, new.title, new.summary, new.organism, new.platform);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_datasets_fts_delete
+AFTER DELETE ON geo_datasets
+BEGIN
+    INSERT INTO geo_datasets_fts(geo_datasets_fts, rowid, geo_id, title, summary, organism, platform)
+    VALUES ('delete', old.rowid, old.geo_id, old.title, old.summary, old.organism, old.platform);
+END;
+
+-- Pipeline progress updates rewrite geo_datasets rows constantly;
+-- only re-index when the searchable text actually changed.
+CREATE TRIGGER IF NOT EXISTS trg_geo_datasets_fts_update
+AFTER UPDATE ON geo_datasets
+WHEN old.title IS NOT new.title
+    OR old.summary IS NOT new.summary
+    OR old.organism IS NOT new.organism
+    OR old.platform IS NOT new.platform
+BEGIN
+    INSERT INTO geo_datasets_fts(geo_datasets_fts, rowid, geo_id, title, summary, organism, platform)
+    VALUES ('delete', old.rowid, old.geo_id, old.title, old.summary, old.organism, old.platform);
+    INSERT INTO geo_datasets_fts(rowid, geo_id, title, summary, organism, platform)
+    VALUES (new.rowid, new.geo_id, new.title, new.summary, new.organism, new.platform);
+END;
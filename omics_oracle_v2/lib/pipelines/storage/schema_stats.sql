@@ -0,0 +1,321 @@
+-- Materialized per-dataset statistics for OmicsOracle
+-- Applied after schema.sql; the table is backfilled by
+-- UnifiedDatabase.rebuild_geo_statistics() when it is first created.
+-- Version: 1.0.0
+
+-- =============================================================================
+-- TABLE: GEO Statistics (one row per dataset, maintained by triggers)
+-- =============================================================================
+-- Replaces on-demand aggregation through v_geo_statistics, whose joins on
+-- geo_id alone build a per-dataset cross product. Every count is a number of
+-- distinct PMIDs (NULL PMIDs are not counted, as in COUNT(DISTINCT pmid)).
+--
+-- The triggers apply deltas: a row adds 1 to a count only if no other row
+-- already counts the same (geo_id, pmid), and removing a row subtracts 1
+-- only if no other row still does. Each check is an indexed lookup on
+-- (geo_id, pmid), so a write costs O(log n) regardless of dataset size.
+CREATE TABLE IF NOT EXISTS geo_statistics (
+    geo_id TEXT PRIMARY KEY,
+
+    publication_count INTEGER NOT NULL DEFAULT 0,   -- universal_identifiers
+    urls_discovered INTEGER NOT NULL DEFAULT 0,     -- url_discovery
+    pdfs_downloaded INTEGER NOT NULL DEFAULT 0,     -- pdf_acquisition (any status)
+    pdfs_available INTEGER NOT NULL DEFAULT 0,      -- pdf_acquisition status 'downloaded'/'success'
+    pdfs_extracted INTEGER NOT NULL DEFAULT 0,      -- content_extraction
+    fulltext_count INTEGER NOT NULL DEFAULT 0,      -- content_extraction with non-empty full_text
+    high_quality_count INTEGER NOT NULL DEFAULT 0,  -- content_extraction grade A/B
+    enriched_count INTEGER NOT NULL DEFAULT 0,      -- enriched_content
+
+    -- AVG(extraction_quality) = quality_sum / quality_count (NULL qualities skipped)
+    quality_sum REAL NOT NULL DEFAULT 0,
+    quality_count INTEGER NOT NULL DEFAULT 0,
+
+    updated_at TEXT
+);
+
+
+-- =============================================================================
+-- universal_identifiers: (geo_id, pmid) is unique, so no distinct checks
+-- =============================================================================
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_ui_insert
+AFTER INSERT ON universal_identifiers
+WHEN new.pmid IS NOT NULL
+BEGIN
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        publication_count = publication_count + 1,
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_ui_delete
+AFTER DELETE ON universal_identifiers
+WHEN old.pmid IS NOT NULL
+BEGIN
+    UPDATE geo_statistics SET
+        publication_count = publication_count - 1,
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_ui_update
+AFTER UPDATE OF geo_id, pmid ON universal_identifiers
+BEGIN
+    UPDATE geo_statistics SET
+        publication_count = publication_count - (old.pmid IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        publication_count = publication_count + (new.pmid IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+
+-- =============================================================================
+-- url_discovery
+-- =============================================================================
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_url_insert
+AFTER INSERT ON url_discovery
+BEGIN
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        urls_discovered = urls_discovered + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM url_discovery x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_url_delete
+AFTER DELETE ON url_discovery
+BEGIN
+    UPDATE geo_statistics SET
+        urls_discovered = urls_discovered - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM url_discovery x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_url_update
+AFTER UPDATE OF geo_id, pmid ON url_discovery
+BEGIN
+    UPDATE geo_statistics SET
+        urls_discovered = urls_discovered - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM url_discovery x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        urls_discovered = urls_discovered + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM url_discovery x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+
+-- =============================================================================
+-- pdf_acquisition (status changes move papers in and out of pdfs_available)
+-- =============================================================================
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_pdf_insert
+AFTER INSERT ON pdf_acquisition
+BEGIN
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        pdfs_downloaded = pdfs_downloaded + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        pdfs_available = pdfs_available + (
+            new.pmid IS NOT NULL AND IFNULL(new.status, '') IN ('downloaded', 'success') AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.status IN ('downloaded', 'success'))),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_pdf_delete
+AFTER DELETE ON pdf_acquisition
+BEGIN
+    UPDATE geo_statistics SET
+        pdfs_downloaded = pdfs_downloaded - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        pdfs_available = pdfs_available - (
+            old.pmid IS NOT NULL AND IFNULL(old.status, '') IN ('downloaded', 'success') AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.status IN ('downloaded', 'success'))),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_pdf_update
+AFTER UPDATE OF geo_id, pmid, status ON pdf_acquisition
+BEGIN
+    UPDATE geo_statistics SET
+        pdfs_downloaded = pdfs_downloaded - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        pdfs_available = pdfs_available - (
+            old.pmid IS NOT NULL AND IFNULL(old.status, '') IN ('downloaded', 'success') AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.status IN ('downloaded', 'success'))),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        pdfs_downloaded = pdfs_downloaded + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        pdfs_available = pdfs_available + (
+            new.pmid IS NOT NULL AND IFNULL(new.status, '') IN ('downloaded', 'success') AND NOT EXISTS (
+            SELECT 1 FROM pdf_acquisition x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.status IN ('downloaded', 'success'))),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+
+-- =============================================================================
+-- content_extraction
+-- =============================================================================
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_extract_insert
+AFTER INSERT ON content_extraction
+BEGIN
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        pdfs_extracted = pdfs_extracted + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        fulltext_count = fulltext_count + (
+            new.pmid IS NOT NULL AND IFNULL(new.full_text, '') != '' AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.full_text != '')),
+        high_quality_count = high_quality_count + (
+            new.pmid IS NOT NULL AND IFNULL(new.extraction_grade, '') IN ('A', 'B') AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.extraction_grade IN ('A', 'B'))),
+        quality_sum = quality_sum + COALESCE(new.extraction_quality, 0),
+        quality_count = quality_count + (new.extraction_quality IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_extract_delete
+AFTER DELETE ON content_extraction
+BEGIN
+    UPDATE geo_statistics SET
+        pdfs_extracted = pdfs_extracted - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        fulltext_count = fulltext_count - (
+            old.pmid IS NOT NULL AND IFNULL(old.full_text, '') != '' AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.full_text != '')),
+        high_quality_count = high_quality_count - (
+            old.pmid IS NOT NULL AND IFNULL(old.extraction_grade, '') IN ('A', 'B') AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.extraction_grade IN ('A', 'B'))),
+        quality_sum = quality_sum - COALESCE(old.extraction_quality, 0),
+        quality_count = quality_count - (old.extraction_quality IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_extract_update
+AFTER UPDATE OF geo_id, pmid, full_text, extraction_quality, extraction_grade ON content_extraction
+BEGIN
+    UPDATE geo_statistics SET
+        pdfs_extracted = pdfs_extracted - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        fulltext_count = fulltext_count - (
+            old.pmid IS NOT NULL AND IFNULL(old.full_text, '') != '' AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.full_text != '')),
+        high_quality_count = high_quality_count - (
+            old.pmid IS NOT NULL AND IFNULL(old.extraction_grade, '') IN ('A', 'B') AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id
+                AND x.extraction_grade IN ('A', 'B'))),
+        quality_sum = quality_sum - COALESCE(old.extraction_quality, 0),
+        quality_count = quality_count - (old.extraction_quality IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        pdfs_extracted = pdfs_extracted + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        fulltext_count = fulltext_count + (
+            new.pmid IS NOT NULL AND IFNULL(new.full_text, '') != '' AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.full_text != '')),
+        high_quality_count = high_quality_count + (
+            new.pmid IS NOT NULL AND IFNULL(new.extraction_grade, '') IN ('A', 'B') AND NOT EXISTS (
+            SELECT 1 FROM content_extraction x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id
+                AND x.extraction_grade IN ('A', 'B'))),
+        quality_sum = quality_sum + COALESCE(new.extraction_quality, 0),
+        quality_count = quality_count + (new.extraction_quality IS NOT NULL),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+
+-- =============================================================================
+-- enriched_content
+-- =============================================================================
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_enriched_insert
+AFTER INSERT ON enriched_content
+BEGIN
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        enriched_count = enriched_count + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM enriched_content x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_enriched_delete
+AFTER DELETE ON enriched_content
+BEGIN
+    UPDATE geo_statistics SET
+        enriched_count = enriched_count - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM enriched_content x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_geo_stats_enriched_update
+AFTER UPDATE OF geo_id, pmid ON enriched_content
+BEGIN
+    UPDATE geo_statistics SET
+        enriched_count = enriched_count - (old.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM enriched_content x
+            WHERE x.geo_id = old.geo_id AND x.pmid = old.pmid AND x.id != old.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = old.geo_id;
+    INSERT OR IGNORE INTO geo_statistics(geo_id) VALUES (new.geo_id);
+    UPDATE geo_statistics SET
+        enriched_count = enriched_count + (new.pmid IS NOT NULL AND NOT EXISTS (
+            SELECT 1 FROM enriched_content x
+            WHERE x.geo_id = new.geo_id AND x.pmid = new.pmid AND x.id != new.id)),
+        updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+    WHERE geo_id = new.geo_id;
+END;
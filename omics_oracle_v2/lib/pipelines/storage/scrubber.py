@@ -0,0 +1,404 @@
+"""
+PDF Integrity Scrubber
+
+Corpus-wide, incremental verification of stored PDFs against their manifest
+hashes (GEOStorage.verify_all_pdfs checks one dataset, serially).
+
+Features:
+- Incremental: files whose size and mtime match the last verification are
+  skipped, except for a random sample that is fully rehashed every pass
+- Hardlinked copies of a blob are hashed once
+- Hashing in a process pool, paced to an I/O bandwidth budget
+- Progress checkpointed to a state file; an interrupted pass resumes
+- Findings written to pdf_acquisition and the Prometheus metrics endpoint
+
+State file ({base_dir}/pdfs/.scrub_state.json):
+    {
+        "pass": 3,
+        "started_at": "...",
+        "completed_at": null,          # set when the pass finishes
+        "files": {"<dev>:<ino>": {"size": 123, "mtime_ns": ..., "sha256": "...",
+                                  "pass": 3, "verified_at": "..."}}
+    }
+
+Usage:
+    scrubber = IntegrityScrubber(storage, db=db, workers=4, bandwidth_mb_per_sec=50)
+    report = scrubber.run()                 # resumes an interrupted pass
+    report["corrupt"]                       # [{"geo_id", "pmid", "path", "error"}, ...]
+
+    scrubber.start()                        # same, in a background thread
+    scrubber.stop()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .geo_storage import GEOStorage
+from .integrity import calculate_sha256
+from .unified_db import UnifiedDatabase
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _hash_file(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """Process-pool worker: (sha256, error)."""
+    try:
+        return calculate_sha256(Path(path), chunk_size=HASH_CHUNK_SIZE), None
+    except OSError as e:
+        return None, str(e)
+
+
+class _BandwidthBudget:
+    """Paces reads so that on average at most `bytes_per_second` are hashed."""
+
+    def __init__(self, bytes_per_second: Optional[float]):
+        self.bytes_per_second = bytes_per_second
+        self._next = time.monotonic()
+
+    def acquire(self, size: int, stop: threading.Event) -> None:
+        if not self.bytes_per_second:
+            return
+        now = time.monotonic()
+        if self._next > now:
+            stop.wait(self._next - now)
+        self._next = max(now, self._next) + size / self.bytes_per_second
+
+
+class IntegrityScrubber:
+    """
+    Background integrity scrubber for GEOStorage PDFs.
+
+    Example:
+        scrubber = IntegrityScrubber(GEOStorage("data"), db=UnifiedDatabase(db_path))
+        report = scrubber.run(max_seconds=3600)   # resumable time slice
+    """
+
+    def __init__(
+        self,
+        storage: GEOStorage,
+        db: Optional[UnifiedDatabase] = None,
+        state_path: Optional[Path] = None,
+        workers: Optional[int] = None,
+        bandwidth_mb_per_sec: Optional[float] = None,
+        sample_rate: float = 0.01,
+        checkpoint_seconds: float = 30.0,
+    ):
+        """
+        Initialize scrubber.
+
+        Args:
+            storage: Storage to scrub
+            db: Database to record findings in (pdf_acquisition); None to skip
+            state_path: Progress file (default: {base_dir}/pdfs/.scrub_state.json)
+            workers: Hashing processes (default: CPU count; <= 1 hashes in-process)
+            bandwidth_mb_per_sec: Read budget in MB/s (None for unlimited)
+            sample_rate: Fraction of unchanged files fully rehashed per pass
+            checkpoint_seconds: Minimum interval between state file writes
+        """
+        self.storage = storage
+        self.db = db
+        self.state_path = Path(state_path or storage.base_dir / "pdfs" / ".scrub_state.json")
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.bandwidth = _BandwidthBudget(
+            bandwidth_mb_per_sec * 1024 * 1024 if bandwidth_mb_per_sec else None
+        )
+        self.sample_rate = sample_rate
+        self.checkpoint_seconds = checkpoint_seconds
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_report: Optional[Dict[str, any]] = None
+        self._verified_refs: List[Tuple[str, str]] = []
+
+    # =========================================================================
+    # STATE
+    # =========================================================================
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            logger.warning(f"Corrupt scrub state {self.state_path}, starting over")
+        return {"pass": 0, "started_at": None, "completed_at": None, "files": {}}
+
+    def _save_state(self, state: dict) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.state_path.parent, prefix=f".{self.state_path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_name, self.state_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _sampled(self, key: str, pass_number: int) -> bool:
+        """Deterministic per pass, so a resumed pass picks the same sample."""
+        digest = hashlib.sha256(f"{pass_number}:{key}".encode()).digest()
+        return int.from_bytes(digest[:4], "big") < self.sample_rate * 2**32
+
+    # =========================================================================
+    # SCRUBBING
+    # =========================================================================
+
+    def _collect(self) -> Tuple[Dict[str, dict], List[dict]]:
+        """
+        Stat every manifest entry, grouping hardlinks of the same file.
+
+        Returns:
+            (files keyed by "dev:ino", missing references)
+        """
+        files: Dict[str, dict] = {}
+        missing = []
+
+        for geo_id in self.storage.list_all_geo_ids():
+            paths = self.storage._list_pdfs(geo_id)
+            for pmid, entry in self.storage._load_manifest(geo_id)["files"].items():
+                ref = {
+                    "geo_id": geo_id,
+                    "pmid": pmid,
+                    "sha256": entry["sha256"],
+                    "size": entry.get("size_bytes"),
+                }
+                path = paths.get(pmid)
+                try:
+                    info = path.stat() if path else None
+                except FileNotFoundError:
+                    info = None
+                if info is None:
+                    missing.append(
+                        {**ref, "path": str(path) if path else None, "error": "integrity: file missing"}
+                    )
+                    continue
+
+                key = f"{info.st_dev}:{info.st_ino}"
+                group = files.setdefault(
+                    key, {"path": str(path), "size": info.st_size, "mtime_ns": info.st_mtime_ns, "refs": []}
+                )
+                group["refs"].append(ref)
+
+        return files, missing
+
+    def _is_due(self, key: str, group: dict, record: Optional[dict], pass_number: int) -> bool:
+        if (
+            record is None
+            or record["size"] != group["size"]
+            or record["mtime_ns"] != group["mtime_ns"]
+            or any(ref["sha256"] != record["sha256"] for ref in group["refs"])
+        ):
+            return True
+        return record["pass"] != pass_number and self._sampled(key, pass_number)
+
+    def run(self, max_seconds: Optional[float] = None) -> Dict[str, any]:
+        """
+        Run (or resume) a scrub pass.
+
+        Args:
+            max_seconds: Stop after this long; the next run resumes the pass
+
+        Returns:
+            Report dictionary:
+            {
+                "pass": 3,
+                "completed": True,
+                "files": 1200,          # distinct files (hardlinks counted once)
+                "unchanged": 1150,      # skipped: size/mtime match last verification
+                "verified": 48,
+                "bytes_hashed": 123456789,
+                "corrupt": [{"geo_id", "pmid", "path", "error"}, ...],
+                "missing": [...],
+                "elapsed_seconds": 12.3
+            }
+        """
+        start = time.monotonic()
+        self._stop.clear()
+        timer = threading.Timer(max_seconds, self._stop.set) if max_seconds else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+
+        self._verified_refs = []
+        state = self._load_state()
+        if state["completed_at"] or not state["pass"]:
+            state.update(
+                {"pass": state["pass"] + 1, "started_at": datetime.utcnow().isoformat(), "completed_at": None}
+            )
+        pass_number = state["pass"]
+        records = state["files"]
+
+        files, missing = self._collect()
+        report = {
+            "pass": pass_number,
+            "completed": False,
+            "files": len(files),
+            "unchanged": 0,
+            "verified": 0,
+            "bytes_hashed": 0,
+            "corrupt": [],
+            "missing": missing,
+        }
+
+        due = []
+        for key, group in files.items():
+            sizes = {ref["size"] for ref in group["refs"] if ref["size"] is not None}
+            if sizes and sizes != {group["size"]}:
+                # Truncated or overwritten: no need to hash
+                self._record_result(report, records, key, group, None, "integrity: size mismatch")
+            elif self._is_due(key, group, records.get(key), pass_number):
+                due.append((key, group))
+            else:
+                report["unchanged"] += 1
+
+        logger.info(
+            f"Scrub pass {pass_number}: {len(files)} files, {len(due)} to hash, "
+            f"{report['unchanged']} unchanged, {len(missing)} missing"
+        )
+
+        findings = [(ref["geo_id"], ref["pmid"], ref["error"]) for ref in missing]
+        try:
+            self._hash_due(due, report, records, state)
+            report["completed"] = not self._stop.is_set()
+        finally:
+            if timer:
+                timer.cancel()
+            if report["completed"]:
+                # Forget files that no longer exist
+                state["files"] = {key: records[key] for key in files if key in records}
+                state["completed_at"] = datetime.utcnow().isoformat()
+            self._save_state(state)
+
+            for finding in report["corrupt"]:
+                findings.append((finding["geo_id"], finding["pmid"], finding["error"]))
+            self._publish(report, findings)
+
+        report["elapsed_seconds"] = round(time.monotonic() - start, 2)
+        self.last_report = report
+        logger.info(
+            f"Scrub pass {pass_number} {'completed' if report['completed'] else 'interrupted'}: "
+            f"{report['verified']} verified, {len(report['corrupt'])} corrupt, {len(missing)} missing"
+        )
+        return report
+
+    def _hash_due(self, due: List[Tuple[str, dict]], report: dict, records: dict, state: dict) -> None:
+        """Hash files within the bandwidth budget, checkpointing progress."""
+        last_checkpoint = time.monotonic()
+        pending: Dict[Future, Tuple[str, dict]] = {}
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+
+        def finish(key: str, group: dict, sha256: Optional[str], error: Optional[str]):
+            nonlocal last_checkpoint
+            if sha256:
+                report["bytes_hashed"] += group["size"]
+            self._record_result(report, records, key, group, sha256, error)
+            if time.monotonic() - last_checkpoint >= self.checkpoint_seconds:
+                self._save_state(state)
+                last_checkpoint = time.monotonic()
+
+        try:
+            for key, group in due:
+                if self._stop.is_set():
+                    break
+                self.bandwidth.acquire(group["size"], self._stop)
+
+                if executor is None:
+                    finish(key, group, *_hash_file(group["path"]))
+                    continue
+
+                # Bound in-flight work so a stop request takes effect quickly
+                while len(pending) >= self.workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(*pending.pop(future), *future.result())
+                pending[executor.submit(_hash_file, group["path"])] = (key, group)
+
+            for future in list(pending):
+                finish(*pending.pop(future), *future.result())
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _record_result(
+        self, report: dict, records: dict, key: str, group: dict, sha256: Optional[str], error: Optional[str]
+    ) -> None:
+        if error is None:
+            bad = [ref for ref in group["refs"] if ref["sha256"] != sha256]
+            error = f"integrity: sha256 mismatch (actual {sha256})" if bad else None
+        else:
+            bad = group["refs"]
+
+        for ref in bad:
+            report["corrupt"].append(
+                {"geo_id": ref["geo_id"], "pmid": ref["pmid"], "path": group["path"], "error": error}
+            )
+            logger.error(f"Corrupt PDF {ref['geo_id']}/{ref['pmid']} ({group['path']}): {error}")
+
+        if bad:
+            # Rehash every pass until repaired
+            records.pop(key, None)
+            return
+
+        report["verified"] += 1
+        records[key] = {
+            "size": group["size"],
+            "mtime_ns": group["mtime_ns"],
+            "sha256": sha256,
+            "pass": report["pass"],
+            "verified_at": datetime.utcnow().isoformat(),
+        }
+        self._verified_refs.extend((ref["geo_id"], ref["pmid"]) for ref in group["refs"])
+
+    def _publish(self, report: dict, findings: List[Tuple[str, str, str]]) -> None:
+        """Record findings in pdf_acquisition and Prometheus."""
+        if self.db is not None:
+            try:
+                self.db.record_pdf_integrity(self._verified_refs, findings)
+            except Exception as e:
+                logger.warning(f"Failed to record scrub results in database: {e}")
+
+        try:
+            from omics_oracle_v2.api.metrics import track_pdf_scrub
+        except ImportError as e:
+            logger.debug(f"Prometheus export unavailable: {e}")
+            return
+
+        track_pdf_scrub(
+            verified=report["verified"],
+            unchanged=report["unchanged"],
+            corrupt=len(report["corrupt"]),
+            missing=len(report["missing"]),
+            bytes_hashed=report["bytes_hashed"],
+            completed=report["completed"],
+        )
+
+    # =========================================================================
+    # BACKGROUND
+    # =========================================================================
+
+    def start(self, max_seconds: Optional[float] = None) -> None:
+        """Run a pass in a background thread (no-op if one is running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self.run, args=(max_seconds,), name="pdf-scrubber", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Interrupt the running pass; progress is checkpointed for the next run."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
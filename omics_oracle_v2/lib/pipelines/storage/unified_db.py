@@ -6,10 +6,11 @@ Provides transaction support, CRUD operations, and type-safe interfaces.
 """
 
 import logging
+import re
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import (CacheMetadata, ContentExtraction, EnrichedContent,
                      GEODataset, PDFAcquisition, ProcessingLog,
@@ -18,6 +19,125 @@ from .models import (CacheMetadata, ContentExtraction, EnrichedContent,
 
 logger = logging.getLogger(__name__)
 
+# bm25() column weights for geo_datasets_fts (geo_id, title, summary, organism, platform)
+GEO_FTS_WEIGHTS = (0.0, 10.0, 4.0, 2.0, 1.0)
+
+_FTS_FIELD_TAG = re.compile(r"\[[^\]]*\]")
+_FTS_PHRASE = re.compile(r'"([^"]+)"')
+_FTS_WORD = re.compile(r"\w+")
+_FTS_OPERATORS = {"AND", "OR", "NOT", "NEAR"}
+_FTS_CLAUSE_SPLIT = re.compile(r"\bAND\b|[()]")
+_FTS_TAGGED_CLAUSE = re.compile(r"(.+?)\s*\[([^\]]+)\]")
+_FTS_TEXT_FIELDS = {"all fields", "title", "description", "text word"}
+_FTS_ORGANISM_FIELDS = {"organism", "orgn"}
+
+# Pipeline stage records: table, timestamp field filled on insert, inserted columns
+_RECORD_TABLES = {
+    URLDiscovery: (
+        "url_discovery",
+        "discovered_at",
+        (
+            "geo_id", "pmid", "urls_json", "sources_queried", "url_count",
+            "pubmed_urls", "unpaywall_urls", "europepmc_urls", "other_urls",
+            "has_pdf_url", "has_html_url", "best_url_type", "discovered_at",
+        ),
+    ),
+    PDFAcquisition: (
+        "pdf_acquisition",
+        "downloaded_at",
+        (
+            "geo_id", "pmid", "pdf_path", "pdf_hash_sha256", "pdf_size_bytes",
+            "source_url", "source_type", "download_method", "status", "error_message",
+            "downloaded_at", "verified_at",
+        ),
+    ),
+    ContentExtraction: (
+        "content_extraction",
+        "extracted_at",
+        (
+            "geo_id", "pmid", "full_text", "page_count", "word_count", "char_count",
+            "extractor_used", "extraction_method", "extraction_quality", "extraction_grade",
+            "has_readable_text", "needs_ocr", "extracted_at",
+        ),
+    ),
+    EnrichedContent: (
+        "enriched_content",
+        "enriched_at",
+        (
+            "geo_id", "pmid", "sections_json", "tables_json", "references_json", "figures_json",
+            "chatgpt_prompt", "chatgpt_metadata", "grobid_xml", "grobid_tei_json",
+            "enrichers_applied", "enrichment_quality", "enriched_at",
+        ),
+    ),
+    ProcessingLog: (
+        "processing_log",
+        "logged_at",
+        (
+            "geo_id", "pmid", "pipeline", "event_type", "message",
+            "duration_ms", "error_type", "error_traceback", "logged_at",
+        ),
+    ),
+}
+
+
+def fts_match_query(query: str) -> Optional[str]:
+    """
+    Turn a free-text or NCBI-style query into a safe FTS5 MATCH expression.
+
+    Field tags ([Organism], [MeSH]) and boolean operators are dropped; quoted
+    phrases are kept as phrases and every other word becomes a quoted term.
+    Terms are AND-ed, like NCBI's default, and BM25 ranks the matches.
+
+    Returns:
+        MATCH expression, or None if the query has no searchable terms
+    """
+    query = _FTS_FIELD_TAG.sub(" ", query)
+    terms = []
+    for phrase in _FTS_PHRASE.findall(query):
+        words = _FTS_WORD.findall(phrase)
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+    for word in _FTS_WORD.findall(_FTS_PHRASE.sub(" ", query)):
+        if word not in _FTS_OPERATORS:
+            terms.append(f'"{word}"')
+    terms = list(dict.fromkeys(terms))
+    return " AND ".join(terms) if terms else None
+
+
+def split_field_filters(query: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Split an NCBI-style query into free text and an organism filter.
+
+    The local index can only honour AND-ed text terms restricted to one
+    organism. Queries using OR/NOT, or field filters it has no column for
+    ([DataSet Type], [MeSH], ...), cannot be answered faithfully.
+
+    Returns:
+        (text, organism) for search_geo_datasets(), or None if the query
+        cannot be answered from the local index
+    """
+    if re.search(r"\b(OR|NOT)\b", query):
+        return None
+    text, organisms = [], []
+    for clause in _FTS_CLAUSE_SPLIT.split(query):
+        clause = clause.strip()
+        tagged = _FTS_TAGGED_CLAUSE.fullmatch(clause)
+        if not tagged:
+            if _FTS_FIELD_TAG.search(clause):
+                return None
+            text.append(clause)
+            continue
+        value, field = tagged.group(1), tagged.group(2).strip().lower()
+        if field in _FTS_ORGANISM_FIELDS:
+            organisms.append(value.strip('"').strip())
+        elif field in _FTS_TEXT_FIELDS:
+            text.append(value)
+        else:
+            return None
+    if len(organisms) > 1:
+        return None
+    return " ".join(text), organisms[0] if organisms else None
+
 
 class UnifiedDatabase:
     """
@@ -57,6 +177,8 @@ class UnifiedDatabase:
 
         # Initialize schema
         self._initialize_schema()
+        self.fts_enabled = self._initialize_fts()
+        self._initialize_statistics()
 
         logger.info(f"Initialized UnifiedDatabase at {self.db_path}")
 
@@ -146,6 +268,59 @@ class UnifiedDatabase:
             logger.error(error_msg, exc_info=True)
             raise
 
+    def _initialize_fts(self) -> bool:
+        """
+        Create the FTS5 index from schema_fts.sql and backfill it if needed.
+
+        The index is optional: SQLite builds without FTS5 keep working, they
+        just cannot serve local full-text search.
+
+        Returns:
+            True if the FTS index is available
+        """
+        schema_path = Path(__file__).parent / "schema_fts.sql"
+
+        try:
+            with self._get_connection() as conn:
+                conn.executescript(schema_path.read_text())
+
+                # Rows written before the index existed (or by a build without
+                # FTS5) are missing from it; rebuild from geo_datasets once.
+                indexed = conn.execute(
+                    "SELECT COUNT(*) FROM geo_datasets_fts_docsize"
+                ).fetchone()[0]
+                total = conn.execute("SELECT COUNT(*) FROM geo_datasets").fetchone()[0]
+                if indexed != total:
+                    logger.info(f"Rebuilding GEO full-text index ({total} datasets)")
+                    conn.execute(
+                        "INSERT INTO geo_datasets_fts(geo_datasets_fts) VALUES ('rebuild')"
+                    )
+                conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            logger.warning(f"[X] GEO full-text index unavailable: {e}")
+            return False
+
+    def _initialize_statistics(self):
+        """
+        Create the geo_statistics table and its triggers from schema_stats.sql.
+
+        The triggers keep the table current from then on; rows written before
+        the table existed are backfilled once.
+        """
+        schema_path = Path(__file__).parent / "schema_stats.sql"
+
+        with self._get_connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'geo_statistics'"
+            ).fetchone()
+            conn.executescript(schema_path.read_text())
+
+        if not exists:
+            logger.info("Building materialized GEO statistics")
+            self.rebuild_geo_statistics()
+
     # =========================================================================
     # UNIVERSAL IDENTIFIERS - Central Hub
     # =========================================================================
@@ -350,40 +525,68 @@ class UnifiedDatabase:
             return GEODataset(**dict(row))
         return None
 
-    # =========================================================================
-    # URL DISCOVERY (Pipeline 2)
-    # =========================================================================
+    def search_geo_datasets(
+        self, query: str, limit: int = 50, organism: Optional[str] = None
+    ) -> List[Tuple[GEODataset, float]]:
+        """
+        Full-text search over stored GEO datasets, ranked by BM25.
 
-    def insert_url_discovery(
-        self, discovery: URLDiscovery, conn: Optional[sqlite3.Connection] = None
-    ) -> int:
-        """Insert URL discovery results. Returns row ID."""
-        if not discovery.discovered_at:
-            discovery.discovered_at = now_iso()
+        Title matches weigh most, then summary, organism and platform.
 
-        sql = """
-            INSERT INTO url_discovery (
-                geo_id, pmid, urls_json, sources_queried, url_count,
-                pubmed_urls, unpaywall_urls, europepmc_urls, other_urls,
-                has_pdf_url, has_html_url, best_url_type, discovered_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        Args:
+            query: Free-text or NCBI-style query
+            limit: Maximum number of results
+            organism: Optional organism filter (case-insensitive substring)
+
+        Returns:
+            (dataset, score) pairs, best first; higher scores are better
         """
+        match = fts_match_query(query)
+        if not self.fts_enabled or not match:
+            return []
 
-        values = (
-            discovery.geo_id,
-            discovery.pmid,
-            discovery.urls_json,
-            discovery.sources_queried,
-            discovery.url_count,
-            discovery.pubmed_urls,
-            discovery.unpaywall_urls,
-            discovery.europepmc_urls,
-            discovery.other_urls,
-            discovery.has_pdf_url,
-            discovery.has_html_url,
-            discovery.best_url_type,
-            discovery.discovered_at,
+        weights = ", ".join(str(w) for w in GEO_FTS_WEIGHTS)
+        sql = f"""
+            SELECT g.*, bm25(geo_datasets_fts, {weights}) AS bm25_score
+            FROM geo_datasets_fts
+            JOIN geo_datasets g ON g.rowid = geo_datasets_fts.rowid
+            WHERE geo_datasets_fts MATCH ?
+        """
+        params: List[Any] = [match]
+        if organism:
+            sql += " AND g.organism LIKE ?"
+            params.append(f"%{organism}%")
+        sql += " ORDER BY bm25_score LIMIT ?"
+        params.append(limit)
+
+        with self._get_connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        results = []
+        for row in rows:
+            data = dict(row)
+            score = -data.pop("bm25_score")  # SQLite bm25() is lower-is-better
+            results.append((GEODataset(**data), score))
+        return results
+
+    # =========================================================================
+    # PIPELINE STAGE RECORDS (shared insert path)
+    # =========================================================================
+
+    @staticmethod
+    def _record_row(record) -> Tuple[str, tuple]:
+        """INSERT statement and values for a stage record (fills its timestamp)."""
+        table, timestamp_field, columns = _RECORD_TABLES[type(record)]
+        if not getattr(record, timestamp_field):
+            setattr(record, timestamp_field, now_iso())
+        sql = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
         )
+        return sql, tuple(getattr(record, column) for column in columns)
+
+    def _insert_record(self, record, conn: Optional[sqlite3.Connection] = None) -> int:
+        sql, values = self._record_row(record)
 
         if conn:
             cursor = conn.execute(sql, values)
@@ -394,6 +597,44 @@ class UnifiedDatabase:
                 conn.commit()
                 return cursor.lastrowid
 
+    def insert_records(self, records: List, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Bulk insert stage records with one executemany per table.
+
+        Args:
+            records: URLDiscovery, PDFAcquisition, ContentExtraction,
+                EnrichedContent and ProcessingLog objects, in any mix
+            conn: Optional connection (for transactions); without one the
+                records are committed together
+
+        Returns:
+            Number of rows inserted
+        """
+        grouped: Dict[str, List[tuple]] = {}
+        for record in records:
+            sql, values = self._record_row(record)
+            grouped.setdefault(sql, []).append(values)
+
+        if conn:
+            for sql, rows in grouped.items():
+                conn.executemany(sql, rows)
+        else:
+            with self.transaction() as conn:
+                for sql, rows in grouped.items():
+                    conn.executemany(sql, rows)
+
+        return len(records)
+
+    # =========================================================================
+    # URL DISCOVERY (Pipeline 2)
+    # =========================================================================
+
+    def insert_url_discovery(
+        self, discovery: URLDiscovery, conn: Optional[sqlite3.Connection] = None
+    ) -> int:
+        """Insert URL discovery results. Returns row ID."""
+        return self._insert_record(discovery, conn)
+
     def get_url_discovery(self, geo_id: str, pmid: str) -> Optional[URLDiscovery]:
         """Get URL discovery results for a publication."""
         sql = """
@@ -417,40 +658,7 @@ class UnifiedDatabase:
         self, acquisition: PDFAcquisition, conn: Optional[sqlite3.Connection] = None
     ) -> int:
         """Insert PDF acquisition record. Returns row ID."""
-        if not acquisition.downloaded_at:
-            acquisition.downloaded_at = now_iso()
-
-        sql = """
-            INSERT INTO pdf_acquisition (
-                geo_id, pmid, pdf_path, pdf_hash_sha256, pdf_size_bytes,
-                source_url, source_type, download_method, status, error_message,
-                downloaded_at, verified_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        values = (
-            acquisition.geo_id,
-            acquisition.pmid,
-            acquisition.pdf_path,
-            acquisition.pdf_hash_sha256,
-            acquisition.pdf_size_bytes,
-            acquisition.source_url,
-            acquisition.source_type,
-            acquisition.download_method,
-            acquisition.status,
-            acquisition.error_message,
-            acquisition.downloaded_at,
-            acquisition.verified_at,
-        )
-
-        if conn:
-            cursor = conn.execute(sql, values)
-            return cursor.lastrowid
-        else:
-            with self._get_connection() as conn:
-                cursor = conn.execute(sql, values)
-                conn.commit()
-                return cursor.lastrowid
+        return self._insert_record(acquisition, conn)
 
     def get_pdf_acquisition(self, geo_id: str, pmid: str) -> Optional[PDFAcquisition]:
         """Get PDF acquisition record for a publication."""
@@ -467,6 +675,42 @@ class UnifiedDatabase:
             return PDFAcquisition(**dict(row))
         return None
 
+    def record_pdf_integrity(
+        self,
+        verified: List[Tuple[str, str]],
+        failures: List[Tuple[str, str, str]],
+    ) -> None:
+        """
+        Record integrity scrub results on pdf_acquisition rows.
+
+        Failed files are marked status='failed' with an "integrity: ..." error;
+        files that verify again are restored to 'downloaded'.
+
+        Args:
+            verified: (geo_id, pmid) of files whose hash matched
+            failures: (geo_id, pmid, error_message) of corrupt or missing files
+        """
+        checked_at = now_iso()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                UPDATE pdf_acquisition SET
+                    verified_at = ?,
+                    status = CASE WHEN error_message LIKE 'integrity:%' THEN 'downloaded' ELSE status END,
+                    error_message = CASE WHEN error_message LIKE 'integrity:%' THEN NULL ELSE error_message END
+                WHERE geo_id = ? AND pmid = ?
+                """,
+                [(checked_at, geo_id, pmid) for geo_id, pmid in verified],
+            )
+            conn.executemany(
+                """
+                UPDATE pdf_acquisition SET status = 'failed', error_message = ?
+                WHERE geo_id = ? AND pmid = ?
+                """,
+                [(error, geo_id, pmid) for geo_id, pmid, error in failures],
+            )
+            conn.commit()
+
     # =========================================================================
     # CONTENT EXTRACTION (Pipeline 4 Basic)
     # =========================================================================
@@ -475,41 +719,7 @@ class UnifiedDatabase:
         self, extraction: ContentExtraction, conn: Optional[sqlite3.Connection] = None
     ) -> int:
         """Insert content extraction record. Returns row ID."""
-        if not extraction.extracted_at:
-            extraction.extracted_at = now_iso()
-
-        sql = """
-            INSERT INTO content_extraction (
-                geo_id, pmid, full_text, page_count, word_count, char_count,
-                extractor_used, extraction_method, extraction_quality, extraction_grade,
-                has_readable_text, needs_ocr, extracted_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        values = (
-            extraction.geo_id,
-            extraction.pmid,
-            extraction.full_text,
-            extraction.page_count,
-            extraction.word_count,
-            extraction.char_count,
-            extraction.extractor_used,
-            extraction.extraction_method,
-            extraction.extraction_quality,
-            extraction.extraction_grade,
-            extraction.has_readable_text,
-            extraction.needs_ocr,
-            extraction.extracted_at,
-        )
-
-        if conn:
-            cursor = conn.execute(sql, values)
-            return cursor.lastrowid
-        else:
-            with self._get_connection() as conn:
-                cursor = conn.execute(sql, values)
-                conn.commit()
-                return cursor.lastrowid
+        return self._insert_record(extraction, conn)
 
     def get_content_extraction(
         self, geo_id: str, pmid: str
@@ -536,41 +746,7 @@ class UnifiedDatabase:
         self, enriched: EnrichedContent, conn: Optional[sqlite3.Connection] = None
     ) -> int:
         """Insert enriched content record. Returns row ID."""
-        if not enriched.enriched_at:
-            enriched.enriched_at = now_iso()
-
-        sql = """
-            INSERT INTO enriched_content (
-                geo_id, pmid, sections_json, tables_json, references_json, figures_json,
-                chatgpt_prompt, chatgpt_metadata, grobid_xml, grobid_tei_json,
-                enrichers_applied, enrichment_quality, enriched_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        values = (
-            enriched.geo_id,
-            enriched.pmid,
-            enriched.sections_json,
-            enriched.tables_json,
-            enriched.references_json,
-            enriched.figures_json,
-            enriched.chatgpt_prompt,
-            enriched.chatgpt_metadata,
-            enriched.grobid_xml,
-            enriched.grobid_tei_json,
-            enriched.enrichers_applied,
-            enriched.enrichment_quality,
-            enriched.enriched_at,
-        )
-
-        if conn:
-            cursor = conn.execute(sql, values)
-            return cursor.lastrowid
-        else:
-            with self._get_connection() as conn:
-                cursor = conn.execute(sql, values)
-                conn.commit()
-                return cursor.lastrowid
+        return self._insert_record(enriched, conn)
 
     def get_enriched_content(self, geo_id: str, pmid: str) -> Optional[EnrichedContent]:
         """Get enriched content record for a publication."""
@@ -766,10 +942,32 @@ class UnifiedDatabase:
         """
         Get comprehensive statistics for a GEO dataset.
 
+        Reads the trigger-maintained geo_statistics row (one indexed lookup)
+        instead of aggregating v_geo_statistics. The first seven keys match
+        the view's columns.
+
         Returns:
             Dictionary with publication counts, quality metrics, etc.
         """
-        sql = "SELECT * FROM v_geo_statistics WHERE geo_id = ?"
+        sql = """
+            SELECT
+                g.geo_id,
+                g.title,
+                g.organism,
+                COALESCE(s.publication_count, 0) AS publication_count,
+                COALESCE(s.pdfs_downloaded, 0) AS pdfs_downloaded,
+                COALESCE(s.pdfs_extracted, 0) AS pdfs_extracted,
+                CASE WHEN s.quality_count > 0
+                    THEN s.quality_sum / s.quality_count END AS avg_quality,
+                COALESCE(s.high_quality_count, 0) AS high_quality_count,
+                COALESCE(s.urls_discovered, 0) AS urls_discovered,
+                COALESCE(s.pdfs_available, 0) AS pdfs_available,
+                COALESCE(s.fulltext_count, 0) AS fulltext_count,
+                COALESCE(s.enriched_count, 0) AS enriched_count
+            FROM geo_datasets g
+            LEFT JOIN geo_statistics s ON s.geo_id = g.geo_id
+            WHERE g.geo_id = ?
+        """
 
         with self._get_connection() as conn:
             row = conn.execute(sql, (geo_id,)).fetchone()
@@ -778,6 +976,79 @@ class UnifiedDatabase:
             return dict(row)
         return {}
 
+    def get_geo_counts(self, geo_id: str) -> Dict[str, Any]:
+        """
+        Get the raw geo_statistics row for a dataset.
+
+        Unlike get_geo_statistics, this does not require a geo_datasets row
+        (publications can be collected before the dataset is saved).
+
+        Returns:
+            Dictionary of counts (empty if nothing is recorded for geo_id)
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM geo_statistics WHERE geo_id = ?", (geo_id,)
+            ).fetchone()
+
+        if row:
+            return dict(row)
+        return {}
+
+    def rebuild_geo_statistics(self) -> int:
+        """
+        Recompute geo_statistics from the pipeline tables.
+
+        Each table is aggregated on its own (no cross-table join) and the
+        table is replaced in a single transaction. Only needed after the
+        table is created or if it is suspected to have drifted.
+
+        Returns:
+            Number of datasets with statistics
+        """
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM geo_statistics")
+            conn.execute(
+                """
+                INSERT INTO geo_statistics (
+                    geo_id, publication_count, urls_discovered, pdfs_downloaded,
+                    pdfs_available, pdfs_extracted, fulltext_count, high_quality_count,
+                    enriched_count, quality_sum, quality_count, updated_at
+                )
+                SELECT geo_id, SUM(pubs), SUM(urls), SUM(pdfs), SUM(available),
+                       SUM(extracted), SUM(fulltext), SUM(high_quality), SUM(enriched),
+                       SUM(quality_sum), SUM(quality_count), strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                FROM (
+                    SELECT geo_id, COUNT(DISTINCT pmid) AS pubs, 0 AS urls, 0 AS pdfs,
+                           0 AS available, 0 AS extracted, 0 AS fulltext, 0 AS high_quality,
+                           0 AS enriched, 0 AS quality_sum, 0 AS quality_count
+                    FROM universal_identifiers GROUP BY geo_id
+                    UNION ALL
+                    SELECT geo_id, 0, COUNT(DISTINCT pmid), 0, 0, 0, 0, 0, 0, 0, 0
+                    FROM url_discovery GROUP BY geo_id
+                    UNION ALL
+                    SELECT geo_id, 0, 0, COUNT(DISTINCT pmid),
+                           COUNT(DISTINCT CASE WHEN status IN ('downloaded', 'success') THEN pmid END),
+                           0, 0, 0, 0, 0, 0
+                    FROM pdf_acquisition GROUP BY geo_id
+                    UNION ALL
+                    SELECT geo_id, 0, 0, 0, 0, COUNT(DISTINCT pmid),
+                           COUNT(DISTINCT CASE WHEN full_text != '' THEN pmid END),
+                           COUNT(DISTINCT CASE WHEN extraction_grade IN ('A', 'B') THEN pmid END),
+                           0, TOTAL(extraction_quality), COUNT(extraction_quality)
+                    FROM content_extraction GROUP BY geo_id
+                    UNION ALL
+                    SELECT geo_id, 0, 0, 0, 0, 0, 0, 0, COUNT(DISTINCT pmid), 0, 0
+                    FROM enriched_content GROUP BY geo_id
+                )
+                GROUP BY geo_id
+                """
+            )
+            count = conn.execute("SELECT COUNT(*) FROM geo_statistics").fetchone()[0]
+
+        logger.info(f"Rebuilt GEO statistics for {count} datasets")
+        return count
+
     def get_database_statistics(self) -> Dict[str, Any]:
         """Get overall database statistics."""
         with self._get_connection() as conn:
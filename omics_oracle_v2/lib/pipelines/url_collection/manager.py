@@ -25,11 +25,15 @@ Example:
 import asyncio
 import logging
 import os
-from dataclasses import dataclass
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Literal, Optional
 
+from omics_oracle_v2.cache.smart_cache import SmartCache
+from omics_oracle_v2.cache.url_cache import (URLCollectionCache,
+                                             make_publication_key)
 from omics_oracle_v2.lib.pipelines.url_collection.sources.institutional_access import (
     InstitutionalAccessManager, InstitutionType)
 from omics_oracle_v2.lib.pipelines.url_collection.sources.libgen_client import (
@@ -44,6 +48,7 @@ from omics_oracle_v2.lib.pipelines.url_collection.sources.scihub_client import (
 from omics_oracle_v2.lib.pipelines.url_collection.url_validator import (
     URLType, URLValidator)
 from omics_oracle_v2.lib.search_engines.citations.models import Publication
+from omics_oracle_v2.lib.utils.tracing import current_span, span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +112,22 @@ class FullTextResult:
     ] = None  # NEW: All URLs from all sources (for fallback)
 
 
+@dataclass
+class BatchLookups:
+    """Upstream answers prefetched for one get_all_fulltext_urls_batch() call."""
+
+    unpaywall: Dict[str, Optional[Dict]] = field(default_factory=dict)
+    crossref: Dict[str, Optional[Dict]] = field(default_factory=dict)
+    pmc: Dict[str, Optional[str]] = field(default_factory=dict)  # PMID -> PMC ID
+
+
+# Lookups of the batch running in this task (inherited by the tasks it spawns,
+# so concurrent batches on a shared manager never see each other's answers)
+_batch_lookups: ContextVar[Optional[BatchLookups]] = ContextVar(
+    "omics_batch_lookups", default=None
+)
+
+
 class FullTextManagerConfig(BaseModel):
     """
     Configuration for FullTextManager.
@@ -128,6 +149,15 @@ class FullTextManagerConfig(BaseModel):
         libgen_use_proxy: Use proxy/Tor for LibGen
         max_concurrent: Maximum concurrent source attempts
         timeout_per_source: Timeout for each source (seconds)
+        enable_url_cache: Cache per-source URL lookups (DOI/PMID keyed)
+        url_cache_ttls: Positive TTL overrides per source name (seconds)
+        url_cache_negative_ttl: TTL for "source had nothing" entries (seconds)
+        local_index_db: SQLite file to persist the local file index (None = memory only)
+        url_race_mode: "all" waits for every source; "good_enough" returns on the
+            first good URL; "hedged" also lets get_fulltext_hedged() start the
+            download on that URL while the other sources finish
+        good_enough_max_priority: Highest source priority (1=institutional,
+            2=unpaywall, ...) whose direct PDF URL counts as good enough
     """
 
     enable_institutional: bool = Field(
@@ -166,6 +196,28 @@ class FullTextManagerConfig(BaseModel):
     timeout_per_source: int = Field(
         default=30, description="Timeout for each source (seconds)", ge=1
     )
+    enable_url_cache: bool = Field(
+        default=True, description="Cache per-source URL lookups (DOI/PMID keyed)"
+    )
+    url_cache_ttls: Optional[Dict[str, int]] = Field(
+        default=None, description="Positive TTL overrides per source (seconds)"
+    )
+    url_cache_negative_ttl: int = Field(
+        default=86400, description="TTL for negative cache entries (seconds)", ge=0
+    )
+    local_index_db: Optional[str] = Field(
+        default=None,
+        description="SQLite file to persist the local file index (None = memory only)",
+    )
+    url_race_mode: Literal["all", "good_enough", "hedged"] = Field(
+        default="all",
+        description="Wait for all sources, return on first good URL, or hedge the download",
+    )
+    good_enough_max_priority: int = Field(
+        default=2,
+        description="Highest source priority whose direct PDF URL ends collection early",
+        ge=0,
+    )
 
 
 class FullTextManager:
@@ -212,6 +264,15 @@ class FullTextManager:
         self.scihub_client: Optional[SciHubClient] = None  # NEW
         self.libgen_client: Optional[LibGenClient] = None  # NEW
 
+        # Per-source URL lookup cache (initialized in initialize())
+        self.url_cache: Optional[URLCollectionCache] = None
+
+        # Local file locator, shared across lookups so its index is built once
+        self.smart_cache: Optional[SmartCache] = None
+
+        # Background work (late source lookups after an early exit)
+        self._background_tasks: set = set()
+
         # Statistics
         self.stats = {
             "total_attempts": 0,
@@ -296,6 +357,14 @@ class FullTextManager:
             await self.libgen_client.__aenter__()
             logger.info("[WARNING] LibGen client initialized (use responsibly)")
 
+        # Initialize URL lookup cache
+        if self.config.enable_url_cache and self.url_cache is None:
+            self.url_cache = URLCollectionCache(
+                source_ttls=self.config.url_cache_ttls,
+                negative_ttl=self.config.url_cache_negative_ttl,
+            )
+            logger.info("URL collection cache initialized")
+
         self.initialized = True
         logger.info("All OA source clients initialized")
 
@@ -306,6 +375,9 @@ class FullTextManager:
 
         logger.info("Cleaning up OA source clients...")
 
+        # Stop late source lookups before their clients are closed
+        await self._cancel_background_tasks()
+
         if self.pmc_client:  # NEW - Phase 1.3
             await self.pmc_client.__aexit__(None, None, None)
         if self.core_client:
@@ -335,6 +407,17 @@ class FullTextManager:
         """Async context manager exit."""
         await self.cleanup()
 
+    def _get_smart_cache(self) -> SmartCache:
+        """Get the shared SmartCache (its file index is built on first use)."""
+        if self.smart_cache is None:
+            self.smart_cache = SmartCache(index_db=self.config.local_index_db)
+        return self.smart_cache
+
+    def _index_download(self, download) -> None:
+        """Add a downloaded PDF to the SmartCache index (no-op outside its tree)."""
+        if download.success and download.pdf_path and download.file_size:
+            self._get_smart_cache()._index_file(Path(download.pdf_path), download.file_size)
+
     async def _check_cache(self, publication: Publication) -> FullTextResult:
         """
         Check if full-text is already available locally.
@@ -354,10 +437,7 @@ class FullTextManager:
         Returns:
             FullTextResult with local file info if found
         """
-        from omics_oracle_v2.cache.smart_cache import SmartCache
-
-        cache = SmartCache()
-        result = cache.find_local_file(publication)
+        result = self._get_smart_cache().find_local_file(publication)
 
         if result.found:
             logger.info(
@@ -439,7 +519,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.debug(f"Institutional access lookup failed: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_pmc(self, publication: Publication) -> FullTextResult:
         """
@@ -466,11 +548,16 @@ class FullTextManager:
             return FullTextResult(success=False, error="PMC client not initialized")
 
         try:
-            result = await self.pmc_client.get_fulltext(publication)
+            lookups = _batch_lookups.get()
+            result = await self.pmc_client.get_fulltext(
+                publication, pmcids=lookups.pmc if lookups else None
+            )
             return result
         except Exception as e:
             logger.warning(f"PMC lookup failed: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_openalex_oa_url(self, publication: Publication) -> FullTextResult:
         """
@@ -504,7 +591,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.warning(f"OpenAlex OA URL error: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_core(self, publication: Publication) -> FullTextResult:
         """
@@ -552,7 +641,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.warning(f"CORE error: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_biorxiv(self, publication: Publication) -> FullTextResult:
         """
@@ -601,7 +692,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.warning(f"bioRxiv error: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_arxiv(self, publication: Publication) -> FullTextResult:
         """
@@ -664,7 +757,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.debug(f"arXiv lookup skipped: {e}")  # Changed to debug level
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_crossref(self, publication: Publication) -> FullTextResult:
         """
@@ -686,7 +781,10 @@ class FullTextManager:
             if not publication.doi:
                 return FullTextResult(success=False, error="No DOI for Crossref lookup")
 
-            result = await self.crossref_client.get_by_doi(publication.doi)
+            lookups = _batch_lookups.get()
+            result = await self.crossref_client.get_by_doi(
+                publication.doi, prefetched=lookups.crossref if lookups else None
+            )
             if result and result.get("fulltext_urls"):
                 urls = result["fulltext_urls"]
                 logger.info(
@@ -706,7 +804,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.warning(f"Crossref error: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_unpaywall(self, publication: Publication) -> FullTextResult:
         """
@@ -739,7 +839,10 @@ class FullTextManager:
                     success=False, error="No DOI for Unpaywall lookup"
                 )
 
-            result = await self.unpaywall_client.get_oa_location(publication.doi)
+            lookups = _batch_lookups.get()
+            result = await self.unpaywall_client.get_oa_location(
+                publication.doi, prefetched=lookups.unpaywall if lookups else None
+            )
 
             # Verify is_oa flag
             if not result or not result.get("is_oa"):
@@ -844,7 +947,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.debug(f"Unpaywall lookup failed: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_scihub(self, publication: Publication) -> FullTextResult:
         """
@@ -897,7 +1002,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.debug(f"Sci-Hub lookup failed: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def _try_libgen(self, publication: Publication) -> FullTextResult:
         """
@@ -946,7 +1053,9 @@ class FullTextManager:
 
         except Exception as e:
             logger.debug(f"LibGen lookup failed: {e}")
-            return FullTextResult(success=False, error=str(e))
+            return FullTextResult(
+                success=False, error=str(e), metadata={"transient": True}
+            )
 
     async def get_parsed_content(self, publication: Publication) -> Optional[Dict]:
         """
@@ -1229,10 +1338,12 @@ class FullTextManager:
                 continue
 
             try:
-                result = await asyncio.wait_for(
-                    source_func(publication),
-                    timeout=self.config.timeout_per_source,
-                )
+                with span("urls.source", upstream=source_name) as source_span:
+                    result = await asyncio.wait_for(
+                        source_func(publication),
+                        timeout=self.config.timeout_per_source,
+                    )
+                    source_span.set(found=result.success)
 
                 if result.success:
                     logger.info(
@@ -1293,9 +1404,155 @@ class FullTextManager:
         Args:
             publication: Publication object
 
+        Race modes (FullTextManagerConfig.url_race_mode):
+        - "all" (default) / "hedged": wait for every source
+        - "good_enough": return as soon as a direct PDF URL arrives from a
+          source with priority <= good_enough_max_priority; slower sources
+          keep running in the background and fill the URL cache
+
         Returns:
             FullTextResult with all_urls populated
         """
+        on_result = None
+        if self.config.url_race_mode == "good_enough":
+            on_result = self._is_good_enough
+        return await self._collect_all_urls(publication, on_result=on_result)
+
+    def _is_good_enough(
+        self, source_name: str, priority: int, result: FullTextResult
+    ) -> bool:
+        """Whether a source result is a high-confidence URL worth stopping for."""
+        return bool(
+            result.success
+            and result.url
+            and priority <= self.config.good_enough_max_priority
+            and URLValidator.classify_url(result.url) == URLType.PDF_DIRECT
+        )
+
+    def _make_source_url(self, result: FullTextResult, priority: int) -> SourceURL:
+        """Build a ranked SourceURL from a successful source result."""
+        return SourceURL(
+            url=result.url,
+            source=result.source,
+            # PDF links get higher priority, landing pages get lower
+            priority=priority + URLValidator.get_priority_boost(result.url),
+            url_type=URLValidator.classify_url(result.url),
+            confidence=1.0,
+            requires_auth=(result.source == FullTextSource.INSTITUTIONAL),
+            metadata=result.metadata or {},
+        )
+
+    async def get_fulltext_hedged(
+        self, publication: Publication, pdf_downloader, output_dir: Path
+    ):
+        """
+        Collect URLs and download the PDF, overlapping the two when hedging.
+
+        With url_race_mode="hedged", the download starts on the first
+        good-enough URL (see good_enough_max_priority) while the remaining
+        sources keep running. If that download succeeds, the remaining sources
+        finish in the background and fill the URL cache. If it fails, the full
+        ranked URL list (minus the URL already tried) is used as fallback.
+
+        In other modes this is get_all_fulltext_urls() followed by
+        download_with_fallback().
+
+        Args:
+            publication: Publication object
+            pdf_downloader: PDFDownloadManager instance
+            output_dir: Directory to save PDF
+
+        Returns:
+            DownloadResult from the downloader
+        """
+        from omics_oracle_v2.lib.pipelines.pdf_download.download_manager import \
+            DownloadResult
+
+        hedge_url = None
+        hedge_download = None
+
+        if self.config.url_race_mode == "hedged":
+            first_good = asyncio.get_running_loop().create_future()
+
+            def on_result(source_name, priority, result):
+                if not first_good.done() and self._is_good_enough(
+                    source_name, priority, result
+                ):
+                    first_good.set_result(self._make_source_url(result, priority))
+                return False  # Keep collecting fallbacks
+
+            collect_task = asyncio.ensure_future(
+                self._collect_all_urls(publication, on_result=on_result)
+            )
+            await asyncio.wait(
+                {collect_task, first_good}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if first_good.done():
+                hedge_url = first_good.result()
+                logger.info(
+                    f"[HEDGE] Downloading from {hedge_url.source.value} "
+                    f"while remaining sources finish"
+                )
+                hedge_download = await pdf_downloader.download_with_fallback(
+                    publication, [hedge_url], output_dir
+                )
+                self._index_download(hedge_download)
+                if hedge_download.success:
+                    if not collect_task.done():
+                        self._track_background(collect_task)
+                    return hedge_download
+            else:
+                first_good.cancel()
+
+            urls_result = await collect_task
+        else:
+            urls_result = await self.get_all_fulltext_urls(publication)
+
+        if urls_result.pdf_path:
+            # Already available locally
+            return DownloadResult(
+                publication=publication,
+                success=True,
+                pdf_path=urls_result.pdf_path,
+                source="cache",
+                file_size=(urls_result.metadata or {}).get("size", 0),
+            )
+
+        tried = {hedge_url.url} if hedge_url else set()
+        remaining = [url for url in urls_result.all_urls or [] if url.url not in tried]
+        if not remaining:
+            return hedge_download or DownloadResult(
+                publication=publication,
+                success=False,
+                error=urls_result.error or "No URLs found",
+            )
+
+        download = await pdf_downloader.download_with_fallback(
+            publication, remaining, output_dir
+        )
+        self._index_download(download)
+        return download
+
+    @traced("urls.collect")
+    async def _collect_all_urls(
+        self,
+        publication: Publication,
+        on_result: Optional[Callable[[str, int, FullTextResult], bool]] = None,
+    ) -> FullTextResult:
+        """
+        Collect URLs from all sources (see get_all_fulltext_urls).
+
+        Args:
+            publication: Publication object
+            on_result: Optional hook called with (source_name, priority, result)
+                as each source finishes; returning True stops waiting for the
+                remaining sources
+
+        Returns:
+            FullTextResult with all_urls populated
+        """
+        current_span().set(pmid=publication.pmid)
         if not self.initialized:
             await self.initialize()
 
@@ -1356,16 +1613,9 @@ class FullTextManager:
             ("pmc", self._try_pmc, 11),  # MOVED TO END - PMC blocks programmatic access
         ]
 
-        # Execute ALL sources in PARALLEL
+        # Execute ALL sources in PARALLEL (cached source lookups are reused)
         logger.info(f"[FAST] Querying {len(sources)} sources in parallel...")
-        tasks = [
-            asyncio.wait_for(
-                source_func(publication), timeout=self.config.timeout_per_source
-            )
-            for _, source_func, _ in sources
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await self._query_sources(publication, sources, on_result=on_result)
 
         # Collect all successful URLs
         all_urls = []
@@ -1381,34 +1631,24 @@ class FullTextManager:
         for i, result in enumerate(results):
             source_name, _, priority = sources[i]
 
-            if isinstance(result, Exception):
-                logger.debug(f"  [X] {source_name} exception: {result}")
+            if result is None:
+                logger.debug(f"  [...] {source_name}: still running (early exit)")
+                continue
+
+            if isinstance(result, BaseException):
+                logger.debug(f"  [X] {source_name} exception: {result!r}")
                 continue
 
             if isinstance(result, FullTextResult) and result.success and result.url:
-                # [OK] NEW: Classify URL type automatically
-                url_type = URLValidator.classify_url(result.url)
-
-                # [OK] NEW: Adjust priority based on URL type
-                # PDF links get higher priority, landing pages get lower
-                priority_adjustment = URLValidator.get_priority_boost(result.url)
-                adjusted_priority = priority + priority_adjustment
-
-                source_url = SourceURL(
-                    url=result.url,
-                    source=result.source,
-                    priority=adjusted_priority,  # [OK] Adjusted priority
-                    url_type=url_type,  # [OK] NEW: Track URL type
-                    confidence=1.0,
-                    requires_auth=(result.source == FullTextSource.INSTITUTIONAL),
-                    metadata=result.metadata or {},
-                )
+                # Classify URL type and adjust priority accordingly
+                source_url = self._make_source_url(result, priority)
                 all_urls.append(source_url)
 
                 # Enhanced logging with URL type
                 logger.info(
                     f"  [OK] {source_name}: Found URL "
-                    f"(type={url_type.value}, priority={priority}->{adjusted_priority})"
+                    f"(type={source_url.url_type.value}, "
+                    f"priority={priority}->{source_url.priority})"
                 )
             else:
                 logger.debug(f"  [X] {source_name}: No URL found")
@@ -1441,19 +1681,256 @@ class FullTextManager:
             self.stats["by_source"].get(best_url.source.value, 0) + 1
         )
 
+        metadata = {
+            "total_sources_found": len(all_urls),
+            "sources": [url.source.value for url in all_urls],
+            "priorities": [url.priority for url in all_urls],
+            "best_source": best_url.source.value,
+        }
+        pending_sources = [
+            name for (name, _, _), result in zip(sources, results) if result is None
+        ]
+        if pending_sources:
+            metadata["early_exit"] = True
+            metadata["pending_sources"] = pending_sources
+
         return FullTextResult(
             success=True,
             source=best_url.source,
             url=best_url.url,
-            metadata={
-                "total_sources_found": len(all_urls),
-                "sources": [url.source.value for url in all_urls],
-                "priorities": [url.priority for url in all_urls],
-                "best_source": best_url.source.value,
-            },
+            metadata=metadata,
             all_urls=all_urls,
         )
 
+    def _cacheable_sources(self) -> Dict[str, object]:
+        """
+        Get network-backed sources whose lookups can be cached.
+
+        Institutional and OpenAlex OA lookups are computed locally and are
+        never cached. Disabled sources (client not initialized) are excluded
+        so that enabling a source later is not masked by stale entries.
+
+        Returns:
+            Dict of source name -> initialized client
+        """
+        clients = {
+            "unpaywall": self.unpaywall_client,
+            "core": self.core_client,
+            "crossref": self.crossref_client,
+            "biorxiv": self.biorxiv_client,
+            "arxiv": self.arxiv_client,
+            "scihub": self.scihub_client,
+            "libgen": self.libgen_client,
+            "pmc": self.pmc_client,
+        }
+        return {name: client for name, client in clients.items() if client}
+
+    @staticmethod
+    def _result_to_cache_entry(result: FullTextResult) -> Dict:
+        """Serialize a source lookup result for the URL cache."""
+        return {
+            "success": result.success,
+            "url": result.url,
+            "source": result.source.value if result.source else None,
+            "metadata": result.metadata or {},
+            "error": result.error,
+        }
+
+    @staticmethod
+    def _result_from_cache_entry(entry: Dict) -> FullTextResult:
+        """Rebuild a source lookup result from a URL cache entry."""
+        source = entry.get("source")
+        return FullTextResult(
+            success=bool(entry.get("success")),
+            source=FullTextSource(source) if source else None,
+            url=entry.get("url"),
+            error=entry.get("error"),
+            metadata={**(entry.get("metadata") or {}), "url_cache_hit": True},
+        )
+
+    async def _query_sources(
+        self,
+        publication: Publication,
+        sources: List,
+        on_result: Optional[Callable[[str, int, FullTextResult], bool]] = None,
+    ) -> List:
+        """
+        Query sources in parallel, serving cached lookups from the URL cache.
+
+        Cached entries (positive and negative) replace the network call for
+        that source. Fresh results are written back, except for timeouts,
+        exceptions and transient errors, which are never cached.
+
+        When on_result returns True for a finished source, the method returns
+        without waiting for the others. Sources still running are left to
+        finish in the background so their answers reach the URL cache (or are
+        cancelled when the URL cache is disabled).
+
+        Args:
+            publication: Publication object
+            sources: List of (name, source_func, priority) tuples
+            on_result: Optional hook called with (source_name, priority, result)
+                as each source finishes; returning True stops waiting
+
+        Returns:
+            List of FullTextResult (or Exception) in the same order as sources;
+            None for sources still running after an early exit
+        """
+        cache_key = make_publication_key(publication) if self.url_cache else None
+        cacheable = self._cacheable_sources() if cache_key else {}
+
+        cached_entries: Dict[str, Dict] = {}
+        if cacheable:
+            names = [name for name, _, _ in sources if name in cacheable]
+            with span("urls.cache_lookup", sources=len(names)) as lookup:
+                cached = await self.url_cache.get_many([cache_key], names)
+                lookup.set(hits=len(cached.get(cache_key, {})))
+            cached_entries = cached.get(cache_key, {})
+
+            if cached_entries:
+                self.stats["url_cache_hits"] = self.stats.get(
+                    "url_cache_hits", 0
+                ) + len(cached_entries)
+                logger.info(
+                    f"  [CACHE] {len(cached_entries)}/{len(cacheable)} source lookups "
+                    f"served from URL cache"
+                )
+
+        async def query(source_name, source_func):
+            if source_name in cached_entries:
+                return self._result_from_cache_entry(cached_entries[source_name])
+            with span("urls.source", upstream=source_name) as source_span:
+                result = await asyncio.wait_for(
+                    source_func(publication), timeout=self.config.timeout_per_source
+                )
+                source_span.set(found=result.success)
+                return result
+
+        tasks = [
+            asyncio.ensure_future(query(name, func)) for name, func, _ in sources
+        ]
+        results: List = [None] * len(tasks)
+        position = {task: i for i, task in enumerate(tasks)}
+
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                stop = False
+                for task in done:
+                    i = position[task]
+                    if task.cancelled():
+                        # exception() would raise CancelledError here
+                        results[i] = asyncio.CancelledError()
+                    else:
+                        results[i] = task.exception() or task.result()
+                    if on_result and isinstance(results[i], FullTextResult):
+                        source_name, _, priority = sources[i]
+                        stop = on_result(source_name, priority, results[i]) or stop
+                if stop:
+                    break
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        finished = [
+            (source, result)
+            for source, result in zip(sources, results)
+            if result is not None
+        ]
+        await self._store_source_results(
+            cache_key, cacheable, cached_entries, finished
+        )
+
+        if pending:
+            still_running = [sources[position[task]][0] for task in pending]
+            logger.info(
+                f"  [FAST] Early exit, {len(pending)} source(s) still running: "
+                f"{', '.join(still_running)}"
+            )
+            # Track the lookups themselves so cleanup() can cancel them
+            for task in pending:
+                self._track_background(task)
+            if cacheable:
+                self._track_background(
+                    self._finish_sources(
+                        [(sources[position[task]], task) for task in pending],
+                        cache_key,
+                        cacheable,
+                        cached_entries,
+                    )
+                )
+            else:
+                for task in pending:
+                    task.cancel()
+
+        return results
+
+    async def _store_source_results(
+        self,
+        cache_key: Optional[str],
+        cacheable: Dict[str, object],
+        cached_entries: Dict[str, Dict],
+        finished: List,
+    ) -> None:
+        """Write fresh, cacheable source results back to the URL cache."""
+        if not cacheable:
+            return
+
+        new_entries = {}
+        for (source_name, _, _), result in finished:
+            if source_name not in cacheable or source_name in cached_entries:
+                continue
+            if not isinstance(result, FullTextResult):
+                continue  # Timeout or exception - retry next time
+            if not result.success and (result.metadata or {}).get("transient"):
+                continue
+            new_entries[source_name] = self._result_to_cache_entry(result)
+
+        if new_entries:
+            await self.url_cache.set_many({cache_key: new_entries})
+
+    async def _finish_sources(
+        self,
+        running: List,
+        cache_key: str,
+        cacheable: Dict[str, object],
+        cached_entries: Dict[str, Dict],
+    ) -> None:
+        """Wait for sources left running after an early exit and cache them."""
+        results = await asyncio.gather(
+            *[task for _, task in running], return_exceptions=True
+        )
+        finished = [(source, result) for (source, _), result in zip(running, results)]
+        await self._store_source_results(
+            cache_key, cacheable, cached_entries, finished
+        )
+        logger.debug(f"  Background fill cached {len(finished)} late source(s)")
+
+    def _track_background(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until done."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_done)
+        return task
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.debug(f"Background task failed: {task.exception()}")
+
+    async def _cancel_background_tasks(self) -> None:
+        """Cancel background work (e.g., late source lookups) and wait for it."""
+        tasks = list(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     async def get_fulltext_batch(
         self,
         publications: List[Publication],
@@ -1486,6 +1963,16 @@ class FullTextManager:
             f"(max {max_concurrent} concurrent, collect_all={collect_all_urls})..."
         )
 
+        # Build the local file index once, off the event loop
+        await asyncio.to_thread(self._get_smart_cache().build_index)
+
+        # Load cached source lookups for the whole batch in one round trip
+        if collect_all_urls and self.url_cache:
+            keys = [make_publication_key(pub) for pub in publications]
+            await self.url_cache.prefetch(
+                [key for key in keys if key], self._cacheable_sources()
+            )
+
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_concurrent)
 
@@ -1511,6 +1998,104 @@ class FullTextManager:
 
         return results
 
+    async def get_all_fulltext_urls_batch(
+        self,
+        publications: List[Publication],
+        max_concurrent: Optional[int] = None,
+    ) -> List[FullTextResult]:
+        """
+        Collect URLs for a whole dataset using batched upstream calls.
+
+        Publications are grouped per source and the batch-capable upstreams
+        are queried once for the group before per-publication collection:
+        - PMC: PMID -> PMC ID conversion, 200 IDs per request
+        - Crossref: works filter=doi:..., 50 DOIs per request
+        - Unpaywall: batch_get_oa() pipelined over one session
+
+        The per-publication pass (get_all_fulltext_urls) then answers those
+        lookups from memory and fans the results back out to one
+        FullTextResult per publication. Lookups already in the URL cache are
+        not prefetched. Prefetched answers belong to this call only; the
+        shared source clients keep no batch state.
+
+        Args:
+            publications: List of Publication objects
+            max_concurrent: Maximum concurrent publications (defaults to config)
+
+        Returns:
+            List of FullTextResult objects (same order as publications)
+        """
+        if not self.initialized:
+            await self.initialize()
+
+        lookups = await self._prefetch_source_batches(publications)
+        token = _batch_lookups.set(lookups)
+        try:
+            return await self.get_fulltext_batch(
+                publications, max_concurrent=max_concurrent, collect_all_urls=True
+            )
+        finally:
+            _batch_lookups.reset(token)
+
+    async def _prefetch_source_batches(
+        self, publications: List[Publication]
+    ) -> BatchLookups:
+        """
+        Issue batched upstream lookups for publications grouped per source.
+
+        Args:
+            publications: List of Publication objects
+
+        Returns:
+            BatchLookups with the answers of every batch call that succeeded
+        """
+        batch_sources = ("unpaywall", "crossref", "pmc")
+
+        cached: Dict[str, Dict] = {}
+        keys = {id(pub): make_publication_key(pub) for pub in publications}
+        if self.url_cache:
+            cached = await self.url_cache.get_many(
+                [key for key in keys.values() if key], batch_sources
+            )
+
+        groups: Dict[str, List[str]] = {name: [] for name in batch_sources}
+        for pub in publications:
+            already = cached.get(keys[id(pub)], {})
+            if pub.doi:
+                if self.unpaywall_client and "unpaywall" not in already:
+                    groups["unpaywall"].append(pub.doi)
+                if self.crossref_client and "crossref" not in already:
+                    groups["crossref"].append(pub.doi)
+            has_pmc_id = pub.pmcid or (pub.metadata or {}).get("pmc_id")
+            if self.pmc_client and pub.pmid and not has_pmc_id and "pmc" not in already:
+                groups["pmc"].append(pub.pmid)
+
+        calls = {}
+        if groups["unpaywall"]:
+            calls["unpaywall"] = self.unpaywall_client.prefetch(groups["unpaywall"])
+        if groups["crossref"]:
+            calls["crossref"] = self.crossref_client.get_by_dois(groups["crossref"])
+        if groups["pmc"]:
+            calls["pmc"] = self.pmc_client.convert_pmids_to_pmcids(groups["pmc"])
+
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+
+        lookups = BatchLookups()
+        counts = {}
+        for source_name, result in zip(calls, results):
+            if isinstance(result, Exception):
+                # Per-publication lookups still run for this source
+                logger.warning(f"Batch prefetch failed for {source_name}: {result}")
+                continue
+            setattr(lookups, source_name, result)
+            counts[source_name] = len(result)
+
+        logger.info(
+            f"[BATCH] Prefetched lookups for {len(publications)} publications: "
+            + ", ".join(f"{name}={count}" for name, count in counts.items())
+        )
+        return lookups
+
     def get_statistics(self) -> Dict:
         """
         Get statistics about full-text retrieval attempts.
@@ -1530,6 +2115,7 @@ class FullTextManager:
             "failures": self.stats["failures"],
             "success_rate": f"{success_rate:.1f}%",
             "by_source": self.stats["by_source"],
+            "url_cache_hits": self.stats.get("url_cache_hits", 0),
         }
 
     def reset_statistics(self):
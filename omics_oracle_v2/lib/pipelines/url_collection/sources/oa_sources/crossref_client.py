@@ -32,8 +32,8 @@ from urllib.parse import quote
 import aiohttp
 from pydantic import BaseModel, Field
 
-from omics_oracle_v2.lib.pipelines.citation_discovery.clients.base import \
-    BasePublicationClient
+from omics_oracle_v2.lib.pipelines.citation_discovery.clients.base import (
+    BasePublicationClient, FetchError)
 from omics_oracle_v2.lib.search_engines.citations.models import (
     Publication, PublicationSource)
 
@@ -178,7 +178,10 @@ class CrossrefClient(BasePublicationClient):
             endpoint: API endpoint (relative to base URL)
 
         Returns:
-            JSON response as dict, or None on failure
+            JSON response as dict, or None if not found (404)
+
+        Raises:
+            FetchError: If Crossref could not answer after all retries
         """
         if not self.session:
             raise RuntimeError(
@@ -189,6 +192,7 @@ class CrossrefClient(BasePublicationClient):
 
         url = f"{self.config.api_url}{endpoint}"
 
+        error = "no attempts made"
         for attempt in range(self.config.retry_count):
             try:
                 async with self.session.get(url) as response:
@@ -199,35 +203,45 @@ class CrossrefClient(BasePublicationClient):
                         logger.debug(f"Not found in Crossref: {endpoint}")
                         return None
                     else:
+                        error = f"status {response.status}"
                         logger.warning(
                             f"Crossref API returned status {response.status} (attempt {attempt + 1})"
                         )
 
             except asyncio.TimeoutError:
+                error = "timeout"
                 logger.warning(f"Crossref API timeout (attempt {attempt + 1})")
             except Exception as e:
+                error = str(e)
                 logger.warning(f"Crossref API error: {e} (attempt {attempt + 1})")
 
             if attempt < self.config.retry_count - 1:
                 await asyncio.sleep(2**attempt)  # Exponential backoff
 
-        return None
+        raise FetchError(f"Crossref request failed ({error}): {endpoint}")
 
-    async def get_by_doi(self, doi: str) -> Optional[Dict]:
+    async def get_by_doi(
+        self, doi: str, prefetched: Optional[Dict[str, Optional[Dict]]] = None
+    ) -> Optional[Dict]:
         """
         Get paper metadata by DOI.
 
         Args:
             doi: DOI (e.g., "10.1371/journal.pone.0123456")
+            prefetched: Works from get_by_dois(); DOIs found here are not
+                requested again
 
         Returns:
             Paper metadata dict with full-text links if available, or None
+
+        Raises:
+            FetchError: If Crossref could not answer (timeout, network or
+                server error), so the caller can retry instead of treating
+                the DOI as missing
         """
-        # Clean DOI
-        clean_doi = doi.strip()
-        if clean_doi.startswith("http"):
-            # Extract DOI from URL
-            clean_doi = clean_doi.split("doi.org/")[-1]
+        clean_doi = self._clean_doi(doi)
+        if prefetched is not None and clean_doi.lower() in prefetched:
+            return prefetched[clean_doi.lower()]
 
         endpoint = f"/works/{quote(clean_doi, safe='')}"
 
@@ -237,6 +251,74 @@ class CrossrefClient(BasePublicationClient):
 
         return self._parse_work(data)
 
+    @staticmethod
+    def _clean_doi(doi: str) -> str:
+        """Strip whitespace and doi.org URL prefix from a DOI."""
+        clean_doi = doi.strip()
+        if clean_doi.startswith("http"):
+            # Extract DOI from URL
+            clean_doi = clean_doi.split("doi.org/")[-1]
+        return clean_doi
+
+    async def get_by_dois(
+        self, dois: List[str], batch_size: int = 50
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Get metadata for many DOIs using the works filter (filter=doi:...).
+
+        One request per batch_size DOIs instead of one per DOI. DOIs from a
+        batch whose request failed, or whose work could not be parsed, are
+        left out of the result (unknown), so callers can fall back to
+        get_by_doi().
+
+        Args:
+            dois: List of DOIs
+            batch_size: DOIs per request
+
+        Returns:
+            Dict of lowercased DOI -> paper metadata dict (None if not found)
+        """
+        # Commas separate filter values, so such DOIs cannot be batched
+        cleaned = sorted(
+            {self._clean_doi(doi) for doi in dois if doi and "," not in doi}
+        )
+        results: Dict[str, Optional[Dict]] = {}
+
+        for start in range(0, len(cleaned), batch_size):
+            chunk = cleaned[start : start + batch_size]
+            doi_filter = ",".join(f"doi:{doi}" for doi in chunk)
+            endpoint = (
+                f"/works?filter={quote(doi_filter, safe=':,/')}&rows={len(chunk)}"
+            )
+
+            try:
+                data = await self._make_request(endpoint)
+            except FetchError as e:
+                logger.warning(f"Crossref batch lookup failed for {len(chunk)} DOIs: {e}")
+                continue
+            if data is None:
+                logger.warning(f"Crossref batch lookup failed for {len(chunk)} DOIs")
+                continue
+
+            found = {}
+            unparsed = set()
+            for work in data.get("items", []):
+                try:
+                    parsed = self._parse_work(work)
+                except Exception as e:
+                    logger.warning(f"Error parsing Crossref work: {e}")
+                    if work.get("DOI"):
+                        unparsed.add(work["DOI"].lower())
+                    continue
+                if parsed.get("doi"):
+                    found[parsed["doi"].lower()] = parsed
+
+            for doi in chunk:
+                if doi.lower() not in unparsed:
+                    results[doi.lower()] = found.get(doi.lower())
+
+        return results
+
     def _parse_work(self, work: Dict) -> Dict:
         """
         Parse Crossref work metadata.
@@ -326,7 +408,11 @@ class CrossrefClient(BasePublicationClient):
         """
         endpoint = f"/works?query={quote(query)}&rows={max_results}"
 
-        data = await self._make_request(endpoint)
+        try:
+            data = await self._make_request(endpoint)
+        except FetchError as e:
+            logger.warning(f"Crossref search failed: {e}")
+            return []
         if not data or "items" not in data:
             return []
 
@@ -352,7 +438,11 @@ class CrossrefClient(BasePublicationClient):
         Returns:
             Publication object, or None if not found
         """
-        paper = await self.get_by_doi(identifier)
+        try:
+            paper = await self.get_by_doi(identifier)
+        except FetchError as e:
+            logger.warning(f"Crossref fetch failed for {identifier}: {e}")
+            return None
         if not paper:
             return None
 
@@ -403,7 +493,11 @@ async def get_fulltext_links(doi: str) -> List[str]:
         List of full-text URLs
     """
     async with CrossrefClient() as client:
-        paper = await client.get_by_doi(doi)
+        try:
+            paper = await client.get_by_doi(doi)
+        except FetchError as e:
+            logger.warning(f"Crossref lookup failed for {doi}: {e}")
+            return []
         if paper:
             return paper.get("fulltext_urls", [])
         return []
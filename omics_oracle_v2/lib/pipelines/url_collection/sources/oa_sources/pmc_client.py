@@ -10,7 +10,7 @@ API Documentation: https://www.ncbi.nlm.nih.gov/pmc/tools/id-converter-api/
 import logging
 import ssl
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Dict, List, Optional
 
 import aiohttp
 from pydantic import BaseModel, Field
@@ -112,7 +112,9 @@ class PMCClient:
             await self.session.close()
             self.session = None
 
-    async def get_fulltext(self, publication) -> "FullTextResult":
+    async def get_fulltext(
+        self, publication, pmcids: Optional[Dict[str, Optional[str]]] = None
+    ) -> "FullTextResult":
         """
         Get full-text from PMC with multiple URL patterns.
 
@@ -123,6 +125,8 @@ class PMCClient:
 
         Args:
             publication: Publication object with pmid or pmc_id
+            pmcids: Conversions from convert_pmids_to_pmcids(); PMIDs found
+                here skip the per-PMID conversion request
 
         Returns:
             FullTextResult with best available URL
@@ -134,7 +138,7 @@ class PMCClient:
 
         try:
             # Extract PMC ID
-            pmc_id = await self._extract_pmc_id(publication)
+            pmc_id = await self._extract_pmc_id(publication, pmcids)
             if not pmc_id:
                 return FullTextResult(success=False, error="No PMC ID found")
 
@@ -146,7 +150,9 @@ class PMCClient:
             logger.warning(f"PMC lookup failed: {e}")
             return FullTextResult(success=False, error=str(e))
 
-    async def _extract_pmc_id(self, publication) -> Optional[str]:
+    async def _extract_pmc_id(
+        self, publication, pmcids: Optional[Dict[str, Optional[str]]] = None
+    ) -> Optional[str]:
         """
         Extract PMC ID from publication using multiple methods.
 
@@ -158,6 +164,7 @@ class PMCClient:
 
         Args:
             publication: Publication object
+            pmcids: Batch PMID -> PMC ID conversions, checked before method 4
 
         Returns:
             PMC ID (numeric only) or None
@@ -184,6 +191,8 @@ class PMCClient:
 
         # Method 4: Fetch PMC ID from PMID using E-utilities
         if hasattr(publication, "pmid") and publication.pmid:
+            if pmcids is not None and str(publication.pmid) in pmcids:
+                return pmcids[str(publication.pmid)]
             pmc_id = await self._convert_pmid_to_pmcid(publication.pmid)
             if pmc_id:
                 logger.info(
@@ -221,6 +230,57 @@ class PMCClient:
 
         return None
 
+    async def convert_pmids_to_pmcids(
+        self, pmids: List[str], batch_size: int = 200
+    ) -> Dict[str, Optional[str]]:
+        """
+        Convert many PMIDs to PMC IDs (the ID converter takes 200 IDs per call).
+
+        Pass the result to get_fulltext() so those publications skip the
+        per-PMID conversion request. PMIDs from a failed request are left
+        out (unknown) and converted individually.
+
+        Args:
+            pmids: List of PubMed IDs
+            batch_size: IDs per request (API maximum is 200)
+
+        Returns:
+            Dict of PMID -> PMC ID (numeric only, None if not in PMC)
+        """
+        todo = sorted({str(pmid) for pmid in pmids if pmid})
+        conversions: Dict[str, Optional[str]] = {}
+
+        for start in range(0, len(todo), batch_size):
+            chunk = todo[start : start + batch_size]
+            url = (
+                "https://www.ncbi.nlm.nih.gov/pmc/utils/idconv/v1.0/"
+                f"?ids={','.join(chunk)}&format=json"
+            )
+            try:
+                async with self.session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    if response.status != 200:
+                        logger.warning(
+                            f"PMC ID conversion returned {response.status} "
+                            f"for {len(chunk)} PMIDs"
+                        )
+                        continue
+                    data = await response.json()
+            except Exception as e:
+                logger.warning(f"PMC ID batch conversion failed: {e}")
+                continue
+
+            converted = {}
+            for record in data.get("records", []):
+                pmcid = record.get("pmcid", "").replace("PMC", "").strip()
+                converted[str(record.get("pmid", ""))] = pmcid or None
+            for pmid in chunk:
+                conversions[pmid] = converted.get(pmid)
+
+        logger.info(f"Converted {len(conversions)} PMIDs to PMC IDs in batches")
+        return conversions
+
     async def _try_url_patterns(self, pmc_id: str) -> "FullTextResult":
         """
         Try multiple PMC URL patterns in priority order.
@@ -17,6 +17,9 @@ from typing import Dict, List, Optional
 import aiohttp
 from pydantic import BaseModel, Field
 
+from omics_oracle_v2.lib.pipelines.citation_discovery.clients.base import \
+    FetchError
+
 logger = logging.getLogger(__name__)
 
 # SSL context for institutional networks
@@ -85,15 +88,19 @@ class UnpaywallClient:
             await self.session.close()
             self.session = None
 
-    async def get_oa_location(self, doi: str) -> Optional[Dict]:
+    async def get_oa_location(
+        self, doi: str, prefetched: Optional[Dict[str, Optional[Dict]]] = None
+    ) -> Optional[Dict]:
         """
         Get open access location for a DOI.
 
         Args:
             doi: Digital Object Identifier
+            prefetched: Lookups from prefetch(); DOIs found here are not
+                requested again
 
         Returns:
-            Dict with OA information, or None if not found
+            Dict with OA information, or None if not found or not OA
 
             Example response:
             {
@@ -112,6 +119,11 @@ class UnpaywallClient:
                 'publisher': 'Springer Nature',
                 'year': 2013
             }
+
+        Raises:
+            FetchError: If Unpaywall could not answer (timeout, network or
+                server error), so the caller can retry instead of treating
+                the DOI as not OA
         """
         if not doi:
             return None
@@ -119,12 +131,16 @@ class UnpaywallClient:
         # Clean DOI
         doi = doi.replace("https://doi.org/", "").replace("http://doi.org/", "").strip()
 
+        if prefetched is not None and doi.lower() in prefetched:
+            return prefetched[doi.lower()]
+
         if not self.session:
             raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
         url = f"{self.config.api_url}/{doi}"
         params = {"email": self.config.email}
 
+        error = "no attempts made"
         for attempt in range(self.config.retry_count):
             try:
                 async with self.session.get(
@@ -148,33 +164,33 @@ class UnpaywallClient:
                     elif response.status == 429:
                         # Rate limited (should not happen with polite use)
                         wait_time = (attempt + 1) * 2
+                        error = "rate limited (HTTP 429)"
                         logger.warning(f"Rate limited by Unpaywall, waiting {wait_time}s")
                         await asyncio.sleep(wait_time)
                         continue
 
                     else:
+                        error = f"API error {response.status}"
                         logger.warning(f"Unpaywall API error {response.status} for DOI: {doi}")
-                        return None
+                        break
 
             except asyncio.TimeoutError:
+                error = "timeout"
                 logger.debug(f"Unpaywall timeout for DOI: {doi}")
                 if attempt < self.config.retry_count - 1:
                     await asyncio.sleep(1)
-                    continue
-                return None
 
             except aiohttp.ClientError as e:
+                error = f"network error: {e}"
                 logger.debug(f"Network error on Unpaywall request: {e}")
                 if attempt < self.config.retry_count - 1:
                     await asyncio.sleep(attempt + 1)
-                    continue
-                return None
 
             except Exception as e:
                 logger.warning(f"Unexpected error in Unpaywall request: {e}")
-                return None
+                raise FetchError(f"Unpaywall lookup failed for DOI {doi}: {e}") from e
 
-        return None
+        raise FetchError(f"Unpaywall lookup failed for DOI {doi}: {error}")
 
     async def get_pdf_url(self, doi: str) -> Optional[str]:
         """
@@ -184,9 +200,13 @@ class UnpaywallClient:
             doi: Digital Object Identifier
 
         Returns:
-            PDF URL or None
+            PDF URL or None (also None if Unpaywall could not answer)
         """
-        result = await self.get_oa_location(doi)
+        try:
+            result = await self.get_oa_location(doi)
+        except FetchError as e:
+            logger.warning(f"Unpaywall lookup failed for {doi}: {e}")
+            return None
 
         if not result:
             return None
@@ -225,8 +245,13 @@ class UnpaywallClient:
             max_concurrent: Maximum concurrent requests
 
         Returns:
-            List of OA information dicts (None for not found)
+            List of OA information dicts (None for not found or failed)
         """
+        results = await self._gather_oa(dois, max_concurrent)
+        return [None if isinstance(result, Exception) else result for result in results]
+
+    async def _gather_oa(self, dois: List[str], max_concurrent: int) -> List:
+        """Look up DOIs concurrently; failed lookups are returned as exceptions."""
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def get_with_semaphore(doi: str) -> Optional[Dict]:
@@ -234,7 +259,45 @@ class UnpaywallClient:
                 return await self.get_oa_location(doi)
 
         tasks = [get_with_semaphore(doi) for doi in dois]
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def prefetch(
+        self, dois: List[str], max_concurrent: int = 10
+    ) -> Dict[str, Optional[Dict]]:
+        """
+        Look up many DOIs ahead of per-publication calls.
+
+        Unpaywall has no multi-DOI endpoint, so lookups are pipelined over
+        the client's keep-alive session. Pass the result to get_oa_location()
+        to answer these DOIs without another request. Failed lookups are left
+        out, so they are retried later.
+
+        Args:
+            dois: List of DOIs
+            max_concurrent: Maximum concurrent requests
+
+        Returns:
+            Dict of lowercased DOI -> OA data (None if not OA or not found)
+        """
+        cleaned = {
+            doi.replace("https://doi.org/", "").replace("http://doi.org/", "").strip()
+            for doi in dois
+            if doi
+        }
+        todo = sorted(cleaned)
+        if not todo:
+            return {}
+
+        results = await self._gather_oa(todo, max_concurrent)
+        prefetched: Dict[str, Optional[Dict]] = {}
+        for doi, data in zip(todo, results):
+            if isinstance(data, Exception):
+                logger.debug(f"Unpaywall prefetch failed for {doi}: {data}")
+                continue
+            prefetched[doi.lower()] = data
+
+        logger.info(f"Prefetched {len(prefetched)}/{len(todo)} Unpaywall lookups")
+        return prefetched
 
 
 # Convenience function
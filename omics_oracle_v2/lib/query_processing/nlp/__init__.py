@@ -6,12 +6,15 @@ for biomedical literature and text.
 """
 
 from .biomedical_ner import BiomedicalNER
+from .gazetteer import Gazetteer, GazetteerMatch
 from .models import Entity, EntityType, ModelInfo, NERResult
 
 __all__ = [
     "BiomedicalNER",
     "Entity",
     "EntityType",
+    "Gazetteer",
+    "GazetteerMatch",
     "ModelInfo",
     "NERResult",
 ]
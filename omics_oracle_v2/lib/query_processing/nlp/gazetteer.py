@@ -0,0 +1,302 @@
+"""
+Compiled biomedical gazetteer.
+
+Classifies entity text against curated term lists in a single pass:
+- All terms of all entity types are compiled into one Aho-Corasick automaton
+- One scan of the text yields every exact, substring, and suffix match
+- Term lists live in versioned JSON files (gazetteer_terms.json); extra files
+  can be merged on top, so curators extend the lists without code changes
+
+Term file format:
+    {
+      "version": "1.0.0",
+      "entity_types": {
+        "technique": {"labels": [...], "exact": [...], "contains": [...],
+                      "suffix": [...], "exclude": {"exact": [...], ...}},
+        ...
+      }
+    }
+
+Entity types are listed in priority order. A term is a lowercase string, or
+{"term": "...", "min_length": N} to require an entity text of at least N
+characters. Exclusions veto the type, including its label match.
+
+Usage:
+    gazetteer = Gazetteer.load()
+    gazetteer.match_types("atac-seq", label="CHEMICAL")  # [EntityType.TECHNIQUE, EntityType.CHEMICAL]
+"""
+
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from omics_oracle_v2.core.exceptions import NLPError
+from omics_oracle_v2.lib.query_processing.nlp.models import EntityType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TERMS_PATH = Path(__file__).parent / "gazetteer_terms.json"
+
+# Match rules: where a term must occur in the entity text
+RULE_EXACT = "exact"
+RULE_CONTAINS = "contains"
+RULE_SUFFIX = "suffix"
+MATCH_RULES = (RULE_EXACT, RULE_CONTAINS, RULE_SUFFIX)
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """A term occurrence that satisfies one of a type's rules."""
+
+    entity_type: EntityType
+    rule: str
+    term: str
+    start: int
+    end: int
+    exclude: bool = False
+
+
+@dataclass(frozen=True)
+class _Rule:
+    entity_type: EntityType
+    rule: str
+    term: str
+    min_length: int
+    exclude: bool
+
+
+class Gazetteer:
+    """
+    Aho-Corasick matcher over the gazetteer's term lists.
+
+    Built once from the term definitions; matching is a single pass over
+    the text regardless of how many terms or entity types are defined.
+    """
+
+    def __init__(self, entity_types: Dict[str, Dict[str, Any]], version: str = "unknown"):
+        """
+        Compile the gazetteer.
+
+        Args:
+            entity_types: Mapping of entity type name to its term sections,
+                in priority order
+            version: Term list version (reported in ModelInfo)
+
+        Raises:
+            NLPError: If an entity type or section is not recognized
+        """
+        self.version = version
+        self.priority: List[EntityType] = []
+        self._labels: Dict[str, Set[EntityType]] = {}
+        self._rules: List[_Rule] = []
+
+        for name, sections in entity_types.items():
+            entity_type = _entity_type(name)
+            self.priority.append(entity_type)
+
+            unknown = set(sections) - {"labels", "exclude", *MATCH_RULES}
+            if unknown:
+                raise NLPError(f"Unknown gazetteer sections for {name}: {sorted(unknown)}")
+
+            for label in sections.get("labels", []):
+                self._labels.setdefault(label, set()).add(entity_type)
+            for rule in MATCH_RULES:
+                self._add_rules(entity_type, rule, sections.get(rule, []), exclude=False)
+            for rule, terms in sections.get("exclude", {}).items():
+                if rule not in MATCH_RULES:
+                    raise NLPError(f"Unknown gazetteer exclude rule for {name}: {rule}")
+                self._add_rules(entity_type, rule, terms, exclude=True)
+
+        self._build_automaton()
+        logger.debug(f"Compiled gazetteer v{version}: {len(self._rules)} rules, {len(self._goto)} states")
+
+    @classmethod
+    def load(cls, paths: Sequence[str] = ()) -> "Gazetteer":
+        """
+        Load the bundled term file plus optional extra term files.
+
+        Compiled gazetteers are cached per list of paths.
+
+        Args:
+            paths: Extra term files; their terms are merged into the bundled
+                lists and new entity types are appended to the priority order
+
+        Returns:
+            Compiled Gazetteer
+        """
+        return _load_cached(tuple(str(p) for p in paths))
+
+    @classmethod
+    def from_files(cls, paths: Sequence[Path]) -> "Gazetteer":
+        """Compile a gazetteer from term files, merged in order."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        versions = []
+        for path in paths:
+            try:
+                data = json.loads(Path(path).read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                raise NLPError(f"Failed to read gazetteer terms from {path}: {e}") from e
+            versions.append(str(data.get("version", "unknown")))
+            for name, sections in data.get("entity_types", {}).items():
+                _merge_sections(merged.setdefault(name, {}), sections)
+        return cls(merged, version="+".join(versions))
+
+    def _add_rules(self, entity_type: EntityType, rule: str, terms: Iterable[Any], exclude: bool) -> None:
+        for entry in terms:
+            if isinstance(entry, dict):
+                term, min_length = entry["term"], int(entry.get("min_length", 0))
+            else:
+                term, min_length = entry, 0
+            if not term:
+                continue
+            self._rules.append(_Rule(entity_type, rule, term.lower(), min_length, exclude))
+
+    def _build_automaton(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for rule_id, rule in enumerate(self._rules):
+            state = 0
+            for char in rule.term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(rule_id)
+
+        # Breadth-first failure links; each state also emits its fail state's outputs
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+                queue.append(next_state)
+
+        self._outputs: List[Tuple[Tuple[int, _Rule], ...]] = [
+            tuple((len(self._rules[rule_id].term), self._rules[rule_id]) for rule_id in ids) for ids in outputs
+        ]
+
+    def _scan(self, text: str):
+        """Yield (start, end, rule) for every satisfied rule in one pass."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        text_length = len(text)
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            end = index + 1
+            for term_length, rule in outputs[state]:
+                if text_length < rule.min_length:
+                    continue
+                start = end - term_length
+                if rule.rule == RULE_CONTAINS or (
+                    end == text_length and (rule.rule == RULE_SUFFIX or start == 0)
+                ):
+                    yield start, end, rule
+
+    def matches(self, text: str) -> List[GazetteerMatch]:
+        """
+        Find every term match in the text.
+
+        Args:
+            text: Entity text (matched case-insensitively)
+
+        Returns:
+            All matches, including exclusion matches, in order of end position
+        """
+        return [
+            GazetteerMatch(rule.entity_type, rule.rule, rule.term, start, end, rule.exclude)
+            for start, end, rule in self._scan(text.lower())
+        ]
+
+    def match_types(
+        self, text: str, label: Optional[str] = None, extra_types: Iterable[EntityType] = ()
+    ) -> List[EntityType]:
+        """
+        Get every entity type the text matches, in priority order.
+
+        Args:
+            text: Entity text (matched case-insensitively)
+            label: Optional spaCy/SciSpaCy entity label
+            extra_types: Types suggested by caller heuristics (still subject
+                to exclusions and priority order)
+
+        Returns:
+            Matching entity types, highest priority first
+        """
+        matched: Set[EntityType] = set(extra_types)
+        excluded: Set[EntityType] = set()
+        if label:
+            matched.update(self._labels.get(label, ()))
+
+        # Inlined _scan: this is the per-entity hot path
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        text = text.lower()
+        text_length = len(text)
+        state = 0
+        for index, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for term_length, rule in outputs[state]:
+                if text_length < rule.min_length:
+                    continue
+                if rule.rule == RULE_CONTAINS or (
+                    index == text_length and (rule.rule == RULE_SUFFIX or index == term_length)
+                ):
+                    (excluded if rule.exclude else matched).add(rule.entity_type)
+        return [entity_type for entity_type in self.priority if entity_type in matched and entity_type not in excluded]
+
+    def classify(self, text: str, label: Optional[str] = None, extra_types: Iterable[EntityType] = ()) -> EntityType:
+        """Get the highest-priority matching type, or EntityType.GENERAL."""
+        types = self.match_types(text, label, extra_types)
+        return types[0] if types else EntityType.GENERAL
+
+    @property
+    def labels(self) -> Dict[str, FrozenSet[EntityType]]:
+        """Entity labels mapped to the types they indicate."""
+        return {label: frozenset(types) for label, types in self._labels.items()}
+
+
+def _entity_type(name: str) -> EntityType:
+    try:
+        return EntityType(name)
+    except ValueError:
+        raise NLPError(f"Unknown gazetteer entity type: {name}") from None
+
+
+def _merge_sections(target: Dict[str, Any], sections: Dict[str, Any]) -> None:
+    for key, value in sections.items():
+        if key == "exclude":
+            for rule, terms in value.items():
+                target.setdefault("exclude", {}).setdefault(rule, []).extend(terms)
+        else:
+            target.setdefault(key, []).extend(value)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(paths: Tuple[str, ...]) -> Gazetteer:
+    gazetteer = Gazetteer.from_files([DEFAULT_TERMS_PATH, *map(Path, paths)])
+    logger.info(f"Loaded biomedical gazetteer v{gazetteer.version}")
+    return gazetteer
+
+
+# Export public API
+__all__ = [
+    "DEFAULT_TERMS_PATH",
+    "Gazetteer",
+    "GazetteerMatch",
+]
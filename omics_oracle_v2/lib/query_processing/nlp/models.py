@@ -107,3 +107,4 @@ class ModelInfo(BaseModel):
     has_scispacy: bool = Field(default=False, description="SciSpaCy availability")
     has_spacy: bool = Field(default=False, description="spaCy availability")
     pipeline_components: List[str] = Field(default_factory=list, description="NLP pipeline components")
+    gazetteer_version: Optional[str] = Field(None, description="Entity gazetteer term list version")
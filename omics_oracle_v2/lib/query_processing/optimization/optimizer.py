@@ -8,6 +8,9 @@ Features:
 - Medical/biological synonym expansion using SapBERT embeddings + ontologies
 - Query term expansion (related concepts)
 - Gene/protein name normalization
+- Two-tier result cache (in-process LRU in front of Redis), keyed by the
+  normalized query and the NER/synonym model versions
+- Batch optimization (optimize_many) with nlp.pipe NER for bulk jobs
 
 Uses Existing Production Tools:
 - BiomedicalNER (omics_oracle_v2/lib/nlp/biomedical_ner.py) - SciSpaCy NER
@@ -18,8 +21,11 @@ Goal: Maximize recall - find ALL relevant results.
 
 import logging
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+
+from omics_oracle_v2.lib.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +74,17 @@ class OptimizedQuery:
             "normalized_terms": self.normalized_terms,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OptimizedQuery":
+        """Rebuild from to_dict() output (containers are copied)."""
+        return cls(
+            primary_query=data["primary_query"],
+            entities={k: list(v) for k, v in data.get("entities", {}).items()},
+            synonyms={k: list(v) for k, v in data.get("synonyms", {}).items()},
+            expanded_terms=list(data.get("expanded_terms", [])),
+            normalized_terms=dict(data.get("normalized_terms", {})),
+        )
+
     def get_all_query_variations(self, max_per_type: int = 3) -> List[str]:
         """
         Get all query variations for comprehensive search.
@@ -116,6 +133,9 @@ class QueryOptimizer:
     - ⏳ UMLS linker - planned for next sprint
     """
 
+    # Bump when optimization rules change so cached results are not reused
+    CACHE_VERSION = 1
+
     # Fallback patterns if BiomedicalNER not available
     FALLBACK_DISEASE_PATTERNS = {
         r"\b(cancer|carcinoma|tumor|tumour|neoplasm|malignancy)\b": "cancer",
@@ -146,6 +166,8 @@ class QueryOptimizer:
         enable_expansion: bool = True,
         enable_normalization: bool = True,
         enable_sapbert: bool = True,  # ✨ NEW: Enable SapBERT embeddings
+        cache: Optional[Any] = None,
+        local_cache_size: int = 1024,
     ):
         """
         Initialize query optimizer with production tools.
@@ -156,6 +178,8 @@ class QueryOptimizer:
             enable_expansion: Enable query expansion
             enable_normalization: Enable term normalization
             enable_sapbert: Enable SapBERT embeddings for synonym mining
+            cache: Optional RedisCache shared across processes (second tier)
+            local_cache_size: Max results in the in-process LRU (0 disables it)
         """
         self.enable_ner = enable_ner
         self.enable_synonyms = enable_synonyms
@@ -196,12 +220,46 @@ class QueryOptimizer:
                 logger.warning(f"Failed to load SynonymExpander: {e}. Using fallback.")
                 self.synonym_expander = None
 
+        # Result cache: in-process LRU, then Redis
+        self.cache = cache
+        self.local_cache_size = local_cache_size
+        self._local_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.model_versions = self._model_versions()
+
         logger.info(
             f"QueryOptimizer initialized: NER={'SciSpaCy' if self.ner_engine else 'fallback'}, "
             f"Synonyms={'SapBERT+ontologies' if self.synonym_expander else 'basic'}, "
             f"Expansion={enable_expansion}, Normalization={enable_normalization}"
         )
 
+    def _model_versions(self) -> str:
+        """Version tag for cache keys: changes whenever results could change."""
+        if self.ner_engine:
+            try:
+                info = self.ner_engine.get_model_info()
+                ner = f"{info.model_name}@{info.model_version}+gazetteer@{info.gazetteer_version}"
+            except Exception:
+                ner = type(self.ner_engine).__name__
+        else:
+            ner = "patterns"
+
+        if self.synonym_expander:
+            config = getattr(self.synonym_expander, "config", None)
+            synonyms = getattr(config, "embedding_model", "embeddings") if self.enable_sapbert else "ontologies"
+        else:
+            synonyms = "basic"
+
+        steps = "".join(
+            str(int(flag))
+            for flag in (self.enable_ner, self.enable_synonyms, self.enable_expansion, self.enable_normalization)
+        )
+        return f"v{self.CACHE_VERSION};ner={ner};syn={synonyms};steps={steps}"
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Collapse whitespace (case is kept: NER and gene patterns are case-sensitive)."""
+        return " ".join(query.split())
+
     async def optimize(self, query: str) -> OptimizedQuery:
         """
         Optimize query for better search recall.
@@ -212,6 +270,8 @@ class QueryOptimizer:
         3. Query expansion (related terms)
         4. Normalization (standardize gene/protein names)
 
+        Results are cached per normalized query (in-process LRU, then Redis).
+
         Args:
             query: Original user query
 
@@ -221,34 +281,143 @@ class QueryOptimizer:
         if not query or not query.strip():
             return OptimizedQuery(primary_query=query)
 
+        key = self.normalize_query(query)
+        with span("query.optimize.cache") as lookup:
+            cached = await self._get_cached(key)
+            lookup.set(hit=cached is not None)
+        if cached is not None:
+            return OptimizedQuery.from_dict(cached)
+
+        result = await self._optimize_uncached(key)
+        return OptimizedQuery.from_dict(await self._store(key, result))
+
+    async def optimize_many(self, queries: List[str]) -> List[OptimizedQuery]:
+        """
+        Optimize many queries, amortizing model overhead.
+
+        Duplicate and cached queries are computed once; the rest go through
+        one nlp.pipe NER pass, and synonym lookups are shared across queries.
+
+        Args:
+            queries: Original user queries
+
+        Returns:
+            One OptimizedQuery per input query, in order
+        """
+        keys: Dict[int, str] = {}
+        results: List[Optional[OptimizedQuery]] = [None] * len(queries)
+        for index, query in enumerate(queries):
+            if not query or not query.strip():
+                results[index] = OptimizedQuery(primary_query=query)
+            else:
+                keys[index] = self.normalize_query(query)
+
+        unique_keys = list(dict.fromkeys(keys.values()))
+        found: Dict[str, Dict[str, Any]] = {}
+        for key in unique_keys:
+            data = self._local_get(key)
+            if data is not None:
+                found[key] = data
+
+        remote_keys = [key for key in unique_keys if key not in found]
+        if self.cache and remote_keys:
+            remote = await self.cache.get_optimized_queries_batch(remote_keys, version=self.model_versions)
+            for key, data in remote.items():
+                self._local_put(key, data)
+                found[key] = data
+
+        missing = [key for key in unique_keys if key not in found]
+        if missing:
+            logger.info(f"Optimizing {len(missing)} queries ({len(unique_keys) - len(missing)} cached)")
+            entities_batch = (
+                await self._extract_entities_batch(missing) if self.enable_ner else [None] * len(missing)
+            )
+            synonym_memo: Dict[str, List[str]] = {}
+            for key, entities in zip(missing, entities_batch):
+                result = await self._optimize_uncached(key, entities=entities, synonym_memo=synonym_memo)
+                found[key] = await self._store(key, result)
+
+        for index, key in keys.items():
+            results[index] = OptimizedQuery.from_dict(found[key])
+        return results
+
+    async def _optimize_uncached(
+        self,
+        query: str,
+        entities: Optional[Dict[str, List[str]]] = None,
+        synonym_memo: Optional[Dict[str, List[str]]] = None,
+    ) -> OptimizedQuery:
+        """Run the optimization steps (entities may be precomputed by a batch NER pass)."""
         result = OptimizedQuery(primary_query=query.strip())
 
         # Step 1: Named Entity Recognition
         if self.enable_ner:
-            entities = await self._extract_entities(query)
+            if entities is None:
+                with span("query.ner"):
+                    entities = await self._extract_entities(query)
             result.entities = entities
-            logger.debug(f"Extracted entities: {entities}")
+            logger.debug(f"Extracted entities: {result.entities}")
 
         # Step 2: Synonym expansion
         if self.enable_synonyms:
-            synonyms = await self._find_synonyms(result.entities, query)
+            with span("query.synonyms"):
+                synonyms = await self._find_synonyms(result.entities, query, synonym_memo)
             result.synonyms = synonyms
             logger.debug(f"Found synonyms: {list(synonyms.keys())}")
 
         # Step 3: Query expansion
         if self.enable_expansion:
-            expanded = await self._expand_query(query, result.entities)
+            with span("query.expansion"):
+                expanded = await self._expand_query(query, result.entities)
             result.expanded_terms = expanded
             logger.debug(f"Expanded terms: {expanded[:5]}")
 
         # Step 4: Normalization
         if self.enable_normalization:
-            normalized = await self._normalize_terms(query, result.entities)
+            with span("query.normalize"):
+                normalized = await self._normalize_terms(query, result.entities)
             result.normalized_terms = normalized
             logger.debug(f"Normalized terms: {normalized}")
 
         return result
 
+    # Result cache ---------------------------------------------------------
+
+    def _local_get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self._local_cache.get(key)
+        if data is not None:
+            self._local_cache.move_to_end(key)
+        return data
+
+    def _local_put(self, key: str, data: Dict[str, Any]) -> None:
+        if self.local_cache_size <= 0:
+            return
+        self._local_cache[key] = data
+        self._local_cache.move_to_end(key)
+        while len(self._local_cache) > self.local_cache_size:
+            self._local_cache.popitem(last=False)
+
+    async def _get_cached(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self._local_get(key)
+        if data is None and self.cache:
+            data = await self.cache.get_optimized_query(key, version=self.model_versions)
+            if data is not None:
+                self._local_put(key, data)
+        return data
+
+    async def _store(self, key: str, result: OptimizedQuery) -> Dict[str, Any]:
+        data = result.to_dict()
+        self._local_put(key, data)
+        if self.cache:
+            await self.cache.set_optimized_query(key, data, version=self.model_versions)
+        return data
+
+    def clear_cache(self) -> None:
+        """Clear the in-process result cache (Redis entries expire by TTL)."""
+        self._local_cache.clear()
+
+    # Optimization steps -----------------------------------------------------
+
     async def _extract_entities(self, query: str) -> Dict[str, List[str]]:
         """
         Extract biomedical entities using production SciSpaCy NER.
@@ -267,32 +436,44 @@ class QueryOptimizer:
                 "protein": ["amyloid beta"],
             }
         """
-        entities = {}
-
         # Use production SciSpaCy NER (preferred)
         if self.ner_engine:
             try:
-                ner_result = self.ner_engine.extract_entities(query)
-
-                # Convert NER result to our format
-                for entity in ner_result.entities:
-                    entity_type = entity.entity_type.value.lower()
-
-                    if entity_type not in entities:
-                        entities[entity_type] = []
-
-                    # Store entity text (unique)
-                    entity_text = entity.text
-                    if entity_text not in entities[entity_type]:
-                        entities[entity_type].append(entity_text)
-
+                entities = self._entities_from_ner(self.ner_engine.extract_entities(query))
                 logger.debug(f"SciSpaCy NER extracted: {entities}")
                 return entities
 
             except Exception as e:
                 logger.warning(f"SciSpaCy NER failed: {e}. Using fallback.")
 
-        # Fallback: Pattern-based extraction
+        return self._fallback_entities(query)
+
+    async def _extract_entities_batch(self, queries: List[str]) -> List[Dict[str, List[str]]]:
+        """Extract entities for many queries with one nlp.pipe pass."""
+        if self.ner_engine:
+            try:
+                return [
+                    self._entities_from_ner(ner_result)
+                    for ner_result in self.ner_engine.extract_entities_batch(queries)
+                ]
+            except Exception as e:
+                logger.warning(f"SciSpaCy batch NER failed: {e}. Using fallback.")
+
+        return [self._fallback_entities(query) for query in queries]
+
+    @staticmethod
+    def _entities_from_ner(ner_result) -> Dict[str, List[str]]:
+        """Convert an NER result to {entity_type: [unique entity texts]}."""
+        entities: Dict[str, List[str]] = {}
+        for entity in ner_result.entities:
+            entity_list = entities.setdefault(entity.entity_type.value.lower(), [])
+            if entity.text not in entity_list:
+                entity_list.append(entity.text)
+        return entities
+
+    def _fallback_entities(self, query: str) -> Dict[str, List[str]]:
+        """Pattern-based entity extraction (used when NER is unavailable)."""
+        entities = {}
         query_lower = query.lower()
 
         # Extract diseases
@@ -324,7 +505,12 @@ class QueryOptimizer:
         logger.debug(f"Fallback pattern extraction: {entities}")
         return entities
 
-    async def _find_synonyms(self, entities: Dict[str, List[str]], query: str) -> Dict[str, List[str]]:
+    async def _find_synonyms(
+        self,
+        entities: Dict[str, List[str]],
+        query: str,
+        memo: Optional[Dict[str, List[str]]] = None,
+    ) -> Dict[str, List[str]]:
         """
         Find medical/biological synonyms using SapBERT embeddings + ontology gazetteers.
 
@@ -339,39 +525,25 @@ class QueryOptimizer:
         Args:
             entities: Extracted entities
             query: Original query for context
+            memo: Optional per-entity synonym memo shared across a batch
 
         Returns:
             Dictionary mapping original term to list of synonyms
         """
         synonyms = {}
+        if memo is None:
+            memo = {}
 
         # Use production SynonymExpander (preferred)
         if self.synonym_expander:
             try:
-                # For each entity, get synonyms
+                # For each entity, get synonyms (memoized across a batch)
                 for entity_type, entity_list in entities.items():
                     for entity_text in entity_list:
-                        # Query SynonymExpander
-                        # Note: SynonymExpander.expand() returns technique-specific synonyms
-                        # We'll use it for disease/gene terms too
-                        try:
-                            expansion_result = self.synonym_expander.expand_query(entity_text)
-
-                            # Extract synonyms from result
-                            entity_syns = set()
-                            for technique_syns in expansion_result.values():
-                                if hasattr(technique_syns, "all_terms"):
-                                    entity_syns.update(technique_syns.all_terms())
-
-                            if entity_syns:
-                                # Remove original term
-                                entity_syns.discard(entity_text)
-                                if entity_syns:
-                                    synonyms[entity_text] = list(entity_syns)[:10]  # Max 10
-
-                        except Exception as e:
-                            logger.debug(f"SynonymExpander failed for '{entity_text}': {e}")
-                            continue
+                        if entity_text not in memo:
+                            memo[entity_text] = self._expand_entity(entity_text)
+                        if memo[entity_text]:
+                            synonyms[entity_text] = memo[entity_text]
 
                 # Also check terms in query directly
                 query_lower = query.lower()
@@ -415,6 +587,26 @@ class QueryOptimizer:
         logger.debug(f"Fallback synonyms found: {list(synonyms.keys())}")
         return synonyms
 
+    def _expand_entity(self, entity_text: str) -> List[str]:
+        """Get up to 10 expander synonyms for one entity (empty on failure)."""
+        # Note: SynonymExpander.expand() returns technique-specific synonyms
+        # We'll use it for disease/gene terms too
+        try:
+            expansion_result = self.synonym_expander.expand_query(entity_text)
+        except Exception as e:
+            logger.debug(f"SynonymExpander failed for '{entity_text}': {e}")
+            return []
+
+        # Extract synonyms from result
+        entity_syns = set()
+        for technique_syns in expansion_result.values():
+            if hasattr(technique_syns, "all_terms"):
+                entity_syns.update(technique_syns.all_terms())
+
+        # Remove original term
+        entity_syns.discard(entity_text)
+        return list(entity_syns)[:10]  # Max 10
+
     async def _expand_query(self, query: str, entities: Dict[str, List[str]]) -> List[str]:
         """
         Expand query with related terms.
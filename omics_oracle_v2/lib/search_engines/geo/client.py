@@ -20,10 +20,13 @@ if TYPE_CHECKING:
     from omics_oracle_v2.core.config import Settings
 
 from omics_oracle_v2.cache.redis_cache import RedisCache
+from omics_oracle_v2.cache.soft_cache import SOFTCacheManager
 from omics_oracle_v2.lib.search_engines.geo.models import (ClientInfo,
                                                            GEOSeriesMetadata,
                                                            SearchResult,
                                                            SRAInfo)
+from omics_oracle_v2.lib.search_engines.geo.soft_parser import (
+    SOFTSeriesHeader, load_series_header, read_sidecar, sidecar_path)
 from omics_oracle_v2.lib.search_engines.geo.utils import (RateLimiter,
                                                           retry_with_backoff)
 
@@ -31,7 +34,7 @@ logger = logging.getLogger(__name__)
 
 # Optional dependencies
 try:
-    from GEOparse import get_GEO
+    from GEOparse import get_GEO_file
 
     HAS_GEOPARSE = True
 except ImportError:
@@ -305,6 +308,13 @@ class GEOClient:
         )
         logger.info("RedisCache initialized for GEO client")
 
+        # GEOparse leaves SOFT files in cache_dir; keep them within a byte budget
+        self.soft_cache = SOFTCacheManager(
+            self.settings.cache_dir,
+            max_bytes=self.settings.soft_cache_max_bytes,
+            min_free_bytes=self.settings.soft_cache_min_free_bytes,
+        )
+
         # Initialize NCBI client
         self.ncbi_client: Optional[NCBIClient] = None
         if self.settings.ncbi_email:
@@ -588,17 +598,12 @@ class GEOClient:
         try:
             logger.info(f"Retrieving metadata for {geo_id} from NCBI")
 
-            # Parse GEO series using GEOparse
-            # Run blocking get_GEO() in thread pool to avoid blocking event loop
+            # Header-only parse of the SOFT file (sidecar after the first load)
+            # Run blocking download/parse in thread pool to avoid blocking event loop
             loop = asyncio.get_event_loop()
-            # Use functools.partial to properly pass keyword argument
-            get_geo_func = functools.partial(
-                get_GEO, geo_id, destdir=str(self.settings.cache_dir)
+            header = await loop.run_in_executor(
+                None, functools.partial(self._load_series_header, geo_id)
             )
-            gse = await loop.run_in_executor(None, get_geo_func)
-
-            # Extract metadata
-            meta = getattr(gse, "metadata", {})
 
             # ===================================================================
             # PHASE 2: ORGANISM TRACE LOGGING + E-SUMMARY FALLBACK
@@ -607,15 +612,13 @@ class GEOClient:
             organism = ""
             organism_source = "none"
 
-            gpls = getattr(gse, "gpls", {})
+            gpls = header.platforms
             logger.info(
-                f"[ORGANISM-TRACE] {geo_id}: Found {len(gpls)} platforms in GEOparse data"
+                f"[ORGANISM-TRACE] {geo_id}: Found {len(gpls)} platforms in SOFT header"
             )
 
             if gpls:
-                first_platform = list(gpls.values())[0]
-                platform_id = list(gpls.keys())[0]
-                platform_meta = getattr(first_platform, "metadata", {})
+                platform_id, platform_meta = next(iter(gpls.items()))
                 organism_list = platform_meta.get("organism", [])
 
                 logger.info(
@@ -624,9 +627,9 @@ class GEOClient:
 
                 if organism_list and organism_list[0]:
                     organism = organism_list[0]
-                    organism_source = "geoparse_platform"
+                    organism_source = "soft_platform"
                     logger.info(
-                        f"[ORGANISM-TRACE] [OK] {geo_id}: Got organism from GEOparse platform: {organism!r}"
+                        f"[ORGANISM-TRACE] [OK] {geo_id}: Got organism from SOFT platform: {organism!r}"
                     )
                 else:
                     logger.warning(
@@ -634,7 +637,7 @@ class GEOClient:
                     )
             else:
                 logger.warning(
-                    f"[ORGANISM-TRACE] {geo_id}: No platforms found in GEOparse, will try E-Summary"
+                    f"[ORGANISM-TRACE] {geo_id}: No platforms found in SOFT header, will try E-Summary"
                 )
 
             # FALLBACK: If organism is empty, try NCBI E-Summary API
@@ -707,25 +710,8 @@ class GEOClient:
                     f"[ORGANISM-TRACE] [FAIL][FAIL] {geo_id}: ORGANISM STILL EMPTY after all attempts!"
                 )
 
-            metadata = GEOSeriesMetadata(
-                geo_id=geo_id,
-                title=meta.get("title", [""])[0],
-                summary=meta.get("summary", [""])[0],
-                overall_design=meta.get("overall_design", [""])[0],
-                organism=organism,
-                submission_date=meta.get("submission_date", [""])[0],
-                last_update_date=meta.get("last_update_date", [""])[0],
-                publication_date=meta.get("status", [""])[0],
-                contact_name=meta.get("contact_name", []),
-                contact_email=meta.get("contact_email", []),
-                contact_institute=meta.get("contact_institute", []),
-                platform_count=len(getattr(gse, "gpls", {})),
-                sample_count=len(getattr(gse, "gsms", {})),
-                platforms=list(getattr(gse, "gpls", {}).keys()),
-                samples=list(getattr(gse, "gsms", {}).keys()),
-                pubmed_ids=meta.get("pubmed_id", []),
-                supplementary_files=meta.get("supplementary_file", []),
-            )
+            metadata = header.to_series_metadata(organism=organism)
+            metadata.geo_id = geo_id
 
             # Parse and populate structured download information
             metadata.data_downloads = metadata.parse_download_info()
@@ -755,6 +741,24 @@ class GEOClient:
         except Exception as e:
             raise GEOError(f"Failed to get metadata for {geo_id}: {e}") from e
 
+    def _load_series_header(self, geo_id: str) -> SOFTSeriesHeader:
+        """
+        Series header for a GSE, downloading the SOFT family file only if needed.
+
+        The sidecar written on first parse means later loads (even after the
+        SOFT file is evicted from the cache) read only a few KB of JSON.
+        """
+        soft_path = self.settings.cache_dir / f"{geo_id.upper()}_family.soft.gz"
+        header = read_sidecar(sidecar_path(soft_path))
+        if header is not None:
+            return header
+
+        # Pinned so background eviction cannot remove the file mid-parse
+        with self.soft_cache.pin(geo_id):
+            filepath, _ = get_GEO_file(geo_id, destdir=str(self.settings.cache_dir), silent=True)
+            self.soft_cache.record(geo_id)
+            return load_series_header(filepath)
+
     async def _get_sra_metadata(self, geo_id: str) -> Optional[SRAInfo]:
         """Get SRA metadata for a GEO series."""
         if not self.sra_client:
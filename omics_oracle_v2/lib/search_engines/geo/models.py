@@ -105,6 +105,10 @@ class GEOSeriesMetadata(BaseModel):
 
     platforms: List[str] = Field(default_factory=list, description="Platform IDs (GPL)")
     samples: List[str] = Field(default_factory=list, description="Sample IDs (GSM)")
+    sample_characteristics: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Per-sample characteristics lines (GSM -> ['tissue: liver', ...])",
+    )
 
     pubmed_ids: List[str] = Field(default_factory=list, description="PubMed IDs")
     supplementary_files: List[str] = Field(
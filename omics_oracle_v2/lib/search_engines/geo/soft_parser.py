@@ -0,0 +1,254 @@
+"""
+Header-only streaming parser for GEO SOFT family files.
+
+GEOparse parses every sample and platform data table into pandas objects;
+GEOSeriesMetadata only needs the series header, platform organisms and
+per-sample characteristics. This parser streams the (gzipped) file line by
+line, keeps header lines and skips `!*_table_begin` ... `!*_table_end`
+blocks without parsing them.
+
+The parsed header is stored as a small JSON sidecar next to the SOFT file,
+so later loads never open the SOFT file again.
+
+Metadata keys follow GEOparse naming ("!Series_title = x" -> {"title": ["x"]}),
+so code written against GSE.metadata reads SOFTSeriesHeader.metadata unchanged.
+
+Usage:
+    header = load_series_header(Path(".cache/geo/GSE12345_family.soft.gz"))
+    metadata = header.to_series_metadata()
+"""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
+
+logger = logging.getLogger(__name__)
+
+# Bump when the sidecar layout or parsing rules change (old sidecars are reparsed)
+SIDECAR_VERSION = 1
+
+# Platform fields kept in the sidecar (platform descriptions can be long)
+PLATFORM_FIELDS = ("title", "organism", "technology")
+
+
+@dataclass
+class SOFTSeriesHeader:
+    """Series-level contents of a SOFT family file (no data tables)."""
+
+    geo_id: str
+    metadata: Dict[str, List[str]] = field(default_factory=dict)
+    platforms: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    samples: List[str] = field(default_factory=list)
+    sample_characteristics: Dict[str, List[str]] = field(default_factory=dict)
+
+    def first(self, key: str) -> str:
+        """First value of a series metadata field ("" if absent)."""
+        values = self.metadata.get(key)
+        return values[0] if values else ""
+
+    def platform_organism(self) -> str:
+        """Organism of the first platform, as GEOparse gpls[0].metadata["organism"][0]."""
+        for platform in self.platforms.values():
+            organisms = platform.get("organism", [])
+            return organisms[0] if organisms else ""
+        return ""
+
+    def to_series_metadata(self, organism: Optional[str] = None) -> GEOSeriesMetadata:
+        """
+        Build GEOSeriesMetadata (same fields GEOClient.get_metadata fills from GEOparse).
+
+        Args:
+            organism: Override the platform organism (e.g. from E-Summary)
+        """
+        meta = self.metadata
+        return GEOSeriesMetadata(
+            geo_id=self.geo_id,
+            title=self.first("title"),
+            summary=self.first("summary"),
+            overall_design=self.first("overall_design"),
+            organism=self.platform_organism() if organism is None else organism,
+            submission_date=self.first("submission_date"),
+            last_update_date=self.first("last_update_date"),
+            publication_date=self.first("status"),
+            contact_name=meta.get("contact_name", []),
+            contact_email=meta.get("contact_email", []),
+            contact_institute=meta.get("contact_institute", []),
+            platform_count=len(self.platforms),
+            sample_count=len(self.samples),
+            platforms=list(self.platforms),
+            samples=list(self.samples),
+            pubmed_ids=meta.get("pubmed_id", []),
+            supplementary_files=meta.get("supplementary_file", []),
+            sample_characteristics=self.sample_characteristics,
+        )
+
+
+def _parse_line(line: str):
+    """"!Series_title = x" -> ("title", "x"); "^SAMPLE = GSM1" -> ("SAMPLE", "GSM1")."""
+    name, _, value = line.partition("=")
+    name = name.strip()
+    if name.startswith("!"):
+        name = name.split("_", 1)[1] if "_" in name else name[1:]
+    else:
+        name = name[1:]
+    return name, value.strip()
+
+
+def _header_lines(stream, chunk_size: int = 1024 * 1024):
+    """
+    Yield the lines of a SOFT stream outside data tables.
+
+    Table bodies are skipped with bytes.find over large blocks rather than
+    line by line, and are never decoded.
+    """
+    marker = b"_table_end"
+    buf, pos = b"", 0
+    eof = in_table = False
+    while True:
+        if in_table:
+            end = buf.find(marker, pos)
+            newline = buf.find(b"\n", end) if end >= 0 else -1
+            if newline >= 0:
+                pos = newline + 1
+                in_table = False
+                continue
+            # Keep a tail in case the end marker spans two blocks
+            keep = end if end >= 0 else max(pos, len(buf) - len(marker))
+        else:
+            newline = buf.find(b"\n", pos)
+            if newline >= 0:
+                line = buf[pos:newline].rstrip()
+                pos = newline + 1
+                if line.endswith(b"_table_begin"):
+                    in_table = True
+                else:
+                    yield line
+                continue
+            keep = pos
+
+        if eof:
+            if not in_table and buf[pos:].strip():
+                yield buf[pos:].rstrip()
+            return
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        buf, pos = buf[keep:] + chunk, 0
+
+
+def parse_soft_headers(path: Path) -> SOFTSeriesHeader:
+    """
+    Stream a SOFT family file and collect header fields.
+
+    Args:
+        path: SOFT file (.soft or .soft.gz)
+
+    Returns:
+        SOFTSeriesHeader
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    header = SOFTSeriesHeader(geo_id=path.name.split("_")[0].split(".")[0])
+
+    section = None  # "SERIES", "PLATFORM", "SAMPLE", ...
+    current: Optional[Dict[str, List[str]]] = None
+    characteristics: Optional[List[str]] = None
+
+    with opener(path, "rb") as soft:
+        for raw in _header_lines(soft):
+            first = raw[:1]
+            if first not in (b"^", b"!"):
+                continue
+            line = raw.decode("utf-8", errors="replace")
+
+            if first == b"^":
+                section, name = _parse_line(line)
+                current = characteristics = None
+                if section == "SERIES":
+                    header.geo_id = name or header.geo_id
+                    current = header.metadata
+                elif section == "PLATFORM":
+                    current = header.platforms.setdefault(name, {})
+                elif section == "SAMPLE":
+                    header.samples.append(name)
+                    characteristics = header.sample_characteristics.setdefault(name, [])
+            elif characteristics is not None:
+                key, value = _parse_line(line)
+                if key.startswith("characteristics_"):
+                    characteristics.append(value)
+            elif current is not None:
+                key, value = _parse_line(line)
+                if section != "PLATFORM" or key in PLATFORM_FIELDS:
+                    current.setdefault(key, []).append(value)
+
+    return header
+
+
+# =============================================================================
+# SIDECAR
+# =============================================================================
+
+
+def sidecar_path(soft_path: Path) -> Path:
+    """Sidecar next to a SOFT file: GSE1_family.soft.gz -> GSE1_family.meta.json."""
+    soft_path = Path(soft_path)
+    return soft_path.with_name(soft_path.name.split(".")[0] + ".meta.json")
+
+
+def read_sidecar(path: Path) -> Optional[SOFTSeriesHeader]:
+    """Load a sidecar; None if missing, unreadable or from an older parser."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable SOFT sidecar {path}: {e}")
+        return None
+
+    if data.pop("version", None) != SIDECAR_VERSION:
+        return None
+    return SOFTSeriesHeader(**data)
+
+
+def write_sidecar(path: Path, header: SOFTSeriesHeader) -> None:
+    """Write a sidecar atomically (compact JSON)."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": SIDECAR_VERSION, **asdict(header)}, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def load_series_header(soft_path: Path) -> SOFTSeriesHeader:
+    """
+    Header for a SOFT file, from its sidecar when present.
+
+    Parses the SOFT file (and writes the sidecar) only on the first call.
+
+    Args:
+        soft_path: SOFT family file; need not exist if the sidecar does
+
+    Returns:
+        SOFTSeriesHeader
+    """
+    sidecar = sidecar_path(soft_path)
+    header = read_sidecar(sidecar)
+    if header is not None:
+        return header
+
+    header = parse_soft_headers(soft_path)
+    try:
+        write_sidecar(sidecar, header)
+    except OSError as e:
+        logger.warning(f"Could not write SOFT sidecar {sidecar}: {e}")
+    return header
@@ -6,7 +6,8 @@ across GEO datasets and publications (PubMed, OpenAlex, Scholar).
 """
 
 from omics_oracle_v2.core.config import SearchSettings as OrchestratorConfig
-from omics_oracle_v2.lib.search_orchestration.models import SearchInput
+from omics_oracle_v2.lib.search_orchestration.models import (SearchEvent,
+                                                             SearchInput)
 from omics_oracle_v2.lib.search_orchestration.models import \
     SearchResult as OrchestratorSearchResult
 from omics_oracle_v2.lib.search_orchestration.orchestrator import \
@@ -17,4 +18,5 @@ __all__ = [
     "OrchestratorConfig",
     "OrchestratorSearchResult",
     "SearchInput",
+    "SearchEvent",
 ]
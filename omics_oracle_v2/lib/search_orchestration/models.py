@@ -80,3 +80,27 @@ class SearchResult:
             "metadata": self.metadata,
             "query_processing": self.query_processing.to_dict() if self.query_processing else None,
         }
+
+
+# Search stream event types (in the order a search emits them)
+EVENT_PLAN = "plan"
+EVENT_GEO = "geo"
+EVENT_PUBLICATIONS = "publications"
+EVENT_COMPLETE = "complete"
+
+
+@dataclass
+class SearchEvent:
+    """
+    Incremental result emitted by SearchOrchestrator.search_stream().
+
+    "geo" and "publications" events carry only the items new to this event;
+    the final "complete" event carries the full SearchResult.
+    """
+
+    type: str
+    source: Optional[str] = None
+    geo_datasets: List[GEOSeriesMetadata] = field(default_factory=list)
+    publications: List[Publication] = field(default_factory=list)
+    result: Optional[SearchResult] = None
+    data: Dict[str, Any] = field(default_factory=dict)
@@ -20,7 +20,7 @@ import logging
 import os
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
 
 from omics_oracle_v2.cache.redis_cache import RedisCache
 from omics_oracle_v2.core.config import SearchSettings
@@ -29,6 +29,7 @@ from omics_oracle_v2.lib.pipelines.citation_discovery.clients.openalex import (
 from omics_oracle_v2.lib.pipelines.citation_discovery.clients.pubmed import \
     PubMedClient
 from omics_oracle_v2.lib.pipelines.coordinator import PipelineCoordinator
+from omics_oracle_v2.lib.pipelines.storage.unified_db import split_field_filters
 from omics_oracle_v2.lib.query_processing.optimization.analyzer import (
     QueryAnalyzer, SearchType)
 from omics_oracle_v2.lib.query_processing.optimization.optimizer import \
@@ -38,7 +39,11 @@ from omics_oracle_v2.lib.search_engines.geo import GEOClient
 from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
 from omics_oracle_v2.lib.search_engines.geo.query_builder import \
     GEOQueryBuilder
-from omics_oracle_v2.lib.search_orchestration.models import SearchResult
+from omics_oracle_v2.lib.search_orchestration.models import (
+    EVENT_COMPLETE, EVENT_GEO, EVENT_PLAN, EVENT_PUBLICATIONS,
+    QueryProcessingContext, SearchEvent, SearchResult)
+from omics_oracle_v2.lib.utils.tracing import (current_span, current_trace_id,
+                                               record, span, traced_stream)
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +154,10 @@ class SearchOrchestrator:
         else:
             self.cache = None
 
+        # Query optimizations are cached in-process and shared through Redis
+        if self.query_optimizer and self.cache:
+            self.query_optimizer.cache = self.cache
+
         logger.info("SearchOrchestrator initialized successfully")
 
     async def search(
@@ -162,6 +171,8 @@ class SearchOrchestrator:
         """
         Execute search across all enabled sources.
 
+        Collects search_stream() and returns its final result.
+
         Args:
             query: Search query
             search_type: Force search type (geo, publication, hybrid, auto)
@@ -172,7 +183,52 @@ class SearchOrchestrator:
         Returns:
             SearchResult with datasets and publications
         """
+        stream = self.search_stream(
+            query,
+            search_type=search_type,
+            max_geo_results=max_geo_results,
+            max_publication_results=max_publication_results,
+            use_cache=use_cache,
+        )
+        try:
+            async for event in stream:
+                if event.type == EVENT_COMPLETE:
+                    return event.result
+        finally:
+            # Ends the search span now rather than when the stream is collected
+            await stream.aclose()
+        raise RuntimeError("Search stream ended without a result")
+
+    @traced_stream("search")
+    async def search_stream(
+        self,
+        query: str,
+        search_type: Optional[str] = None,
+        max_geo_results: Optional[int] = None,
+        max_publication_results: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[SearchEvent]:
+        """
+        Execute search, yielding results as each source resolves.
+
+        Events:
+        - plan: query type and optimized query (after analysis/optimization)
+        - geo: newly found GEO datasets (cached ones first, then each fetch)
+        - publications: results from one publication source
+        - complete: the full SearchResult, after persistence and caching
+
+        Args:
+            query: Search query
+            search_type: Force search type (geo, publication, hybrid, auto)
+            max_geo_results: Maximum GEO results
+            max_publication_results: Maximum publication results
+            use_cache: Whether to use cache
+
+        Yields:
+            SearchEvent objects; the last one is always "complete"
+        """
         start_time = time.time()
+        current_span().set(query=query)
 
         # Apply defaults
         max_geo_results = max_geo_results or self.config.max_geo_results
@@ -182,102 +238,114 @@ class SearchOrchestrator:
 
         logger.info(f"🔍 Search request: '{query}' (type={search_type})")
 
+        # Include max_results in cache key to avoid returning limited results
+        cache_search_type = search_type or "auto"
+        cache_key = f"{query}:{cache_search_type}:{max_geo_results}:{max_publication_results}"
+
         # Step 1: Check cache
-        cache_hit = False
         if use_cache and self.cache:
             try:
-                cache_search_type = search_type or "auto"
-                # Include max_results in cache key to avoid returning limited results
-                cache_key = f"{query}:{cache_search_type}:{max_geo_results}:{max_publication_results}"
-                cached = await self.cache.get_search_result(
-                    cache_key, search_type=cache_search_type
-                )
+                with span("search.cache_lookup") as lookup:
+                    cached = await self.cache.get_search_result(
+                        cache_key, search_type=cache_search_type
+                    )
+                    lookup.set(hit=bool(cached))
                 if cached:
                     logger.info(
                         f"✅ Cache hit - returning cached results (max_geo={max_geo_results})"
                     )
                     cached_result = SearchResult(**cached)
                     cached_result.cache_hit = True
-                    return cached_result
+                    cached_result.metadata["trace_id"] = current_trace_id()
+                    yield SearchEvent(
+                        EVENT_PLAN,
+                        data=self._plan_data(
+                            cached_result.query_type, cached_result.optimized_query
+                        ),
+                    )
+                    if cached_result.geo_datasets:
+                        yield SearchEvent(
+                            EVENT_GEO,
+                            source="cache",
+                            geo_datasets=cached_result.geo_datasets,
+                        )
+                    if cached_result.publications:
+                        yield SearchEvent(
+                            EVENT_PUBLICATIONS,
+                            source="cache",
+                            publications=cached_result.publications,
+                        )
+                    yield SearchEvent(EVENT_COMPLETE, result=cached_result)
+                    return
             except Exception as e:
                 logger.warning(f"Cache check failed: {e}")
 
-        # Step 2: Analyze query type
-        analysis = self.query_analyzer.analyze(query)
-        logger.info(
-            f"📊 Query analysis: type={analysis.search_type.value}, confidence={analysis.confidence:.2f}"
-        )
-
-        # Default to HYBRID for maximum recall
-        if analysis.search_type == SearchType.AUTO:
-            logger.info("AUTO mode: Enabling HYBRID search (GEO + Publications)")
-            analysis.search_type = SearchType.HYBRID
-        elif analysis.search_type == SearchType.PUBLICATIONS:
-            logger.info(
-                "PUBLICATIONS mode: Enabling HYBRID to also find linked datasets"
+        # Steps 2-3: Analyze and optimize query
+        with span("query.plan"):
+            analysis, optimized_query, optimization_result = await self._plan_query(
+                query, search_type
             )
-            analysis.search_type = SearchType.HYBRID
-
-        # Override if specified
-        if search_type:
-            if search_type.lower() == "geo":
-                analysis.search_type = SearchType.GEO
-            elif search_type.lower() == "publication":
-                analysis.search_type = SearchType.PUBLICATIONS
-            elif search_type.lower() == "hybrid":
-                analysis.search_type = SearchType.HYBRID
-            logger.info(f"🎯 Query type overridden to: {analysis.search_type.value}")
-
-        # Step 3: Optimize query (if enabled and not GEO ID fast path)
-        optimized_query = query
-        optimization_result = None  # For RAG Phase 3
-        if self.query_optimizer and analysis.search_type != SearchType.GEO_ID:
-            try:
-                logger.info("🔄 Optimizing query with NER + SapBERT")
-                optimization_result = await self.query_optimizer.optimize(query)
-                optimized_query = optimization_result.primary_query
-                logger.info(f"✨ Query optimized: '{query}' -> '{optimized_query}'")
-                logger.info(f"📝 Entities found: {len(optimization_result.entities)}")
-            except Exception as e:
-                logger.warning(f"Query optimization failed: {e}. Using original query.")
-                optimized_query = query
-                optimization_result = None
+        yield SearchEvent(
+            EVENT_PLAN, data=self._plan_data(analysis.search_type.value, optimized_query)
+        )
 
-        # Step 4: Execute searches based on type
+        # Step 4: Execute searches, yielding each source's results as they arrive
+        # Step 5: Deduplicate GEO results (GEO IDs are unique)
         geo_datasets = []
         publications = []
+        seen_geo_ids: Dict[str, int] = {}  # geo_id -> position in geo_datasets
+        local_ids = set()  # served from the local index (NCBI failed)
+        duplicates = 0
+        dedup_seconds = 0.0  # accumulated across events, recorded as one span
 
-        # GEO ID fast path
-        if analysis.search_type == SearchType.GEO_ID and analysis.geo_ids:
-            logger.info(f"⚡ GEO ID detected: {analysis.geo_ids[0]} - fast path")
-            geo_datasets = await self._search_geo_by_id(analysis.geo_ids[0])
-
-        # HYBRID: Run all searches in parallel
-        elif analysis.search_type == SearchType.HYBRID:
-            logger.info("🔄 HYBRID search: Running all sources in parallel")
-            geo_datasets, publications = await self._search_parallel(
-                optimized_query, max_geo_results, max_publication_results
+        sources = self._stream_sources(
+            analysis, optimized_query, max_geo_results, max_publication_results
+        )
+        try:
+            async for event in sources:
+                if event.type == EVENT_GEO:
+                    new_datasets = []
+                    dedup_start = time.perf_counter()
+                    for dataset in event.geo_datasets:
+                        if dataset.geo_id in seen_geo_ids:
+                            duplicates += 1
+                            logger.debug(f"Skipping duplicate: {dataset.geo_id}")
+                            continue
+                        seen_geo_ids[dataset.geo_id] = len(geo_datasets)
+                        geo_datasets.append(dataset)
+                        if event.source == "local":
+                            local_ids.add(dataset.geo_id)
+                        new_datasets.append(dataset)
+                    dedup_seconds += time.perf_counter() - dedup_start
+                    if not new_datasets:
+                        continue
+                    event.geo_datasets = new_datasets
+                else:
+                    publications.extend(event.publications)
+                yield event
+        finally:
+            # Closing this stream early must stop the sources now, not at GC
+            await sources.aclose()
+
+        record(
+            "search.dedup",
+            dedup_seconds * 1000,
+            datasets=len(geo_datasets),
+            duplicates=duplicates,
+        )
+        if duplicates:
+            logger.info(
+                f"🔄 Deduplicated {len(geo_datasets) + duplicates} -> {len(geo_datasets)} GEO datasets"
             )
 
-        # GEO only
-        elif analysis.search_type == SearchType.GEO:
-            logger.info("📊 GEO-only search")
-            geo_datasets = await self._search_geo(optimized_query, max_geo_results)
-
-        # Publications only
-        elif analysis.search_type == SearchType.PUBLICATIONS:
-            logger.info("📄 Publications-only search")
-            publications = await self._search_publications(
-                optimized_query, max_publication_results
+        # NCBI failed or missed its deadline, and (some) GEO datasets came from the local index
+        degraded = bool(local_ids)
+        if degraded:
+            logger.warning(
+                f"[GEO] Serving {len(local_ids)} datasets from the local index"
             )
 
-        # Step 5: Deduplicate GEO results (GEO IDs are unique)
-        geo_datasets = self._deduplicate_geo(geo_datasets)
-
         # Step 5.5: Build query processing context for RAG (Phase 3)
-        from omics_oracle_v2.lib.search_orchestration.models import \
-            QueryProcessingContext
-
         query_processing_context = None
         if optimization_result:
             # Extract data from OptimizedQuery
@@ -302,11 +370,14 @@ class SearchOrchestrator:
             publications=publications,
             total_results=len(geo_datasets) + len(publications),
             search_time_ms=search_time_ms,
-            cache_hit=cache_hit,
+            cache_hit=False,
             metadata={
                 "geo_count": len(geo_datasets),
                 "publication_count": len(publications),
                 "query_confidence": analysis.confidence,
+                "local_index_count": len(local_ids),
+                "degraded": degraded,
+                "trace_id": current_trace_id(),
             },
             query_processing=query_processing_context,  # RAG Phase 3
         )
@@ -318,90 +389,249 @@ class SearchOrchestrator:
         # Step 6.5: Persist to database (Phase B integration)
         if self.coordinator:
             try:
-                await self._persist_results(result)
+                with span("search.persist", datasets=len(geo_datasets)):
+                    await self._persist_results(result, skip_geo_ids=local_ids)
             except Exception as e:
                 logger.error(f"Persistence failed (non-fatal): {e}")
 
-        # Step 7: Cache result
-        if use_cache and self.cache and not cache_hit:
+        # Step 7: Cache result (a local-only fallback is not worth pinning for cache_ttl)
+        if use_cache and self.cache and not degraded:
             try:
-                cache_search_type = search_type or "auto"
-                # Include max_results in cache key to avoid returning limited results
-                cache_key = f"{query}:{cache_search_type}:{max_geo_results}:{max_publication_results}"
-                # Fixed: search_type should be 2nd positional arg, not keyword arg
-                await self.cache.set_search_result(
-                    cache_key, cache_search_type, result.to_dict()
-                )
+                with span("search.cache_store"):
+                    await self.cache.set_search_result(
+                        cache_key, cache_search_type, result.to_dict()
+                    )
                 logger.info(
                     f"💾 Results cached (max_geo={max_geo_results}, max_pub={max_publication_results})"
                 )
             except Exception as e:
                 logger.warning(f"Cache set failed: {e}")
 
-        return result
+        yield SearchEvent(EVENT_COMPLETE, result=result)
+
+    @staticmethod
+    def _plan_data(query_type: str, optimized_query: str) -> Dict[str, Any]:
+        return {"query_type": query_type, "optimized_query": optimized_query}
+
+    async def _plan_query(self, query: str, search_type: Optional[str]):
+        """Steps 2-3: analyze query type and optimize the query."""
+        # Step 2: Analyze query type
+        with span("query.analyze") as analyze_span:
+            analysis = self.query_analyzer.analyze(query)
+            analyze_span.set(search_type=analysis.search_type.value)
+        logger.info(
+            f"📊 Query analysis: type={analysis.search_type.value}, confidence={analysis.confidence:.2f}"
+        )
+
+        # Default to HYBRID for maximum recall
+        if analysis.search_type == SearchType.AUTO:
+            logger.info("AUTO mode: Enabling HYBRID search (GEO + Publications)")
+            analysis.search_type = SearchType.HYBRID
+        elif analysis.search_type == SearchType.PUBLICATIONS:
+            logger.info(
+                "PUBLICATIONS mode: Enabling HYBRID to also find linked datasets"
+            )
+            analysis.search_type = SearchType.HYBRID
+
+        # Override if specified
+        if search_type:
+            if search_type.lower() == "geo":
+                analysis.search_type = SearchType.GEO
+            elif search_type.lower() == "publication":
+                analysis.search_type = SearchType.PUBLICATIONS
+            elif search_type.lower() == "hybrid":
+                analysis.search_type = SearchType.HYBRID
+            logger.info(f"🎯 Query type overridden to: {analysis.search_type.value}")
+
+        # Step 3: Optimize query (if enabled and not GEO ID fast path)
+        optimized_query = query
+        optimization_result = None  # For RAG Phase 3
+        if self.query_optimizer and analysis.search_type != SearchType.GEO_ID:
+            try:
+                logger.info("🔄 Optimizing query with NER + SapBERT")
+                with span("query.optimize") as optimize_span:
+                    optimization_result = await self.query_optimizer.optimize(query)
+                    optimize_span.set(entities=len(optimization_result.entities))
+                optimized_query = optimization_result.primary_query
+                logger.info(f"✨ Query optimized: '{query}' -> '{optimized_query}'")
+                logger.info(f"📝 Entities found: {len(optimization_result.entities)}")
+            except Exception as e:
+                logger.warning(f"Query optimization failed: {e}. Using original query.")
+                optimized_query = query
+                optimization_result = None
+
+        return analysis, optimized_query, optimization_result
 
-    async def _search_parallel(
+    async def _stream_sources(
         self,
+        analysis,
         query: str,
         max_geo_results: int,
         max_publication_results: int,
-    ) -> tuple[List[GEOSeriesMetadata], List[Publication]]:
+    ) -> AsyncIterator[SearchEvent]:
         """
-        Execute all searches in parallel.
+        Run the sources for the query type concurrently, yielding events as they resolve.
 
         This is the key improvement over the nested pipeline architecture.
         """
-        tasks = []
+        producers = []
 
-        # GEO search task
-        if self.geo_client:
-            geo_task = self._search_geo(query, max_geo_results)
-            tasks.append(("geo", geo_task))
+        # GEO ID fast path
+        if analysis.search_type == SearchType.GEO_ID and analysis.geo_ids:
+            logger.info(f"⚡ GEO ID detected: {analysis.geo_ids[0]} - fast path")
+            producers.append(self._stream_geo_by_id(analysis.geo_ids[0]))
 
-        # Publication search tasks (run all in parallel)
-        pub_tasks = []
+        # HYBRID: Run all searches in parallel
+        elif analysis.search_type == SearchType.HYBRID:
+            logger.info("🔄 HYBRID search: Running all sources in parallel")
+            producers.extend(self._geo_producers(query, max_geo_results))
+            producers.extend(self._publication_producers(query, max_publication_results))
 
-        if self.pubmed_client:
-            pubmed_task = self._search_pubmed(query, max_publication_results)
-            pub_tasks.append(("pubmed", pubmed_task))
+        # GEO only
+        elif analysis.search_type == SearchType.GEO:
+            logger.info("📊 GEO-only search")
+            producers.extend(self._geo_producers(query, max_geo_results))
 
-        if self.openalex_client:
-            openalex_task = self._search_openalex(query, max_publication_results)
-            pub_tasks.append(("openalex", openalex_task))
+        # Publications only
+        elif analysis.search_type == SearchType.PUBLICATIONS:
+            logger.info("📄 Publications-only search")
+            producers.extend(self._publication_producers(query, max_publication_results))
 
-        # Execute all in parallel
-        all_tasks = [t[1] for t in tasks] + [t[1] for t in pub_tasks]
+        if not producers:
+            return
 
-        logger.info(f"⚡ Executing {len(all_tasks)} searches in parallel...")
-        results = await asyncio.gather(*all_tasks, return_exceptions=True)
+        logger.info(f"⚡ Executing {len(producers)} searches in parallel...")
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
 
-        # Parse results
-        geo_datasets = []
-        publications = []
+        async def pump(producer):
+            try:
+                async for event in producer:
+                    await queue.put(event)
+            except Exception as e:
+                logger.error(f"Search source failed: {e}", exc_info=True)
+            finally:
+                await queue.put(done)
 
-        # GEO results
-        if tasks:
-            geo_result = results[0]
-            if isinstance(geo_result, list):
-                geo_datasets = geo_result
-            elif isinstance(geo_result, Exception):
-                logger.error(f"GEO search failed: {geo_result}")
-
-        # Publication results
-        pub_results = results[len(tasks) :]
-        for i, result in enumerate(pub_results):
-            source = pub_tasks[i][0]
-            if isinstance(result, list):
-                publications.extend(result)
-                logger.info(f"📄 {source}: {len(result)} results")
-            elif isinstance(result, Exception):
-                logger.error(f"{source} search failed: {result}")
+        tasks = [asyncio.create_task(pump(producer)) for producer in producers]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await queue.get()
+                if event is done:
+                    remaining -= 1
+                else:
+                    yield event
+        finally:
+            # Client went away (or search failed): stop outstanding sources
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _geo_producers(self, query: str, max_results: int) -> list:
+        fallback = bool(self.config.enable_local_index and self.coordinator)
+        return [self._stream_geo(query, max_results, fallback_to_local=fallback)]
+
+    def _publication_producers(self, query: str, max_results: int) -> list:
+        producers = []
+        if self.pubmed_client:
+            producers.append(
+                self._stream_publications(
+                    "pubmed", self._search_pubmed(query, max_results)
+                )
+            )
+        if self.openalex_client:
+            producers.append(
+                self._stream_publications(
+                    "openalex", self._search_openalex(query, max_results)
+                )
+            )
+        return producers
+
+    @staticmethod
+    async def _stream_publications(source: str, search) -> AsyncIterator[SearchEvent]:
+        with span("search.source", upstream=source, source=source) as source_span:
+            publications = await search
+            source_span.set(results=len(publications))
+        logger.info(f"📄 {source}: {len(publications)} results")
+        if publications:
+            yield SearchEvent(
+                EVENT_PUBLICATIONS, source=source, publications=publications
+            )
+
+    async def _stream_geo_by_id(self, geo_id: str) -> AsyncIterator[SearchEvent]:
+        with span("search.source", source="geo_id", geo_id=geo_id):
+            datasets = await self._search_geo_by_id(geo_id)
+        if datasets:
+            yield SearchEvent(EVENT_GEO, source="geo", geo_datasets=datasets)
+
+    async def _stream_local_geo(
+        self,
+        query: str,
+        max_results: int,
+        served: Set[str],
+        geo_ids: Optional[List[str]] = None,
+    ) -> AsyncIterator[SearchEvent]:
+        """
+        Search the local BM25 index of previously seen GEO datasets.
 
-        return geo_datasets, publications
+        Fallback for when NCBI fails or is rate-limited. Rows carry only
+        title/summary/organism/platform. Datasets already served are skipped,
+        and if NCBI returned its ID list before failing, only those IDs are kept.
+        """
+        local_query = split_field_filters(query)
+        if local_query is None:
+            logger.info("[GEO] Local index cannot answer this query's field filters")
+            return
+        text, organism = local_query
+        limit = max_results - len(served)
+        if limit <= 0:
+            return
+
+        with span("search.source", source="local_index") as source_span:
+            hits = await asyncio.to_thread(
+                self.coordinator.db.search_geo_datasets,
+                text,
+                max_results + len(served),
+                organism,
+            )
+            hits = [
+                dataset
+                for dataset, _score in hits
+                if dataset.geo_id not in served
+                and (geo_ids is None or dataset.geo_id in geo_ids)
+            ][:limit]
+            source_span.set(results=len(hits))
+        logger.info(f"[GEO] Local index: {len(hits)} results")
+        if hits:
+            yield SearchEvent(
+                EVENT_GEO,
+                source="local",
+                geo_datasets=[
+                    GEOSeriesMetadata(
+                        geo_id=dataset.geo_id,
+                        title=dataset.title or "",
+                        summary=dataset.summary or "",
+                        organism=dataset.organism or "",
+                        platforms=[dataset.platform] if dataset.platform else [],
+                    )
+                    for dataset in hits
+                ],
+            )
 
     async def _search_geo(
         self, query: str, max_results: int
     ) -> List[GEOSeriesMetadata]:
+        """Search GEO datasets (collects _stream_geo())."""
+        datasets = []
+        async for event in self._stream_geo(query, max_results):
+            datasets.extend(event.geo_datasets)
+        return datasets
+
+    @traced_stream("search.source", source="geo")
+    async def _stream_geo(
+        self, query: str, max_results: int, fallback_to_local: bool = False
+    ) -> AsyncIterator[SearchEvent]:
         """
         Search GEO datasets with per-item caching for 10-50x speedup.
 
@@ -410,10 +640,26 @@ class SearchOrchestrator:
         2. Check cache for full metadata (batch operation)
         3. Fetch only uncached datasets from GEO
         4. Cache newly fetched datasets for future queries
+
+        Cached datasets are yielded as one event, then each fetched dataset
+        as soon as its E-Summary resolves. If fallback_to_local is set and the
+        search fails, or NCBI has not finished by config.local_index_deadline,
+        the rest comes from the local index.
         """
         if not self.geo_client:
-            return []
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = None
+        if fallback_to_local and self.config.local_index_deadline:
+            deadline = loop.time() + self.config.local_index_deadline
+
+        def time_left() -> Optional[float]:
+            return None if deadline is None else max(deadline - loop.time(), 0)
 
+        geo_ids = None
+        served = set()
+        failed = False
         try:
             # Step 1: Build GEO-optimized query
             logger.info(f"[GEO] Original query: '{query}'")
@@ -426,13 +672,16 @@ class SearchOrchestrator:
             logger.info(f"[GEO] Executing search with query: '{geo_query}'")
 
             # Step 2: Get GEO IDs from search (lightweight, returns IDs only)
-            search_result = await self.geo_client.search(
-                geo_query, max_results=max_results
-            )
+            with span("geo.search", upstream="ncbi") as search_span:
+                search_result = await asyncio.wait_for(
+                    self.geo_client.search(geo_query, max_results=max_results),
+                    timeout=time_left(),
+                )
+                search_span.set(results=len(search_result.geo_ids))
 
             if not search_result.geo_ids:
                 logger.info("[GEO] No datasets found")
-                return []
+                return
 
             geo_ids = search_result.geo_ids
             logger.info(f"[GEO] Found {len(geo_ids)} dataset IDs")
@@ -443,7 +692,9 @@ class SearchOrchestrator:
                 logger.info(
                     f"[GEO] Checking cache for {len(geo_ids)} datasets (batch operation)..."
                 )
-                cached_datasets = await self.cache.get_geo_datasets_batch(geo_ids)
+                with span("geo.cache_lookup", datasets=len(geo_ids)) as lookup:
+                    cached_datasets = await self.cache.get_geo_datasets_batch(geo_ids)
+                    lookup.set(hits=sum(1 for data in cached_datasets.values() if data))
 
             # Step 4: Identify what needs fetching
             cached_ids = [
@@ -457,65 +708,84 @@ class SearchOrchestrator:
                 f"({cache_hit_rate:.1f}% hit rate) - fetching {len(missing_ids)} from GEO"
             )
 
-            # Step 5: Build result list starting with cached datasets
-            datasets = []
+            # Step 5: Yield cached datasets first (instant!)
+            cached = []
             newly_fetched = {}
 
-            # Add cached datasets first (instant!)
             for gse_id in cached_ids:
                 try:
                     # Reconstruct GEOSeriesMetadata from cached dict
-                    metadata = GEOSeriesMetadata(**cached_datasets[gse_id])
-                    datasets.append(metadata)
+                    cached.append(GEOSeriesMetadata(**cached_datasets[gse_id]))
                 except Exception as e:
                     logger.warning(
                         f"Failed to deserialize cached dataset {gse_id}: {e}"
                     )
                     missing_ids.append(gse_id)  # Re-fetch if cache corrupt
 
-            # Step 6: Fetch missing datasets from GEO
+            if cached:
+                served.update(dataset.geo_id for dataset in cached)
+                yield SearchEvent(EVENT_GEO, source="cache", geo_datasets=cached)
+
+            # Step 6: Fetch missing datasets from GEO, yielding each as it resolves
             if missing_ids:
                 logger.info(
                     f"[GEO] Fetching {len(missing_ids)} uncached datasets from GEO (FAST mode)..."
                 )
-                logger.warning(f"[DEBUG] Missing IDs: {missing_ids}")
                 for geo_id in missing_ids:
                     try:
-                        logger.warning(
-                            f"[DEBUG] Calling get_metadata_fast for {geo_id}"
-                        )
                         # Use fast E-Summary method (100x faster than SOFT files)
-                        metadata = await self.geo_client.get_metadata_fast(geo_id)
-                        if metadata:
+                        with span("geo.fetch", upstream="ncbi", geo_id=geo_id):
+                            metadata = await asyncio.wait_for(
+                                self.geo_client.get_metadata_fast(geo_id),
+                                timeout=time_left(),
+                            )
+                    except asyncio.TimeoutError:
+                        if deadline is not None and loop.time() >= deadline:
                             logger.warning(
-                                f"[DEBUG] Got metadata for {geo_id}, organism={repr(metadata.organism)}"
+                                f"[GEO] NCBI missed the {self.config.local_index_deadline}s deadline, "
+                                f"{len(geo_ids) - len(served)} datasets left to the local index"
                             )
-                            datasets.append(metadata)
-                            newly_fetched[geo_id] = metadata
+                            failed = True
+                            break
+                        logger.warning(f"Timed out fetching metadata for {geo_id}")
+                        continue
                     except Exception as e:
                         logger.warning(f"Failed to fetch metadata for {geo_id}: {e}")
                         continue
-            else:
-                logger.warning(
-                    f"[DEBUG] No missing IDs! All {len(geo_ids)} datasets were cached"
-                )
+                    if metadata:
+                        newly_fetched[geo_id] = metadata
+                        served.add(geo_id)
+                        yield SearchEvent(
+                            EVENT_GEO, source="geo", geo_datasets=[metadata]
+                        )
 
                 # Step 7: Cache newly fetched datasets (batch operation)
                 if newly_fetched and self.cache:
-                    cached_count = await self.cache.set_geo_datasets_batch(
-                        newly_fetched
-                    )
+                    with span("geo.cache_store", datasets=len(newly_fetched)):
+                        cached_count = await self.cache.set_geo_datasets_batch(
+                            newly_fetched
+                        )
                     logger.info(f"[GEO] Cached {cached_count} newly fetched datasets")
 
             logger.info(
-                f"[GEO] ✅ Retrieved {len(datasets)}/{len(geo_ids)} datasets "
-                f"({len(cached_ids)} from cache, {len(newly_fetched)} from GEO)"
+                f"[GEO] ✅ Retrieved {len(cached) + len(newly_fetched)}/{len(geo_ids)} datasets "
+                f"({len(cached)} from cache, {len(newly_fetched)} from GEO)"
             )
-            return datasets
 
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[GEO] NCBI search missed the {self.config.local_index_deadline}s deadline"
+                if deadline is not None and loop.time() >= deadline
+                else "[GEO] NCBI search timed out"
+            )
+            failed = True
         except Exception as e:
             logger.error(f"GEO search failed: {e}", exc_info=True)
-            return []
+            failed = True
+
+        if failed and fallback_to_local:
+            async for event in self._stream_local_geo(query, max_results, served, geo_ids):
+                yield event
 
     async def _search_geo_by_id(self, geo_id: str) -> List[GEOSeriesMetadata]:
         """
@@ -531,18 +801,22 @@ class SearchOrchestrator:
 
             # Check cache first
             if self.cache:
-                cached = await self.cache.get_geo_metadata(geo_id)
+                with span("geo.cache_lookup", datasets=1) as lookup:
+                    cached = await self.cache.get_geo_metadata(geo_id)
+                    lookup.set(hits=int(bool(cached)))
                 if cached:
                     logger.info(f"⚡ Cache HIT for {geo_id} - instant return!")
                     metadata = GEOSeriesMetadata(**cached)
                     return [metadata]
 
             # Fetch from GEO if not cached
-            metadata = await self.geo_client.get_metadata(geo_id)
+            with span("geo.fetch", upstream="ncbi", geo_id=geo_id):
+                metadata = await self.geo_client.get_metadata(geo_id)
 
             # Cache for future lookups
             if metadata and self.cache:
-                await self.cache.set_geo_metadata(geo_id, metadata)
+                with span("geo.cache_store", datasets=1):
+                    await self.cache.set_geo_metadata(geo_id, metadata)
 
             return [metadata] if metadata else []
         except Exception as e:
@@ -622,27 +896,9 @@ class SearchOrchestrator:
             logger.error(f"OpenAlex search failed: {e}", exc_info=True)
             return []
 
-    def _deduplicate_geo(
-        self, datasets: List[GEOSeriesMetadata]
-    ) -> List[GEOSeriesMetadata]:
-        """Remove duplicate GEO datasets by geo_id."""
-        seen_ids = set()
-        unique = []
-
-        for dataset in datasets:
-            geo_id = dataset.geo_id
-            if geo_id not in seen_ids:
-                seen_ids.add(geo_id)
-                unique.append(dataset)
-            else:
-                logger.debug(f"Skipping duplicate: {geo_id}")
-
-        if len(unique) < len(datasets):
-            logger.info(f"🔄 Deduplicated {len(datasets)} -> {len(unique)} GEO datasets")
-
-        return unique
-
-    async def _persist_results(self, result: SearchResult) -> None:
+    async def _persist_results(
+        self, result: SearchResult, skip_geo_ids: Optional[set] = None
+    ) -> None:
         """
         Persist search results to the unified database (Phase B integration).
 
@@ -654,6 +910,7 @@ class SearchOrchestrator:
 
         Args:
             result: SearchResult containing datasets and publications
+            skip_geo_ids: Datasets already stored (served from the local index)
         """
         logger.info(
             f"[PERSIST] Starting persistence: coordinator={self.coordinator is not None}, "
@@ -675,6 +932,8 @@ class SearchOrchestrator:
 
             # Persist each GEO dataset
             for dataset in result.geo_datasets:
+                if skip_geo_ids and dataset.geo_id in skip_geo_ids:
+                    continue
                 try:
                     # Step 1: Persist GEO dataset metadata to geo_datasets table
                     geo_dataset = GEODataset(
@@ -0,0 +1,628 @@
+"""
+Offline HTTP record/replay for benchmarks and performance tests.
+
+Patches the two HTTP stacks the pipelines use at the transport boundary:
+``aiohttp.ClientSession._request`` (GEO, URL collection, PDF download) and
+``requests.adapters.HTTPAdapter.send`` (citation clients). In record mode
+real exchanges are written to a versioned JSON cassette; in replay mode the
+cassette answers every request with the recorded status, headers and body,
+delayed by the recorded response time and optionally failed on purpose.
+Client code is unchanged - the layer is switched on by one setting.
+
+Features:
+- Modes: off, record (fresh cassette), replay (cassette only), auto (record misses)
+- Request keys ignore credentials (api_key, email, tool, ...) and query order
+- Repeated requests replay their recordings in order, then repeat the last
+- Latency: recorded response time x latency_scale + latency_ms
+- Error injection decided per request key and occurrence, so it is deterministic
+  under any concurrency for a given seed
+- localhost is passed through, so load tests against the local API still work
+
+Usage:
+    # Record once against the live services
+    OMICS_HTTP_REPLAY_MODE=record python scripts/benchmark_parallel_collection.py
+
+    # Replay offline at recorded speed, with 5% of upstream calls failing
+    OMICS_HTTP_REPLAY_MODE=replay OMICS_HTTP_REPLAY_ERROR_RATE=0.05 \\
+        python scripts/benchmark_parallel_collection.py
+
+    >>> from omics_oracle_v2.lib.utils.http_replay import HTTPReplay
+    >>> with HTTPReplay("tests/cassettes/geo.json", mode="replay", latency_scale=0):
+    ...     run_benchmark()
+
+Bio.Entrez and GEOparse download through urllib/FTP and are not covered.
+"""
+
+import asyncio
+import atexit
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import aiohttp
+    from multidict import CIMultiDict, CIMultiDictProxy
+    from yarl import URL
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    HAS_REQUESTS = True
+except ImportError:
+    HAS_REQUESTS = False
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+MODES = ("off", "record", "replay", "auto")
+
+# Query/body parameters that carry credentials or contact details
+REDACTED_PARAMS = frozenset({"api_key", "apikey", "key", "email", "mailto", "tool", "token", "access_token"})
+
+# Response headers that are not replayed (bodies are stored decoded)
+DROPPED_HEADERS = frozenset({"set-cookie", "date", "content-encoding", "content-length", "transfer-encoding"})
+
+
+class CassetteMissError(ConnectionError):
+    """Raised in replay mode for a request the cassette has no recording of."""
+
+
+# ============================================================================
+# Request keys
+# ============================================================================
+
+
+def _redact_pairs(pairs: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    return sorted((k, v) for k, v in pairs if k.lower() not in REDACTED_PARAMS)
+
+
+def normalize_url(url: str) -> str:
+    """URL with credentials removed and query parameters sorted."""
+    parts = urlsplit(str(url))
+    query = urlencode(_redact_pairs(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def canonical_body(body: Optional[bytes], content_type: str = "") -> bytes:
+    """Request body with credentials removed from form and JSON payloads."""
+    if not body:
+        return b""
+    if "x-www-form-urlencoded" in content_type:
+        pairs = parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True)
+        return urlencode(_redact_pairs(pairs)).encode()
+    if "json" in content_type:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return body
+        if isinstance(payload, dict):
+            payload = {k: v for k, v in payload.items() if k.lower() not in REDACTED_PARAMS}
+        return json.dumps(payload, sort_keys=True).encode()
+    return body
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """
+    Stable key for an exchange: method, normalized URL and a body digest.
+
+    Args:
+        method: HTTP method
+        url: Full request URL including the query string
+        body: Canonical request body (see canonical_body)
+    """
+    key = f"{method.upper()} {normalize_url(url)}"
+    if body:
+        key += " #" + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+def _encode_body(content: bytes) -> Tuple[str, str]:
+    try:
+        return content.decode("utf-8"), "utf-8"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode_body(interaction: Dict[str, Any]) -> bytes:
+    body = interaction.get("body", "")
+    if interaction.get("encoding") == "base64":
+        return base64.b64decode(body)
+    return body.encode("utf-8")
+
+
+# ============================================================================
+# Cassette
+# ============================================================================
+
+
+class Cassette:
+    """
+    Versioned set of recorded exchanges, keyed by request_key().
+
+    The file is JSON: {"version", "created_at", "updated_at", "interactions"}.
+    A cassette written by another format version is rejected rather than
+    half-replayed; re-record it.
+    """
+
+    def __init__(self, path: Path, load: bool = True):
+        self.path = Path(path)
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.created_at: Optional[str] = None
+        self.dirty = False
+        self._lock = threading.Lock()
+        if load and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self.interactions.values())
+
+    def _load(self) -> None:
+        data = json.loads(self.path.read_text())
+        version = data.get("version")
+        if version != CASSETTE_VERSION:
+            raise ValueError(
+                f"{self.path}: cassette format v{version}, expected v{CASSETTE_VERSION}; re-record it"
+            )
+        self.created_at = data.get("created_at")
+        for interaction in data.get("interactions", []):
+            self.interactions.setdefault(interaction["key"], []).append(interaction)
+
+    def get(self, key: str, occurrence: int) -> Optional[Dict[str, Any]]:
+        """Recording for the n-th request with this key (the last one once exhausted)."""
+        recorded = self.interactions.get(key)
+        if not recorded:
+            return None
+        return recorded[min(occurrence, len(recorded) - 1)]
+
+    def add(self, interaction: Dict[str, Any]) -> None:
+        with self._lock:
+            self.interactions.setdefault(interaction["key"], []).append(interaction)
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cassette atomically if anything was recorded."""
+        with self._lock:
+            if not self.dirty:
+                return
+            now = datetime.now(timezone.utc).isoformat()
+            self.created_at = self.created_at or now
+            data = {
+                "version": CASSETTE_VERSION,
+                "created_at": self.created_at,
+                "updated_at": now,
+                "interactions": [i for items in self.interactions.values() for i in items],
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f, indent=1)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+            self.dirty = False
+        logger.info(f"Saved {len(self)} HTTP interactions to {self.path}")
+
+
+# ============================================================================
+# aiohttp response
+# ============================================================================
+
+
+class _ReplayStream:
+    """Minimal StreamReader over a recorded body."""
+
+    def __init__(self, body: bytes):
+        self._body = body
+        self._pos = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        end = len(self._body) if n < 0 else self._pos + n
+        chunk, self._pos = self._body[self._pos:end], min(end, len(self._body))
+        return chunk
+
+    async def iter_chunked(self, n: int):
+        while True:
+            chunk = await self.read(n)
+            if not chunk:
+                return
+            yield chunk
+
+    async def iter_any(self):
+        async for chunk in self.iter_chunked(2**16):
+            yield chunk
+
+
+class ReplayResponse:
+    """Recorded exchange exposed through the aiohttp ClientResponse surface."""
+
+    def __init__(self, interaction: Dict[str, Any], method: str, url: str):
+        self.method = method
+        self.url = self.real_url = URL(url)
+        self.status = interaction["status"]
+        self.reason = interaction.get("reason") or ""
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.get("headers", {})))
+        self.history: Tuple = ()
+        self._body = _decode_body(interaction)
+        self.content = _ReplayStream(self._body)
+        self.content_length = len(self._body)
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip().lower()
+
+    @property
+    def charset(self) -> Optional[str]:
+        for param in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"')
+        return None
+
+    @property
+    def request_info(self) -> "aiohttp.RequestInfo":
+        return aiohttp.RequestInfo(self.url, self.method, CIMultiDictProxy(CIMultiDict()), self.real_url)
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: Optional[str] = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self.charset or "utf-8", errors)
+
+    async def json(
+        self, *, encoding: Optional[str] = None, loads=json.loads, content_type: str = "application/json"
+    ) -> Any:
+        expected = "json" if content_type == "application/json" else content_type
+        if content_type and expected not in self.content_type:
+            raise aiohttp.ContentTypeError(
+                self.request_info,
+                self.history,
+                status=self.status,
+                message=f"Attempt to decode JSON with unexpected mimetype: {self.content_type}",
+                headers=self.headers,
+            )
+        stripped = self._body.strip()
+        if not stripped:
+            return None
+        return loads(stripped.decode(encoding or self.charset or "utf-8"))
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, self.history, status=self.status, message=self.reason, headers=self.headers
+            )
+
+    def release(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    async def wait_for_close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "ReplayResponse":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+def _aiohttp_body(data: Any, json_payload: Any) -> Tuple[bytes, str]:
+    """Request body and content type as aiohttp would send them (for keying only)."""
+    if json_payload is not None:
+        return json.dumps(json_payload).encode(), "application/json"
+    if data is None:
+        return b"", ""
+    if isinstance(data, dict):
+        return urlencode(sorted(data.items())).encode(), "application/x-www-form-urlencoded"
+    if isinstance(data, str):
+        return data.encode(), ""
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data), ""
+    return type(data).__name__.encode(), ""
+
+
+def _requests_response(
+    interaction: Dict[str, Any], request: "requests.PreparedRequest", adapter: Any
+) -> "requests.Response":
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction.get("reason") or ""
+    response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = _decode_body(interaction)
+    response._content_consumed = True
+    response.url = request.url
+    response.request = request
+    response.connection = adapter
+    response.elapsed = timedelta(milliseconds=interaction.get("elapsed_ms", 0))
+    return response
+
+
+# ============================================================================
+# Replay layer
+# ============================================================================
+
+
+class HTTPReplay:
+    """
+    Transport-level record/replay for aiohttp and requests.
+
+    Args:
+        cassette_path: Cassette JSON file
+        mode: off, record, replay or auto
+        latency_scale: Multiplier on recorded response times during replay
+        latency_ms: Fixed latency added to every replayed response
+        error_rate: Fraction of replayed requests that fail
+        error_status: Status of injected failures; 0 raises a timeout instead
+        seed: Seed for error injection
+        passthrough_hosts: Hosts that always go to the network unrecorded
+    """
+
+    def __init__(
+        self,
+        cassette_path: Path,
+        mode: str = "replay",
+        latency_scale: float = 1.0,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+        passthrough_hosts: Iterable[str] = ("localhost", "127.0.0.1"),
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown HTTP replay mode {mode!r}; expected one of {MODES}")
+        self.mode = mode
+        self.cassette = Cassette(cassette_path, load=mode != "record")
+        self.latency_scale = latency_scale
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.seed = seed
+        self.passthrough_hosts = frozenset(h.lower() for h in passthrough_hosts)
+        self.stats = {"recorded": 0, "replayed": 0, "missed": 0, "injected_errors": 0, "passthrough": 0}
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._originals: Dict[str, Any] = {}
+
+    @classmethod
+    def from_settings(cls, settings=None) -> "HTTPReplay":
+        """Build from HTTPReplaySettings (environment: OMICS_HTTP_REPLAY_*)."""
+        if settings is None:
+            from omics_oracle_v2.core.config import HTTPReplaySettings
+
+            settings = HTTPReplaySettings()
+        return cls(
+            Path(settings.cassette_dir) / f"{settings.cassette}.json",
+            mode=settings.mode.lower(),
+            latency_scale=settings.latency_scale,
+            latency_ms=settings.latency_ms,
+            error_rate=settings.error_rate,
+            error_status=settings.error_status,
+            seed=settings.seed,
+            passthrough_hosts=[h.strip() for h in settings.passthrough_hosts.split(",") if h.strip()],
+        )
+
+    # ========================================================================
+    # Installation
+    # ========================================================================
+
+    def install(self) -> "HTTPReplay":
+        """Patch aiohttp and requests (whichever are installed)."""
+        if self.mode == "off" or self._originals:
+            return self
+        if HAS_AIOHTTP:
+            self._originals["aiohttp"] = aiohttp.ClientSession._request
+            aiohttp.ClientSession._request = self._aiohttp_request(self._originals["aiohttp"])
+        if HAS_REQUESTS:
+            self._originals["requests"] = requests.adapters.HTTPAdapter.send
+            requests.adapters.HTTPAdapter.send = self._requests_send(self._originals["requests"])
+        logger.info(
+            f"HTTP replay ({self.mode}) installed for {', '.join(self._originals)}: "
+            f"{self.cassette.path} ({len(self.cassette)} interactions)"
+        )
+        return self
+
+    def uninstall(self) -> None:
+        """Restore the original transports and save new recordings."""
+        if "aiohttp" in self._originals:
+            aiohttp.ClientSession._request = self._originals.pop("aiohttp")
+        if "requests" in self._originals:
+            requests.adapters.HTTPAdapter.send = self._originals.pop("requests")
+        self.cassette.save()
+        logger.info(f"HTTP replay stats: {self.stats}")
+
+    def __enter__(self) -> "HTTPReplay":
+        return self.install()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.uninstall()
+
+    # ========================================================================
+    # Decisions shared by both transports
+    # ========================================================================
+
+    def _is_passthrough(self, url: str) -> bool:
+        if (urlsplit(url).hostname or "").lower() in self.passthrough_hosts:
+            self.stats["passthrough"] += 1
+            return True
+        return False
+
+    def _plan(self, method: str, url: str, body: bytes) -> Tuple[str, int, Optional[Dict[str, Any]]]:
+        """Key, occurrence and recording for a request; no recording means go to the network."""
+        key = request_key(method, url, body)
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+        if self.mode == "record":
+            return key, occurrence, None
+        interaction = self.cassette.get(key, occurrence)
+        if interaction is None and self.mode == "replay":
+            self.stats["missed"] += 1
+            raise CassetteMissError(f"No recording for {key} in {self.cassette.path}")
+        return key, occurrence, interaction
+
+    def _replay(
+        self, key: str, occurrence: int, interaction: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], float, bool]:
+        """Interaction to serve, delay in seconds, and whether to raise a timeout instead."""
+        delay = (interaction.get("elapsed_ms", 0.0) * self.latency_scale + self.latency_ms) / 1000
+        if self.error_rate > 0:
+            digest = hashlib.sha256(f"{self.seed}:{key}:{occurrence}".encode()).digest()
+            if int.from_bytes(digest[:8], "big") / 2**64 < self.error_rate:
+                self.stats["injected_errors"] += 1
+                if self.error_status == 0:
+                    return interaction, delay, True
+                interaction = {
+                    **interaction,
+                    "status": self.error_status,
+                    "reason": "Injected failure",
+                    "headers": {"Content-Type": "text/plain"},
+                    "body": "",
+                    "encoding": "utf-8",
+                }
+        self.stats["replayed"] += 1
+        return interaction, delay, False
+
+    def _record(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status: int,
+        reason: str,
+        headers: Any,
+        content: bytes,
+        elapsed: float,
+    ) -> Dict[str, Any]:
+        body, encoding = _encode_body(content)
+        interaction = {
+            "key": key,
+            "method": method.upper(),
+            "url": normalize_url(url),
+            "status": status,
+            "reason": reason or "",
+            "headers": {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+            "body": body,
+            "encoding": encoding,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self.cassette.add(interaction)
+        self.stats["recorded"] += 1
+        return interaction
+
+    # ========================================================================
+    # Transport patches
+    # ========================================================================
+
+    def _aiohttp_request(self, original):
+        replay = self
+
+        async def _request(session, method, str_or_url, **kwargs):
+            url = session._build_url(str_or_url) if hasattr(session, "_build_url") else URL(str_or_url)
+            if kwargs.get("params"):
+                url = url.extend_query(kwargs["params"])
+            url = str(url)
+            if replay._is_passthrough(url):
+                return await original(session, method, str_or_url, **kwargs)
+
+            body, content_type = _aiohttp_body(kwargs.get("data"), kwargs.get("json"))
+            key, occurrence, interaction = replay._plan(method, url, canonical_body(body, content_type))
+            if interaction is None:
+                start = time.perf_counter()
+                response = await original(session, method, str_or_url, **kwargs)
+                content = await response.read()
+                response.release()
+                interaction = replay._record(
+                    key, method, url, response.status, response.reason, response.headers,
+                    content, time.perf_counter() - start,
+                )
+                # The live body stream is consumed; serve the recording so streaming callers get it
+                return ReplayResponse(interaction, method, url)
+
+            interaction, delay, timeout = replay._replay(key, occurrence, interaction)
+            if delay:
+                await asyncio.sleep(delay)
+            if timeout:
+                raise asyncio.TimeoutError(f"Injected timeout for {key}")
+            return ReplayResponse(interaction, method, url)
+
+        return _request
+
+    def _requests_send(self, original):
+        replay = self
+
+        def send(adapter, request, **kwargs):
+            if replay._is_passthrough(request.url):
+                return original(adapter, request, **kwargs)
+
+            body = request.body.encode() if isinstance(request.body, str) else request.body
+            if body is not None and not isinstance(body, bytes):
+                body = type(body).__name__.encode()  # streamed upload
+            content_type = request.headers.get("Content-Type", "")
+            body = canonical_body(body, content_type)
+            key, occurrence, interaction = replay._plan(request.method, request.url, body)
+            if interaction is None:
+                start = time.perf_counter()
+                response = original(adapter, request, **kwargs)
+                replay._record(
+                    key, request.method, request.url, response.status_code, response.reason,
+                    response.headers, response.content, time.perf_counter() - start,
+                )
+                return response
+
+            interaction, delay, timeout = replay._replay(key, occurrence, interaction)
+            if delay:
+                time.sleep(delay)
+            if timeout:
+                raise requests.exceptions.Timeout(f"Injected timeout for {key}", request=request)
+            return _requests_response(interaction, request, adapter)
+
+        return send
+
+
+_active: Optional[HTTPReplay] = None
+
+
+def install_from_settings(settings=None) -> Optional[HTTPReplay]:
+    """
+    Install the replay layer described by HTTPReplaySettings, once per process.
+
+    Called on ``import omics_oracle_v2`` when OMICS_HTTP_REPLAY_MODE is set, so
+    benchmarks and tests pick it up without code changes. New recordings are
+    saved at interpreter exit.
+
+    Returns:
+        The active HTTPReplay, or None when the mode is off
+    """
+    global _active
+    if _active is not None:
+        return _active
+    replay = HTTPReplay.from_settings(settings)
+    if replay.mode == "off":
+        return None
+    _active = replay.install()
+    atexit.register(_active.uninstall)
+    return _active
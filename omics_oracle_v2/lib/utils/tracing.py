@@ -0,0 +1,435 @@
+"""
+In-process span tracing for the search and enrichment request path.
+
+Every stage of a request (query analysis, NER, each source search, cache
+lookups, dedup, persistence, per-dataset enrichment, URL collection,
+download, parse) runs inside a span. Spans are linked by trace/parent IDs
+through a context variable, so asyncio tasks and asyncio.to_thread calls
+started inside a span become its children. Finished spans go to the
+exporters: an in-memory store of recent traces (served by /metrics/traces)
+and the Prometheus stage/upstream histograms.
+
+Span schema (version SPAN_SCHEMA_VERSION, see Span.to_dict):
+    schema, trace_id, span_id, parent_id, name, upstream, start_time,
+    duration_ms, status ("ok" | "error" | "cancelled"), error, attributes
+
+Span names are a fixed catalogue (they are Prometheus label values):
+    search.request, search, search.cache_lookup, search.cache_store,
+    search.source, search.dedup, search.persist,
+    query.plan, query.analyze, query.optimize, query.optimize.cache,
+    query.ner, query.synonyms, query.expansion, query.normalize,
+    geo.search, geo.cache_lookup, geo.fetch, geo.cache_store, enrich.dataset,
+    fulltext.request, fulltext.dataset, fulltext.pubmed_fetch,
+    urls.collect, urls.cache_lookup, urls.source,
+    download.pdf, download.attempt, parse.pdf
+
+Usage:
+    >>> from omics_oracle_v2.lib.utils.tracing import span, get_trace
+    >>> with span("geo.fetch", upstream="ncbi", geo_id="GSE1") as s:
+    ...     metadata = await client.get_metadata_fast("GSE1")
+    ...     s.set(cached=False)
+    >>> get_trace(s.trace_id)  # every span of the request
+
+Coroutines can be decorated with ``traced``. Do not yield inside
+``with span(...)`` in an async generator; decorate it with ``traced_stream``.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SPAN_SCHEMA_VERSION = 1
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_CANCELLED = "cancelled"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("omics_current_span", default=None)
+
+# Default for the parent argument: the span current in this context
+CURRENT = object()
+
+
+def _new_id(bits: int) -> str:
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+@dataclass
+class Span:
+    """One timed stage of a request."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    upstream: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    duration_ms: Optional[float] = None
+    status: str = STATUS_OK
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    tracer: Optional["Tracer"] = field(default=None, repr=False, compare=False)
+    _start: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    def set(self, **attributes: Any) -> "Span":
+        """Attach attributes (counts, IDs, cache hit flags)."""
+        self.attributes.update(attributes)
+        return self
+
+    def fail(self, error: Any) -> None:
+        """Mark the span failed without raising (e.g. a source that returned an error)."""
+        self.status = STATUS_ERROR
+        self.error = str(error)[:500]
+
+    def end(self, exc: Optional[BaseException] = None) -> None:
+        """Finish the span (idempotent) and hand it to the exporters."""
+        if self.duration_ms is not None:
+            return
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+        if isinstance(exc, asyncio.CancelledError):
+            self.status = STATUS_CANCELLED
+        elif exc is not None and not isinstance(exc, GeneratorExit):
+            self.fail(f"{type(exc).__name__}: {exc}")
+        if self.tracer is not None:
+            self.tracer._export(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stable, JSON-serializable representation."""
+        return {
+            "schema": SPAN_SCHEMA_VERSION,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "upstream": self.upstream,
+            "start_time": datetime.fromtimestamp(self.start_time, timezone.utc).isoformat(),
+            "duration_ms": None if self.duration_ms is None else round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+# ============================================================================
+# Exporters
+# ============================================================================
+
+
+class InMemoryExporter:
+    """
+    Keeps the spans of the most recent traces for inspection.
+
+    Args:
+        max_traces: Traces kept (oldest evicted first)
+        max_spans_per_trace: Spans kept per trace; later spans are counted only
+    """
+
+    def __init__(self, max_traces: int = 200, max_spans_per_trace: int = 2000):
+        self.max_traces = max_traces
+        self.max_spans_per_trace = max_spans_per_trace
+        self._traces: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._dropped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            spans = self._traces.get(span.trace_id)
+            if spans is None:
+                spans = self._traces[span.trace_id] = []
+                while len(self._traces) > self.max_traces:
+                    evicted, _ = self._traces.popitem(last=False)
+                    self._dropped.pop(evicted, None)
+            if len(spans) < self.max_spans_per_trace:
+                spans.append(span)
+            else:
+                self._dropped[span.trace_id] = self._dropped.get(span.trace_id, 0) + 1
+
+    def get_trace(self, trace_id: str) -> List[Span]:
+        with self._lock:
+            return list(self._traces.get(trace_id, []))
+
+    def trace_ids(self) -> List[str]:
+        """Trace IDs, most recent first."""
+        with self._lock:
+            return list(reversed(self._traces))
+
+    def dropped(self, trace_id: str) -> int:
+        return self._dropped.get(trace_id, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+            self._dropped.clear()
+
+
+class PrometheusExporter:
+    """Feeds span durations into the per-stage and per-upstream histograms."""
+
+    def __init__(self):
+        self._track = None
+        self._available = True
+
+    def export(self, span: Span) -> None:
+        if not self._available:
+            return
+        if self._track is None:
+            try:
+                from omics_oracle_v2.api.metrics import track_span
+            except ImportError as e:
+                logger.debug(f"Prometheus export unavailable: {e}")
+                self._available = False
+                return
+            self._track = track_span
+        self._track(span.name, span.upstream, span.duration_ms / 1000, span.status)
+
+
+# ============================================================================
+# Tracer
+# ============================================================================
+
+
+class Tracer:
+    """Creates spans and passes finished ones to its exporters."""
+
+    def __init__(self, exporters: Optional[List[Any]] = None):
+        self.exporters = list(exporters or [])
+
+    def start_span(
+        self, name: str, parent: Any = CURRENT, upstream: Optional[str] = None, **attributes: Any
+    ) -> Span:
+        """
+        Start a span without making it current; call span.end() when done.
+
+        Args:
+            name: Span name from the catalogue in the module docstring
+            parent: Parent span; defaults to the current one, None starts a new trace
+            upstream: External service the span waits on (histogram label)
+            **attributes: Initial attributes
+        """
+        if parent is CURRENT:
+            parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else _new_id(128),
+            span_id=_new_id(64),
+            parent_id=parent.span_id if parent else None,
+            upstream=upstream,
+            attributes=attributes,
+            tracer=self,
+        )
+
+    @contextmanager
+    def span(
+        self, name: str, parent: Any = CURRENT, upstream: Optional[str] = None, **attributes: Any
+    ) -> Iterator[Span]:
+        """Run a block inside a span that is current for its duration."""
+        span = self.start_span(name, parent=parent, upstream=upstream, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def record(self, name: str, duration_ms: float, parent: Any = CURRENT, **attributes: Any) -> Span:
+        """
+        Record an already-measured span (e.g. time accumulated across a stream).
+
+        The span is placed to end now: start_time = now - duration_ms.
+        """
+        span = self.start_span(name, parent=parent, **attributes)
+        span.start_time -= duration_ms / 1000
+        span._start -= duration_ms / 1000
+        span.end()
+        return span
+
+    def traced(self, name: str, upstream: Optional[str] = None, **attributes: Any):
+        """Decorate a coroutine function so each call runs inside a span."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with self.span(name, upstream=upstream, **attributes):
+                    return await func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @contextmanager
+    def activate(self, span: Optional[Span]) -> Iterator[Optional[Span]]:
+        """Make an existing span current (e.g. while creating child tasks)."""
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    def traced_stream(self, name: str, **attributes: Any):
+        """
+        Decorate an async generator so it runs inside one span.
+
+        The span is current only while the generator body runs, never while
+        the consumer handles a yielded item, so the consumer's own spans are
+        not misattributed. Closing the generator early ends the span as ok.
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                span = self.start_span(name, **attributes)
+                stream = func(*args, **kwargs)
+                error = None
+                try:
+                    while True:
+                        token = _current_span.set(span)
+                        try:
+                            item = await stream.__anext__()
+                        except StopAsyncIteration:
+                            break
+                        finally:
+                            _current_span.reset(token)
+                        yield item
+                except BaseException as e:
+                    error = e
+                    raise
+                finally:
+                    try:
+                        with self.activate(span):
+                            await stream.aclose()
+                    finally:
+                        span.end(error)
+
+            return wrapper
+
+        return decorator
+
+    def _export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.debug(f"Span export failed in {type(exporter).__name__}: {e}")
+
+
+# ============================================================================
+# Process-wide tracer
+# ============================================================================
+
+memory_exporter = InMemoryExporter()
+tracer = Tracer([memory_exporter, PrometheusExporter()])
+
+span = tracer.span
+start_span = tracer.start_span
+record = tracer.record
+activate = tracer.activate
+traced = tracer.traced
+traced_stream = tracer.traced_stream
+
+
+def current_span() -> Optional[Span]:
+    """The span current in this context, if any."""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    """Trace ID of the current span, if any."""
+    current = _current_span.get()
+    return current.trace_id if current else None
+
+
+def get_trace(trace_id: str) -> List[Span]:
+    """Finished spans of a recent trace, in start order."""
+    return sorted(memory_exporter.get_trace(trace_id), key=lambda s: s._start)
+
+
+def trace_tree(trace_id: str) -> Optional[Dict[str, Any]]:
+    """
+    A recent trace as a span tree with per-span self time.
+
+    Self time (duration minus the union of child time) shows where a slow
+    request actually waited. Spans whose parent is not in the trace (still
+    running, or evicted) are attached to the root.
+
+    Returns:
+        Root span dict with nested "children", or None if the trace is unknown
+    """
+    spans = get_trace(trace_id)
+    if not spans:
+        return None
+    nodes = {s.span_id: {**s.to_dict(), "children": []} for s in spans}
+    starts = {s.span_id: s.start_time for s in spans}
+    roots = []
+    for s in spans:
+        parent = nodes.get(s.parent_id) if s.parent_id else None
+        (parent["children"] if parent else roots).append(nodes[s.span_id])
+
+    def add_self_time(node: Dict[str, Any]) -> None:
+        intervals = []
+        for child in node["children"]:
+            add_self_time(child)
+            start = starts[child["span_id"]]
+            intervals.append((start, start + child["duration_ms"] / 1000))
+        covered, low, high = 0.0, None, None
+        for lo, hi in sorted(intervals):
+            if high is None or lo > high:
+                covered += 0.0 if high is None else high - low
+                low, high = lo, hi
+            else:
+                high = max(high, hi)
+        covered += 0.0 if high is None else high - low
+        node["self_ms"] = round(max(node["duration_ms"] - covered * 1000, 0.0), 3)
+
+    root = next((n for n in roots if n["parent_id"] is None), roots[0])
+    root["children"].extend(n for n in roots if n is not root)
+    add_self_time(root)
+    root["span_count"] = len(spans)
+    root["dropped_spans"] = memory_exporter.dropped(trace_id)
+    return root
+
+
+def recent_traces(limit: int = 20, min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    Summaries of recent traces, most recent first.
+
+    Each summary has the root span's name, duration and status, the span
+    count, and the time spent per span name (the stage breakdown).
+    """
+    summaries = []
+    for trace_id in memory_exporter.trace_ids():
+        spans = memory_exporter.get_trace(trace_id)
+        root = next((s for s in spans if s.parent_id is None), None)
+        if root is None or (root.duration_ms or 0) < min_duration_ms:
+            continue
+        stages: Dict[str, float] = {}
+        for s in spans:
+            if s is not root:
+                stages[s.name] = stages.get(s.name, 0.0) + (s.duration_ms or 0)
+        summaries.append(
+            {
+                "trace_id": trace_id,
+                "name": root.name,
+                "start_time": root.to_dict()["start_time"],
+                "duration_ms": round(root.duration_ms, 3),
+                "status": root.status,
+                "span_count": len(spans),
+                "stages_ms": {name: round(ms, 3) for name, ms in sorted(stages.items(), key=lambda i: -i[1])},
+            }
+        )
+        if len(summaries) >= limit:
+            break
+    return summaries
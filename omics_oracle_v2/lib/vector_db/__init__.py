@@ -0,0 +1,12 @@
+"""
+Vector database for semantic search.
+
+Provides vector storage and similarity search using FAISS: exact
+(FAISSVectorDB) and persistent approximate HNSW/IVF-PQ (ANNVectorDB).
+"""
+
+from omics_oracle_v2.lib.vector_db.ann_index import ANNConfig, ANNVectorDB
+from omics_oracle_v2.lib.vector_db.faiss_db import FAISSVectorDB
+from omics_oracle_v2.lib.vector_db.interface import VectorDB
+
+__all__ = ["VectorDB", "FAISSVectorDB", "ANNVectorDB", "ANNConfig"]
@@ -0,0 +1,574 @@
+"""
+Persistent approximate nearest neighbor (ANN) vector database.
+
+Replaces the exact IndexFlatL2 linear scan with an HNSW or IVF-PQ index so
+semantic search over every GEO series summary stays fast on CPU.
+
+Features:
+- HNSW (graph) or IVF-PQ (compressed) index with recall/latency knobs
+- Incremental add, upsert and delete by ID (e.g. GEO accession)
+- On-disk snapshots, memory-mapped on load, swapped in atomically
+- Recall measurement against brute force on the stored vectors
+
+Layout on disk:
+    {path}/CURRENT                  - name of the live snapshot
+    {path}/snapshots/{version}/     - index.faiss, vectors.npy, metadata.pkl
+
+Usage:
+    >>> db = ANNVectorDB(1536, ANNConfig(index_type="hnsw", ef_search=64))
+    >>> db.add_vectors(embeddings, ids=["GSE100001", "GSE100002"])
+    >>> db.save("data/vector_index")
+    >>>
+    >>> reader = ANNVectorDB.open("data/vector_index")  # memory-mapped
+    >>> reader.search(query_embedding, k=10)
+    >>> reader.reload_if_changed("data/vector_index")
+"""
+
+import logging
+import os
+import pickle
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from omics_oracle_v2.lib.vector_db.interface import VectorDB
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("hnsw", "ivfpq", "flat")
+
+
+@dataclass
+class ANNConfig:
+    """
+    Configuration for ANNVectorDB.
+
+    HNSW: hnsw_m and ef_construction trade build time/memory for graph
+    quality; ef_search trades query latency for recall.
+    IVF-PQ: ivf_nlist clusters, ivf_nprobe clusters scanned per query
+    (recall vs latency), pq_m sub-quantizers of pq_bits each (memory);
+    rerank_factor * k PQ candidates are re-scored exactly from the stored
+    vectors, recovering the recall lost to compression.
+    """
+
+    index_type: str = "hnsw"
+
+    # HNSW
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+
+    # IVF-PQ
+    ivf_nlist: int = 1024
+    ivf_nprobe: int = 16
+    pq_m: int = 16
+    pq_bits: int = 8
+    train_size: int = 0  # Vectors needed before training (0 = 39 * nlist)
+    rerank_factor: int = 4  # 1 disables exact re-ranking
+
+    # Persistence
+    mmap: bool = True
+    keep_snapshots: int = 2
+    compact_ratio: float = 0.2  # Rebuild on save when deleted/total exceeds this
+
+    def __post_init__(self):
+        """Validate configuration."""
+        if self.index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {INDEX_TYPES}, got {self.index_type}")
+
+        if min(self.hnsw_m, self.ef_construction, self.ef_search, self.ivf_nlist, self.ivf_nprobe) <= 0:
+            raise ValueError("Index parameters must be positive")
+
+        if self.keep_snapshots < 1:
+            raise ValueError(f"keep_snapshots must be at least 1, got {self.keep_snapshots}")
+
+    @property
+    def min_train_size(self) -> int:
+        return self.train_size or 39 * self.ivf_nlist
+
+
+class ANNVectorDB(VectorDB):
+    """
+    ANN vector database with incremental updates and snapshot persistence.
+
+    Vectors are stored alongside the index (vectors.npy) so IVF-PQ can be
+    (re)trained, deleted entries can be compacted away, and recall can be
+    checked against exact search. Until an IVF-PQ index has enough vectors
+    to train, queries are answered exactly from the stored vectors.
+
+    Deletes are tombstones (HNSW graphs cannot drop nodes); they are
+    filtered out of results and reclaimed by rebuild() or on save().
+    """
+
+    def __init__(self, dimension: int, config: Optional[ANNConfig] = None):
+        """
+        Initialize ANN vector database.
+
+        Args:
+            dimension: Vector dimension (must match embedding dimension)
+            config: Index configuration (uses HNSW defaults if None)
+
+        Raises:
+            ValueError: If dimension <= 0 or PQ does not divide the dimension
+        """
+        if dimension <= 0:
+            raise ValueError(f"Dimension must be positive, got {dimension}")
+
+        self.config = config or ANNConfig()
+        if self.config.index_type == "ivfpq" and dimension % self.config.pq_m:
+            raise ValueError(f"pq_m ({self.config.pq_m}) must divide dimension ({dimension})")
+
+        self._dimension = dimension
+        self._index = self._new_index()
+        self._vector_chunks: List[np.ndarray] = []  # Row i holds the vector for label i
+        self._id_to_idx: Dict[str, int] = {}
+        self._idx_to_id: Dict[int, str] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._next_idx = 0
+        self._snapshot: Optional[Path] = None  # Snapshot the index was loaded from
+        self._read_only = False  # Index is memory-mapped from the snapshot
+
+    # =========================================================================
+    # Index construction
+    # =========================================================================
+
+    def _new_index(self) -> faiss.Index:
+        """Create an empty index, wrapped so labels are explicit int64 IDs."""
+        config = self.config
+        if config.index_type == "hnsw":
+            base = faiss.IndexHNSWFlat(self._dimension, config.hnsw_m)
+            base.hnsw.efConstruction = config.ef_construction
+            base.hnsw.efSearch = config.ef_search
+        elif config.index_type == "ivfpq":
+            quantizer = faiss.IndexFlatL2(self._dimension)
+            base = faiss.IndexIVFPQ(quantizer, self._dimension, config.ivf_nlist, config.pq_m, config.pq_bits)
+            base.nprobe = config.ivf_nprobe
+        else:
+            base = faiss.IndexFlatL2(self._dimension)
+        return faiss.IndexIDMap2(base)
+
+    def _apply_search_params(self) -> None:
+        """Push ef_search / nprobe onto the (possibly reloaded) index."""
+        base = faiss.downcast_index(self._index.index)
+        if self.config.index_type == "hnsw":
+            base.hnsw.efSearch = self.config.ef_search
+        elif self.config.index_type == "ivfpq":
+            base.nprobe = self.config.ivf_nprobe
+
+    def set_search_params(self, ef_search: Optional[int] = None, nprobe: Optional[int] = None) -> None:
+        """
+        Tune recall vs latency at query time (no rebuild needed).
+
+        Args:
+            ef_search: HNSW candidate list size
+            nprobe: IVF clusters scanned per query
+        """
+        if ef_search:
+            self.config.ef_search = ef_search
+        if nprobe:
+            self.config.ivf_nprobe = nprobe
+        self._apply_search_params()
+
+    def _ensure_writable(self) -> None:
+        """Replace a memory-mapped (read-only) index with an in-memory copy."""
+        if self._read_only:
+            self._index = faiss.read_index(str(self._snapshot / "index.faiss"))
+            self._apply_search_params()
+            self._read_only = False
+
+    @property
+    def is_trained(self) -> bool:
+        return self._index.is_trained
+
+    def _vectors(self) -> np.ndarray:
+        """All stored vectors (including tombstoned rows), by label."""
+        if not self._vector_chunks:
+            return np.zeros((0, self._dimension), dtype=np.float32)
+        if len(self._vector_chunks) > 1:
+            self._vector_chunks = [np.concatenate(self._vector_chunks)]
+        return self._vector_chunks[0]
+
+    def _train(self) -> None:
+        """Train IVF-PQ on the stored vectors and index everything added so far."""
+        vectors = self._vectors()
+        logger.info(f"Training IVF-PQ index on {len(vectors)} vectors")
+        self._index.train(np.ascontiguousarray(vectors))
+        labels = np.fromiter(self._idx_to_id, dtype=np.int64)
+        if len(labels):
+            self._index.add_with_ids(np.ascontiguousarray(vectors[labels]), labels)
+
+    # =========================================================================
+    # VectorDB interface
+    # =========================================================================
+
+    def add_vectors(
+        self,
+        vectors: np.ndarray,
+        ids: Optional[List[str]] = None,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Add vectors to the index.
+
+        Args:
+            vectors: Array of shape (n_vectors, dimension)
+            ids: Optional list of unique IDs (auto-generated if None)
+            metadata: Optional metadata for each vector
+
+        Raises:
+            ValueError: If shapes don't match or IDs aren't unique
+        """
+        if vectors.ndim != 2:
+            raise ValueError(f"Vectors must be 2D array, got shape {vectors.shape}")
+
+        if vectors.shape[1] != self._dimension:
+            raise ValueError(
+                f"Vector dimension {vectors.shape[1]} doesn't match database dimension {self._dimension}"
+            )
+
+        n_vectors = vectors.shape[0]
+        if ids is None:
+            ids = [f"vec_{self._next_idx + i}" for i in range(n_vectors)]
+        elif len(ids) != n_vectors:
+            raise ValueError(f"Number of IDs ({len(ids)}) doesn't match number of vectors ({n_vectors})")
+
+        existing_ids = set(ids) & set(self._id_to_idx)
+        if existing_ids or len(set(ids)) != len(ids):
+            raise ValueError(f"Duplicate IDs: {existing_ids or ids}")
+
+        if n_vectors == 0:
+            return
+
+        self._ensure_writable()
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        labels = np.arange(self._next_idx, self._next_idx + n_vectors, dtype=np.int64)
+
+        self._vector_chunks.append(vectors)
+        for i, id in enumerate(ids):
+            self._id_to_idx[id] = int(labels[i])
+            self._idx_to_id[int(labels[i])] = id
+            if metadata and i < len(metadata):
+                self._metadata[id] = metadata[i]
+        self._next_idx += n_vectors
+
+        if self.is_trained:
+            self._index.add_with_ids(vectors, labels)
+        elif self.size() >= self.config.min_train_size:
+            self._train()
+
+    def upsert(
+        self, vectors: np.ndarray, ids: List[str], metadata: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """Add vectors, replacing any existing entries with the same IDs."""
+        self.remove(ids)
+        self.add_vectors(vectors, ids, metadata)
+
+    def search(self, query_vector: np.ndarray, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Find k approximate nearest neighbors.
+
+        Args:
+            query_vector: Query vector of shape (dimension,) or (1, dimension)
+            k: Number of neighbors to return
+
+        Returns:
+            List of (id, distance) tuples sorted by distance
+
+        Raises:
+            ValueError: If query dimension doesn't match
+        """
+        if query_vector.ndim == 1:
+            query_vector = query_vector.reshape(1, -1)
+        return self.search_batch(query_vector, k)[0]
+
+    def search_batch(self, query_vectors: np.ndarray, k: int = 10) -> List[List[Tuple[str, float]]]:
+        """
+        Batch search for multiple queries.
+
+        Args:
+            query_vectors: Array of shape (n_queries, dimension)
+            k: Number of neighbors per query
+
+        Returns:
+            List of results for each query
+        """
+        if query_vectors.ndim != 2:
+            raise ValueError(f"Query vectors must be 2D array, got shape {query_vectors.shape}")
+
+        if query_vectors.shape[1] != self._dimension:
+            raise ValueError(
+                f"Query dimension {query_vectors.shape[1]} doesn't match database dimension {self._dimension}"
+            )
+
+        if self.size() == 0:
+            return [[] for _ in range(query_vectors.shape[0])]
+
+        query_vectors = np.ascontiguousarray(query_vectors, dtype=np.float32)
+        if not self.is_trained:
+            return self.search_exact(query_vectors, k)
+
+        rerank = self.config.index_type == "ivfpq" and self.config.rerank_factor > 1
+        k_fetch = k * self.config.rerank_factor if rerank else k
+
+        # Over-fetch by the number of tombstones so k live results survive filtering
+        k_search = min(k_fetch + self.deleted_count(), self._index.ntotal)
+        distances, labels = self._index.search(query_vectors, k_search)
+        if rerank:
+            distances, labels = self._rerank(query_vectors, labels)
+        return [self._to_results(d, l, k) for d, l in zip(distances, labels)]
+
+    def _rerank(self, query_vectors: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Re-score PQ candidates with exact L2 distances from the stored vectors."""
+        vectors = self._vectors()
+        candidates = vectors[np.maximum(labels, 0)]  # (n_queries, k_search, dimension)
+        distances = ((candidates - query_vectors[:, None, :]) ** 2).sum(axis=2)
+        distances[labels < 0] = np.inf
+        order = np.argsort(distances, axis=1)
+        return np.take_along_axis(distances, order, 1), np.take_along_axis(labels, order, 1)
+
+    def search_exact(self, query_vectors: np.ndarray, k: int = 10) -> List[List[Tuple[str, float]]]:
+        """
+        Brute-force search over the stored vectors (ground truth for recall).
+
+        Args:
+            query_vectors: Array of shape (n_queries, dimension)
+            k: Number of neighbors per query
+
+        Returns:
+            List of results for each query
+        """
+        labels = np.fromiter(self._idx_to_id, dtype=np.int64)
+        if not len(labels):
+            return [[] for _ in range(query_vectors.shape[0])]
+
+        flat = faiss.IndexFlatL2(self._dimension)
+        flat.add(np.ascontiguousarray(self._vectors()[labels]))
+        distances, rows = flat.search(np.ascontiguousarray(query_vectors, dtype=np.float32), min(k, len(labels)))
+        return [
+            self._to_results(d, np.where(r >= 0, labels[r], -1), k) for d, r in zip(distances, rows)
+        ]
+
+    def _to_results(self, distances: np.ndarray, labels: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        results = []
+        for dist, label in zip(distances, labels):
+            id = self._idx_to_id.get(int(label))
+            if id is not None:
+                results.append((id, float(dist)))
+                if len(results) == k:
+                    break
+        return results
+
+    def evaluate_recall(self, query_vectors: np.ndarray, k: int = 10) -> float:
+        """
+        Recall@k of the ANN index against brute force on the same data.
+
+        Args:
+            query_vectors: Array of shape (n_queries, dimension)
+            k: Number of neighbors per query
+
+        Returns:
+            Fraction of exact top-k IDs that the index also returned
+        """
+        exact = self.search_exact(query_vectors, k)
+        approximate = self.search_batch(query_vectors, k)
+        found = total = 0
+        for truth, result in zip(exact, approximate):
+            truth_ids = {id for id, _ in truth}
+            found += len(truth_ids & {id for id, _ in result})
+            total += len(truth_ids)
+        return found / total if total else 1.0
+
+    def get_metadata(self, id: str) -> Optional[Dict[str, Any]]:
+        """Get metadata for a vector."""
+        return self._metadata.get(id)
+
+    def remove(self, ids: List[str]) -> int:
+        """
+        Remove vectors by ID (tombstoned until the next rebuild or save).
+
+        Args:
+            ids: List of IDs to remove
+
+        Returns:
+            Number of vectors actually removed
+        """
+        removed = 0
+        for id in ids:
+            idx = self._id_to_idx.pop(id, None)
+            if idx is not None:
+                del self._idx_to_id[idx]
+                self._metadata.pop(id, None)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """Clear all vectors."""
+        self._index = self._new_index()
+        self._vector_chunks = []
+        self._id_to_idx.clear()
+        self._idx_to_id.clear()
+        self._metadata.clear()
+        self._next_idx = 0
+        self._read_only = False
+
+    def size(self) -> int:
+        """Get number of live vectors."""
+        return len(self._id_to_idx)
+
+    def deleted_count(self) -> int:
+        """Get number of tombstoned vectors still held by the index."""
+        return self._next_idx - self.size()
+
+    def dimension(self) -> int:
+        """Get vector dimension."""
+        return self._dimension
+
+    def rebuild(self) -> None:
+        """
+        Rebuild the index from live vectors, dropping tombstones.
+
+        Labels are renumbered; IVF-PQ is retrained once enough vectors remain.
+        """
+        labels = sorted(self._idx_to_id)
+        vectors = np.array(self._vectors()[labels], dtype=np.float32)
+        ids = [self._idx_to_id[label] for label in labels]
+        metadata = {id: self._metadata[id] for id in ids if id in self._metadata}
+
+        logger.info(f"Rebuilding {self.config.index_type} index: {len(ids)} live, {self.deleted_count()} deleted")
+        self.clear()
+        if ids:
+            self.add_vectors(vectors, ids)
+            self._metadata = metadata
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def save(self, path: str) -> None:
+        """
+        Write a new snapshot and atomically make it the current one.
+
+        Readers that already opened the previous snapshot keep working;
+        the oldest snapshots beyond keep_snapshots are removed.
+
+        Args:
+            path: Index directory
+        """
+        if self._next_idx and self.deleted_count() / self._next_idx > self.config.compact_ratio:
+            self.rebuild()
+
+        root = Path(path)
+        snapshots = root / "snapshots"
+        snapshots.mkdir(parents=True, exist_ok=True)
+
+        version = f"{time.time_ns():020d}"
+        staging = snapshots / f".staging-{version}"
+        staging.mkdir()
+
+        faiss.write_index(self._index, str(staging / "index.faiss"))
+        np.save(staging / "vectors.npy", self._vectors())
+        with open(staging / "metadata.pkl", "wb") as f:
+            pickle.dump(
+                {
+                    "dimension": self._dimension,
+                    "config": asdict(self.config),
+                    "id_to_idx": self._id_to_idx,
+                    "metadata": self._metadata,
+                    "next_idx": self._next_idx,
+                },
+                f,
+            )
+
+        # Publish: rename the complete snapshot, then swap the CURRENT pointer
+        snapshot = snapshots / version
+        os.replace(staging, snapshot)
+        pointer = root / "CURRENT.tmp"
+        pointer.write_text(version)
+        os.replace(pointer, root / "CURRENT")
+
+        self._snapshot = snapshot
+        self._prune_snapshots(snapshots, keep=version)
+        logger.info(f"Saved {self.size()} vectors to snapshot {snapshot}")
+
+    def _prune_snapshots(self, snapshots: Path, keep: str) -> None:
+        versions = sorted(p.name for p in snapshots.iterdir() if not p.name.startswith("."))
+        for version in versions[: -self.config.keep_snapshots]:
+            if version != keep:
+                shutil.rmtree(snapshots / version, ignore_errors=True)
+
+    @staticmethod
+    def current_snapshot(path: str) -> Path:
+        """
+        Resolve the live snapshot directory.
+
+        Raises:
+            FileNotFoundError: If no snapshot has been saved
+        """
+        pointer = Path(path) / "CURRENT"
+        if not pointer.exists():
+            raise FileNotFoundError(f"No index snapshot found in {path}")
+        return Path(path) / "snapshots" / pointer.read_text().strip()
+
+    def load(self, path: str) -> None:
+        """
+        Load the current snapshot, memory-mapped if config.mmap is set.
+
+        Args:
+            path: Index directory
+
+        Raises:
+            FileNotFoundError: If index files don't exist
+        """
+        snapshot = self.current_snapshot(path)
+        index_file = snapshot / "index.faiss"
+        if not index_file.exists():
+            raise FileNotFoundError(f"FAISS index not found: {index_file}")
+
+        with open(snapshot / "metadata.pkl", "rb") as f:
+            state = pickle.load(f)
+
+        self._dimension = state["dimension"]
+        config = ANNConfig(**state["config"])
+        config.mmap = self.config.mmap
+        self.config = config
+
+        if config.mmap:
+            self._index = faiss.read_index(str(index_file), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+            self._vector_chunks = [np.load(snapshot / "vectors.npy", mmap_mode="r")]
+        else:
+            self._index = faiss.read_index(str(index_file))
+            self._vector_chunks = [np.load(snapshot / "vectors.npy")]
+
+        self._id_to_idx = state["id_to_idx"]
+        self._idx_to_id = {idx: id for id, idx in self._id_to_idx.items()}
+        self._metadata = state["metadata"]
+        self._next_idx = state["next_idx"]
+        self._snapshot = snapshot
+        self._read_only = config.mmap
+        self._apply_search_params()
+
+    @classmethod
+    def open(cls, path: str, mmap: bool = True) -> "ANNVectorDB":
+        """Open the current snapshot in a directory."""
+        with open(cls.current_snapshot(path) / "metadata.pkl", "rb") as f:
+            state = pickle.load(f)
+        db = cls(state["dimension"], ANNConfig(**{**state["config"], "mmap": mmap}))
+        db.load(path)
+        return db
+
+    def reload_if_changed(self, path: str) -> bool:
+        """
+        Switch to a newer snapshot published by another process.
+
+        Returns:
+            True if a new snapshot was loaded
+        """
+        if self._snapshot == self.current_snapshot(path):
+            return False
+        self.load(path)
+        return True
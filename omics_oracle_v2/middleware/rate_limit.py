@@ -2,21 +2,34 @@
 Rate limiting middleware for FastAPI.
 
 Enforces tier-based rate limits and adds X-RateLimit-* headers to responses.
+
+Per request this costs one cached credential lookup and one Redis script
+call (or an in-process check when Redis is unavailable or local_only is set).
 """
 
 import logging
-from typing import Callable
+import time
+from contextlib import asynccontextmanager
+from typing import Callable, Optional, Tuple
+from uuid import UUID
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from omics_oracle_v2.auth.dependencies import get_optional_user
+from omics_oracle_v2.auth import crud
 from omics_oracle_v2.auth.quota import check_rate_limit, get_endpoint_cost
+from omics_oracle_v2.auth.rate_limiter import RateLimiter
+from omics_oracle_v2.auth.security import decode_access_token, verify_api_key
 from omics_oracle_v2.core.config import Settings
+from omics_oracle_v2.database import get_db
 
 logger = logging.getLogger(__name__)
 
+# (user_id, tier)
+Identity = Tuple[Optional[UUID], str]
+ANONYMOUS: Identity = (None, "anonymous")
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -26,16 +39,18 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     X-RateLimit-* headers to all responses.
     """
 
-    def __init__(self, app, settings: Settings | None = None):
+    def __init__(self, app, settings: Settings | None = None, limiter: RateLimiter | None = None):
         """
         Initialize rate limit middleware.
 
         Args:
             app: FastAPI application
             settings: Application settings (optional)
+            limiter: Rate limiter (optional, created from settings)
         """
         super().__init__(app)
         self.settings = settings or Settings()
+        self.limiter = limiter or RateLimiter(self.settings)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -52,20 +67,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         if not self.settings.rate_limit.enabled:
             return await call_next(request)
 
-        # Get client IP
-        client_ip = request.client.host if request.client else None
-
-        # Try to get authenticated user
-        try:
-            user = await get_optional_user(request)
-            user_id = user.id if user else None
-            tier = user.tier if user else "anonymous"
-        except Exception as e:
-            # If we can't determine user, treat as anonymous
-            logger.debug(f"Could not determine user from request: {e}")
-            user_id = None
-            tier = "anonymous"
-
         # Get endpoint cost multiplier
         cost = get_endpoint_cost(request.url.path, request.method)
 
@@ -74,12 +75,19 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             return response
 
-        # Check rate limit (hourly)
+        # Get client IP
+        client_ip = request.client.host if request.client else None
+
+        # Try to get authenticated user (cached per credential)
+        user_id, tier = await self._resolve_identity(request)
+
+        # Check rate limit (hourly and daily, one atomic check)
         rate_info = await check_rate_limit(
             user_id=user_id,
             ip_address=client_ip,
             tier=tier,
-            window="hour",
+            cost=cost,
+            limiter=self.limiter,
         )
 
         # If quota exceeded, return 429
@@ -92,7 +100,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 status_code=429,
                 content={
                     "error": "Rate limit exceeded",
-                    "message": f"You have exceeded your quota of {rate_info.limit} requests per hour. "
+                    "message": f"You have exceeded your quota of {rate_info.limit} requests per {rate_info.window}. "
                     f"Please try again in {rate_info.retry_after} seconds.",
                     "limit": rate_info.limit,
                     "retry_after": rate_info.retry_after,
@@ -110,7 +118,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         # Add rate limit headers to response
         response.headers["X-RateLimit-Limit"] = str(rate_info.limit)
-        response.headers["X-RateLimit-Remaining"] = str(rate_info.remaining - 1)  # -1 for current request
+        response.headers["X-RateLimit-Remaining"] = str(rate_info.remaining)  # Already excludes this request
         response.headers["X-RateLimit-Reset"] = str(rate_info.reset_at)
 
         # Add tier info for debugging (optional)
@@ -119,6 +127,82 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         return response
 
+    async def _resolve_identity(self, request: Request) -> Identity:
+        """
+        Resolve (user_id, tier) from the Bearer token or X-API-Key header.
+
+        Lookups (including invalid credentials) are cached for a short TTL;
+        lookup errors fall back to anonymous without caching.
+        """
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() == "bearer ":
+            kind, credential = "jwt", authorization[7:].strip()
+        elif request.headers.get("x-api-key"):
+            kind, credential = "api_key", request.headers["x-api-key"]
+        else:
+            return ANONYMOUS
+
+        cache = self.limiter.identities
+        found, identity = cache.get(f"{kind}:{credential}")
+        if found:
+            return identity
+
+        try:
+            identity, ttl = await self._lookup_identity(request, kind, credential)
+        except Exception as e:
+            # If we can't determine user, treat as anonymous
+            logger.debug(f"Could not determine user from request: {e}")
+            return ANONYMOUS
+
+        cache.set(f"{kind}:{credential}", identity, ttl)
+        return identity
+
+    async def _lookup_identity(self, request: Request, kind: str, credential: str) -> Tuple[Identity, Optional[float]]:
+        """
+        Look up the user behind a credential (read-only, no usage updates).
+
+        Returns:
+            (identity, ttl) - ttl caps caching at the token's expiry (None = default)
+        """
+        if kind == "jwt":
+            payload = decode_access_token(credential)
+            if not payload or not payload.get("sub"):
+                return ANONYMOUS, None
+            try:
+                user_id = UUID(payload["sub"])
+            except (ValueError, TypeError):
+                return ANONYMOUS, None
+            ttl = payload["exp"] - time.time() if payload.get("exp") else None
+
+            async with self._db_session(request) as db:
+                user = await crud.get_user_by_id(db, user_id)
+        else:
+            if not credential.startswith("omics_"):
+                return ANONYMOUS, None
+            ttl = None
+
+            async with self._db_session(request) as db:
+                api_key = await crud.get_api_key_by_prefix(db, credential[:12])
+                if not api_key or not api_key.is_active or not verify_api_key(credential, api_key.key_hash):
+                    return ANONYMOUS, None
+                user = await crud.get_user_by_id(db, api_key.user_id)
+
+        if not user or not user.is_active:
+            return ANONYMOUS, ttl
+        return (user.id, user.tier), ttl
+
+    @staticmethod
+    @asynccontextmanager
+    async def _db_session(request: Request):
+        """Database session from get_db (honors app.dependency_overrides)."""
+        app = request.scope.get("app")
+        overrides = getattr(app, "dependency_overrides", {})
+        sessions = overrides.get(get_db, get_db)()
+        try:
+            yield await sessions.__anext__()
+        finally:
+            await sessions.aclose()
+
 
 def create_rate_limit_middleware(settings: Settings | None = None) -> RateLimitMiddleware:
     """
@@ -0,0 +1,408 @@
+"""
+Token-budget context packing for AI analysis.
+
+Builds the dataset section of the analysis prompt to an exact token budget:
+- Papers' parsed content is loaded concurrently
+- Sections are split into paragraph passages and counted with the model's
+  tokenizer (tiktoken; a conservative estimate if it is not installed)
+- Passages are ranked by BM25 against the query (and, at lower weight, the
+  dataset's title and GEO summary)
+- The best passages are packed greedily until the budget is used; every
+  dataset keeps its header (ID, title, organism, GEO summary)
+
+Usage:
+    tokenizer = Tokenizer.for_model("gpt-4")
+    builder = ContextBuilder(tokenizer)
+    summaries, papers_used, tokens = builder.pack(datasets, papers, query, budget=6000)
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Optional tokenizer dependency
+try:
+    import tiktoken
+
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+    tiktoken = None  # type: ignore
+
+# Context windows (tokens) by model prefix; longest prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4-1106": 128000,
+    "gpt-4-0125": 128000,
+    "gpt-4-32k": 32768,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Paper sections in prompt order, with a small prior for analysis value
+SECTION_ORDER = ("abstract", "methods", "results", "discussion", "full_text")
+SECTION_PRIOR = {"methods": 1.2, "results": 1.2, "discussion": 1.0, "abstract": 0.9, "full_text": 1.0}
+SECTION_LABELS = {
+    "abstract": "Abstract",
+    "methods": "Methods",
+    "results": "Results",
+    "discussion": "Discussion",
+    "full_text": "Text",
+}
+
+# Section headings in raw full text (a line on its own, optionally numbered)
+_HEADING_RE = re.compile(
+    r"^\s*(?:\d+\.?\s*)?(abstract|introduction|background|"
+    r"(?:materials\s+and\s+)?methods|methodology|experimental\s+procedures|"
+    r"results(?:\s+and\s+discussion)?|discussion|conclusions?|references)\s*:?\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+_HEADING_SECTIONS = {
+    "abstract": "abstract",
+    "introduction": "abstract",
+    "background": "abstract",
+    "methods": "methods",
+    "materials and methods": "methods",
+    "methodology": "methods",
+    "experimental procedures": "methods",
+    "results": "results",
+    "results and discussion": "results",
+    "discussion": "discussion",
+    "conclusion": "discussion",
+    "conclusions": "discussion",
+}
+
+_TERM_RE = re.compile(r"[a-z0-9][a-z0-9\-]+")
+_STOPWORDS = frozenset(
+    "the and for with from that this were was are been have has had not but can which "
+    "these those their into using used also than then there such our its all any".split()
+)
+
+
+class Tokenizer:
+    """Token counter for one model."""
+
+    def __init__(self, encoding=None):
+        self._encoding = encoding
+
+    @classmethod
+    def for_model(cls, model: str) -> "Tokenizer":
+        """Get the tokenizer for a model (cached)."""
+        return _tokenizer_for_model(model)
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts come from the model's real tokenizer."""
+        return self._encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        # Conservative estimate: never below word/punctuation pieces or chars/3.5
+        return max(len(re.findall(r"\w+|[^\w\s]", text)), math.ceil(len(text) / 3.5))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut text to at most max_tokens tokens."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self._encoding is not None:
+            return self._encoding.decode(self._encoding.encode(text, disallowed_special=())[:max_tokens])
+        # Binary search on the character length for the estimate
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.count(text[:mid]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low]
+
+
+@lru_cache(maxsize=16)
+def _tokenizer_for_model(model: str) -> Tokenizer:
+    if not HAS_TIKTOKEN:
+        logger.warning("tiktoken not installed - using conservative token estimates")
+        return Tokenizer()
+    try:
+        return Tokenizer(tiktoken.encoding_for_model(model))
+    except KeyError:
+        return Tokenizer(tiktoken.get_encoding("cl100k_base"))
+    except Exception as e:
+        logger.warning(f"Failed to load tokenizer for {model}: {e} - using estimates")
+        return Tokenizer()
+
+
+def context_window(model: str) -> int:
+    """Context window (tokens) for a model."""
+    model = model.lower()
+    for prefix in sorted(MODEL_CONTEXT_WINDOWS, key=len, reverse=True):
+        if model.startswith(prefix):
+            return MODEL_CONTEXT_WINDOWS[prefix]
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def split_sections(full_text: str) -> Dict[str, str]:
+    """
+    Split raw full text into sections at recognizable headings.
+
+    Text before the first heading counts as abstract; references are dropped.
+    Returns {"full_text": text} if no headings are found.
+    """
+    matches = list(_HEADING_RE.finditer(full_text or ""))
+    if not matches:
+        return {"full_text": full_text} if full_text else {}
+
+    sections: Dict[str, List[str]] = {}
+    preamble = full_text[: matches[0].start()].strip()
+    if preamble:
+        sections.setdefault("abstract", []).append(preamble)
+    for i, match in enumerate(matches):
+        heading = " ".join(match.group(1).lower().split())
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(full_text)
+        body = full_text[match.end() : end].strip()
+        section = _HEADING_SECTIONS.get(heading)
+        if section and body:
+            sections.setdefault(section, []).append(body)
+    return {name: "\n\n".join(parts) for name, parts in sections.items()}
+
+
+@dataclass
+class PaperContent:
+    """Loaded content of one linked paper."""
+
+    pmid: Optional[str]
+    title: str
+    sections: Dict[str, str]
+
+
+@dataclass
+class Passage:
+    """A rankable piece of one paper section."""
+
+    dataset_index: int
+    paper_index: int
+    section: str
+    order: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+@dataclass
+class _DatasetBlock:
+    header: str
+    papers: List[PaperContent]
+    total_papers: int
+    passages: List[Passage] = field(default_factory=list)
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in _TERM_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class ContextBuilder:
+    """
+    Packs dataset headers and ranked paper passages into a token budget.
+
+    Args:
+        tokenizer: Token counter for the target model
+        passage_tokens: Target passage size; paragraphs are merged up to it
+            and longer ones are split
+        summary_tokens: Token cap for each dataset's GEO summary in its header
+    """
+
+    def __init__(self, tokenizer: Tokenizer, passage_tokens: int = 160, summary_tokens: int = 120):
+        self.tokenizer = tokenizer
+        self.passage_tokens = passage_tokens
+        self.summary_tokens = summary_tokens
+
+    def passages(self, text: str) -> List[str]:
+        """Split text into paragraph passages of about passage_tokens tokens."""
+        paragraphs = [" ".join(p.split()) for p in re.split(r"\n\s*\n", text or "")]
+        passages, current = [], ""
+        for paragraph in filter(None, paragraphs):
+            candidate = f"{current} {paragraph}".strip()
+            if current and self.tokenizer.count(candidate) > self.passage_tokens:
+                passages.append(current)
+                current = paragraph
+            else:
+                current = candidate
+            # Split an oversized paragraph at sentence boundaries
+            while self.tokenizer.count(current) > self.passage_tokens * 2:
+                head = self.tokenizer.truncate(current, self.passage_tokens)
+                cut = max(head.rfind(". "), len(head) // 2)
+                passages.append(current[: cut + 1].strip())
+                current = current[cut + 1 :].strip()
+        if current:
+            passages.append(current)
+        return passages
+
+    def dataset_header(self, index: int, dataset) -> str:
+        summary = self.tokenizer.truncate(" ".join((dataset.summary or "").split()), self.summary_tokens)
+        if summary and len(summary) < len(" ".join((dataset.summary or "").split())):
+            summary += "..."
+        return "\n".join(
+            [
+                f"{index}. **{dataset.geo_id}** (Relevance: {int(dataset.relevance_score * 100)}%)",
+                f"   Title: {dataset.title}",
+                f"   Organism: {dataset.organism or 'N/A'}, Samples: {dataset.sample_count or 0}",
+                f"   GEO Summary: {summary or 'No summary'}",
+            ]
+        )
+
+    def pack(
+        self,
+        datasets: Sequence,
+        papers: Sequence[Sequence[PaperContent]],
+        query: str,
+        budget: int,
+        total_papers: Optional[Sequence[int]] = None,
+    ) -> Tuple[List[str], int, int]:
+        """
+        Build one prompt block per dataset within a token budget.
+
+        Args:
+            datasets: Datasets (with geo_id, title, summary, ...)
+            papers: Loaded candidate papers per dataset, in priority order
+            query: User query (primary relevance signal)
+            budget: Token budget for all blocks together
+            total_papers: Linked paper count per dataset (for the header note)
+
+        Returns:
+            Tuple of (dataset_summaries, papers_with_passages, tokens_used)
+        """
+        blocks = []
+        for i, (dataset, dataset_papers) in enumerate(zip(datasets, papers)):
+            block = _DatasetBlock(
+                header=self.dataset_header(i + 1, dataset),
+                papers=list(dataset_papers),
+                total_papers=total_papers[i] if total_papers else len(dataset_papers),
+            )
+            for p, paper in enumerate(block.papers):
+                for section in SECTION_ORDER:
+                    for order, text in enumerate(self.passages(paper.sections.get(section, ""))):
+                        block.passages.append(Passage(i, p, section, order, text, self.tokenizer.count(text)))
+            blocks.append(block)
+
+        self._score(blocks, query)
+
+        # Headers are always included (the separator between blocks is one newline pair)
+        used = sum(self.tokenizer.count(block.header) + 2 for block in blocks)
+        if used > budget:
+            logger.warning(f"[CONTEXT] Dataset headers alone use {used} tokens (budget {budget})")
+
+        candidates = sorted(
+            (passage for block in blocks for passage in block.passages),
+            key=lambda passage: passage.score,
+            reverse=True,
+        )
+        selected: Dict[int, List[Passage]] = {}
+        paper_headers = set()
+        for passage in candidates:
+            if passage.score <= 0:
+                break
+            cost = passage.tokens + 4  # "   [Section] " prefix and newline
+            paper_key = (passage.dataset_index, passage.paper_index)
+            if paper_key not in paper_headers:
+                cost += self.tokenizer.count(self._paper_line(blocks[passage.dataset_index].papers[passage.paper_index]))
+            if passage.dataset_index not in selected:
+                cost += 24  # full-text intro line
+            if used + cost > budget:
+                continue
+            used += cost
+            paper_headers.add(paper_key)
+            selected.setdefault(passage.dataset_index, []).append(passage)
+
+        summaries = [self._render(i, block, selected.get(i, [])) for i, block in enumerate(blocks)]
+        tokens = self.tokenizer.count("\n\n".join(summaries))
+        logger.info(
+            f"[CONTEXT] Packed {sum(len(s) for s in selected.values())} of {len(candidates)} passages "
+            f"into {tokens}/{budget} tokens ({'exact' if self.tokenizer.exact else 'estimated'})"
+        )
+        return summaries, len(paper_headers), tokens
+
+    def _score(self, blocks: List[_DatasetBlock], query: str) -> None:
+        """BM25 score of each passage for the query plus the dataset's title/summary."""
+        passages = [passage for block in blocks for passage in block.passages]
+        if not passages:
+            return
+        passage_terms = [Counter(_terms(p.text)) for p in passages]
+        document_frequency = Counter(term for terms in passage_terms for term in terms)
+        n = len(passages)
+        average_length = sum(sum(t.values()) for t in passage_terms) / n or 1.0
+        query_weights = Counter(_terms(query))
+
+        k1, b = 1.2, 0.75
+        for passage, terms in zip(passages, passage_terms):
+            dataset = blocks[passage.dataset_index]
+            weights = dict.fromkeys(_terms(dataset.header), 0.3)
+            weights.update({term: 1.0 + count for term, count in query_weights.items()})
+            length = sum(terms.values())
+            score = 0.0
+            for term, weight in weights.items():
+                frequency = terms.get(term)
+                if not frequency:
+                    continue
+                idf = math.log(1 + (n - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+                score += weight * idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * length / average_length))
+            # Section prior, and a mild preference for earlier (prioritized) papers
+            passage.score = score * SECTION_PRIOR.get(passage.section, 1.0) / (1 + 0.05 * passage.paper_index)
+
+    @staticmethod
+    def _paper_line(paper: PaperContent) -> str:
+        return f"\n   Paper: {(paper.title or 'Unknown')[:150]} (PMID: {paper.pmid})"
+
+    def _render(self, index: int, block: _DatasetBlock, passages: List[Passage]) -> str:
+        lines = [block.header]
+        if not block.papers:
+            lines.append("   [WARNING] No full-text available (analyzing GEO summary only)")
+            return "\n".join(lines)
+
+        paper_indexes = sorted({passage.paper_index for passage in passages})
+        lines.append(
+            f"\n   [DOC] Most relevant full-text passages from {len(paper_indexes)} of "
+            f"{block.total_papers} linked publication(s):"
+        )
+        section_rank = {name: i for i, name in enumerate(SECTION_ORDER)}
+        for paper_index in paper_indexes:
+            lines.append(self._paper_line(block.papers[paper_index]))
+            for passage in sorted(
+                (p for p in passages if p.paper_index == paper_index),
+                key=lambda p: (section_rank[p.section], p.order),
+            ):
+                lines.append(f"   [{SECTION_LABELS[passage.section]}] {passage.text}")
+        if not passages:
+            lines.append("   (No passages fit the token budget)")
+        return "\n".join(lines)
+
+
+def paper_sections(paper: Dict[str, Any]) -> Dict[str, str]:
+    """Named sections of a paper dict; raw full text is split at its headings."""
+    sections = {name: paper.get(name) for name in SECTION_ORDER[:-1] if paper.get(name)}
+    if not sections and paper.get("full_text"):
+        sections = split_sections(paper["full_text"])
+    return sections
+
+
+# Export public API
+__all__ = [
+    "ContextBuilder",
+    "PaperContent",
+    "Passage",
+    "Tokenizer",
+    "context_window",
+    "paper_sections",
+    "split_sections",
+]
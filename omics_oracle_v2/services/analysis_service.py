@@ -5,12 +5,18 @@ Business logic for AI-powered dataset analysis using LLMs.
 Extracted from api/routes/agents.py to improve separation of concerns.
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Tuple
 
 from omics_oracle_v2.core.config import Settings
+from omics_oracle_v2.core.exceptions import AIError
+from omics_oracle_v2.services.analysis_context import (ContextBuilder,
+                                                       PaperContent, Tokenizer,
+                                                       context_window,
+                                                       paper_sections)
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
@@ -19,6 +25,28 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_SYSTEM_MESSAGE = (
+    "You are an expert bioinformatics advisor helping researchers understand and select genomics datasets. "
+    "You use step-by-step reasoning to analyze datasets based on:\n"
+    "1. Query context (extracted entities, search intent)\n"
+    "2. Match explanations (why each dataset was retrieved)\n"
+    "3. Full-text content (experimental methods, results, discussion)\n"
+    "4. Dataset metadata (organism, samples, platform)\n\n"
+    "Provide clear, actionable insights that reference specific evidence from the query analysis "
+    "and dataset content. Be specific about WHY datasets are relevant and HOW they differ."
+)
+
+# Chat message framing overhead (role markers etc.), in tokens
+CHAT_FORMAT_TOKENS = 16
+
+# Analysis stream event types (see AnalysisService.analyze_datasets_stream)
+ANALYSIS_TOKEN = "token"
+ANALYSIS_COMPLETE = "complete"
+
+
+def _analysis_event(event: str, event_id: str, data: Any) -> Dict[str, Any]:
+    return {"event": event, "id": event_id, "data": data}
+
 
 class AnalysisService:
     """Service for AI-powered dataset analysis."""
@@ -35,6 +63,8 @@ class AnalysisService:
         """
         Generate AI analysis of datasets using LLM.
 
+        Collects analyze_datasets_stream() and returns its final response.
+
         Args:
             request: Analysis request with datasets and query
             settings: Application settings with AI configuration
@@ -42,6 +72,33 @@ class AnalysisService:
         Returns:
             AIAnalysisResponse with analysis and insights
 
+        Raises:
+            HTTPException: If OpenAI not configured or analysis fails
+        """
+        async for event in self.analyze_datasets_stream(request, settings):
+            if event["event"] == ANALYSIS_COMPLETE:
+                return event["data"]
+        raise RuntimeError("Analysis stream ended without a response")
+
+    async def analyze_datasets_stream(
+        self,
+        request: "AIAnalysisRequest",
+        settings: Settings,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate AI analysis of datasets, yielding LLM tokens as they arrive.
+
+        Each event is {"event": type, "id": id, "data": payload}:
+        - token: next chunk of analysis text (id = chunk number)
+        - complete: the full AIAnalysisResponse (same as analyze_datasets())
+
+        Args:
+            request: Analysis request with datasets and query
+            settings: Application settings with AI configuration
+
+        Yields:
+            Event dictionaries; the last one is always "complete"
+
         Raises:
             HTTPException: If OpenAI not configured or analysis fails
         """
@@ -49,8 +106,8 @@ class AnalysisService:
 
         start_time = time.time()
 
-        # Check OpenAI configuration
-        if not settings.ai.openai_api_key:
+        # Check OpenAI configuration (the stub provider runs offline)
+        if settings.ai.provider == "openai" and not settings.ai.openai_api_key:
             raise HTTPException(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="AI analysis unavailable: OpenAI API key not configured. "
@@ -77,13 +134,45 @@ class AnalysisService:
         ) = self._check_content_availability(datasets_to_analyze)
 
         if not has_content:
-            return self._build_no_content_response(
-                request, start_time, total_fulltext, total_with_content
+            yield _analysis_event(
+                ANALYSIS_COMPLETE,
+                "complete",
+                self._build_no_content_response(
+                    request, start_time, total_fulltext, total_with_content
+                ),
+            )
+            return
+
+        # Token budget: context window minus the output reservation, capped by
+        # max_prompt_tokens, minus the fixed prompt text around the datasets
+        tokenizer = Tokenizer.for_model(settings.ai.model)
+        window = context_window(settings.ai.model)
+        max_output_tokens = min(settings.ai.max_tokens, window // 4)
+        prompt_overhead = (
+            tokenizer.count(ANALYSIS_SYSTEM_MESSAGE)
+            + tokenizer.count(
+                self._build_analysis_prompt(
+                    request=request,
+                    datasets_to_analyze=datasets_to_analyze,
+                    dataset_summaries=[],
+                    total_fulltext_papers=1,
+                )
             )
+            + CHAT_FORMAT_TOKENS
+        )
+        context_budget = (
+            min(window - max_output_tokens, settings.ai.max_prompt_tokens)
+            - prompt_overhead
+        )
 
-        # Build dataset summaries with full-text
+        # Build dataset summaries with the most relevant full-text passages
         dataset_summaries, total_fulltext_papers = await self._build_dataset_summaries(
-            datasets_to_analyze, parsed_cache, request.max_papers_per_dataset
+            datasets_to_analyze,
+            parsed_cache,
+            request.query,
+            context_budget,
+            tokenizer,
+            request.max_papers_per_dataset,
         )
 
         # Build comprehensive analysis prompt
@@ -94,8 +183,14 @@ class AnalysisService:
             total_fulltext_papers=total_fulltext_papers,
         )
 
-        # Call LLM
-        analysis = await self._call_llm(analysis_prompt, settings)
+        # Call LLM, streaming tokens
+        chunks = []
+        async for chunk in self._stream_llm(
+            analysis_prompt, settings, max_output_tokens, tokenizer.count(analysis_prompt)
+        ):
+            yield _analysis_event(ANALYSIS_TOKEN, str(len(chunks)), {"text": chunk})
+            chunks.append(chunk)
+        analysis = "".join(chunks).strip()
 
         # Parse insights and recommendations
         insights, recommendations = self._parse_analysis_results(analysis)
@@ -105,15 +200,21 @@ class AnalysisService:
         # Import at runtime to avoid circular dependency
         from omics_oracle_v2.api.routes.agents import AIAnalysisResponse
 
-        return AIAnalysisResponse(
-            success=True,
-            execution_time_ms=execution_time_ms,
-            timestamp=datetime.now(timezone.utc),
-            query=request.query,
-            analysis=analysis,
-            insights=insights[:5] if insights else [],
-            recommendations=recommendations[:5] if recommendations else [],
-            model_used=settings.ai.model,
+        yield _analysis_event(
+            ANALYSIS_COMPLETE,
+            "complete",
+            AIAnalysisResponse(
+                success=True,
+                execution_time_ms=execution_time_ms,
+                timestamp=datetime.now(timezone.utc),
+                query=request.query,
+                analysis=analysis,
+                insights=insights[:5] if insights else [],
+                recommendations=recommendations[:5] if recommendations else [],
+                model_used=settings.ai.model
+                if settings.ai.provider == "openai"
+                else f"{settings.ai.model} ({settings.ai.provider})",
+            ),
         )
 
     async def _enrich_datasets_with_fulltext(self, datasets: List) -> None:
@@ -189,34 +290,15 @@ class AnalysisService:
                             "year": paper_info.publication_year if paper_info else None,
                         }
 
-                        # Distribute full_text into sections for AI Analysis
-                        # Simple heuristic: beginning, middle, end
-                        text_len = len(full_text)
-                        if text_len > 0:
-                            # First 30% for abstract/intro
-                            fulltext_obj["abstract"] = full_text[
-                                : min(5000, text_len // 3)
-                            ]
-                            # Middle 30% for methods
-                            mid_start = text_len // 3
-                            fulltext_obj["methods"] = full_text[
-                                mid_start : mid_start + min(5000, text_len // 3)
-                            ]
-                            # Next 20% for results
-                            results_start = (text_len * 2) // 3
-                            fulltext_obj["results"] = full_text[
-                                results_start : results_start + min(5000, text_len // 5)
-                            ]
-                            # Last 20% for discussion
-                            fulltext_obj["discussion"] = full_text[
-                                -min(5000, text_len // 5) :
-                            ]
-
+                        # Split full_text at its section headings for AI Analysis
+                        if full_text:
+                            sections = paper_sections({"full_text": full_text})
+                            fulltext_obj.update(sections)
                             fulltext_obj["full_text"] = full_text
                             fulltext_obj["char_count"] = content.char_count
                             fulltext_obj["page_count"] = content.page_count
-                            fulltext_obj["has_methods"] = True
-                            fulltext_obj["has_results"] = True
+                            fulltext_obj["has_methods"] = "methods" in sections
+                            fulltext_obj["has_results"] = "results" in sections
                             fulltext_obj[
                                 "extraction_method"
                             ] = content.extraction_method
@@ -267,12 +349,18 @@ class AnalysisService:
                         if isinstance(ft, dict)
                         else getattr(ft, "abstract", None)
                     )
+                    full_text = (
+                        ft.get("full_text")
+                        if isinstance(ft, dict)
+                        else getattr(ft, "full_text", None)
+                    )
 
                     has_content = any(
                         [
                             methods and len(methods) > 100,
                             results and len(results) > 100,
                             abstract and len(abstract) > 50,
+                            full_text and len(full_text) > 100,
                         ]
                     )
                     if has_content:
@@ -342,154 +430,104 @@ class AnalysisService:
         )
 
     async def _build_dataset_summaries(
-        self, datasets: List, parsed_cache, max_papers_per_dataset: int = 10
+        self,
+        datasets: List,
+        parsed_cache,
+        query: str,
+        token_budget: int,
+        tokenizer: Tokenizer,
+        max_papers_per_dataset: int = 10,
     ) -> Tuple[List[str], int]:
         """
-        Build comprehensive dataset summaries with full-text content.
+        Build dataset summaries packed with the most relevant full-text passages.
+
+        All candidate papers are loaded concurrently, then ContextBuilder ranks
+        their passages against the query and packs them into token_budget.
 
         Returns:
             Tuple of (dataset_summaries, total_fulltext_papers)
         """
-        dataset_summaries = []
-        total_fulltext_papers = 0
-
-        for i, ds in enumerate(datasets, 1):
-            dataset_info = [
-                f"{i}. **{ds.geo_id}** (Relevance: {int(ds.relevance_score * 100)}%)",
-                f"   Title: {ds.title}",
-                f"   Organism: {ds.organism or 'N/A'}, Samples: {ds.sample_count or 0}",
-                f"   GEO Summary: {ds.summary[:200] if ds.summary else 'No summary'}...",
+        candidates = [
+            self._prioritize_papers(ds)[:max_papers_per_dataset] if ds.fulltext else []
+            for ds in datasets
+        ]
+        loaded = await asyncio.gather(
+            *[
+                self._load_paper_content(paper, parsed_cache)
+                for papers in candidates
+                for paper in papers
             ]
+        )
 
-            # Add full-text content if available
-            if ds.fulltext and len(ds.fulltext) > 0:
-                # Prioritize papers for analysis
-                sorted_papers = sorted(
-                    ds.fulltext,
-                    key=lambda p: (
-                        0
-                        if (
-                            hasattr(ds, "pubmed_ids")
-                            and (p.get("pmid") if isinstance(p, dict) else p.pmid)
-                            in (ds.pubmed_ids or [])
-                        )
-                        else 1,
-                        0
-                        if (
-                            p.get("has_methods")
-                            if isinstance(p, dict)
-                            else getattr(p, "has_methods", False)
-                        )
-                        else 1,
-                        -int(p.get("pmid") if isinstance(p, dict) else p.pmid)
-                        if (p.get("pmid") if isinstance(p, dict) else p.pmid)
-                        and str(
-                            p.get("pmid") if isinstance(p, dict) else p.pmid
-                        ).isdigit()
-                        else 0,
-                    ),
-                )
-
-                papers_to_analyze = sorted_papers[:max_papers_per_dataset]
-                total_papers = len(ds.fulltext)
-
-                dataset_info.append(
-                    f"\n   [DOC] Full-text content from {len(papers_to_analyze)} of {total_papers} linked publication(s):"
-                )
-                if total_papers > max_papers_per_dataset:
-                    dataset_info.append(
-                        f"   [INFO] Analyzing {len(papers_to_analyze)} of {total_papers} papers (max={max_papers_per_dataset}, token limit). "
-                        f"Prioritized: original dataset papers, papers with parsed content."
-                    )
-                total_fulltext_papers += len(papers_to_analyze)
-
-                for j, ft in enumerate(papers_to_analyze, 1):
-                    # Load content from cache if not in object
-                    (
-                        abstract_text,
-                        methods_text,
-                        results_text,
-                        discussion_text,
-                    ) = await self._load_paper_content(ft, parsed_cache)
-
-                    # Handle both dict and object types
-                    pmid = ft.get("pmid") if isinstance(ft, dict) else ft.pmid
-                    title = (
-                        ft.get("title", "Unknown")
-                        if isinstance(ft, dict)
-                        else getattr(ft, "title", "Unknown")
-                    )
-                    # Ensure title is never None
-                    title = title or "Unknown"
+        papers_by_dataset = []
+        position = 0
+        for papers in candidates:
+            papers_by_dataset.append(list(loaded[position : position + len(papers)]))
+            position += len(papers)
+
+        dataset_summaries, total_fulltext_papers, tokens = ContextBuilder(tokenizer).pack(
+            datasets,
+            papers_by_dataset,
+            query,
+            budget=token_budget,
+            total_papers=[len(ds.fulltext or []) for ds in datasets],
+        )
+        self.logger.info(
+            f"[ANALYZE] Context: {tokens}/{token_budget} tokens from "
+            f"{total_fulltext_papers} of {sum(map(len, candidates))} candidate papers"
+        )
+        return dataset_summaries, total_fulltext_papers
 
-                    dataset_info.extend(
-                        [
-                            f"\n   Paper {j}: {title[:100]}... (PMID: {pmid})",
-                            f"   Abstract: {abstract_text[:250] if abstract_text else 'N/A'}...",
-                            f"   Methods: {methods_text[:400] if methods_text else 'N/A'}...",
-                            f"   Results: {results_text[:400] if results_text else 'N/A'}...",
-                            f"   Discussion: {discussion_text[:250] if discussion_text else 'N/A'}...",
-                        ]
-                    )
-            else:
-                dataset_info.append(
-                    "   [WARNING] No full-text available (analyzing GEO summary only)"
+    @staticmethod
+    def _prioritize_papers(ds) -> List:
+        """Order a dataset's papers: original dataset papers, parsed content, newest PMID."""
+
+        def pmid_of(p):
+            return p.get("pmid") if isinstance(p, dict) else p.pmid
+
+        return sorted(
+            ds.fulltext,
+            key=lambda p: (
+                0 if pmid_of(p) in (ds.pubmed_ids or []) else 1,
+                0
+                if (
+                    p.get("has_methods")
+                    if isinstance(p, dict)
+                    else getattr(p, "has_methods", False)
                 )
+                else 1,
+                -int(pmid_of(p)) if pmid_of(p) and str(pmid_of(p)).isdigit() else 0,
+            ),
+        )
 
-            dataset_summaries.append("\n".join(dataset_info))
-
-        return dataset_summaries, total_fulltext_papers
-
-    async def _load_paper_content(
-        self, paper, parsed_cache
-    ) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    async def _load_paper_content(self, paper, parsed_cache) -> PaperContent:
         """Load paper content from object or cache."""
         # Handle both dict and object types
         if isinstance(paper, dict):
-            abstract_text = paper.get("abstract")
-            methods_text = paper.get("methods")
-            results_text = paper.get("results")
-            discussion_text = paper.get("discussion")
-            pmid = paper.get("pmid")
+            data = paper
         else:
-            abstract_text = (
-                paper.abstract
-                if hasattr(paper, "abstract") and paper.abstract
-                else None
-            )
-            methods_text = (
-                paper.methods if hasattr(paper, "methods") and paper.methods else None
-            )
-            results_text = (
-                paper.results if hasattr(paper, "results") and paper.results else None
-            )
-            discussion_text = (
-                paper.discussion
-                if hasattr(paper, "discussion") and paper.discussion
-                else None
-            )
-            pmid = paper.pmid if hasattr(paper, "pmid") else None
+            data = {
+                name: getattr(paper, name, None)
+                for name in ("pmid", "title", "abstract", "methods", "results", "discussion", "full_text")
+            }
+        pmid = data.get("pmid")
+        sections = paper_sections(data)
 
         # Load from cache if not in object
-        if not any([abstract_text, methods_text, results_text, discussion_text]):
-            if pmid:
-                try:
-                    cached_data = await parsed_cache.get(pmid)
-                    if cached_data:
-                        content_data = cached_data.get("content", {})
-                        abstract_text = content_data.get("abstract", "")
-                        methods_text = content_data.get("methods", "")
-                        results_text = content_data.get("results", "")
-                        discussion_text = content_data.get("discussion", "")
-                        self.logger.info(
-                            f"[ANALYZE] Loaded parsed content from cache for PMID {pmid}"
-                        )
-                except Exception as e:
-                    self.logger.warning(
-                        f"[ANALYZE] Could not load parsed content for PMID {pmid}: {e}"
+        if not sections and pmid:
+            try:
+                cached_data = await parsed_cache.get(pmid)
+                if cached_data:
+                    sections = paper_sections(cached_data.get("content", {}))
+                    self.logger.info(
+                        f"[ANALYZE] Loaded parsed content from cache for PMID {pmid}"
                     )
+            except Exception as e:
+                self.logger.warning(
+                    f"[ANALYZE] Could not load parsed content for PMID {pmid}: {e}"
+                )
 
-        return abstract_text, methods_text, results_text, discussion_text
+        return PaperContent(pmid=pmid, title=data.get("title") or "Unknown", sections=sections)
 
     def _build_analysis_prompt(
         self,
@@ -586,85 +624,52 @@ Be specific. Cite dataset IDs (GSE numbers){" and PMIDs" if total_fulltext_paper
 {"Reference the entities and terms from the query context when explaining relevance." if request.query_processing else ""}
 """
 
-    async def _call_llm(self, prompt: str, settings) -> str:
-        """Call LLM with analysis prompt."""
+    async def _stream_llm(
+        self, prompt: str, settings, max_output_tokens: int, prompt_tokens: int
+    ) -> AsyncIterator[str]:
+        """Stream the LLM response to the analysis prompt through the shared gateway."""
         from fastapi import HTTPException, status
 
-        from omics_oracle_v2.api.helpers import call_openai
-
-        system_message = (
-            "You are an expert bioinformatics advisor helping researchers understand and select genomics datasets. "
-            "You use step-by-step reasoning to analyze datasets based on:\n"
-            "1. Query context (extracted entities, search intent)\n"
-            "2. Match explanations (why each dataset was retrieved)\n"
-            "3. Full-text content (experimental methods, results, discussion)\n"
-            "4. Dataset metadata (organism, samples, platform)\n\n"
-            "Provide clear, actionable insights that reference specific evidence from the query analysis "
-            "and dataset content. Be specific about WHY datasets are relevant and HOW they differ."
-        )
-
-        # Smart token allocation based on model and prompt length
-        # GPT-4 base: 8,192 total tokens
-        # GPT-4-turbo: 128,000 total tokens
-        # GPT-4o: 128,000 total tokens
-        model_name = settings.ai.model.lower()
-        if (
-            "turbo" in model_name
-            or "gpt-4o" in model_name
-            or "gpt-4-1106" in model_name
-        ):
-            # GPT-4 Turbo or GPT-4o: Use large context window
-            max_output_tokens = 4000
-        else:
-            # GPT-4 base: Conservative allocation to avoid context overflow
-            # Estimate: prompt is ~4-5K tokens, leave 3K for output
-            estimated_prompt_tokens = (
-                len(prompt) // 4
-            )  # Rough estimate: 1 token ~= 4 chars
-            max_output_tokens = max(
-                2000, 8000 - estimated_prompt_tokens - 200
-            )  # 200 buffer
-            if max_output_tokens > 3500:
-                max_output_tokens = 3500  # Cap at 3500 for safety
+        from omics_oracle_v2.api.helpers.llm_gateway import (
+            LLMBudgetExceeded, LLMRequest, get_llm_gateway)
 
         self.logger.info(
-            f"[ANALYZE] Using model={settings.ai.model}, "
-            f"max_output_tokens={max_output_tokens} "
-            f"(prompt_chars={len(prompt)}, est_tokens={len(prompt)//4})"
+            f"[ANALYZE] Using model={settings.ai.model}, provider={settings.ai.provider}, "
+            f"max_output_tokens={max_output_tokens}, prompt_tokens={prompt_tokens}"
         )
 
-        analysis = await call_openai(
+        llm_request = LLMRequest(
             prompt=prompt,
-            system_message=system_message,
-            api_key=settings.ai.openai_api_key,
+            system_message=ANALYSIS_SYSTEM_MESSAGE,
             model=settings.ai.model,
             max_tokens=max_output_tokens,
             temperature=settings.ai.temperature,
             timeout=settings.ai.timeout,
         )
 
-        if not analysis:
-            # Build helpful error message
+        try:
+            gateway = get_llm_gateway(settings.ai)
+            async for chunk in gateway.stream(llm_request):
+                yield chunk
+        except LLMBudgetExceeded as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"AI analysis unavailable: {e}",
+            )
+        except AIError as e:
+            self.logger.error(f"[ANALYZE] LLM call failed: {e}")
+
             error_detail = (
                 "AI analysis failed to generate response. "
-                f"Model: {settings.ai.model}, Max tokens: {max_output_tokens}. "
+                f"Model: {settings.ai.model}, Prompt tokens: {prompt_tokens}, "
+                f"Max tokens: {max_output_tokens}."
             )
 
-            # Check if it's likely a context length issue
-            if estimated_prompt_tokens > 6000:
-                error_detail += (
-                    "The prompt is very large. "
-                    "Try: (1) Reduce max_papers_per_dataset to 5, or "
-                    "(2) Set OMICS_AI_MODEL=gpt-4-turbo-preview for 128K context"
-                )
-
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=error_detail,
             )
 
-        return analysis
-
     def _parse_analysis_results(self, analysis: str) -> Tuple[List[str], List[str]]:
         """Parse insights and recommendations from analysis text."""
         insights = []
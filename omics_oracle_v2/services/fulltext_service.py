@@ -35,6 +35,7 @@ from omics_oracle_v2.lib.pipelines.text_enrichment import PDFExtractor
 from omics_oracle_v2.lib.pipelines.url_collection import (
     FullTextManager, FullTextManagerConfig)
 from omics_oracle_v2.lib.search_engines.citations.models import Publication
+from omics_oracle_v2.lib.utils.tracing import current_span, span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,7 @@ class FulltextService:
         """Initialize service with database."""
         self.db = UnifiedDatabase("data/database/omics_oracle.db")
 
+    @traced("fulltext.request")
     async def enrich_datasets(
         self,
         datasets: List[DatasetResponse],
@@ -82,6 +84,7 @@ class FulltextService:
             List of datasets with fulltext status and counts
         """
         start_time = time.time()
+        current_span().set(datasets=len(datasets), max_papers=max_papers)
 
         logger.info(f"[FULLTEXT] Starting enrichment for {len(datasets)} dataset(s)...")
 
@@ -107,6 +110,8 @@ class FulltextService:
                 download_pdfs=False,  # We handle downloads separately
                 unpaywall_email=os.getenv("UNPAYWALL_EMAIL", "research@omicsoracle.ai"),
                 core_api_key=os.getenv("CORE_API_KEY"),
+                # "hedged" starts each download on the first good URL
+                url_race_mode=os.getenv("FULLTEXT_URL_RACE_MODE", "all"),
             )
             fulltext_manager = FullTextManager(fulltext_config)
             await fulltext_manager.initialize()
@@ -163,6 +168,7 @@ class FulltextService:
                 except Exception as e:
                     logger.warning(f"[FULLTEXT] Cleanup error: {e}")
 
+    @traced("fulltext.dataset")
     async def _process_dataset(
         self,
         dataset: DatasetResponse,
@@ -179,6 +185,7 @@ class FulltextService:
             Enriched dataset with fulltext_status and fulltext_count
         """
         geo_id = dataset.geo_id
+        current_span().set(geo_id=geo_id)
         logger.info(f"[{geo_id}] Starting enrichment...")
 
         # Get PubMed IDs - FIRST check database for ALL citing papers
@@ -243,12 +250,22 @@ class FulltextService:
             return dataset
 
         # Step 2: Collect URLs using FullTextManager
-        url_results = await self._collect_urls(geo_id, publications, fulltext_manager)
+        # (hedged mode collects per publication, overlapped with its download)
+        hedged = fulltext_manager.config.url_race_mode == "hedged"
+        if hedged:
+            url_results = {}
+        else:
+            url_results = await self._collect_urls(geo_id, publications, fulltext_manager)
 
         # Step 3: Download PDFs with fallback
         output_dir = Path("data/pdfs") / geo_id
         download_results = await self._download_pdfs(
-            geo_id, publications, url_results, pdf_downloader, output_dir
+            geo_id,
+            publications,
+            url_results,
+            pdf_downloader,
+            output_dir,
+            hedge_manager=fulltext_manager if hedged else None,
         )
 
         # Step 4: Parse PDFs if requested
@@ -392,7 +409,8 @@ class FulltextService:
         for pmid in pmids:
             try:
                 # Fetch from PubMed (returns Publication object)
-                pub = pubmed_client.fetch_by_id(pmid)
+                with span("fulltext.pubmed_fetch", upstream="pubmed", pmid=pmid):
+                    pub = pubmed_client.fetch_by_id(pmid)
 
                 if pub:
                     publications.append(pub)
@@ -465,10 +483,16 @@ class FulltextService:
         url_results: Dict[str, List],
         pdf_downloader: PDFDownloadManager,
         output_dir: Path,
+        hedge_manager: Optional[FullTextManager] = None,
     ) -> List:
         """
         Download PDFs with fallback through multiple URLs.
 
+        With hedge_manager set (url_race_mode="hedged"), url_results is not
+        used: each publication goes through hedge_manager.get_fulltext_hedged(),
+        which starts the download on the first good URL while the remaining
+        sources are still being queried.
+
         Returns:
             List of DownloadResult objects
         """
@@ -532,7 +556,7 @@ class FulltextService:
 
                 urls = url_results.get(pub.pmid, [])
 
-                if not urls:
+                if not urls and hedge_manager is None:
                     logger.warning(f"[{geo_id}] PMID:{pub.pmid} - No URLs to download")
                     from omics_oracle_v2.lib.pipelines.pdf_download.download_manager import \
                         DownloadResult
@@ -546,11 +570,16 @@ class FulltextService:
 
                 download_start = time.time()
 
-                result = await pdf_downloader.download_with_fallback(
-                    publication=pub,
-                    all_urls=urls,
-                    output_dir=output_dir,
-                )
+                if hedge_manager is not None:
+                    result = await hedge_manager.get_fulltext_hedged(
+                        pub, pdf_downloader, output_dir
+                    )
+                else:
+                    result = await pdf_downloader.download_with_fallback(
+                        publication=pub,
+                        all_urls=urls,
+                        output_dir=output_dir,
+                    )
 
                 download_time = time.time() - download_start
 
@@ -664,7 +693,9 @@ class FulltextService:
                     "pmid": pmid,
                     "doi": result.publication.doi,
                 }
-                parsed = extractor.extract_text(pdf_path, metadata=metadata)
+                with span("parse.pdf", pmid=pmid) as parse_span:
+                    parsed = extractor.extract_text(pdf_path, metadata=metadata)
+                    parse_span.set(pages=(parsed or {}).get("page_count", 0))
 
                 if parsed and parsed.get("full_text"):
                     # Store in database
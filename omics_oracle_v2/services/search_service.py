@@ -7,11 +7,12 @@ Extracted from api/routes/agents.py to separate concerns.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from omics_oracle_v2.api.models.requests import SearchRequest
 from omics_oracle_v2.api.models.responses import (DatasetResponse,
@@ -21,9 +22,26 @@ from omics_oracle_v2.api.models.responses import (DatasetResponse,
 from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
 from omics_oracle_v2.lib.search_orchestration import (OrchestratorConfig,
                                                       SearchOrchestrator)
+from omics_oracle_v2.lib.search_orchestration.models import (
+    EVENT_COMPLETE, EVENT_GEO, EVENT_PLAN, EVENT_PUBLICATIONS)
+from omics_oracle_v2.lib.utils.tracing import (current_span, current_trace_id,
+                                               traced, traced_stream)
 
 logger = logging.getLogger(__name__)
 
+# Search stream event types (see SearchService.execute_search_stream)
+STREAM_STARTED = "started"
+STREAM_PLAN = "plan"
+STREAM_DATASET = "dataset"
+STREAM_DATASET_ENRICHED = "dataset_enriched"
+STREAM_PUBLICATION = "publication"
+STREAM_COMPLETE = "complete"
+STREAM_ERROR = "error"
+
+
+def _stream_event(event: str, event_id: str, data: Any) -> Dict[str, Any]:
+    return {"event": event, "id": event_id, "data": data}
+
 
 class SearchService:
     """Service for executing search operations across datasets and publications."""
@@ -67,17 +85,58 @@ class SearchService:
         """
         Execute unified search across datasets and publications.
 
+        Collects execute_search_stream() and returns its final response.
+
         Args:
             request: Search request with terms, filters, and options
 
         Returns:
             SearchResponse with ranked datasets, publications, and metadata
 
+        Raises:
+            Exception: If search execution fails
+        """
+        stream = self.execute_search_stream(request)
+        try:
+            async for event in stream:
+                if event["event"] == STREAM_COMPLETE:
+                    return event["data"]
+        finally:
+            await stream.aclose()
+        raise RuntimeError("Search stream ended without a response")
+
+    @traced_stream("search.request")
+    async def execute_search_stream(
+        self, request: SearchRequest
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute unified search, yielding results as each source resolves.
+
+        Each event is {"event": type, "id": stable id, "data": payload}:
+        - started: query after filters
+        - plan: query type and optimized query
+        - dataset: scored GEO dataset (id = GEO ID), before database metrics
+        - dataset_enriched: same dataset with database metrics
+        - publication: one publication (id = PMID, DOI, or position)
+        - complete: the full SearchResponse (same as execute_search())
+
+        Closing the generator early cancels the outstanding source searches.
+
+        Args:
+            request: Search request with terms, filters, and options
+
+        Yields:
+            Event dictionaries; the last one is always "complete"
+
         Raises:
             Exception: If search execution fails
         """
         start_time = time.time()
         search_logs = []
+        enrichments: Dict[str, asyncio.Task] = {}
+        enriched: Dict[str, DatasetResponse] = {}
+        publication_count = 0
+        events = None
 
         try:
             # Build search configuration
@@ -86,13 +145,55 @@ class SearchService:
             # Execute search pipeline
             pipeline = SearchOrchestrator(config)
             query = self._build_query(request, search_logs)
+            yield _stream_event(STREAM_STARTED, "started", {"query": query})
 
-            search_result = await pipeline.search(
+            search_result = None
+            events = pipeline.search_stream(
                 query=query,
                 max_geo_results=request.max_results,
                 max_publication_results=50,
                 use_cache=True,
             )
+            async for event in events:
+                if event.type == EVENT_PLAN:
+                    yield _stream_event(STREAM_PLAN, "plan", event.data)
+
+                elif event.type == EVENT_GEO:
+                    # Scores depend only on the dataset, so they are final here
+                    datasets = self._apply_sample_filter(event.geo_datasets, request, [])
+                    for ranked in self._calculate_relevance_scores(datasets, request):
+                        geo_id = ranked.dataset.geo_id
+                        yield _stream_event(
+                            STREAM_DATASET, geo_id, self._dataset_response(ranked)
+                        )
+                        # A repeated geo_id is an update (local index row -> NCBI)
+                        if geo_id in enrichments:
+                            enrichments[geo_id].cancel()
+                            enriched.pop(geo_id, None)
+                        enrichments[geo_id] = asyncio.create_task(
+                            self._enrich_dataset(ranked)
+                        )
+
+                elif event.type == EVENT_PUBLICATIONS:
+                    for pub in event.publications:
+                        response = self._build_publication_response(pub)
+                        yield _stream_event(
+                            STREAM_PUBLICATION,
+                            response.pmid or response.doi or f"pub-{publication_count}",
+                            response,
+                        )
+                        publication_count += 1
+
+                elif event.type == EVENT_COMPLETE:
+                    search_result = event.result
+
+                # Emit enrichments that finished while sources were running
+                for geo_id, task in enrichments.items():
+                    if task.done() and geo_id not in enriched:
+                        enriched[geo_id] = task.result()
+                        yield _stream_event(
+                            STREAM_DATASET_ENRICHED, geo_id, enriched[geo_id]
+                        )
 
             # Log search results
             self._log_search_results(search_result, search_logs)
@@ -103,7 +204,19 @@ class SearchService:
             )
 
             # Convert to response format (with database metrics enrichment)
-            datasets = await self._build_dataset_responses(ranked_datasets)
+            pending = [
+                task for geo_id, task in enrichments.items() if geo_id not in enriched
+            ]
+            for task in asyncio.as_completed(pending):
+                response = await task
+                enriched[response.geo_id] = response
+                yield _stream_event(STREAM_DATASET_ENRICHED, response.geo_id, response)
+
+            datasets = [
+                enriched.get(ranked.dataset.geo_id)
+                or await self._enrich_dataset(ranked)
+                for ranked in ranked_datasets
+            ]
             publications = self._build_publication_responses(
                 search_result.publications, search_logs
             )
@@ -122,23 +235,51 @@ class SearchService:
                 f"[TIME] Total execution time: {execution_time_ms:.2f}ms"
             )
 
-            return SearchResponse(
-                success=True,
-                execution_time_ms=execution_time_ms,
-                timestamp=datetime.now(timezone.utc),
-                total_found=search_result.total_results,
-                datasets=datasets,
-                search_terms_used=request.search_terms,
-                filters_applied=filters_applied,
-                search_logs=search_logs,
-                publications=publications,
-                publications_count=len(publications),
-                query_processing=query_processing,
+            yield _stream_event(
+                STREAM_COMPLETE,
+                "complete",
+                SearchResponse(
+                    success=True,
+                    execution_time_ms=execution_time_ms,
+                    timestamp=datetime.now(timezone.utc),
+                    total_found=search_result.total_results,
+                    datasets=datasets,
+                    search_terms_used=request.search_terms,
+                    filters_applied=filters_applied,
+                    search_logs=search_logs,
+                    publications=publications,
+                    publications_count=len(publications),
+                    query_processing=query_processing,
+                    trace_id=current_trace_id(),
+                ),
             )
 
         except Exception as e:
             self.logger.error(f"Search execution failed: {e}", exc_info=True)
             raise
+        finally:
+            if events is not None:
+                await events.aclose()
+            for task in enrichments.values():
+                task.cancel()
+
+    @staticmethod
+    def _dataset_response(ranked) -> DatasetResponse:
+        """Convert a ranked dataset to response format without database metrics."""
+        dataset = ranked.dataset
+        return DatasetResponse(
+            geo_id=dataset.geo_id,
+            title=dataset.title,
+            summary=dataset.summary,
+            organism=dataset.organism,
+            sample_count=dataset.sample_count,
+            platform=dataset.platforms[0] if dataset.platforms else None,
+            relevance_score=ranked.relevance_score,
+            match_reasons=ranked.match_reasons,
+            publication_date=dataset.publication_date,
+            submission_date=dataset.submission_date,
+            pubmed_ids=dataset.pubmed_ids,
+        )
 
     def _build_search_config(
         self, request: SearchRequest, search_logs: List[str]
@@ -328,173 +469,123 @@ class SearchService:
 
         return ranked_datasets
 
-    async def _build_dataset_responses(
-        self, ranked_datasets: list
-    ) -> List[DatasetResponse]:
-        """
-        Convert ranked datasets to response format with database metrics enrichment.
-
-        OPTIMIZED: Uses parallel enrichment with asyncio.gather() for 50x speedup.
-        """
-        import asyncio
-
-        async def enrich_single_dataset(ranked) -> DatasetResponse:
-            """Enrich a single dataset with database metrics (parallel execution)."""
-            # Enrich with database metrics from UnifiedDB via GEOCache
-            citation_count = 0
-            pdf_count = 0
-            processed_count = 0
-            completion_rate = 0.0
-            fulltext_count = 0  # NEW: Track actual full-text content availability
-            fulltext_status = "not_downloaded"  # NEW: Track download status
-            all_pmids = []  # Will be populated from database
-
-            if self.geo_cache:
-                try:
-                    # Get complete GEO data from cache/DB
-                    geo_data = await self.geo_cache.get(ranked.dataset.geo_id)
-                    if geo_data:
-                        # Extract publications from the correct structure
-                        # UnifiedDB returns: {"geo": {...}, "papers": {"original": [...], "citing": []}}
-                        papers_data = geo_data.get("papers", {})
-                        original_papers = papers_data.get("original", [])
-                        citing_papers = papers_data.get("citing", [])
-
-                        # Combine both original and citing papers
-                        papers = original_papers + citing_papers
-                        citation_count = len(papers)
-
-                        # CRITICAL FIX: Extract PMIDs from database papers
-                        # This ensures ALL papers (original + citing) are available for download
-                        all_pmids = [p.get("pmid") for p in papers if p.get("pmid")]
-
-                        # Initialize database connection for all queries
-                        from omics_oracle_v2.lib.pipelines.storage.unified_db import \
-                            UnifiedDatabase
-
-                        db = UnifiedDatabase(db_path="data/database/omics_oracle.db")
-
-                        # Count PDFs - check pdf_acquisition table directly
-                        # The download_history in papers may not be populated correctly
-                        try:
-                            query_pdfs = """
-                                SELECT COUNT(DISTINCT pmid)
-                                FROM pdf_acquisition
-                                WHERE geo_id = ? AND (status = 'success' OR status = 'downloaded')
-                            """
-                            with db.get_connection() as conn:
-                                pdf_row = conn.execute(
-                                    query_pdfs, (ranked.dataset.geo_id,)
-                                ).fetchone()
-                                pdf_count = pdf_row[0] if pdf_row else 0
-                        except Exception as pdf_error:
-                            logger.warning(
-                                f"Failed to query pdf_acquisition for {ranked.dataset.geo_id}: {pdf_error}"
-                            )
-                            # Fallback to old method if query fails
-                            pdf_count = sum(
-                                1
-                                for pub in papers
-                                if any(
-                                    h.get("status") == "downloaded"
-                                    for h in pub.get("download_history", [])
-                                )
+    @traced("enrich.dataset")
+    async def _enrich_dataset(self, ranked) -> DatasetResponse:
+        """Convert one ranked dataset to a response enriched with database metrics."""
+        current_span().set(geo_id=ranked.dataset.geo_id)
+        # Enrich with database metrics from UnifiedDB via GEOCache
+        citation_count = 0
+        pdf_count = 0
+        processed_count = 0
+        completion_rate = 0.0
+        fulltext_count = 0  # NEW: Track actual full-text content availability
+        fulltext_status = "not_downloaded"  # NEW: Track download status
+        all_pmids = []  # Will be populated from database
+
+        if self.geo_cache:
+            try:
+                # Get complete GEO data from cache/DB
+                geo_data = await self.geo_cache.get(ranked.dataset.geo_id)
+                if geo_data:
+                    # Extract publications from the correct structure
+                    # UnifiedDB returns: {"geo": {...}, "papers": {"original": [...], "citing": []}}
+                    papers_data = geo_data.get("papers", {})
+                    original_papers = papers_data.get("original", [])
+                    citing_papers = papers_data.get("citing", [])
+
+                    # Combine both original and citing papers
+                    papers = original_papers + citing_papers
+                    citation_count = len(papers)
+
+                    # CRITICAL FIX: Extract PMIDs from database papers
+                    # This ensures ALL papers (original + citing) are available for download
+                    all_pmids = [p.get("pmid") for p in papers if p.get("pmid")]
+
+                    # Initialize database connection for all queries
+                    from omics_oracle_v2.lib.pipelines.storage.unified_db import \
+                        UnifiedDatabase
+
+                    db = UnifiedDatabase(db_path="data/database/omics_oracle.db")
+
+                    # PDF, extraction and full-text counts from the materialized
+                    # geo_statistics row (maintained by triggers on each write)
+                    try:
+                        counts = db.get_geo_counts(ranked.dataset.geo_id)
+                        pdf_count = counts.get("pdfs_available", 0)
+                        processed_count = counts.get("pdfs_extracted", 0)
+                        fulltext_count = counts.get("fulltext_count", 0)
+                    except Exception as db_error:
+                        logger.warning(
+                            f"Failed to read statistics for {ranked.dataset.geo_id}: {db_error}"
+                        )
+                        # Fallback to the download history loaded with the papers
+                        pdf_count = sum(
+                            1
+                            for pub in papers
+                            if any(
+                                h.get("status") == "downloaded"
+                                for h in pub.get("download_history", [])
                             )
+                        )
 
-                        # Count processed papers by checking content_extraction table
-                        try:
-                            # Query content_extraction table for this GEO dataset
-                            # Count DISTINCT pmids to avoid counting duplicate extractions
-                            query = """
-                                SELECT COUNT(DISTINCT pmid) as processed_count,
-                                       COUNT(DISTINCT CASE WHEN full_text IS NOT NULL AND full_text != '' THEN pmid END) as fulltext_count
-                                FROM content_extraction
-                                WHERE geo_id = ?
-                            """
-                            with db.get_connection() as conn:
-                                row = conn.execute(
-                                    query, (ranked.dataset.geo_id,)
-                                ).fetchone()
-                                if row:
-                                    processed_count = row[0] or 0
-                                    fulltext_count = row[1] or 0
-                                else:
-                                    processed_count = 0
-                                    fulltext_count = 0
-                        except Exception as db_error:
-                            logger.warning(
-                                f"Failed to query content_extraction for {ranked.dataset.geo_id}: {db_error}"
-                            )
-                            processed_count = 0
-                            fulltext_count = 0
-
-                        # Determine fulltext status based on actual database content
-                        if fulltext_count > 0:
-                            if fulltext_count >= len(all_pmids):
-                                fulltext_status = (
-                                    "available"  # All papers have full-text
-                                )
-                            else:
-                                fulltext_status = (
-                                    "partial"  # Some papers have full-text
-                                )
-                        elif pdf_count > 0:
+                    # Determine fulltext status based on actual database content
+                    if fulltext_count > 0:
+                        if fulltext_count >= len(all_pmids):
                             fulltext_status = (
-                                "downloaded"  # PDFs exist but not extracted
+                                "available"  # All papers have full-text
                             )
                         else:
-                            fulltext_status = "not_downloaded"  # No PDFs yet
+                            fulltext_status = (
+                                "partial"  # Some papers have full-text
+                            )
+                    elif pdf_count > 0:
+                        fulltext_status = (
+                            "downloaded"  # PDFs exist but not extracted
+                        )
+                    else:
+                        fulltext_status = "not_downloaded"  # No PDFs yet
 
-                        # Calculate completion rate
-                        if citation_count > 0:
-                            completion_rate = (pdf_count / citation_count) * 100
+                    # Calculate completion rate
+                    if citation_count > 0:
+                        completion_rate = (pdf_count / citation_count) * 100
 
-                        logger.debug(
-                            f"Enriched {ranked.dataset.geo_id}: citations={citation_count}, "
-                            f"pdfs={pdf_count}, processed={processed_count}, "
-                            f"fulltext={fulltext_count}, status={fulltext_status}, pmids={len(all_pmids)}"
-                        )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to enrich {ranked.dataset.geo_id} with database metrics: {e}"
+                    logger.debug(
+                        f"Enriched {ranked.dataset.geo_id}: citations={citation_count}, "
+                        f"pdfs={pdf_count}, processed={processed_count}, "
+                        f"fulltext={fulltext_count}, status={fulltext_status}, pmids={len(all_pmids)}"
                     )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to enrich {ranked.dataset.geo_id} with database metrics: {e}"
+                )
 
-            # Use enriched PMIDs if available, otherwise fall back to GEO metadata
-            final_pmids = all_pmids if all_pmids else ranked.dataset.pubmed_ids
-
-            return DatasetResponse(
-                geo_id=ranked.dataset.geo_id,
-                title=ranked.dataset.title,
-                summary=ranked.dataset.summary,
-                organism=ranked.dataset.organism,
-                sample_count=ranked.dataset.sample_count,
-                platform=ranked.dataset.platforms[0]
-                if ranked.dataset.platforms
-                else None,
-                relevance_score=ranked.relevance_score,
-                match_reasons=ranked.match_reasons,
-                publication_date=ranked.dataset.publication_date,
-                submission_date=ranked.dataset.submission_date,
-                pubmed_ids=final_pmids,  # NOW INCLUDES ALL PAPERS FROM DATABASE!
-                # Database metrics (enriched from UnifiedDB)
-                citation_count=citation_count,
-                pdf_count=pdf_count,
-                processed_count=processed_count,
-                completion_rate=completion_rate,
-                # NEW: Full-text content metrics
-                fulltext_count=fulltext_count,
-                fulltext_status=fulltext_status,
-                fulltext_total=citation_count,  # Total papers attempted
-            )
-
-        # OPTIMIZATION: Execute all enrichments in parallel
-        if ranked_datasets:
-            datasets = await asyncio.gather(
-                *[enrich_single_dataset(ranked) for ranked in ranked_datasets]
-            )
-            return list(datasets)
-        else:
-            return []
+        # Use enriched PMIDs if available, otherwise fall back to GEO metadata
+        final_pmids = all_pmids if all_pmids else ranked.dataset.pubmed_ids
+
+        return DatasetResponse(
+            geo_id=ranked.dataset.geo_id,
+            title=ranked.dataset.title,
+            summary=ranked.dataset.summary,
+            organism=ranked.dataset.organism,
+            sample_count=ranked.dataset.sample_count,
+            platform=ranked.dataset.platforms[0]
+            if ranked.dataset.platforms
+            else None,
+            relevance_score=ranked.relevance_score,
+            match_reasons=ranked.match_reasons,
+            publication_date=ranked.dataset.publication_date,
+            submission_date=ranked.dataset.submission_date,
+            pubmed_ids=final_pmids,  # NOW INCLUDES ALL PAPERS FROM DATABASE!
+            # Database metrics (enriched from UnifiedDB)
+            citation_count=citation_count,
+            pdf_count=pdf_count,
+            processed_count=processed_count,
+            completion_rate=completion_rate,
+            # NEW: Full-text content metrics
+            fulltext_count=fulltext_count,
+            fulltext_status=fulltext_status,
+            fulltext_total=citation_count,  # Total papers attempted
+        )
 
     def _build_publication_responses(
         self, publications: List, search_logs: List[str]
@@ -505,46 +596,43 @@ class SearchService:
         if not publications:
             return []
 
-        publication_responses = []
-
-        for pub in publications:
-            # Extract GEO IDs from text
-            geo_ids = []
-            if hasattr(pub, "abstract") and pub.abstract:
-                geo_ids.extend(re.findall(r"\bGSE\d{5,}\b", pub.abstract))
-            if hasattr(pub, "full_text") and pub.full_text:
-                geo_ids.extend(re.findall(r"\bGSE\d{5,}\b", pub.full_text))
-
-            # Handle publication date
-            pub_date = getattr(pub, "publication_date", None)
-            if pub_date:
-                if isinstance(pub_date, datetime):
-                    pub_date_str = pub_date.isoformat()
-                elif hasattr(pub_date, "year"):
-                    pub_date_str = f"{pub_date.year:04d}-{getattr(pub_date, 'month', 1):02d}-{getattr(pub_date, 'day', 1):02d}"
-                else:
-                    pub_date_str = str(pub_date)
+        return [self._build_publication_response(pub) for pub in publications]
+
+    def _build_publication_response(self, pub) -> PublicationResponse:
+        """Convert one publication to response format."""
+        # Extract GEO IDs from text
+        geo_ids = []
+        if hasattr(pub, "abstract") and pub.abstract:
+            geo_ids.extend(re.findall(r"\bGSE\d{5,}\b", pub.abstract))
+        if hasattr(pub, "full_text") and pub.full_text:
+            geo_ids.extend(re.findall(r"\bGSE\d{5,}\b", pub.full_text))
+
+        # Handle publication date
+        pub_date = getattr(pub, "publication_date", None)
+        if pub_date:
+            if isinstance(pub_date, datetime):
+                pub_date_str = pub_date.isoformat()
+            elif hasattr(pub_date, "year"):
+                pub_date_str = f"{pub_date.year:04d}-{getattr(pub_date, 'month', 1):02d}-{getattr(pub_date, 'day', 1):02d}"
             else:
-                pub_date_str = None
-
-            publication_responses.append(
-                PublicationResponse(
-                    pmid=getattr(pub, "pmid", None),
-                    pmc_id=getattr(pub, "pmc_id", None),
-                    doi=getattr(pub, "doi", None),
-                    title=getattr(pub, "title", ""),
-                    abstract=getattr(pub, "abstract", None),
-                    authors=getattr(pub, "authors", []),
-                    journal=getattr(pub, "journal", None),
-                    publication_date=pub_date_str,
-                    geo_ids_mentioned=list(set(geo_ids)),
-                    fulltext_available=hasattr(pub, "full_text")
-                    and pub.full_text is not None,
-                    pdf_path=getattr(pub, "pdf_path", None),
-                )
-            )
-
-        return publication_responses
+                pub_date_str = str(pub_date)
+        else:
+            pub_date_str = None
+
+        return PublicationResponse(
+            pmid=getattr(pub, "pmid", None),
+            pmc_id=getattr(pub, "pmc_id", None),
+            doi=getattr(pub, "doi", None),
+            title=getattr(pub, "title", ""),
+            abstract=getattr(pub, "abstract", None),
+            authors=getattr(pub, "authors", []),
+            journal=getattr(pub, "journal", None),
+            publication_date=pub_date_str,
+            geo_ids_mentioned=list(set(geo_ids)),
+            fulltext_available=hasattr(pub, "full_text")
+            and pub.full_text is not None,
+            pdf_path=getattr(pub, "pdf_path", None),
+        )
 
     def _build_filters_metadata(
         self, request: SearchRequest, search_result, original_query: str
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Gazetteer Classification Benchmark Script
+
+Measures BiomedicalNER entity classification through the compiled gazetteer
+on a corpus of real search queries.
+
+Entities are taken from spaCy when a model is installed; otherwise every
+1-3 word span of each query is classified (a superset of what NER returns).
+
+Usage:
+    python scripts/benchmark_gazetteer.py
+    python scripts/benchmark_gazetteer.py --queries queries.txt --iterations 50
+    python scripts/benchmark_gazetteer.py --terms extra_terms.json
+"""
+
+import argparse
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+from omics_oracle_v2.lib.query_processing.nlp.gazetteer import Gazetteer
+from omics_oracle_v2.lib.query_processing.nlp.models import EntityType
+
+# Queries from the search, refinement, and integration test suites
+DEFAULT_QUERIES = [
+    "BRCA1 breast cancer",
+    "CRISPR gene editing",
+    "RNA-seq human",
+    "WGBS DNA methylation data related to human brain tumor glioblastoma multiforme",
+    "alzheimer brain neurons",
+    "breast cancer gene expression",
+    "breast cancer single-cell RNA-seq human",
+    "breast cancer tumor microenvironment",
+    "cancer breast tissue",
+    "covid-19 lung transcriptome data",
+    "diabetes microarray data from pancreatic tissue",
+    "diabetes pancreatic beta cells",
+    "diabetes pancreatic tissue RNA-seq",
+    "dna methylation WGBS human brain cancer",
+    "dna methylation brain",
+    "gene expression data for liver cancer of human species",
+    "gene expression data for liver cancer",
+    "get information about dna methylation of immune cells",
+    "human breast cancer transcriptome",
+    "insulin resistance",
+    "neurodegenerative disease brain expression profiles",
+    "single cell RNA sequencing heart development",
+    "very specific rare neuroblastoma mutation variant",
+    "ATAC-seq chromatin accessibility in mouse T cells",
+    "TP53 mutations in lung adenocarcinoma",
+    "ChIP-seq histone modification H3K27ac in human liver",
+    "Hi-C chromatin conformation in embryonic stem cells",
+    "scRNA-seq of macrophages in atherosclerosis",
+    "EGFR inhibitor resistance in non-small cell lung cancer",
+    "zebrafish heart regeneration transcriptomics",
+]
+
+
+def load_queries(path: str = None) -> List[str]:
+    if not path:
+        return DEFAULT_QUERIES
+    return [line.strip() for line in Path(path).read_text().splitlines() if line.strip()]
+
+
+def extract_spans(queries: List[str]):
+    """Entity-like spans for each query (spaCy entities if a model is available)."""
+    try:
+        import spacy
+
+        nlp = spacy.load("en_core_web_sm")
+        spans = [ent for doc in nlp.pipe(queries) for ent in doc.ents]
+        return spans, "spaCy entities"
+    except (ImportError, OSError):
+        spans = []
+        for query in queries:
+            words = query.split()
+            for size in range(1, 4):
+                for start in range(len(words) - size + 1):
+                    spans.append(SimpleNamespace(text=" ".join(words[start : start + size]), label_=""))
+        return spans, "1-3 word spans"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gazetteer entity classification")
+    parser.add_argument("--queries", help="File with one query per line (default: built-in corpus)")
+    parser.add_argument("--terms", nargs="*", default=[], help="Extra gazetteer term files")
+    parser.add_argument("--iterations", type=int, default=20, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    gazetteer = Gazetteer.load(args.terms)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    queries = load_queries(args.queries)
+    spans, source = extract_spans(queries)
+
+    timings = []
+    for _ in range(args.iterations):
+        for span in spans:
+            text_lower = span.text.lower()
+            extra = ()
+            if 2 <= len(text_lower) <= 8 and span.text.isupper():
+                extra = (EntityType.GENE,)
+            t0 = time.perf_counter()
+            gazetteer.classify(text_lower, span.label_, extra)
+            timings.append((time.perf_counter() - t0) * 1e6)
+    types = Counter(gazetteer.classify(span.text.lower(), span.label_).value for span in spans)
+
+    timings.sort()
+    print(f"Gazetteer v{gazetteer.version} compiled in {build_ms:.1f} ms")
+    print(f"Corpus: {len(queries)} queries, {len(spans)} {source}, {args.iterations} iterations")
+    print(f"Per entity: mean {statistics.mean(timings):.2f} us, "
+          f"p50 {timings[len(timings) // 2]:.2f} us, p95 {timings[int(len(timings) * 0.95)]:.2f} us")
+    print(f"Throughput: {len(timings) / (sum(timings) / 1e6):,.0f} entities/s")
+    print("Types:", ", ".join(f"{name}={count}" for name, count in types.most_common()))
+
+
+if __name__ == "__main__":
+    main()
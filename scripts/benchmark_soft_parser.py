@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+SOFT Parser Benchmark
+
+Compares GEOparse parse_GSE (full parse, every data table into pandas) with
+the header-only streaming parser and its JSON sidecar, on local SOFT family
+files. Reports wall time, peak Python memory and whether the resulting
+GEOSeriesMetadata fields agree.
+
+Without --files, a synthetic series is generated (default: 500 samples x
+20000 probes, 2 platforms) in a temporary directory.
+
+Usage:
+    python scripts/benchmark_soft_parser.py
+    python scripts/benchmark_soft_parser.py --samples 200 --rows 50000
+    python scripts/benchmark_soft_parser.py --files .cache/geo/GSE*_family.soft.gz
+"""
+
+import argparse
+import gzip
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from GEOparse import parse_GSE, set_verbosity
+
+from omics_oracle_v2.lib.search_engines.geo.soft_parser import (load_series_header,
+                                                                parse_soft_headers,
+                                                                sidecar_path)
+
+
+def write_fixture(path: Path, samples: int, rows: int, platforms: int = 2) -> Path:
+    """Write a synthetic SOFT family file shaped like a real GEO series."""
+    rng = random.Random(7)
+    gpls = [f"GPL{1000 + i}" for i in range(platforms)]
+    with gzip.open(path, "wt") as f:
+        f.write("^DATABASE = GeoMiame\n!Database_name = Gene Expression Omnibus (GEO)\n")
+        f.write("^SERIES = GSE999999\n!Series_title = Synthetic benchmark series\n")
+        f.write("!Series_summary = Expression profiling of synthetic tissue.\n")
+        f.write("!Series_overall_design = Case vs control.\n!Series_status = Public on Jan 01 2024\n")
+        f.write("!Series_submission_date = Jan 01 2023\n!Series_last_update_date = Feb 01 2024\n")
+        f.write("!Series_pubmed_id = 12345678\n!Series_contact_name = Jane,,Doe\n")
+        f.write("!Series_supplementary_file = ftp://ftp.ncbi.nlm.nih.gov/geo/series/GSE999nnn/GSE999999/suppl/GSE999999_RAW.tar\n")
+        for gpl in gpls:
+            f.write(f"!Series_platform_id = {gpl}\n")
+        for gpl in gpls:
+            f.write(f"^PLATFORM = {gpl}\n!Platform_title = Synthetic array {gpl}\n")
+            f.write("!Platform_organism = Homo sapiens\n!Platform_technology = in situ oligonucleotide\n")
+            f.write("#ID = probe id\n#GENE_SYMBOL = gene\n!platform_table_begin\nID\tGENE_SYMBOL\n")
+            for r in range(rows):
+                f.write(f"probe_{r}\tGENE{r % 5000}\n")
+            f.write("!platform_table_end\n")
+        for s in range(samples):
+            f.write(f"^SAMPLE = GSM{5000000 + s}\n!Sample_title = sample {s}\n")
+            f.write(f"!Sample_platform_id = {gpls[s % platforms]}\n!Sample_organism_ch1 = Homo sapiens\n")
+            f.write(f"!Sample_characteristics_ch1 = tissue: {'tumor' if s % 2 else 'normal'}\n")
+            f.write(f"!Sample_characteristics_ch1 = age: {30 + s % 40}\n")
+            f.write("#ID_REF = \n#VALUE = normalized signal\n!sample_table_begin\nID_REF\tVALUE\n")
+            for r in range(rows):
+                f.write(f"probe_{r}\t{rng.random() * 10:.4f}\n")
+            f.write("!sample_table_end\n")
+    return path
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024**2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GEOparse vs header-only SOFT parsing")
+    parser.add_argument("--files", type=Path, nargs="*", help="SOFT family files to parse")
+    parser.add_argument("--samples", type=int, default=500, help="Synthetic series samples")
+    parser.add_argument("--rows", type=int, default=20000, help="Synthetic rows per data table")
+    args = parser.parse_args()
+    set_verbosity("ERROR")
+
+    tmp = tempfile.TemporaryDirectory()
+    files = args.files
+    if not files:
+        print(f"Generating synthetic series: {args.samples} samples x {args.rows} rows...")
+        files = [write_fixture(Path(tmp.name) / "GSE999999_family.soft.gz", args.samples, args.rows)]
+
+    for path in files:
+        print(f"\n{path.name} ({path.stat().st_size / 1024**2:.1f} MB)")
+        sidecar_path(path).unlink(missing_ok=True)
+
+        gse, geoparse_s, geoparse_mb = measure(lambda: parse_GSE(str(path), open_kwargs={}))
+        header, stream_s, stream_mb = measure(lambda: parse_soft_headers(path))
+        load_series_header(path)  # writes the sidecar
+        _, sidecar_s, sidecar_mb = measure(lambda: load_series_header(path))
+
+        print(f"  {'GEOparse parse_GSE':<24} {geoparse_s:8.2f}s  peak {geoparse_mb:8.1f} MB")
+        print(f"  {'header-only stream':<24} {stream_s:8.2f}s  peak {stream_mb:8.1f} MB  "
+              f"({geoparse_s / stream_s:.1f}x faster)")
+        print(f"  {'sidecar load':<24} {sidecar_s * 1000:8.2f}ms peak {sidecar_mb:8.1f} MB  "
+              f"({sidecar_path(path).stat().st_size / 1024:.0f} KB)")
+
+        agree = (
+            header.metadata.get("title") == gse.metadata.get("title")
+            and list(header.platforms) == list(gse.gpls)
+            and header.samples == list(gse.gsms)
+            and all(
+                header.sample_characteristics[name] == gsm.metadata.get("characteristics_ch1", [])
+                + gsm.metadata.get("characteristics_ch2", [])
+                for name, gsm in gse.gsms.items()
+            )
+        )
+        print(f"  metadata matches GEOparse: {agree}")
+
+    tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,10 @@
 """
 Clean old GEOparse SOFT files from cache.
 
-GEOparse caches SOFT files indefinitely. This script removes files older
-than a specified age (default: 90 days) to free up disk space.
+GEOparse caches SOFT files indefinitely. GEOClient now keeps them within a
+byte budget (SOFTCacheManager, OMICS_GEO_SOFT_CACHE_MAX_BYTES) with LRU
+eviction, so this script is only needed for one-off cleanups. It removes
+files older than a specified age (default: 90 days) to free up disk space.
 
 Usage:
     # Dry run (show what would be removed)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized geo_statistics table.
+
+The table is kept current by triggers; rebuild it after bulk edits made
+with triggers dropped, or to check for drift against the v_geo_statistics
+view (the reference aggregation).
+
+Usage:
+    # Recompute every dataset's statistics
+    python scripts/rebuild_geo_statistics.py
+
+    # Report datasets whose stored statistics differ from the view, then rebuild
+    python scripts/rebuild_geo_statistics.py --check
+"""
+
+import argparse
+import logging
+import math
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from omics_oracle_v2.lib.pipelines.storage import UnifiedDatabase
+
+VIEW_COLUMNS = ("publication_count", "pdfs_downloaded", "pdfs_extracted", "avg_quality", "high_quality_count")
+
+
+def find_drift(db: UnifiedDatabase) -> list:
+    """Datasets whose geo_statistics values differ from v_geo_statistics."""
+    drifted = []
+    with db.get_connection() as conn:
+        rows = conn.execute("SELECT * FROM v_geo_statistics").fetchall()
+    for row in rows:
+        stats = db.get_geo_statistics(row["geo_id"])
+        for column in VIEW_COLUMNS:
+            expected, actual = row[column], stats[column]
+            if expected is None or actual is None:
+                same = expected is actual
+            else:
+                same = math.isclose(expected, actual, rel_tol=1e-9)
+            if not same:
+                drifted.append((row["geo_id"], column, expected, actual))
+    return drifted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild materialized GEO statistics")
+    parser.add_argument(
+        "--db", type=Path, default=Path("data/database/omics_oracle.db"), help="Unified database"
+    )
+    parser.add_argument("--check", action="store_true", help="Report drift against the view first")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    db = UnifiedDatabase(args.db)
+    if args.check:
+        drifted = find_drift(db)
+        for geo_id, column, expected, actual in drifted:
+            print(f"  {geo_id}.{column}: view={expected} table={actual}")
+        print(f"{len(drifted)} drifted values")
+
+    count = db.rebuild_geo_statistics()
+    print(f"Rebuilt statistics for {count} datasets")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -67,6 +67,9 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "requires_api_key: Tests requiring API keys")
     config.addinivalue_line("markers", "requires_network: Tests requiring network access")
 
+    # OMICS_HTTP_REPLAY_MODE=replay runs network-bound suites (tests/performance) from cassettes
+    import omics_oracle_v2  # noqa: F401 - installs the HTTP replay layer when configured
+
 
 @pytest.fixture
 def temp_dir():
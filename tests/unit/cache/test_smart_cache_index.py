@@ -0,0 +1,123 @@
+"""
+Unit tests for the SmartCache filesystem index.
+
+Tests cover:
+- Index lookups match direct filesystem probing
+- save_file and files written or removed elsewhere keep the index fresh
+- Batch lookups
+- SQLite persistence (unchanged directories are reused)
+"""
+
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+from omics_oracle_v2.cache.smart_cache import SmartCache
+
+
+def make_publication(**kwargs):
+    fields = {"doi": None, "pmid": None, "pmc_id": None, "title": "Test paper"}
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+def populate(base_dir):
+    (base_dir / "xml" / "pmc").mkdir(parents=True)
+    (base_dir / "pdf" / "arxiv").mkdir(parents=True)
+    (base_dir / "pdf" / "publisher").mkdir(parents=True)
+    (base_dir / "xml" / "pmc" / "PMC111.nxml").write_bytes(b"<article/>")
+    (base_dir / "pdf" / "arxiv" / "2301.12345.pdf").write_bytes(b"%PDF-arxiv")
+    (base_dir / "pdf" / "publisher" / "10_1_abc.pdf").write_bytes(b"%PDF-pub")
+    (base_dir / "pdf" / "publisher" / "empty.pdf").write_bytes(b"")
+
+
+class TestSmartCacheIndex:
+    """Test index-backed lookups."""
+
+    def test_index_matches_filesystem_probing(self, tmp_path):
+        populate(tmp_path)
+        publications = [
+            make_publication(pmc_id="PMC111"),
+            make_publication(doi="10.48550/arxiv.2301.12345"),
+            make_publication(doi="10.1/abc"),
+            make_publication(doi="10.1/missing"),
+            make_publication(doi="empty"),
+        ]
+
+        indexed = SmartCache(base_dir=tmp_path).find_local_files(publications)
+        probed = SmartCache(base_dir=tmp_path, use_index=False).find_local_files(publications)
+
+        assert indexed == probed
+        assert [r.found for r in indexed] == [True, True, True, False, False]
+        assert indexed[0].file_type == "nxml"
+        assert indexed[1].source == "arxiv"
+
+    def test_save_file_updates_index(self, tmp_path):
+        cache = SmartCache(base_dir=tmp_path)
+        pub = make_publication(doi="10.1/new")
+
+        assert cache.find_local_file(pub).found is False
+
+        cache.save_file(b"%PDF-new", pub, source="publisher")
+        result = cache.find_local_file(pub)
+
+        assert result.found is True
+        assert result.size_bytes == len(b"%PDF-new")
+
+    def test_files_written_elsewhere_are_found_and_indexed(self, tmp_path):
+        cache = SmartCache(base_dir=tmp_path)
+        pub = make_publication(doi="10.1/late")
+        cache.build_index()
+
+        # e.g. the download manager or another process, bypassing save_file()
+        (tmp_path / "pdf" / "publisher").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "pdf" / "publisher" / "10_1_late.pdf").write_bytes(b"%PDF")
+
+        assert cache.find_local_file(pub).found is True
+        assert cache._index["pdf/publisher"]["10_1_late.pdf"] == 4
+
+    def test_files_removed_elsewhere_are_dropped(self, tmp_path):
+        populate(tmp_path)
+        cache = SmartCache(base_dir=tmp_path)
+        pub = make_publication(doi="10.1/abc")
+        assert cache.find_local_file(pub).found is True
+
+        (tmp_path / "pdf" / "publisher" / "10_1_abc.pdf").unlink()
+        assert cache.find_local_file(pub).found is False
+
+        shutil.rmtree(tmp_path / "pdf" / "arxiv")
+        assert cache.find_local_file(make_publication(doi="10.48550/arxiv.2301.12345")).found is False
+        assert "pdf/arxiv" not in cache._index
+
+    def test_lookups_do_not_stat_files(self, tmp_path, monkeypatch):
+        populate(tmp_path)
+        cache = SmartCache(base_dir=tmp_path)
+        cache.build_index()
+
+        statted = []
+        original_stat = Path.stat
+        monkeypatch.setattr(
+            Path, "stat", lambda self, **kw: statted.append(self) or original_stat(self, **kw)
+        )
+        cache.find_local_file(make_publication(pmid="1", doi="10.1/missing"))
+
+        # One stat per candidate directory, none per candidate file
+        assert statted and all(not path.suffix for path in statted)
+        assert len(statted) == len(set(statted))
+
+    def test_persisted_index_is_reused(self, tmp_path):
+        base_dir = tmp_path / "fulltext"
+        index_db = tmp_path / "index.db"
+        populate(base_dir)
+
+        first = SmartCache(base_dir=base_dir, index_db=index_db)
+        assert first.build_index() == 3
+
+        second = SmartCache(base_dir=base_dir, index_db=index_db)
+        scanned = []
+        original_scan = second._scan_directory
+        second._scan_directory = lambda d: scanned.append(d) or original_scan(d)
+
+        assert second.build_index() == 3
+        assert scanned == []
+        assert second.find_local_file(make_publication(doi="10.1/abc")).found is True
@@ -0,0 +1,93 @@
+"""
+Unit tests for the GEOparse SOFT cache manager.
+
+Tests cover:
+- Files are indexed after get_GEO and the cache total tracked
+- LRU eviction to the byte budget, oldest access first
+- Pinned datasets are never evicted
+- Files cached before the index existed are adopted
+- Eviction runs in the background after inserts
+"""
+
+import os
+import time
+
+import pytest
+
+from omics_oracle_v2.cache.soft_cache import SOFTCacheManager
+
+
+def write_soft(cache_dir, geo_id, size=1000):
+    path = cache_dir / f"{geo_id}_family.soft.gz"
+    path.write_bytes(b"x" * size)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SOFTCacheManager(tmp_path / "geo", max_bytes=3000, min_free_bytes=0)
+    # Evict synchronously in tests
+    cache._schedule_eviction = lambda: None
+    return cache
+
+
+class TestIndex:
+    """Test indexing of SOFT files."""
+
+    def test_record_indexes_files(self, cache):
+        write_soft(cache.cache_dir, "GSE1")
+        write_soft(cache.cache_dir, "GSE2", size=500)
+
+        assert cache.record("gse1") == 1000
+        assert cache.record("GSE2") == 500
+        assert cache.record("GSE3") == 0  # nothing downloaded
+        assert cache.stats() == {"files": 2, "size_bytes": 1500, "max_bytes": 3000}
+
+    def test_adopts_existing_files(self, tmp_path):
+        cache_dir = tmp_path / "geo"
+        cache_dir.mkdir()
+        write_soft(cache_dir, "GSE1")
+        (cache_dir / "notes.txt").write_text("not a SOFT file")
+
+        assert SOFTCacheManager(cache_dir, min_free_bytes=0).stats()["files"] == 1
+
+
+class TestEviction:
+    """Test budgeted LRU eviction."""
+
+    def test_evicts_least_recently_used(self, cache):
+        for geo_id in ("GSE1", "GSE2", "GSE3", "GSE4"):
+            write_soft(cache.cache_dir, geo_id)
+            cache.record(geo_id)
+            time.sleep(0.01)
+        cache.record("GSE1")  # cache hit refreshes LRU position
+
+        result = cache.evict()
+
+        assert result == {"evicted": 2, "freed_bytes": 2000}  # down to 90% of the budget
+        assert sorted(p.name[:4] for p in cache.cache_dir.glob("GSE*")) == ["GSE1", "GSE4"]
+        assert cache.total_bytes() == 2000
+
+    def test_pinned_datasets_are_kept(self, cache):
+        for geo_id in ("GSE1", "GSE2", "GSE3", "GSE4"):
+            write_soft(cache.cache_dir, geo_id)
+            cache.record(geo_id)
+            time.sleep(0.01)
+
+        with cache.pin("GSE1"):
+            cache.evict()
+            assert (cache.cache_dir / "GSE1_family.soft.gz").exists()
+        assert not cache.is_pinned("GSE1")
+
+    def test_background_eviction(self, tmp_path):
+        cache = SOFTCacheManager(tmp_path / "geo", max_bytes=1500, min_free_bytes=0)
+        for geo_id in ("GSE1", "GSE2"):
+            write_soft(cache.cache_dir, geo_id)
+            cache.record(geo_id)
+
+        deadline = time.time() + 5
+        while cache.total_bytes() > 1500 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert cache.total_bytes() == 1000
+        assert not os.path.exists(cache.cache_dir / "GSE1_family.soft.gz")
@@ -0,0 +1,239 @@
+"""
+Unit tests for URL collection cache.
+
+Tests cover:
+- Publication key normalization
+- Positive / negative entries and per-source TTLs
+- Batch lookup
+- FullTextManager integration (cached sources are not re-queried)
+- Client timeouts are retried next time, definitive misses are cached
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from omics_oracle_v2.cache.url_cache import URLCollectionCache, make_publication_key
+from omics_oracle_v2.lib.pipelines.url_collection.manager import (
+    FullTextManager,
+    FullTextManagerConfig,
+    FullTextResult,
+    FullTextSource,
+)
+from omics_oracle_v2.lib.pipelines.url_collection.sources.oa_sources import (
+    CrossrefClient,
+    UnpaywallClient,
+    UnpaywallConfig,
+)
+from omics_oracle_v2.lib.search_engines.citations.models import Publication, PublicationSource
+
+
+def make_publication(**kwargs):
+    return Publication(title="Test paper", source=PublicationSource.PUBMED, **kwargs)
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class FakeSession:
+    """Times out, or answers with a fixed status, and counts requests."""
+
+    def __init__(self, status=None):
+        self.status = status
+        self.requests = 0
+
+    def get(self, url, **kwargs):
+        self.requests += 1
+        if self.status is None:
+            raise asyncio.TimeoutError()
+        return FakeResponse(self.status)
+
+
+class TestPublicationKey:
+    """Test cache key construction."""
+
+    def test_doi_is_normalized(self):
+        pub = make_publication(doi="https://doi.org/10.1038/NATURE12373", pmid="123")
+        assert make_publication_key(pub) == "doi:10.1038/nature12373"
+
+    def test_falls_back_to_pmid_then_pmcid(self):
+        assert make_publication_key(make_publication(pmid="123")) == "pmid:123"
+        assert make_publication_key(make_publication(pmcid="PMC456")) == "pmc:456"
+
+    def test_no_identifier(self):
+        assert make_publication_key(make_publication()) is None
+
+
+class TestURLCollectionCache:
+    """Test memory-layer caching behavior."""
+
+    @pytest.mark.asyncio
+    async def test_positive_and_negative_entries(self):
+        cache = URLCollectionCache(use_redis=False)
+
+        await cache.set("doi:10.1/a", "unpaywall", {"success": True, "url": "https://x/a.pdf"})
+        await cache.set("doi:10.1/a", "core", {"success": False, "error": "not found"})
+
+        assert (await cache.get("doi:10.1/a", "unpaywall"))["url"] == "https://x/a.pdf"
+        assert (await cache.get("doi:10.1/a", "core"))["success"] is False
+        assert await cache.get("doi:10.1/a", "crossref") is None
+
+        stats = cache.get_stats()
+        assert stats.hits == 1
+        assert stats.negative_hits == 1
+        assert stats.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_zero_disables_negative_caching(self):
+        cache = URLCollectionCache(use_redis=False, negative_ttl=0)
+
+        cached = await cache.set_many({"pmid:1": {"core": {"success": False}}})
+
+        assert cached == 0
+        assert await cache.get("pmid:1", "core") is None
+
+    def test_per_source_ttls(self):
+        cache = URLCollectionCache(use_redis=False, source_ttls={"unpaywall": 60}, negative_ttl=10)
+
+        assert cache.ttl_for("unpaywall", True) == 60
+        assert cache.ttl_for("crossref", True) == 30 * 86400
+        assert cache.ttl_for("crossref", False) == 10
+
+    @pytest.mark.asyncio
+    async def test_get_many_and_invalidate(self):
+        cache = URLCollectionCache(use_redis=False)
+        await cache.set_many(
+            {
+                "pmid:1": {"pmc": {"success": True, "url": "u1"}},
+                "pmid:2": {"pmc": {"success": True, "url": "u2"}},
+            }
+        )
+
+        entries = await cache.get_many(["pmid:1", "pmid:2", "pmid:3"], ["pmc"])
+        assert set(entries) == {"pmid:1", "pmid:2"}
+
+        assert cache.invalidate("pmid:1") == 1
+        assert await cache.get("pmid:1", "pmc") is None
+
+
+class TestManagerIntegration:
+    """Test that FullTextManager reuses cached source lookups."""
+
+    @pytest.mark.asyncio
+    async def test_cached_sources_are_not_requeried(self):
+        config = FullTextManagerConfig(
+            enable_institutional=False,
+            enable_pmc=False,
+            enable_openalex=False,
+            enable_core=False,
+            enable_biorxiv=False,
+            enable_arxiv=False,
+            enable_crossref=False,
+            enable_unpaywall=True,
+            enable_scihub=False,
+            enable_libgen=False,
+        )
+        manager = FullTextManager(config)
+        manager.initialized = True
+        manager.url_cache = URLCollectionCache(use_redis=False)
+        manager.unpaywall_client = object()
+        manager._try_unpaywall = AsyncMock(
+            return_value=FullTextResult(
+                success=True, source=FullTextSource.UNPAYWALL, url="https://oa.example/a.pdf"
+            )
+        )
+
+        pub = make_publication(doi="10.1/a")
+        first = await manager.get_all_fulltext_urls(pub)
+        second = await manager.get_all_fulltext_urls(pub)
+
+        assert manager._try_unpaywall.await_count == 1
+        assert first.all_urls[0].url == second.all_urls[0].url == "https://oa.example/a.pdf"
+        assert second.all_urls[0].metadata.get("url_cache_hit") is True
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_not_cached(self):
+        config = FullTextManagerConfig(
+            enable_institutional=False,
+            enable_pmc=False,
+            enable_openalex=False,
+            enable_core=False,
+            enable_biorxiv=False,
+            enable_arxiv=False,
+            enable_crossref=False,
+            enable_unpaywall=True,
+            enable_scihub=False,
+            enable_libgen=False,
+        )
+        manager = FullTextManager(config)
+        manager.initialized = True
+        manager.url_cache = URLCollectionCache(use_redis=False)
+        manager.unpaywall_client = object()
+        manager._try_unpaywall = AsyncMock(
+            return_value=FullTextResult(success=False, error="boom", metadata={"transient": True})
+        )
+
+        pub = make_publication(doi="10.1/b")
+        await manager.get_all_fulltext_urls(pub)
+        await manager.get_all_fulltext_urls(pub)
+
+        assert manager._try_unpaywall.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_timeouts_are_not_cached(self):
+        config = FullTextManagerConfig(
+            enable_institutional=False,
+            enable_pmc=False,
+            enable_openalex=False,
+            enable_core=False,
+            enable_biorxiv=False,
+            enable_arxiv=False,
+            enable_crossref=True,
+            enable_unpaywall=True,
+            enable_scihub=False,
+            enable_libgen=False,
+        )
+        manager = FullTextManager(config)
+        manager.initialized = True
+        manager.url_cache = URLCollectionCache(use_redis=False)
+        manager.unpaywall_client = UnpaywallClient(UnpaywallConfig(email="test@example.org", retry_count=1))
+        manager.crossref_client = CrossrefClient()
+        manager.crossref_client.config.retry_count = 1
+        manager.unpaywall_client.session = FakeSession()
+        manager.crossref_client.session = FakeSession()
+
+        pub = make_publication(doi="10.1/c")
+        await manager.get_all_fulltext_urls(pub)
+        assert await manager.url_cache.get("doi:10.1/c", "unpaywall") is None
+        assert await manager.url_cache.get("doi:10.1/c", "crossref") is None
+
+        # Once the sources answer, a definitive miss (404) is cached
+        manager.unpaywall_client.session = FakeSession(status=404)
+        manager.crossref_client.session = FakeSession(status=404)
+        await manager.get_all_fulltext_urls(pub)
+        await manager.get_all_fulltext_urls(pub)
+
+        assert manager.unpaywall_client.session.requests == 1
+        assert manager.crossref_client.session.requests == 1
+        entry = await manager.url_cache.get("doi:10.1/c", "unpaywall")
+        assert entry is not None and not entry["success"]
+
+    @pytest.mark.asyncio
+    async def test_public_helpers_swallow_client_timeouts(self):
+        unpaywall = UnpaywallClient(UnpaywallConfig(email="test@example.org", retry_count=1))
+        unpaywall.session = FakeSession()
+        crossref = CrossrefClient()
+        crossref.config.retry_count = 1
+        crossref.session = FakeSession()
+
+        assert await unpaywall.get_pdf_url("10.1/d") is None
+        assert await crossref.fetch_by_id("10.1/d") is None
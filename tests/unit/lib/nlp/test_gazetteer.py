@@ -0,0 +1,95 @@
+"""
+Unit tests for the compiled biomedical gazetteer.
+
+Tests cover:
+- Bundled term lists reproduce the entity classification rules
+- Exclusions veto a type, including its label match
+- Every type match is returned from one scan
+- Extra term files extend the lists and the version
+"""
+
+import json
+
+import pytest
+
+from omics_oracle_v2.core.exceptions import NLPError
+from omics_oracle_v2.lib.query_processing.nlp.gazetteer import Gazetteer
+from omics_oracle_v2.lib.query_processing.nlp.models import EntityType
+
+
+@pytest.fixture
+def gazetteer():
+    return Gazetteer.load()
+
+
+class TestClassification:
+    """Test the bundled term lists."""
+
+    @pytest.mark.parametrize(
+        "text,label,expected",
+        [
+            ("wgbs", "", EntityType.TECHNIQUE),
+            ("atac-seq", "CHEMICAL", EntityType.TECHNIQUE),
+            ("whole genome sequencing", "", EntityType.TECHNIQUE),
+            ("chromatin", "", EntityType.CHEMICAL),  # "chromatin" alone is too short for a technique
+            ("chromatin loops", "", EntityType.TECHNIQUE),
+            ("brca1", "", EntityType.GENE),
+            ("breast cancer", "", EntityType.DISEASE),
+            ("melanoma", "", EntityType.DISEASE),
+            ("kinase", "", EntityType.CHEMICAL),
+            ("homo sapiens", "", EntityType.ORGANISM),
+            ("liver", "", EntityType.TISSUE),
+            ("hepatocyte", "", EntityType.CELL_TYPE),
+            ("mitochondria", "", EntityType.ANATOMICAL),
+            ("insulin signaling", "", EntityType.PHENOTYPE),
+            ("tp53", "ORGANISM", EntityType.GENE),
+            ("data", "", EntityType.GENERAL),
+        ],
+    )
+    def test_classify(self, gazetteer, text, label, expected):
+        assert gazetteer.classify(text, label) == expected
+
+    def test_exclusion_vetoes_label(self, gazetteer):
+        # Gene names are never diseases, even with a DISEASE label
+        assert EntityType.DISEASE not in gazetteer.match_types("tp53", "DISEASE")
+        # Organism words veto the gene heuristic
+        assert gazetteer.classify("human", extra_types=[EntityType.GENE]) == EntityType.ORGANISM
+
+    def test_all_types_in_priority_order(self, gazetteer):
+        types = gazetteer.match_types("mouse liver cell expression")
+
+        assert types == [
+            EntityType.ORGANISM,
+            EntityType.TISSUE,
+            EntityType.CELL_TYPE,
+            EntityType.PHENOTYPE,
+        ]
+
+    def test_matches_report_positions(self, gazetteer):
+        matches = {(m.term, m.rule, m.start, m.end) for m in gazetteer.matches("Human RNA-seq")}
+
+        assert ("human", "contains", 0, 5) in matches
+        assert ("seq", "suffix", 10, 13) in matches
+        # Exact terms only match the whole entity text
+        assert not any(term == "rna-seq" for term, _, _, _ in matches)
+        assert ("rna-seq", "exact", 0, 7) in {(m.term, m.rule, m.start, m.end) for m in gazetteer.matches("RNA-seq")}
+
+
+class TestTermFiles:
+    """Test loading curator term files."""
+
+    def test_extra_file_extends_terms(self, tmp_path):
+        extra = tmp_path / "local_terms.json"
+        extra.write_text(
+            json.dumps({"version": "local-1", "entity_types": {"technique": {"exact": ["spatial transcriptomics"]}}})
+        )
+
+        gazetteer = Gazetteer.load([str(extra)])
+
+        assert gazetteer.version == "1.0.0+local-1"
+        assert gazetteer.classify("spatial transcriptomics") == EntityType.TECHNIQUE
+        assert gazetteer.classify("wgbs") == EntityType.TECHNIQUE
+
+    def test_unknown_entity_type_rejected(self):
+        with pytest.raises(NLPError):
+            Gazetteer({"pathogen": {"exact": ["sars-cov-2"]}})
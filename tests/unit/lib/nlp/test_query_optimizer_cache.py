@@ -0,0 +1,146 @@
+"""
+Unit tests for QueryOptimizer result caching and batch optimization.
+
+Tests cover:
+- Repeated queries are served from the in-process LRU
+- Redis tier is shared across optimizers and keyed by model versions
+- optimize_many runs one batch NER pass over unique uncached queries
+"""
+
+import pytest
+
+from omics_oracle_v2.lib.query_processing.nlp.models import Entity, EntityType, ModelInfo, NERResult
+from omics_oracle_v2.lib.query_processing.optimization.optimizer import QueryOptimizer
+
+
+class FakeRedisCache:
+    """Stands in for RedisCache's optimized-query methods."""
+
+    def __init__(self):
+        self.store = {}
+        self.gets = 0
+
+    async def get_optimized_query(self, query, version=""):
+        self.gets += 1
+        return self.store.get((version, query))
+
+    async def get_optimized_queries_batch(self, queries, version=""):
+        self.gets += 1
+        return {q: self.store[(version, q)] for q in queries if (version, q) in self.store}
+
+    async def set_optimized_query(self, query, optimization, ttl=None, version=""):
+        self.store[(version, query)] = optimization
+        return True
+
+
+class FakeNER:
+    """Tags upper-case words as genes; counts single and batch calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def _result(self, text):
+        entities = [
+            Entity(text=word, entity_type=EntityType.GENE, start=0, end=len(word), label="GENE")
+            for word in text.split()
+            if word.isupper()
+        ]
+        return NERResult(text=text, entities=entities, processing_time_ms=0, model_name="fake", model_version="1")
+
+    def extract_entities(self, text):
+        self.calls.append([text])
+        return self._result(text)
+
+    def extract_entities_batch(self, texts):
+        self.calls.append(list(texts))
+        return [self._result(text) for text in texts]
+
+    def get_model_info(self):
+        return ModelInfo(status="loaded", model_name="fake", model_version="1", gazetteer_version="1.0.0")
+
+
+def make_optimizer(**kwargs):
+    optimizer = QueryOptimizer(enable_ner=False, enable_synonyms=True, **kwargs)
+    optimizer.enable_ner = True
+    optimizer.ner_engine = FakeNER()
+    optimizer.model_versions = optimizer._model_versions()
+    return optimizer
+
+
+class TestOptimizedQueryCache:
+    """Test the two cache tiers."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_served_from_local_cache(self):
+        optimizer = make_optimizer()
+
+        first = await optimizer.optimize("TP53 mutations in  breast cancer")
+        second = await optimizer.optimize("TP53 mutations in breast cancer ")
+
+        assert len(optimizer.ner_engine.calls) == 1
+        assert second.to_dict() == first.to_dict()
+        assert first.entities == {"gene": ["TP53"]}
+        assert "breast cancer" in first.synonyms
+
+        # Results are copies: mutating one does not touch the cache
+        first.entities["gene"].append("BRCA1")
+        assert (await optimizer.optimize("TP53 mutations in breast cancer")).entities == {"gene": ["TP53"]}
+
+    @pytest.mark.asyncio
+    async def test_redis_tier_shared_and_versioned(self):
+        redis = FakeRedisCache()
+        writer = make_optimizer(cache=redis)
+        await writer.optimize("APOE in alzheimer")
+
+        reader = make_optimizer(cache=redis)
+        result = await reader.optimize("APOE in alzheimer")
+        assert reader.ner_engine.calls == []
+        assert result.entities == {"gene": ["APOE"]}
+
+        # A different model version does not reuse the entry
+        reader.clear_cache()
+        reader.model_versions += ";ner=other"
+        await reader.optimize("APOE in alzheimer")
+        assert reader.ner_engine.calls == [["APOE in alzheimer"]]
+
+    @pytest.mark.asyncio
+    async def test_local_cache_is_bounded(self):
+        optimizer = make_optimizer(local_cache_size=2)
+        for query in ["a", "b", "c"]:
+            await optimizer.optimize(query)
+
+        assert list(optimizer._local_cache) == ["b", "c"]
+
+
+class TestOptimizeMany:
+    """Test batch optimization."""
+
+    @pytest.mark.asyncio
+    async def test_single_batch_ner_pass_over_unique_misses(self):
+        redis = FakeRedisCache()
+        optimizer = make_optimizer(cache=redis)
+        await optimizer.optimize("BRCA1 breast cancer")
+        optimizer.ner_engine.calls.clear()
+
+        queries = ["BRCA1 breast cancer", "TP53 lung", "", "TP53  lung", "APOE brain"]
+        results = await optimizer.optimize_many(queries)
+
+        assert optimizer.ner_engine.calls == [["TP53 lung", "APOE brain"]]
+        assert [r.primary_query for r in results] == [
+            "BRCA1 breast cancer",
+            "TP53 lung",
+            "",
+            "TP53 lung",
+            "APOE brain",
+        ]
+        assert results[4].entities == {"gene": ["APOE"]}
+        assert results[1] is not results[3]
+
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_results(self):
+        queries = ["diabetes insulin resistance", "TP53 mutations in cancer"]
+        batch = await make_optimizer().optimize_many(queries)
+
+        single = make_optimizer()
+        for query, result in zip(queries, batch):
+            assert (await single.optimize(query)).to_dict() == result.to_dict()
@@ -0,0 +1,196 @@
+"""
+Unit tests for the offline HTTP record/replay layer.
+
+Tests cover:
+- aiohttp exchanges recorded against a local server replay without reaching it
+- Streaming callers get the body in record mode too
+- requests exchanges round-trip the same way
+- Credentials and query order do not change request keys
+- Repeated requests replay in order; replay mode fails loudly on a miss
+- Latency and deterministic error injection (status and timeout)
+- Cassettes of another format version are rejected
+"""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiohttp
+import pytest
+import requests
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from omics_oracle_v2.core.config import HTTPReplaySettings
+from omics_oracle_v2.lib.utils.http_replay import (CassetteMissError, HTTPReplay, install_from_settings,
+                                                   request_key)
+
+
+def replay(tmp_path, mode, **kwargs):
+    return HTTPReplay(tmp_path / "cassette.json", mode=mode, passthrough_hosts=(), **kwargs)
+
+
+@pytest.fixture
+async def aiohttp_server_url():
+    calls = {"n": 0}
+
+    async def works(request):
+        calls["n"] += 1
+        return web.json_response({"call": calls["n"], "q": request.query.get("q")})
+
+    async def pdf(request):
+        return web.Response(body=b"%PDF-1.7\xff\x00", content_type="application/pdf")
+
+    app = web.Application()
+    app.router.add_get("/works", works)
+    app.router.add_get("/paper.pdf", pdf)
+    server = TestServer(app, host="127.0.0.1")
+    await server.start_server()
+    yield f"http://127.0.0.1:{server.port}"
+    await server.close()
+
+
+@pytest.fixture
+def requests_server_url():
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            payload = json.dumps({"echo": json.loads(body)["ids"]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+async def fetch_all(base_url, *paths):
+    async with aiohttp.ClientSession() as session:
+        results = []
+        for path in paths:
+            async with session.get(base_url + path) as response:
+                results.append((response.status, await response.read()))
+        return results
+
+
+class TestRequestKey:
+    """Test request normalization."""
+
+    def test_credentials_and_order_ignored(self):
+        a = request_key("get", "https://api.x/works?q=tp53&api_key=SECRET&email=a@b.c")
+        b = request_key("GET", "https://API.x/works?mailto=z@y.x&q=tp53")
+        assert a == b == "GET https://api.x/works?q=tp53"
+        url = "https://api.x/works"
+        assert request_key("POST", url, b"1") != request_key("POST", url, b"2")
+
+
+class TestAiohttp:
+    """Test the aiohttp transport."""
+
+    async def test_record_then_replay(self, tmp_path, aiohttp_server_url):
+        with replay(tmp_path, "record") as recorder:
+            recorded = await fetch_all(aiohttp_server_url, "/works?q=a&api_key=1", "/works?q=a", "/paper.pdf")
+        assert recorder.stats["recorded"] == 3
+        assert json.loads(recorded[1][1])["call"] == 2
+
+        with replay(tmp_path, "replay", latency_scale=0) as player:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(aiohttp_server_url + "/works", params={"q": "a", "api_key": "2"}) as r:
+                    assert r.status == 200 and (await r.json())["call"] == 1
+                async with session.get(aiohttp_server_url + "/works?q=a") as r:
+                    assert (await r.json())["call"] == 2
+                async with session.get(aiohttp_server_url + "/works?q=a") as r:
+                    assert (await r.json())["call"] == 2  # exhausted: repeats the last
+                async with session.get(aiohttp_server_url + "/paper.pdf") as r:
+                    assert r.content_type == "application/pdf"
+                    assert await r.read() == b"%PDF-1.7\xff\x00"
+                    with pytest.raises(aiohttp.ContentTypeError):
+                        await r.json()
+        assert player.stats["replayed"] == 4 and player.stats["recorded"] == 0
+
+    async def test_record_mode_streams_body(self, tmp_path, aiohttp_server_url):
+        with replay(tmp_path, "record"):
+            async with aiohttp.ClientSession() as session:
+                async with session.get(aiohttp_server_url + "/paper.pdf") as r:
+                    chunks = [chunk async for chunk in r.content.iter_chunked(4)]
+                    assert r.status == 200 and r.content_type == "application/pdf"
+        assert b"".join(chunks) == b"%PDF-1.7\xff\x00"
+
+    async def test_replay_miss(self, tmp_path, aiohttp_server_url):
+        with replay(tmp_path, "replay"):
+            with pytest.raises(CassetteMissError):
+                await fetch_all(aiohttp_server_url, "/works?q=unseen")
+
+        with replay(tmp_path, "auto") as auto:
+            await fetch_all(aiohttp_server_url, "/works?q=unseen")
+        assert auto.stats["recorded"] == 1
+        assert len(replay(tmp_path, "replay").cassette) == 1
+
+    async def test_latency_and_errors(self, tmp_path, aiohttp_server_url):
+        with replay(tmp_path, "record"):
+            await fetch_all(aiohttp_server_url, "/works?q=a")
+
+        with replay(tmp_path, "replay", latency_scale=0, latency_ms=50):
+            start = time.perf_counter()
+            await fetch_all(aiohttp_server_url, "/works?q=a")
+            assert time.perf_counter() - start >= 0.05
+
+        with replay(tmp_path, "replay", latency_scale=0, error_rate=1.0, error_status=429):
+            [(status, body)] = await fetch_all(aiohttp_server_url, "/works?q=a")
+            assert status == 429 and body == b""
+
+        with replay(tmp_path, "replay", latency_scale=0, error_rate=1.0, error_status=0):
+            with pytest.raises(asyncio.TimeoutError):
+                await fetch_all(aiohttp_server_url, "/works?q=a")
+
+    def test_error_injection_is_deterministic(self, tmp_path):
+        def failures(seed):
+            player = replay(tmp_path, "replay", latency_scale=0, error_rate=0.3, seed=seed)
+            return [player._replay("k", n, {"status": 200})[0]["status"] for n in range(50)]
+
+        assert failures(1) == failures(1)
+        assert failures(1) != failures(2)
+        assert 5 < failures(1).count(503) < 30
+
+
+class TestRequests:
+    """Test the requests transport."""
+
+    def test_record_then_replay(self, tmp_path, requests_server_url):
+        with replay(tmp_path, "record"):
+            response = requests.post(requests_server_url + "/batch", json={"ids": [1, 2], "email": "a@b.c"})
+            assert response.json() == {"echo": [1, 2]}
+
+        with replay(tmp_path, "replay", latency_scale=0):
+            response = requests.post(requests_server_url + "/batch", json={"email": "x@y.z", "ids": [1, 2]})
+            assert response.status_code == 200 and response.json() == {"echo": [1, 2]}
+            with pytest.raises(CassetteMissError):
+                requests.post(requests_server_url + "/batch", json={"ids": [3]})
+
+        with replay(tmp_path, "replay", latency_scale=0, error_rate=1.0, error_status=0):
+            with pytest.raises(requests.exceptions.Timeout):
+                requests.post(requests_server_url + "/batch", json={"ids": [1, 2]})
+
+
+class TestCassette:
+    """Test cassette files and settings."""
+
+    def test_version_mismatch(self, tmp_path):
+        (tmp_path / "cassette.json").write_text(json.dumps({"version": 0, "interactions": []}))
+        with pytest.raises(ValueError, match="re-record"):
+            replay(tmp_path, "replay")
+
+    def test_off_installs_nothing(self, tmp_path):
+        original = aiohttp.ClientSession._request
+        assert install_from_settings(HTTPReplaySettings(mode="off", cassette_dir=tmp_path)) is None
+        assert aiohttp.ClientSession._request is original
@@ -0,0 +1,156 @@
+"""
+Unit tests for in-process span tracing.
+
+Tests cover:
+- Parent/child linking across awaits, asyncio tasks and traced async generators
+- Error and cancelled status, and failures recorded without raising
+- Pre-measured spans (record) and the trace tree with self time
+- Recent trace summaries and the Prometheus stage/upstream histograms
+"""
+
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from omics_oracle_v2.lib.utils import tracing
+from omics_oracle_v2.lib.utils.tracing import (current_span, get_trace, record, recent_traces, span, traced,
+                                               traced_stream, trace_tree)
+
+
+@pytest.fixture(autouse=True)
+def clear_traces():
+    tracing.memory_exporter.clear()
+    yield
+    tracing.memory_exporter.clear()
+
+
+def by_name(trace_id):
+    return {s.name: s for s in get_trace(trace_id)}
+
+
+class TestSpans:
+    """Test span creation and linking."""
+
+    async def test_nesting_across_tasks(self):
+        @traced("geo.fetch", upstream="ncbi")
+        async def fetch(geo_id):
+            current_span().set(geo_id=geo_id)
+            await asyncio.sleep(0)
+
+        with span("search") as root:
+            await asyncio.gather(fetch("GSE1"), fetch("GSE2"))
+        assert current_span() is None
+
+        spans = get_trace(root.trace_id)
+        assert [s.name for s in spans] == ["search", "geo.fetch", "geo.fetch"]
+        assert {s.parent_id for s in spans[1:]} == {root.span_id}
+        assert sorted(s.attributes["geo_id"] for s in spans[1:]) == ["GSE1", "GSE2"]
+        assert spans[1].to_dict()["schema"] == tracing.SPAN_SCHEMA_VERSION
+
+    async def test_stream_span_is_not_current_in_consumer(self):
+        @traced_stream("search.source", source="geo")
+        async def stream():
+            for i in range(2):
+                with span("geo.fetch"):
+                    await asyncio.sleep(0)
+                yield i
+
+        with span("search.request") as root:
+            async for _ in stream():
+                with span("enrich.dataset"):
+                    pass
+
+        spans = by_name(root.trace_id)
+        source = spans["search.source"]
+        assert source.parent_id == root.span_id and source.attributes == {"source": "geo"}
+        assert spans["geo.fetch"].parent_id == source.span_id
+        assert spans["enrich.dataset"].parent_id == root.span_id
+
+    async def test_closing_stream_early_is_ok(self):
+        @traced_stream("search")
+        async def stream():
+            yield 1
+            yield 2
+
+        with span("search.request") as root:
+            gen = stream()
+            assert await gen.__anext__() == 1
+            await gen.aclose()
+        assert by_name(root.trace_id)["search"].status == "ok"
+
+
+class TestStatus:
+    """Test error and cancellation handling."""
+
+    async def test_error_and_fail(self):
+        with pytest.raises(ValueError):
+            with span("search.persist") as failed:
+                raise ValueError("disk full")
+        assert failed.status == "error" and failed.error == "ValueError: disk full"
+
+        with span("download.attempt") as attempt:
+            attempt.fail("HTTP 403")
+        assert attempt.status == "error" and attempt.duration_ms is not None
+
+    async def test_cancelled(self):
+        @traced("urls.source", upstream="unpaywall")
+        async def slow():
+            await asyncio.sleep(10)
+
+        with span("urls.collect") as root:
+            task = asyncio.create_task(slow())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        assert by_name(root.trace_id)["urls.source"].status == "cancelled"
+
+
+class TestTraceViews:
+    """Test trace trees, summaries and histograms."""
+
+    async def test_record_and_self_time(self):
+        with span("search") as root:
+            await asyncio.sleep(0.03)
+            record("search.dedup", 10.0, datasets=3)
+            record("search.persist", 5.0)
+
+        tree = trace_tree(root.trace_id)
+        assert tree["name"] == "search" and tree["span_count"] == 3
+        assert [c["name"] for c in tree["children"]] == ["search.dedup", "search.persist"]
+        assert tree["children"][0]["attributes"] == {"datasets": 3}
+        # Both recorded children end now, so they overlap: 10 ms covered, not 15
+        assert tree["self_ms"] == pytest.approx(tree["duration_ms"] - 10.0, abs=1.0)
+        assert trace_tree("missing") is None
+
+    async def test_recent_traces(self):
+        with span("search.request"):
+            record("geo.fetch", 20.0, upstream="ncbi")
+            record("geo.fetch", 30.0)
+        with span("fulltext.request"):
+            pass
+
+        summaries = recent_traces()
+        assert [s["name"] for s in summaries] == ["fulltext.request", "search.request"]
+        assert summaries[1]["stages_ms"] == {"geo.fetch": pytest.approx(50.0, abs=1.0)}
+        assert recent_traces(limit=1)[0]["name"] == "fulltext.request"
+        assert recent_traces(min_duration_ms=1e6) == []
+
+    async def test_prometheus_histograms(self):
+        def count(metric, **labels):
+            return REGISTRY.get_sample_value(f"omicsoracle_{metric}_count", labels) or 0
+
+        stage = {"stage": "geo.fetch", "status": "ok"}
+        upstream = {"upstream": "ncbi", **stage}
+        before = count("pipeline_stage_duration_seconds", **stage), count(
+            "upstream_request_duration_seconds", **upstream
+        )
+
+        with span("geo.fetch", upstream="ncbi"):
+            pass
+        with span("geo.fetch"):
+            pass
+
+        assert count("pipeline_stage_duration_seconds", **stage) == before[0] + 2
+        assert count("upstream_request_duration_seconds", **upstream) == before[1] + 1
@@ -0,0 +1,147 @@
+"""
+Unit tests for the persistent ANN vector database.
+
+Tests incremental updates, snapshot persistence and reloading, and recall
+of the approximate indexes against brute force.
+"""
+
+import numpy as np
+import pytest
+
+from omics_oracle_v2.lib.vector_db.ann_index import ANNConfig, ANNVectorDB
+
+
+def random_vectors(n, dimension=16, seed=0):
+    return np.random.default_rng(seed).random((n, dimension), dtype=np.float32)
+
+
+class TestANNVectorDBUpdates:
+    """Test add, upsert and remove."""
+
+    @pytest.fixture
+    def db(self):
+        """Create a small HNSW database."""
+        db = ANNVectorDB(dimension=16)
+        db.add_vectors(random_vectors(10), ids=[f"GSE{i}" for i in range(10)])
+        return db
+
+    def test_add_and_search(self, db):
+        """Test that stored vectors are their own nearest neighbor."""
+        vectors = random_vectors(10)
+
+        assert db.size() == 10
+        assert db.search(vectors[3], k=1)[0][0] == "GSE3"
+
+    def test_add_duplicate_ids(self, db):
+        """Test that existing IDs are rejected."""
+        with pytest.raises(ValueError, match="Duplicate IDs"):
+            db.add_vectors(random_vectors(1), ids=["GSE1"])
+
+    def test_upsert_replaces_vector(self, db):
+        """Test upsert moves an ID to its new vector."""
+        new_vector = np.full((1, 16), 5.0, dtype=np.float32)
+
+        db.upsert(new_vector, ids=["GSE3"], metadata=[{"title": "updated"}])
+
+        assert db.size() == 10
+        assert db.search(new_vector[0], k=1)[0][0] == "GSE3"
+        assert db.get_metadata("GSE3") == {"title": "updated"}
+
+    def test_remove_filters_results(self, db):
+        """Test removed IDs are tombstoned and never returned."""
+        assert db.remove(["GSE3", "missing"]) == 1
+
+        results = db.search(random_vectors(10)[3], k=10)
+
+        assert db.size() == 9
+        assert db.deleted_count() == 1
+        assert len(results) == 9
+        assert "GSE3" not in {id for id, _ in results}
+
+
+class TestANNVectorDBPersistence:
+    """Test snapshot save/open and reloading."""
+
+    def test_save_and_open(self, tmp_path):
+        """Test a saved snapshot opens with the same contents."""
+        db = ANNVectorDB(dimension=16)
+        db.add_vectors(random_vectors(20), ids=[f"GSE{i}" for i in range(20)], metadata=[{"n": i} for i in range(20)])
+        db.save(str(tmp_path))
+
+        reader = ANNVectorDB.open(str(tmp_path))
+
+        assert reader.size() == 20
+        assert reader.get_metadata("GSE7") == {"n": 7}
+        assert reader.search(random_vectors(20)[7], k=1)[0][0] == "GSE7"
+
+    def test_opened_snapshot_accepts_updates(self, tmp_path):
+        """Test a memory-mapped index is copied before it is modified."""
+        db = ANNVectorDB(dimension=16)
+        db.add_vectors(random_vectors(5), ids=[f"GSE{i}" for i in range(5)])
+        db.save(str(tmp_path))
+
+        reader = ANNVectorDB.open(str(tmp_path))
+        reader.add_vectors(random_vectors(1, seed=1), ids=["GSE99"])
+
+        assert reader.search(random_vectors(1, seed=1)[0], k=1)[0][0] == "GSE99"
+
+    def test_save_compacts_tombstones(self, tmp_path):
+        """Test save rebuilds once deletes exceed compact_ratio."""
+        db = ANNVectorDB(dimension=16, config=ANNConfig(compact_ratio=0.2))
+        db.add_vectors(random_vectors(10), ids=[f"GSE{i}" for i in range(10)])
+        db.remove(["GSE0", "GSE1", "GSE2"])
+
+        db.save(str(tmp_path))
+
+        assert db.deleted_count() == 0
+        assert ANNVectorDB.open(str(tmp_path)).size() == 7
+
+    def test_reload_if_changed(self, tmp_path):
+        """Test readers pick up snapshots published by a writer."""
+        writer = ANNVectorDB(dimension=16)
+        writer.add_vectors(random_vectors(5), ids=[f"GSE{i}" for i in range(5)])
+        writer.save(str(tmp_path))
+        reader = ANNVectorDB.open(str(tmp_path))
+
+        assert reader.reload_if_changed(str(tmp_path)) is False
+
+        writer.add_vectors(random_vectors(1, seed=1), ids=["GSE99"])
+        writer.save(str(tmp_path))
+
+        assert reader.reload_if_changed(str(tmp_path)) is True
+        assert reader.size() == 6
+
+    def test_open_missing_index(self, tmp_path):
+        """Test opening a directory without snapshots."""
+        with pytest.raises(FileNotFoundError):
+            ANNVectorDB.open(str(tmp_path))
+
+
+class TestANNVectorDBRecall:
+    """Test recall against brute force."""
+
+    def test_hnsw_recall(self):
+        """Test HNSW finds nearly all exact neighbors."""
+        db = ANNVectorDB(dimension=32, config=ANNConfig(index_type="hnsw", hnsw_m=16, ef_search=64))
+        db.add_vectors(random_vectors(2000, dimension=32))
+
+        recall = db.evaluate_recall(random_vectors(50, dimension=32, seed=1), k=10)
+
+        assert recall >= 0.9
+
+    def test_ivfpq_answers_exactly_until_trained(self):
+        """Test an untrained IVF-PQ index falls back to exact search."""
+        db = ANNVectorDB(dimension=16, config=ANNConfig(index_type="ivfpq", ivf_nlist=4, pq_m=4))
+        db.add_vectors(random_vectors(50))
+
+        assert not db.is_trained
+        assert db.evaluate_recall(random_vectors(10, seed=1), k=5) == 1.0
+
+    def test_ivfpq_recall_with_rerank(self):
+        """Test re-ranked IVF-PQ recall once the index is trained."""
+        config = ANNConfig(index_type="ivfpq", ivf_nlist=8, ivf_nprobe=8, pq_m=8, train_size=1000)
+        db = ANNVectorDB(dimension=32, config=config)
+        db.add_vectors(random_vectors(1000, dimension=32))
+
+        assert db.is_trained
+        assert db.evaluate_recall(random_vectors(50, dimension=32, seed=1), k=10) >= 0.8
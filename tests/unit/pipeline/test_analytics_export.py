@@ -0,0 +1,144 @@
+"""
+Unit tests for the incremental Parquet analytics export.
+
+Tests cover:
+- Append tables are partitioned by month and exported past a watermark
+- Parts left by an interrupted run are discarded and re-exported once
+- Snapshot tables pick up in-place updates
+- Reports (acquisition by source, quality by journal, time to PDF, events)
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from omics_oracle_v2.lib.pipelines.storage import (ContentExtraction, PDFAcquisition, ProcessingLog,
+                                                   UnifiedDatabase, UniversalIdentifier)
+from omics_oracle_v2.lib.pipelines.storage.analytics import AnalyticsExporter, AnalyticsStore
+
+
+def log(pmid, pipeline, event_type, logged_at, duration_ms=10):
+    return ProcessingLog(
+        geo_id="GSE1", pmid=pmid, pipeline=pipeline, event_type=event_type,
+        duration_ms=duration_ms, logged_at=logged_at,
+    )
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = UnifiedDatabase(tmp_path / "omics.db")
+    for pmid, journal in [("1", "Nature"), ("2", "Nature"), ("3", "Cell")]:
+        db.insert_universal_identifier(UniversalIdentifier(
+            geo_id="GSE1", pmid=pmid, journal=journal, first_discovered_at="2025-09-30T00:00:00Z",
+        ))
+    db.insert_records([
+        PDFAcquisition(geo_id="GSE1", pmid="1", pdf_path="a", pdf_hash_sha256="x", source_type="pmc",
+                       status="downloaded", downloaded_at="2025-09-30T02:00:00Z"),
+        PDFAcquisition(geo_id="GSE1", pmid="2", pdf_path="b", pdf_hash_sha256="x", source_type="pmc",
+                       status="failed", downloaded_at="2025-09-30T03:00:00Z"),
+        PDFAcquisition(geo_id="GSE1", pmid="3", pdf_path="c", pdf_hash_sha256="x", source_type="unpaywall",
+                       status="downloaded", downloaded_at="2025-09-30T06:00:00.250000Z"),
+        ContentExtraction(geo_id="GSE1", pmid="1", full_text="abc", extraction_quality=0.9,
+                          extraction_grade="A"),
+        ContentExtraction(geo_id="GSE1", pmid="2", full_text="", extraction_quality=0.5,
+                          extraction_grade="C"),
+        ContentExtraction(geo_id="GSE1", pmid="3", full_text="abcdef", extraction_quality=0.7,
+                          extraction_grade="B"),
+        log("1", "P3", "success", "2025-09-30T02:00:00Z", 100),
+        log("2", "P3", "error", "2025-10-01T03:00:00Z", 300),
+        log("3", "P3", "success", "2025-10-02T06:00:00Z", 200),
+    ])
+    return db
+
+
+def export_dir(tmp_path):
+    return tmp_path / "analytics"
+
+
+class TestExport:
+    """Test incremental export."""
+
+    def test_partitions_and_watermark(self, tmp_path, db):
+        exporter = AnalyticsExporter(db.db_path, export_dir(tmp_path), chunk_size=2)
+        result = exporter.export()
+
+        assert result["processing_log"] == 3 and result["content_extraction"] == 3
+        months = sorted(p.name for p in (export_dir(tmp_path) / "processing_log").iterdir())
+        assert months == ["month=2025-09", "month=2025-10"]
+        state = json.loads((export_dir(tmp_path) / "_export_state.json").read_text())
+        assert state["tables"]["processing_log"]["watermark"] == 3
+
+        assert exporter.export()["processing_log"] == 0
+        db.log_event(geo_id="GSE1", pipeline="P4", event_type="success", pmid="1")
+        assert exporter.export()["processing_log"] == 1
+
+        store = AnalyticsStore(export_dir(tmp_path))
+        assert store.table("processing_log").num_rows == 4
+        extraction = store.table("content_extraction")
+        assert "full_text" not in extraction.column_names
+        assert sorted(extraction["full_text_chars"].to_pylist()) == [0, 3, 6]
+
+    def test_interrupted_run_is_not_duplicated(self, tmp_path, db, monkeypatch):
+        exporter = AnalyticsExporter(db.db_path, export_dir(tmp_path), chunk_size=1)
+        save_state = exporter._save_state
+        calls = []
+
+        def crash_on_second_save(state):
+            calls.append(1)
+            if len(calls) == 2:
+                raise KeyboardInterrupt  # part 2 is written, its watermark is not
+            save_state(state)
+
+        monkeypatch.setattr(exporter, "_save_state", crash_on_second_save)
+        with pytest.raises(KeyboardInterrupt):
+            exporter.export(["processing_log"])
+        assert len(list((export_dir(tmp_path) / "processing_log").glob("*/*.parquet"))) == 2
+
+        monkeypatch.setattr(exporter, "_save_state", save_state)
+        assert exporter.export(["processing_log"])["processing_log"] == 2
+        assert AnalyticsStore(export_dir(tmp_path)).table("processing_log").num_rows == 3
+
+    def test_snapshot_picks_up_updates(self, tmp_path, db):
+        exporter = AnalyticsExporter(db.db_path, export_dir(tmp_path))
+        exporter.export()
+        db.record_pdf_integrity(verified=[], failures=[("GSE1", "1", "integrity: missing")])
+        exporter.export()
+
+        statuses = AnalyticsStore(export_dir(tmp_path)).table("pdf_acquisition", columns=["pmid", "status"])
+        assert dict(zip(statuses["pmid"].to_pylist(), statuses["status"].to_pylist()))["1"] == "failed"
+
+
+class TestReports:
+    """Test the pyarrow report layer."""
+
+    @pytest.fixture
+    def store(self, tmp_path, db):
+        AnalyticsExporter(db.db_path, export_dir(tmp_path)).export()
+        return AnalyticsStore(export_dir(tmp_path))
+
+    def test_acquisition_by_source(self, store):
+        rows = {row["source_type"]: row for row in store.acquisition_by_source()}
+        assert rows["pmc"] == {"source_type": "pmc", "attempts": 2, "downloaded": 1, "success_rate": 0.5}
+        assert rows["unpaywall"]["success_rate"] == 1.0
+
+    def test_quality_by_journal(self, store):
+        rows = {row["journal"]: row for row in store.extraction_quality_by_journal()}
+        assert rows["Nature"]["avg_quality"] == pytest.approx(0.7)
+        assert rows["Nature"]["high_quality_rate"] == 0.5
+        assert rows["Cell"]["extractions"] == 1
+
+    def test_time_to_pdf(self, store):
+        summary = store.time_to_pdf()
+        assert summary["papers"] == 2
+        assert summary["mean_hours"] == pytest.approx((2 + 6 + 0.25 / 3600) / 2)
+
+    def test_pipeline_events(self, store):
+        rows = store.pipeline_events()
+        assert [(r["event_type"], r["events"]) for r in rows] == [("error", 1), ("success", 2)]
+        assert rows[1]["avg_duration_ms"] == 150
+
+        recent = store.pipeline_events(since=datetime(2025, 10, 1, tzinfo=timezone.utc))
+        assert sum(r["events"] for r in recent) == 2
@@ -0,0 +1,155 @@
+"""
+Unit tests for the content-addressed PDF blob store.
+
+Tests cover:
+- A PDF saved for several GEO datasets is stored once (hardlinks share the blob)
+- Per-GEO paths, verification and deletion behave as before
+- Garbage collection removes only unreferenced blobs, and spares reused ones
+- Manifest references are used when hardlinks are unavailable
+- Legacy per-GEO copies are deduplicated in place
+"""
+
+import errno
+import os
+import shutil
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.storage import BlobStore, GEOStorage, calculate_sha256
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return GEOStorage(tmp_path / "data")
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "download.pdf"
+    path.write_bytes(b"%PDF-1.7 landmark paper " * 1000)
+    return path
+
+
+class TestDeduplication:
+    """Test cross-dataset deduplication."""
+
+    def test_same_pdf_stored_once(self, storage, pdf):
+        first = storage.save_pdf("GSE1", "111", pdf)
+        second = storage.save_pdf("GSE2", "111", pdf)
+
+        assert not first["deduplicated"] and second["deduplicated"]
+        assert first["sha256"] == second["sha256"] == calculate_sha256(pdf)
+        assert first["pdf_path"] == os.path.join("pdfs", "by_geo", "GSE1", "pmid_111.pdf")
+        assert first["full_path"].samefile(second["full_path"])
+        assert storage.blobs.refcount(first["sha256"]) == 2
+        assert storage.get_storage_stats()["dedup_ratio"] == 2.0
+
+    def test_paths_verify_and_delete(self, storage, pdf):
+        info = storage.save_pdf("GSE1", "111", pdf)
+        storage.save_pdf("GSE2", "111", pdf)
+
+        assert storage.get_pdf_path("GSE1", "111") == info["full_path"]
+        assert storage.verify_all_pdfs("GSE1")["valid"] == 1
+
+        assert storage.delete_pdf("GSE1", "111")
+        assert storage.get_pdf_path("GSE1", "111") is None
+        assert storage.get_pdf_path("GSE2", "111").read_bytes() == pdf.read_bytes()
+        assert storage.blobs.refcount(info["sha256"]) == 1
+
+    def test_blobs_are_read_only(self, storage, pdf):
+        info = storage.save_pdf("GSE1", "111", pdf)
+
+        # Hardlinks share the inode, so editing a per-GEO file in place is refused
+        assert not info["full_path"].stat().st_mode & 0o222
+
+
+class TestGarbageCollection:
+    """Test reference counting and GC."""
+
+    def test_gc_removes_unreferenced_blobs_only(self, storage, pdf, tmp_path):
+        other = tmp_path / "other.pdf"
+        other.write_bytes(b"%PDF-1.7 another paper")
+        kept = storage.save_pdf("GSE1", "111", pdf)
+        dropped = storage.save_pdf("GSE1", "222", other)
+        storage.delete_pdf("GSE1", "222")
+
+        assert storage.collect_garbage()["removed"] == []  # still inside grace period
+        result = storage.collect_garbage(grace_seconds=0)
+
+        assert result["removed"] == [dropped["sha256"]]
+        assert result["freed_bytes"] == dropped["size_bytes"]
+        assert storage.blobs.exists(kept["sha256"])
+
+    def test_reused_blob_is_pinned_without_touching_it(self, pdf, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        blob = store.put(pdf)
+        old = blob["path"].stat().st_mtime - 7200
+        os.utime(blob["path"], (old, old))
+
+        assert not store.put(pdf)["created"]
+
+        # The blob inode (shared with every hardlink) keeps its mtime
+        assert blob["path"].stat().st_mtime == old
+        assert store.collect_garbage(set())["removed"] == []
+        assert store.collect_garbage(set(), grace_seconds=0)["removed"] == [blob["sha256"]]
+
+
+class TestReferenceFallback:
+    """Test manifest references when hardlinks are unavailable."""
+
+    def test_reference_storage(self, storage, pdf, monkeypatch):
+        monkeypatch.setattr(BlobStore, "link", lambda self, sha256, dest: False)
+
+        info = storage.save_pdf("GSE1", "111", pdf)
+
+        assert info["full_path"] == storage.blobs.blob_path(info["sha256"])
+        assert storage.get_pdf_path("GSE1", "111") == info["full_path"]
+        assert storage.get_geo_stats("GSE1")["files"] == ["111"]
+        assert storage.collect_garbage(grace_seconds=0)["removed"] == []
+
+        storage.delete_pdf("GSE1", "111")
+        assert storage.collect_garbage(grace_seconds=0)["removed"] == [info["sha256"]]
+
+    def test_rebuild_manifest_keeps_references(self, storage, pdf, monkeypatch):
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "link", cross_device)
+        info = storage.save_pdf("GSE1", "111", pdf)
+        assert storage.get_geo_stats("GSE1")["files"] == ["111"]
+
+        storage.rebuild_manifest("GSE1")
+
+        assert storage.get_pdf_path("GSE1", "111") == info["full_path"]
+        assert storage.collect_garbage(grace_seconds=0)["removed"] == []
+        assert storage.blobs.exists(info["sha256"])
+
+    def test_other_link_errors_propagate(self, pdf, tmp_path, monkeypatch):
+        store = BlobStore(tmp_path / "blobs")
+        blob = store.put(pdf)
+
+        def no_space(src, dst):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(os, "link", no_space)
+        with pytest.raises(OSError):
+            store.link(blob["sha256"], tmp_path / "pmid_1.pdf")
+
+
+class TestMigration:
+    """Test deduplication of PDFs saved before the blob store."""
+
+    def test_deduplicate_existing(self, storage, pdf):
+        for geo_id in ["GSE1", "GSE2", "GSE3"]:
+            geo_dir = storage.pdfs_dir / geo_id
+            geo_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(pdf, geo_dir / "pmid_111.pdf")
+            storage.rebuild_manifest(geo_id)
+
+        result = storage.deduplicate_existing()
+
+        assert result["migrated"] == 3
+        assert result["blobs"] == 1
+        assert result["reclaimed_bytes"] == 2 * pdf.stat().st_size
+        assert storage.verify_all_pdfs("GSE3")["valid"] == 1
+        assert storage.deduplicate_existing()["migrated"] == 0
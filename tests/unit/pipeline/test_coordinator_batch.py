@@ -0,0 +1,124 @@
+"""
+Unit tests for PipelineCoordinator.batch (transactional stage writes).
+
+Tests cover:
+- Records from all four stages and their log entries are written in one flush
+- A rejected record is dropped and logged as an error; the rest are written
+- Records that fail to build are isolated the same way
+- The buffer flushes automatically at max_pending
+- Staged records are flushed when the block raises
+- A flush that fails on a locked database keeps the buffer for a retry
+"""
+
+import functools
+import sqlite3
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.coordinator import PipelineBatch, PipelineCoordinator
+from omics_oracle_v2.lib.pipelines.storage import UniversalIdentifier
+
+
+@pytest.fixture
+def coordinator(tmp_path):
+    coordinator = PipelineCoordinator(db_path=tmp_path / "omics.db", storage_path=tmp_path / "data")
+    for pmid in ("1", "2", "3"):
+        coordinator.db.insert_universal_identifier(
+            UniversalIdentifier(geo_id="GSE1", pmid=pmid, title=f"Paper {pmid}")
+        )
+    return coordinator
+
+
+def count(coordinator, table, where="1"):
+    with coordinator.db.get_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}").fetchone()[0]
+
+
+class TestBatch:
+    """Test unit-of-work writes."""
+
+    def test_all_stages_in_one_flush(self, coordinator, tmp_path, monkeypatch):
+        pdf = tmp_path / "paper.pdf"
+        pdf.write_bytes(b"%PDF-1.7 " * 100)
+        flushes = []
+        insert_records = coordinator.db.insert_records
+
+        def counting_insert(rows, conn=None):
+            flushes.append(len(rows))
+            return insert_records(rows, conn)
+
+        monkeypatch.setattr(coordinator.db, "insert_records", counting_insert)
+
+        with coordinator.batch("GSE1") as uow:
+            for pmid in ("1", "2"):
+                uow.add_url_discovery(pmid, [{"url": "https://x/1.pdf", "type": "pdf"}], ["pubmed"])
+                assert uow.add_pdf_acquisition(pmid, pdf)["verified"]
+                uow.add_content_extraction(pmid, {"full_text": "a b c", "extraction_grade": "A"})
+                uow.add_enriched_content(pmid, {"enrichers_applied": ["sections"]})
+            assert uow.pending == 8
+            assert count(coordinator, "content_extraction") == 0
+
+        assert flushes == [16]
+        assert uow.written == 8 and uow.errors == []
+        for table in ("url_discovery", "pdf_acquisition", "content_extraction", "enriched_content"):
+            assert count(coordinator, table) == 2
+        assert count(coordinator, "processing_log", "event_type = 'success'") == 8
+        assert coordinator.db.get_content_extraction("GSE1", "1").word_count == 3
+        assert coordinator.get_geo_progress("GSE1")["enriched"] == 2
+
+    def test_rejected_record_is_isolated(self, coordinator):
+        with coordinator.batch("GSE1") as uow:
+            uow.add_content_extraction("1", {"full_text": "ok"})
+            uow.add_content_extraction("999", {"full_text": "no citation"})  # foreign key violation
+            uow.add_content_extraction("2", {"full_text": "ok"})
+
+        assert uow.written == 2
+        assert [e["pmid"] for e in uow.errors] == ["999"]
+        assert count(coordinator, "content_extraction") == 2
+        assert count(coordinator, "processing_log", "event_type = 'success'") == 2
+        assert count(coordinator, "processing_log", "event_type = 'error' AND pmid = '999'") == 1
+
+    def test_build_error_is_isolated(self, coordinator):
+        with coordinator.batch("GSE1") as uow:
+            assert not uow.add_url_discovery("1", [{"url": object()}], ["pubmed"])  # not JSON serializable
+            assert uow.add_url_discovery("2", [], ["pubmed"])
+
+        assert uow.written == 1
+        assert uow.errors[0]["pipeline"] == "P2"
+        assert count(coordinator, "processing_log", "event_type = 'error' AND pmid = '1'") == 1
+
+    def test_bounded_buffer(self, coordinator):
+        with coordinator.batch("GSE1", max_pending=2) as uow:
+            for pmid in ("1", "2", "3"):
+                uow.add_content_extraction(pmid, {"full_text": "text"})
+            assert uow.pending == 1
+            assert count(coordinator, "content_extraction") == 2
+
+        assert count(coordinator, "content_extraction") == 3
+
+    def test_flushes_on_error(self, coordinator):
+        with pytest.raises(RuntimeError):
+            with coordinator.batch("GSE1") as uow:
+                uow.add_content_extraction("1", {"full_text": "text"})
+                raise RuntimeError("enrichment crashed")
+
+        assert count(coordinator, "content_extraction") == 1
+
+    def test_locked_database_keeps_buffer(self, coordinator, monkeypatch):
+        monkeypatch.setattr(sqlite3, "connect", functools.partial(sqlite3.connect, timeout=0.05))
+        uow = PipelineBatch(coordinator, "GSE1")
+        uow.add_content_extraction("1", {"full_text": "text"})
+        uow.add_content_extraction("999", {"full_text": "no citation"})  # isolated on retry
+
+        locker = sqlite3.connect(str(coordinator.db.db_path), isolation_level=None)
+        locker.execute("BEGIN EXCLUSIVE")
+        with pytest.raises(sqlite3.OperationalError, match="locked"):
+            uow.flush()
+        assert uow.pending == 2 and uow.written == 0 and uow.errors == []
+        locker.execute("ROLLBACK")
+        locker.close()
+
+        assert uow.flush() == 1
+        assert uow.pending == 0 and [e["pmid"] for e in uow.errors] == ["999"]
+        assert count(coordinator, "content_extraction") == 1
+        assert count(coordinator, "processing_log", "event_type = 'error' AND pmid = '999'") == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for the materialized geo_statistics table.
+
+Tests cover:
+- Trigger-maintained counts match the v_geo_statistics view
+- Duplicate rows per paper are counted once; deleting one keeps the count
+- Status, grade and quality updates move counts
+- Rebuild backfills rows written before the table existed
+- Pipeline progress reads the same counts
+"""
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.storage import (ContentExtraction, EnrichedContent, GEODataset,
+                                                   PDFAcquisition, UnifiedDatabase,
+                                                   UniversalIdentifier, URLDiscovery)
+
+VIEW_COLUMNS = [
+    "geo_id", "title", "organism", "publication_count", "pdfs_downloaded",
+    "pdfs_extracted", "avg_quality", "high_quality_count",
+]
+
+
+def add_paper(db, geo_id, pmid, pdf_status=None, grades=(), full_text="text"):
+    db.insert_universal_identifier(UniversalIdentifier(geo_id=geo_id, pmid=pmid, title=f"Paper {pmid}"))
+    if pdf_status:
+        db.insert_pdf_acquisition(PDFAcquisition(
+            geo_id=geo_id, pmid=pmid, pdf_path=f"{geo_id}/pmid_{pmid}.pdf",
+            pdf_hash_sha256="x", status=pdf_status,
+        ))
+    for grade, quality in grades:
+        db.insert_content_extraction(ContentExtraction(
+            geo_id=geo_id, pmid=pmid, full_text=full_text,
+            extraction_quality=quality, extraction_grade=grade,
+        ))
+
+
+def populate(db):
+    for geo_id in ("GSE1", "GSE2", "GSE3"):
+        db.insert_geo_dataset(GEODataset(geo_id=geo_id, title=f"Dataset {geo_id}", organism="Homo sapiens"))
+
+    add_paper(db, "GSE1", "1", "downloaded", [("A", 0.9), ("C", 0.5)])  # re-extracted
+    add_paper(db, "GSE1", "2", "failed", [("B", 0.8)], full_text="")
+    add_paper(db, "GSE1", "3", "downloaded")
+    add_paper(db, "GSE1", "4", grades=[("D", None)])
+    add_paper(db, "GSE2", "1", "downloaded", [("A", 0.95)])
+    db.insert_pdf_acquisition(PDFAcquisition(
+        geo_id="GSE1", pmid="1", pdf_path="GSE1/pmid_1.pdf", pdf_hash_sha256="y", status="downloaded",
+    ))
+    db.insert_universal_identifier(UniversalIdentifier(geo_id="GSE1", doi="10.1/no-pmid", title="No PMID"))
+    db.insert_url_discovery(URLDiscovery(geo_id="GSE1", pmid="1", urls_json="[]", sources_queried="[]"))
+    db.insert_enriched_content(EnrichedContent(geo_id="GSE1", pmid="1"))
+
+
+def view_rows(db):
+    with db.get_connection() as conn:
+        return {row["geo_id"]: dict(row) for row in conn.execute("SELECT * FROM v_geo_statistics")}
+
+
+def assert_matches_view(db):
+    expected = view_rows(db)
+    for geo_id, row in expected.items():
+        actual = {key: db.get_geo_statistics(geo_id)[key] for key in VIEW_COLUMNS}
+        assert actual == pytest.approx(row), geo_id
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = UnifiedDatabase(tmp_path / "omics.db")
+    populate(db)
+    return db
+
+
+class TestTriggers:
+    """Test incremental maintenance."""
+
+    def test_matches_view(self, db):
+        assert_matches_view(db)
+        stats = db.get_geo_statistics("GSE1")
+        assert stats["publication_count"] == 4
+        assert stats["pdfs_downloaded"] == 3
+        assert stats["pdfs_available"] == 2
+        assert stats["pdfs_extracted"] == 3
+        assert stats["fulltext_count"] == 2
+        assert stats["high_quality_count"] == 2
+        assert stats["avg_quality"] == pytest.approx((0.9 + 0.5 + 0.8) / 3)
+        assert db.get_geo_statistics("GSE3")["publication_count"] == 0
+
+    def test_deleting_duplicate_keeps_count(self, db):
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM pdf_acquisition WHERE pdf_hash_sha256 = 'y'")
+            conn.execute("DELETE FROM content_extraction WHERE extraction_grade = 'C'")
+        assert db.get_geo_statistics("GSE1")["pdfs_downloaded"] == 3
+        assert_matches_view(db)
+
+        with db.transaction() as conn:
+            conn.execute("DELETE FROM content_extraction WHERE geo_id = 'GSE1' AND pmid = '1'")
+            conn.execute("DELETE FROM pdf_acquisition WHERE geo_id = 'GSE1' AND pmid = '1'")
+        stats = db.get_geo_statistics("GSE1")
+        assert stats["pdfs_downloaded"] == 2 and stats["high_quality_count"] == 1
+        assert_matches_view(db)
+
+    def test_updates_move_counts(self, db):
+        db.record_pdf_integrity(verified=[], failures=[("GSE1", "3", "integrity: missing")])
+        assert db.get_geo_statistics("GSE1")["pdfs_available"] == 1
+
+        with db.transaction() as conn:
+            conn.execute(
+                "UPDATE content_extraction SET extraction_grade = 'A', extraction_quality = 0.7 "
+                "WHERE geo_id = 'GSE1' AND pmid = '4'"
+            )
+            conn.execute("UPDATE content_extraction SET full_text = 'now' WHERE geo_id = 'GSE1' AND pmid = '2'")
+        stats = db.get_geo_statistics("GSE1")
+        assert stats["high_quality_count"] == 3
+        assert stats["fulltext_count"] == 3
+        assert_matches_view(db)
+
+
+class TestRebuild:
+    """Test backfill and pipeline progress."""
+
+    def test_rebuild_backfills(self, tmp_path, db):
+        before = {geo_id: db.get_geo_counts(geo_id) for geo_id in ("GSE1", "GSE2")}
+        with db.transaction() as conn:
+            conn.execute("DROP TABLE geo_statistics")
+
+        reopened = UnifiedDatabase(tmp_path / "omics.db")  # recreates and rebuilds
+        for geo_id, counts in before.items():
+            after = reopened.get_geo_counts(geo_id)
+            counts.pop("updated_at"), after.pop("updated_at")
+            assert after == pytest.approx(counts)
+        assert reopened.rebuild_geo_statistics() == 2
+
+    def test_geo_progress(self, db):
+        from omics_oracle_v2.lib.pipelines.coordinator import PipelineCoordinator
+
+        coordinator = PipelineCoordinator.__new__(PipelineCoordinator)
+        coordinator.db = db
+        progress = coordinator.get_geo_progress("GSE1")
+        assert progress["total_publications"] == 4
+        assert (progress["urls"], progress["pdfs"], progress["extracted"], progress["enriched"]) == (1, 3, 3, 1)
+        assert coordinator.get_geo_progress("GSE9")["total_publications"] == 0
@@ -0,0 +1,134 @@
+"""
+Unit tests for the incremental PDF integrity scrubber.
+
+Tests cover:
+- First pass hashes everything once (hardlinked copies counted once)
+- Unchanged files are skipped on later passes; sampling rehashes them
+- Corrupt and missing files are reported and recorded in pdf_acquisition
+- An interrupted pass resumes without rehashing finished files
+- Hashing in a process pool
+"""
+
+import os
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.storage import (GEOStorage, IntegrityScrubber, PDFAcquisition,
+                                                   UnifiedDatabase, UniversalIdentifier)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = GEOStorage(tmp_path / "data")
+    for i, geo_ids in enumerate([["GSE1", "GSE2"], ["GSE1"], ["GSE2"]]):
+        pdf = tmp_path / f"paper{i}.pdf"
+        pdf.write_bytes(f"%PDF-1.7 paper {i} ".encode() * 2000)
+        for geo_id in geo_ids:
+            storage.save_pdf(geo_id, str(100 + i), pdf)
+    return storage
+
+
+@pytest.fixture
+def db(tmp_path, storage):
+    db = UnifiedDatabase(tmp_path / "omics.db")
+    for geo_id, pmid in [("GSE1", "100"), ("GSE1", "101"), ("GSE2", "100"), ("GSE2", "102")]:
+        db.insert_universal_identifier(UniversalIdentifier(geo_id=geo_id, pmid=pmid, title=f"Paper {pmid}"))
+        db.insert_pdf_acquisition(PDFAcquisition(
+            geo_id=geo_id, pmid=pmid, pdf_path=f"{geo_id}/pmid_{pmid}.pdf",
+            pdf_hash_sha256="x", status="downloaded",
+        ))
+    return db
+
+
+def corrupt(path):
+    """Flip bytes in place without changing size or mtime (bit rot)."""
+    info = path.stat()
+    os.chmod(path, 0o644)
+    with open(path, "r+b") as f:
+        f.write(b"XXXX")
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns))
+
+
+class TestPasses:
+    """Test incremental passes."""
+
+    def test_first_pass_hashes_each_file_once(self, storage):
+        report = IntegrityScrubber(storage, workers=1).run()
+
+        assert report["completed"]
+        assert report["files"] == 3  # paper0 is hardlinked into both datasets
+        assert report["verified"] == 3 and report["unchanged"] == 0
+        assert not report["corrupt"] and not report["missing"]
+
+    def test_unchanged_files_are_skipped(self, storage):
+        IntegrityScrubber(storage, workers=1, sample_rate=0).run()
+        report = IntegrityScrubber(storage, workers=1, sample_rate=0).run()
+
+        assert report["pass"] == 2
+        assert report["unchanged"] == 3 and report["bytes_hashed"] == 0
+
+    def test_sampling_finds_silent_corruption(self, storage):
+        IntegrityScrubber(storage, workers=1).run()
+        corrupt(storage.get_pdf_path("GSE1", "101"))
+
+        assert not IntegrityScrubber(storage, workers=1, sample_rate=0).run()["corrupt"]
+        report = IntegrityScrubber(storage, workers=1, sample_rate=1).run()
+
+        assert [(c["geo_id"], c["pmid"]) for c in report["corrupt"]] == [("GSE1", "101")]
+
+
+class TestFindings:
+    """Test reporting of corrupt and missing files."""
+
+    def test_findings_recorded_in_database(self, storage, db):
+        storage.get_pdf_path("GSE2", "102").unlink()
+        path = storage.get_pdf_path("GSE1", "100")
+        os.chmod(path, 0o644)
+        with open(path, "ab") as f:
+            f.write(b"trailing garbage")
+
+        report = IntegrityScrubber(storage, db=db, workers=1).run()
+
+        # Shared blob: both datasets referencing it are reported
+        assert sorted((c["geo_id"], c["pmid"]) for c in report["corrupt"]) == [("GSE1", "100"), ("GSE2", "100")]
+        assert [(m["geo_id"], m["pmid"]) for m in report["missing"]] == [("GSE2", "102")]
+        assert db.get_pdf_acquisition("GSE1", "100").status == "failed"
+        assert db.get_pdf_acquisition("GSE1", "100").error_message == "integrity: size mismatch"
+        assert db.get_pdf_acquisition("GSE2", "102").status == "failed"
+        assert db.get_pdf_acquisition("GSE1", "101").verified_at is not None
+
+    def test_repaired_file_is_restored(self, storage, db, tmp_path):
+        storage.get_pdf_path("GSE1", "101").unlink()
+        IntegrityScrubber(storage, db=db, workers=1).run()
+
+        storage.save_pdf("GSE1", "101", tmp_path / "paper1.pdf")
+        IntegrityScrubber(storage, db=db, workers=1).run()
+
+        acquisition = db.get_pdf_acquisition("GSE1", "101")
+        assert acquisition.status == "downloaded" and acquisition.error_message is None
+
+
+class TestResume:
+    """Test interruption and parallel hashing."""
+
+    def test_interrupted_pass_resumes(self, storage, monkeypatch):
+        scrubber = IntegrityScrubber(storage, workers=1)
+        original = scrubber._record_result
+
+        def record_then_stop(*args):
+            original(*args)
+            scrubber._stop.set()
+
+        monkeypatch.setattr(scrubber, "_record_result", record_then_stop)
+        first = scrubber.run()
+        assert not first["completed"] and first["verified"] == 1
+
+        second = IntegrityScrubber(storage, workers=1, sample_rate=1).run()
+
+        assert second["completed"] and second["pass"] == first["pass"]
+        assert second["verified"] == 2 and second["unchanged"] == 1
+
+    def test_process_pool(self, storage):
+        report = IntegrityScrubber(storage, workers=2, bandwidth_mb_per_sec=1000).run()
+
+        assert report["completed"] and report["verified"] == 3
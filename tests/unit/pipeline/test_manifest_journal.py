@@ -0,0 +1,125 @@
+"""
+Unit tests for journaled GEOStorage manifests.
+
+Tests cover:
+- Saves append one journal line instead of rewriting the snapshot
+- Snapshot + journal fold to the same manifest as before (puts, deletes)
+- A torn trailing journal record is skipped
+- Compaction produces an equivalent snapshot and an empty journal
+- Concurrent writers from several processes lose no entries
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.storage import GEOStorage
+from omics_oracle_v2.lib.pipelines.storage import geo_storage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return GEOStorage(tmp_path / "data")
+
+
+def make_pdf(tmp_path, name):
+    path = tmp_path / f"{name}.pdf"
+    path.write_bytes(f"%PDF-1.7 {name} ".encode() * 100)
+    return path
+
+
+def save_many(base_dir, src_dir, pmids):
+    storage = GEOStorage(base_dir)
+    for pmid in pmids:
+        storage.save_pdf("GSE1", pmid, make_pdf(src_dir, pmid))
+
+
+class TestJournal:
+    """Test journal appends and folding."""
+
+    def test_saves_append_to_journal(self, storage, tmp_path):
+        storage.save_pdf("GSE1", "111", make_pdf(tmp_path, "111"))
+        storage.save_pdf("GSE1", "222", make_pdf(tmp_path, "222"))
+
+        journal = storage._get_journal_path("GSE1").read_text().splitlines()
+        assert [json.loads(line)["pmid"] for line in journal] == ["111", "222"]
+        assert not storage._get_manifest_path("GSE1").exists()
+        assert set(storage._load_manifest("GSE1")["files"]) == {"111", "222"}
+        assert storage.get_geo_stats("GSE1")["has_manifest"]
+
+    def test_delete_and_reload(self, storage, tmp_path):
+        storage.save_pdf("GSE1", "111", make_pdf(tmp_path, "111"))
+        storage.save_pdf("GSE1", "222", make_pdf(tmp_path, "222"))
+        storage.delete_pdf("GSE1", "111")
+
+        # A fresh instance (no cache) folds the same state
+        assert set(GEOStorage(storage.base_dir)._load_manifest("GSE1")["files"]) == {"222"}
+        assert storage.verify_pdf("GSE1", "222")
+
+    def test_torn_record_is_skipped(self, storage, tmp_path):
+        storage.save_pdf("GSE1", "111", make_pdf(tmp_path, "111"))
+        with open(storage._get_journal_path("GSE1"), "a") as f:
+            f.write('{"op": "put", "pmid": "222", "ent')
+
+        assert set(GEOStorage(storage.base_dir)._load_manifest("GSE1")["files"]) == {"111"}
+
+    def test_loaded_manifest_is_a_copy(self, storage, tmp_path):
+        storage.save_pdf("GSE1", "111", make_pdf(tmp_path, "111"))
+        storage._load_manifest("GSE1")["files"]["111"]["sha256"] = "tampered"
+
+        assert storage.verify_pdf("GSE1", "111")
+
+
+class TestCompaction:
+    """Test folding the journal into the snapshot."""
+
+    def test_compact_manifest(self, storage, tmp_path):
+        for pmid in ("111", "222", "333"):
+            storage.save_pdf("GSE1", pmid, make_pdf(tmp_path, pmid))
+        storage.delete_pdf("GSE1", "222")
+        before = storage._load_manifest("GSE1")["files"]
+
+        storage.compact_manifest("GSE1")
+
+        assert storage._get_journal_path("GSE1").read_text() == ""
+        snapshot = json.loads(storage._get_manifest_path("GSE1").read_text())
+        assert snapshot["files"] == before == GEOStorage(storage.base_dir)._load_manifest("GSE1")["files"]
+
+    def test_compacts_when_journal_outgrows_snapshot(self, storage, tmp_path, monkeypatch):
+        monkeypatch.setattr(geo_storage, "MANIFEST_COMPACT_MIN_BYTES", 0)
+        pdf = make_pdf(tmp_path, "111")
+        for _ in range(5):
+            storage.save_pdf("GSE1", "111", pdf)
+
+        # Journal never grows past the snapshot it will be folded into
+        assert storage._get_journal_path("GSE1").stat().st_size <= storage._get_manifest_path("GSE1").stat().st_size
+        assert list(storage._load_manifest("GSE1")["files"]) == ["111"]
+
+    def test_rebuild_manifest_discards_journal(self, storage, tmp_path):
+        storage.save_pdf("GSE1", "111", make_pdf(tmp_path, "111"))
+        storage.get_pdf_path("GSE1", "111").unlink()
+
+        storage.rebuild_manifest("GSE1")
+
+        assert storage._get_journal_path("GSE1").read_text() == ""
+        assert storage._load_manifest("GSE1")["files"] == {}
+
+
+class TestConcurrency:
+    """Test concurrent writers."""
+
+    def test_concurrent_processes_lose_no_entries(self, tmp_path, monkeypatch):
+        base_dir = tmp_path / "data"
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=save_many, args=(base_dir, tmp_path, [f"{w}{i:02d}" for i in range(20)]))
+            for w in range(1, 5)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        manifest = GEOStorage(base_dir)._load_manifest("GSE1")
+        assert len(manifest["files"]) == 80
@@ -0,0 +1,184 @@
+"""
+Unit tests for buffered citation discovery metrics.
+
+Tests cover:
+- MetricsSink buffers records until the size threshold, interval, or flush
+- Batched appends rotate by size
+- SnapshotWriter keeps only the latest snapshot and writes it atomically
+- One exit hook flushes every live writer without keeping writers alive
+- MetricsLogger and SourceManager route their writes through the sinks
+"""
+
+import gc
+import json
+import time
+
+from omics_oracle_v2.lib.pipelines.citation_discovery import metrics_sink
+from omics_oracle_v2.lib.pipelines.citation_discovery.metrics_logger import MetricsLogger
+from omics_oracle_v2.lib.pipelines.citation_discovery.metrics_sink import (
+    MetricsSink,
+    SnapshotWriter,
+)
+from omics_oracle_v2.lib.pipelines.citation_discovery.source_metrics import (
+    SourceManager,
+    SourceManagerConfig,
+    SourcePriority,
+)
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestMetricsSink:
+    """Test buffered JSONL appends."""
+
+    def test_records_are_buffered_until_flush(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), max_buffer=100, flush_interval=60)
+
+        sink.write({"n": 1})
+        sink.write({"n": 2})
+
+        assert not path.exists()
+        assert sink.pending == 2
+
+        assert sink.flush() == 2
+        assert read_lines(path) == [{"n": 1}, {"n": 2}]
+        sink.close()
+
+    def test_full_buffer_wakes_writer(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), max_buffer=3, flush_interval=60)
+
+        for n in range(3):
+            sink.write({"n": n})
+
+        assert wait_for(lambda: sink.records_written == 3)
+        assert sink.flushes == 1
+        assert len(read_lines(path)) == 3
+        sink.close()
+
+    def test_interval_flush_and_idle_writer_exits(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), max_buffer=100, flush_interval=0.05)
+
+        sink.write({"n": 1})
+
+        assert wait_for(lambda: sink.records_written == 1)
+        assert wait_for(lambda: sink._thread is None)
+
+        # Next write restarts the writer
+        sink.write({"n": 2})
+        assert wait_for(lambda: sink.records_written == 2)
+        sink.close()
+
+    def test_close_flushes_and_later_writes_go_direct(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), flush_interval=60)
+
+        sink.write({"n": 1})
+        sink.close()
+        assert len(read_lines(path)) == 1
+
+        sink.write({"n": 2})
+        assert len(read_lines(path)) == 2
+
+    def test_exit_hook_flushes_live_writers(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), flush_interval=60)
+        sink.write({"n": 1})
+        assert sink in metrics_sink._writers
+
+        metrics_sink._close_writers()
+        assert len(read_lines(path)) == 1
+
+        count = len(metrics_sink._writers)
+        del sink
+        gc.collect()
+        assert len(metrics_sink._writers) == count - 1
+
+    def test_rotation_checked_per_batch(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        sink = MetricsSink(str(path), flush_interval=60, max_file_size_mb=0.0001)
+
+        for n in range(20):
+            sink.write({"n": n, "padding": "x" * 10})
+        sink.flush()
+
+        archives = list(tmp_path.glob("metrics_*.jsonl"))
+        assert len(archives) == 1
+        assert len(read_lines(archives[0])) == 20
+        assert not path.exists()
+        sink.close()
+
+
+class TestSnapshotWriter:
+    """Test debounced atomic snapshots."""
+
+    def test_latest_snapshot_wins(self, tmp_path):
+        path = tmp_path / "summary.json"
+        writer = SnapshotWriter(str(path), flush_interval=60)
+
+        for n in range(5):
+            writer.submit({"version": n})
+
+        assert not path.exists()
+        writer.close()
+
+        assert json.loads(path.read_text()) == {"version": 4}
+        assert writer.writes == 1
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+class TestDiscoveryMetrics:
+    """Test MetricsLogger and SourceManager integration."""
+
+    def test_recent_sessions_include_buffered_records(self, tmp_path):
+        metrics = MetricsLogger(log_file=str(tmp_path / "log.jsonl"), flush_interval=60)
+
+        metrics.log_discovery_session(
+            geo_id="GSE1",
+            sources={"pubmed": {"success": True, "papers_found": 3, "response_time": 0.5}},
+        )
+
+        sessions = metrics.get_recent_sessions(days=1)
+        assert [s["geo_id"] for s in sessions] == ["GSE1"]
+        metrics.close()
+
+    def test_prometheus_export(self, tmp_path):
+        from omics_oracle_v2.api.metrics import citation_source_requests_total
+
+        counter = citation_source_requests_total.labels(source="openalex", status="success")
+        before = counter._value.get()
+
+        metrics = MetricsLogger(enable_logging=False, prometheus_export=True)
+        metrics.log_discovery_session(
+            geo_id="GSE2",
+            sources={"openalex": {"success": True, "papers_found": 2, "response_time": 0.1}},
+        )
+
+        assert counter._value.get() == before + 1
+
+    def test_source_manager_snapshots_in_background(self, tmp_path):
+        path = tmp_path / "source_metrics.json"
+        manager = SourceManager(SourceManagerConfig(metrics_file=str(path), metrics_flush_interval=60))
+
+        manager.register_source("openalex", SourcePriority.HIGH)
+        manager.record_deduplication({"openalex": ["p1", "p2"]})
+
+        assert not path.exists()
+        manager.close()
+
+        saved = json.loads(path.read_text())
+        assert "timestamp" in saved
+        assert "openalex" in saved["sources"]
@@ -0,0 +1,226 @@
+"""
+Unit tests for dataset-level batched URL collection.
+
+Tests cover:
+- PMC ID conversion batches 200 PMIDs per request
+- Crossref filter=doi: batching and per-DOI fallback semantics
+- Prefetch returns only definitive answers, never failed lookups
+- get_all_fulltext_urls_batch issues batched calls and fans results out
+- Prefetched answers stay with their batch, never on the shared clients
+"""
+
+import asyncio
+
+import pytest
+
+from omics_oracle_v2.lib.pipelines.url_collection.manager import (
+    FullTextManager,
+    FullTextManagerConfig,
+)
+from omics_oracle_v2.lib.pipelines.url_collection.sources.oa_sources import (
+    CrossrefClient,
+    PMCClient,
+    PMCConfig,
+    UnpaywallClient,
+    UnpaywallConfig,
+)
+from omics_oracle_v2.lib.search_engines.citations.models import Publication, PublicationSource
+
+
+class FakeResponse:
+    def __init__(self, status=200, json_data=None, text=""):
+        self.status = status
+        self._json = json_data
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def json(self):
+        return self._json
+
+    async def text(self):
+        return self._text
+
+
+class FakeSession:
+    """Routes requests to canned responses and records every URL requested."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        self.requests.append(url)
+
+        if "idconv" in url:
+            ids = url.split("ids=")[1].split("&")[0].split(",")
+            return FakeResponse(
+                json_data={"records": [{"pmid": pmid, "pmcid": f"PMC9{pmid}"} for pmid in ids]}
+            )
+
+        if "oa.fcgi" in url:
+            pmc_id = url.split("id=")[1]
+            xml = f'<OA><records><record><link format="pdf" href="ftp://ftp.ncbi.nlm.nih.gov/{pmc_id}.pdf"/></record></records></OA>'
+            return FakeResponse(text=xml)
+
+        if "api.crossref.org/works?filter=" in url:
+            dois = [part[len("doi:") :] for part in url.split("filter=")[1].split("&")[0].split(",")]
+            items = [
+                {"DOI": doi, "link": [{"URL": f"https://publisher.example/{doi}.pdf", "content-type": "application/pdf"}]}
+                for doi in dois
+                if not doi.endswith("missing")
+            ]
+            return FakeResponse(json_data={"message": {"items": items}})
+
+        if "api.unpaywall.org" in url:
+            doi = url.split("/v2/")[1]
+            return FakeResponse(
+                json_data={"is_oa": True, "best_oa_location": {"url_for_pdf": f"https://oa.example/{doi}.pdf"}}
+            )
+
+        return FakeResponse(status=404)
+
+    def head(self, url, **kwargs):
+        self.requests.append(url)
+        return FakeResponse(status=404)
+
+    async def close(self):
+        pass
+
+
+def make_publications(count):
+    return [
+        Publication(
+            title=f"Paper {i}",
+            source=PublicationSource.PUBMED,
+            pmid=str(1000 + i),
+            doi=f"10.1/paper{i}",
+        )
+        for i in range(count)
+    ]
+
+
+class TestClientBatching:
+    """Test batch methods on individual clients."""
+
+    @pytest.mark.asyncio
+    async def test_pmc_conversion_batches_200_ids(self):
+        client = PMCClient(PMCConfig())
+        client.session = FakeSession()
+
+        pmids = [str(i) for i in range(450)]
+        converted = await client.convert_pmids_to_pmcids(pmids)
+
+        assert len(client.session.requests) == 3
+        assert converted["7"] == "97"
+
+        # Lookups given the conversions skip the per-PMID request
+        publication = make_publications(1)[0]
+        publication.pmid = "7"
+        assert await client._extract_pmc_id(publication, converted) == "97"
+        assert len(client.session.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_crossref_doi_filter_batching(self):
+        client = CrossrefClient()
+        client.config.rate_limit_per_second = 1000
+        client.session = FakeSession()
+
+        results = await client.get_by_dois(["10.1/A", "10.1/missing", "10.1/b"], batch_size=2)
+
+        assert len(client.session.requests) == 2
+        assert results["10.1/a"]["fulltext_urls"] == ["https://publisher.example/10.1/A.pdf"]
+        assert results["10.1/missing"] is None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_skips_failed_lookups(self):
+        class FlakySession(FakeSession):
+            def get(self, url, **kwargs):
+                if "timeout" in url:
+                    self.requests.append(url)
+                    raise asyncio.TimeoutError()
+                if "api.crossref.org" in url and "10.1/down" in url:
+                    self.requests.append(url)
+                    return FakeResponse(status=503)
+                return super().get(url, **kwargs)
+
+        unpaywall = UnpaywallClient(UnpaywallConfig(email="test@example.org", retry_count=1))
+        unpaywall.session = FlakySession()
+        prefetched = await unpaywall.prefetch(["10.1/timeout", "10.1/a"])
+        assert set(prefetched) == {"10.1/a"}
+
+        crossref = CrossrefClient()
+        crossref.config.rate_limit_per_second = 1000
+        crossref.config.retry_count = 1
+        crossref.session = FlakySession()
+        prefetched = await crossref.get_by_dois(["10.1/down", "10.1/missing"], batch_size=1)
+        assert prefetched == {"10.1/missing": None}
+
+
+class TestManagerBatch:
+    """Test dataset-level collection."""
+
+    @staticmethod
+    def make_manager(session):
+        config = FullTextManagerConfig(
+            enable_institutional=False,
+            enable_openalex=False,
+            enable_core=False,
+            enable_biorxiv=False,
+            enable_arxiv=False,
+            enable_scihub=False,
+            enable_libgen=False,
+            enable_url_cache=False,
+        )
+        manager = FullTextManager(config)
+        manager.initialized = True
+
+        manager.pmc_client = PMCClient(PMCConfig())
+        manager.crossref_client = CrossrefClient()
+        manager.crossref_client.config.rate_limit_per_second = 1000
+        manager.unpaywall_client = UnpaywallClient(UnpaywallConfig(email="test@example.org"))
+        for client in (manager.pmc_client, manager.crossref_client, manager.unpaywall_client):
+            client.session = session
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_batch_collection_uses_batched_upstream_calls(self):
+        session = FakeSession()
+        manager = self.make_manager(session)
+
+        publications = make_publications(100)
+        results = await manager.get_all_fulltext_urls_batch(publications)
+
+        assert len(results) == 100
+        assert all(r.success for r in results)
+        assert {u.source.value for u in results[0].all_urls} == {"unpaywall", "crossref", "pmc"}
+
+        idconv = [url for url in session.requests if "idconv" in url]
+        crossref = [url for url in session.requests if "api.crossref.org" in url]
+        unpaywall = [url for url in session.requests if "api.unpaywall.org" in url]
+        assert len(idconv) == 1
+        assert len(crossref) == 2
+        assert len(unpaywall) == 100
+
+    @pytest.mark.asyncio
+    async def test_concurrent_batches_keep_their_own_lookups(self):
+        session = FakeSession()
+        manager = self.make_manager(session)
+
+        publications = make_publications(40)
+        first, second = await asyncio.gather(
+            manager.get_all_fulltext_urls_batch(publications[:20]),
+            manager.get_all_fulltext_urls_batch(publications[20:]),
+        )
+
+        assert all(r.success for r in first + second)
+
+        # One conversion request per batch; no per-PMID fallbacks after the
+        # other batch finished
+        idconv = [url for url in session.requests if "idconv" in url]
+        crossref_single = [url for url in session.requests if "api.crossref.org/works/" in url]
+        assert len(idconv) == 2
+        assert not crossref_single
@@ -0,0 +1,177 @@
+"""
+Unit tests for early-exit and hedged URL collection in FullTextManager.
+
+Tests cover:
+- "all" mode waits for every source
+- "good_enough" mode returns on the first direct PDF URL and caches late sources
+- Hedged download starts before slow sources finish and falls back on failure
+- FulltextService downloads through the hedged path in "hedged" mode
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from omics_oracle_v2.cache.url_cache import URLCollectionCache
+from omics_oracle_v2.lib.pipelines.url_collection.manager import (
+    FullTextManager,
+    FullTextManagerConfig,
+    FullTextResult,
+    FullTextSource,
+)
+from omics_oracle_v2.lib.search_engines.citations.models import Publication, PublicationSource
+from omics_oracle_v2.services.fulltext_service import FulltextService
+
+FAST_PDF = "https://oa.example.org/paper.pdf"
+SLOW_PDF = "https://core.example.org/download/paper.pdf"
+
+
+def make_manager(mode, slow_delay=0.5):
+    config = FullTextManagerConfig(
+        enable_institutional=False,
+        enable_pmc=False,
+        enable_openalex=False,
+        enable_core=True,
+        enable_biorxiv=False,
+        enable_arxiv=False,
+        enable_crossref=False,
+        enable_unpaywall=True,
+        enable_scihub=False,
+        enable_libgen=False,
+        url_race_mode=mode,
+    )
+    manager = FullTextManager(config)
+    manager.initialized = True
+    manager.url_cache = URLCollectionCache(use_redis=False)
+    manager.unpaywall_client = AsyncMock()
+    manager.core_client = AsyncMock()
+
+    async def fast(publication):
+        return FullTextResult(success=True, source=FullTextSource.UNPAYWALL, url=FAST_PDF)
+
+    async def slow(publication):
+        await asyncio.sleep(slow_delay)
+        return FullTextResult(success=True, source=FullTextSource.CORE, url=SLOW_PDF)
+
+    manager._try_unpaywall = fast
+    manager._try_core = slow
+    return manager
+
+
+def make_publication():
+    return Publication(title="Test paper", source=PublicationSource.PUBMED, doi="10.1/race")
+
+
+class FakeDownloader:
+    """Records attempted URLs; succeeds only for URLs in `working`."""
+
+    def __init__(self, working):
+        self.working = set(working)
+        self.attempts = []
+
+    async def download_with_fallback(self, publication, all_urls, output_dir):
+        for url in all_urls:
+            self.attempts.append(url.url)
+            if url.url in self.working:
+                return SimpleNamespace(success=True, pdf_path=None, source=url.source.value)
+        return SimpleNamespace(success=False, pdf_path=None, source=None)
+
+
+class TestGoodEnoughMode:
+    """Test early-exit URL collection."""
+
+    @pytest.mark.asyncio
+    async def test_all_mode_waits_for_every_source(self):
+        manager = make_manager("all", slow_delay=0.05)
+
+        result = await manager.get_all_fulltext_urls(make_publication())
+
+        assert [u.url for u in result.all_urls] == [FAST_PDF, SLOW_PDF]
+        assert "early_exit" not in result.metadata
+
+    @pytest.mark.asyncio
+    async def test_returns_before_slow_source_and_fills_cache(self):
+        manager = make_manager("good_enough", slow_delay=0.2)
+
+        result = await manager.get_all_fulltext_urls(make_publication())
+
+        assert [u.url for u in result.all_urls] == [FAST_PDF]
+        assert result.metadata["pending_sources"] == ["core"]
+
+        await asyncio.gather(*manager._background_tasks)
+        entry = await manager.url_cache.get("doi:10.1/race", "core")
+        assert entry["url"] == SLOW_PDF
+
+    @pytest.mark.asyncio
+    async def test_cleanup_cancels_background_lookups(self):
+        manager = make_manager("good_enough", slow_delay=5)
+
+        await manager.get_all_fulltext_urls(make_publication())
+        assert manager._background_tasks
+
+        await manager.cleanup()
+        assert not manager._background_tasks
+
+
+class TestHedgedMode:
+    """Test hedged download."""
+
+    @pytest.mark.asyncio
+    async def test_download_starts_on_first_good_url(self, tmp_path):
+        manager = make_manager("hedged", slow_delay=5)
+        downloader = FakeDownloader(working=[FAST_PDF])
+
+        result = await asyncio.wait_for(
+            manager.get_fulltext_hedged(make_publication(), downloader, tmp_path), timeout=2
+        )
+
+        assert result.success
+        assert downloader.attempts == [FAST_PDF]
+        await manager.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_remaining_urls(self, tmp_path):
+        manager = make_manager("hedged", slow_delay=0.05)
+        downloader = FakeDownloader(working=[SLOW_PDF])
+
+        result = await manager.get_fulltext_hedged(make_publication(), downloader, tmp_path)
+
+        assert result.success
+        assert downloader.attempts == [FAST_PDF, SLOW_PDF]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_source_does_not_abort_collection(self):
+        manager = make_manager("hedged", slow_delay=0.05)
+
+        async def cancelled(publication):
+            raise asyncio.CancelledError()
+
+        manager._try_core = cancelled
+        result = await manager.get_all_fulltext_urls(make_publication())
+
+        assert [u.url for u in result.all_urls] == [FAST_PDF]
+
+    @pytest.mark.asyncio
+    async def test_fulltext_service_routes_downloads_through_hedging(self, tmp_path):
+        manager = make_manager("hedged", slow_delay=5)
+        pdf_path = tmp_path / "pmid_1.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        pub = Publication(title="Test paper", source=PublicationSource.PUBMED, pmid="1")
+        manager.get_fulltext_hedged = AsyncMock(
+            return_value=SimpleNamespace(
+                publication=pub, success=True, pdf_path=pdf_path, file_size=8, source=FAST_PDF
+            )
+        )
+        downloader = FakeDownloader(working=[])
+
+        service = FulltextService.__new__(FulltextService)
+        service.db = MagicMock()
+        results = await service._download_pdfs(
+            "GSE1", [pub], {}, downloader, tmp_path / "out", hedge_manager=manager
+        )
+
+        assert results[0].success
+        manager.get_fulltext_hedged.assert_awaited_once_with(pub, downloader, tmp_path / "out")
+        assert downloader.attempts == []
@@ -0,0 +1,132 @@
+"""
+Unit tests for token-budget context packing.
+
+Tests cover:
+- Full text is split at real section headings
+- Packed context never exceeds the token budget and keeps every dataset header
+- Passages relevant to the query win over filler
+- AnalysisService loads candidate papers concurrently
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from omics_oracle_v2.services.analysis_context import (ContextBuilder, PaperContent, Tokenizer, context_window,
+                                                       split_sections)
+from omics_oracle_v2.services.analysis_service import AnalysisService
+
+
+def make_dataset(geo_id, title="Study", summary="Expression profiling of tumour samples."):
+    return SimpleNamespace(
+        geo_id=geo_id,
+        title=title,
+        summary=summary,
+        organism="Homo sapiens",
+        sample_count=24,
+        relevance_score=0.8,
+        pubmed_ids=[],
+        fulltext=[],
+    )
+
+
+FILLER = "The samples were stored and processed according to the standard laboratory protocol. " * 6
+
+
+class TestSplitSections:
+    """Test heading detection in raw full text."""
+
+    def test_split_at_headings(self):
+        text = (
+            "Single-cell atlas of breast tumours.\n\n"
+            "1. Introduction\nTumours are heterogeneous.\n\n"
+            "Materials and Methods\nWe used 10x Chromium.\n\n"
+            "Results\nWe found 12 clusters.\n\n"
+            "Discussion\nClusters differ by subtype.\n\n"
+            "References\n[1] Smith et al."
+        )
+
+        sections = split_sections(text)
+
+        assert sections["abstract"].startswith("Single-cell atlas")
+        assert "heterogeneous" in sections["abstract"]
+        assert sections["methods"] == "We used 10x Chromium."
+        assert sections["results"] == "We found 12 clusters."
+        assert "Smith" not in " ".join(sections.values())
+
+    def test_no_headings_keeps_full_text(self):
+        assert split_sections("Just one block of text.") == {"full_text": "Just one block of text."}
+
+
+class TestContextBuilder:
+    """Test ranking and packing."""
+
+    def test_packs_within_budget_and_keeps_headers(self):
+        tokenizer = Tokenizer()
+        datasets = [make_dataset(f"GSE10000{i}") for i in range(3)]
+        papers = [
+            [PaperContent(pmid=f"{i}{j}", title=f"Paper {j}", sections={"methods": FILLER, "results": FILLER})
+             for j in range(4)]
+            for i in range(3)
+        ]
+        papers[1][2].sections["results"] = "CRISPR screen of BRCA1 in breast cancer organoids. " * 4
+
+        for budget in (300, 800, 2000):
+            summaries, papers_used, tokens = ContextBuilder(tokenizer).pack(datasets, papers, "BRCA1 CRISPR", budget)
+
+            assert tokens <= budget
+            assert tokens == tokenizer.count("\n\n".join(summaries))
+            for dataset, summary in zip(datasets, summaries):
+                assert f"**{dataset.geo_id}**" in summary
+            # The relevant passage is packed first
+            if budget >= 800:
+                assert "CRISPR screen of BRCA1" in summaries[1]
+
+    def test_oversized_paragraphs_are_split(self):
+        builder = ContextBuilder(Tokenizer(), passage_tokens=50)
+        passages = builder.passages(FILLER * 5)
+
+        assert len(passages) > 1
+        assert all(builder.tokenizer.count(p) <= 100 for p in passages)
+
+    def test_truncate_respects_token_count(self):
+        tokenizer = Tokenizer()
+        truncated = tokenizer.truncate(FILLER, 20)
+
+        assert tokenizer.count(truncated) <= 20
+        assert FILLER.startswith(truncated)
+
+    def test_context_windows(self):
+        assert context_window("gpt-4") == 8192
+        assert context_window("gpt-4-turbo-preview") == 128000
+        assert context_window("unknown-model") == 8192
+
+
+class SlowParsedCache:
+    """Parsed cache whose every lookup takes 50 ms."""
+
+    async def get(self, pmid):
+        await asyncio.sleep(0.05)
+        return {"content": {"methods": f"Methods of paper {pmid}. " * 10}}
+
+
+class TestConcurrentLoading:
+    """Test that candidate papers are loaded concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_papers_loaded_concurrently(self):
+        datasets = [make_dataset("GSE100001"), make_dataset("GSE100002")]
+        for i, dataset in enumerate(datasets):
+            dataset.fulltext = [{"pmid": f"{i}{j}", "title": f"Paper {j}"} for j in range(5)]
+
+        start = time.perf_counter()
+        summaries, papers_used = await AnalysisService()._build_dataset_summaries(
+            datasets, SlowParsedCache(), "methods", token_budget=4000, tokenizer=Tokenizer(), max_papers_per_dataset=5
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.25  # 10 sequential loads would take 0.5 s
+        assert papers_used == 10
+        assert "Methods of paper 00." in summaries[0]
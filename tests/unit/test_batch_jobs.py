@@ -0,0 +1,223 @@
+"""
+Unit tests for durable batch jobs.
+
+Tests cover:
+- Worker pool runs submitted workflows and completes the job
+- Retries keep the idempotency key; exhausted retries fail the workflow
+- Idempotent resubmission returns the original job
+- Concurrency stays within max_concurrency
+- Two managers sharing a database finish one job without losing updates
+- A restarted manager resumes only the unfinished workflows
+- Lease-expired reclaims count as attempts; an item that keeps losing its
+  worker is failed
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from omics_oracle_v2.api.batch import BatchJobManager, JobStatus
+from omics_oracle_v2.api.batch_store import ITEM_COMPLETED, ITEM_FAILED, ITEM_PENDING, SQLiteJobStore
+
+
+async def wait_for(condition, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if condition():
+            return True
+        await asyncio.sleep(0.01)
+    return condition()
+
+
+def make_manager(tmp_path, executor, **kwargs):
+    kwargs.setdefault("retry_backoff", 0.0)
+    kwargs.setdefault("poll_interval", 0.05)
+    return BatchJobManager(store=SQLiteJobStore(str(tmp_path / "batch.db")), executor=executor, **kwargs)
+
+
+def is_finished(manager, job_id):
+    return manager.get_job(job_id).status in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class TestWorkerPool:
+    """Test running submitted workflows."""
+
+    @pytest.mark.asyncio
+    async def test_runs_workflows_to_completion(self, tmp_path):
+        async def executor(spec, key):
+            return {"doubled": spec["n"] * 2}
+
+        manager = make_manager(tmp_path, executor)
+        manager.start_workers()
+        job_id = await manager.submit_job([{"workflow_id": f"wf-{n}", "n": n} for n in range(5)])
+
+        assert await wait_for(lambda: is_finished(manager, job_id))
+        job = manager.get_job(job_id)
+        assert job.status == JobStatus.COMPLETED
+        assert job.completed_workflows == 5
+        assert sorted(wf.result["doubled"] for wf in job.workflows) == [0, 2, 4, 6, 8]
+        await manager.stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_idempotency_key(self, tmp_path):
+        keys = []
+
+        async def flaky(spec, key):
+            keys.append(key)
+            if len(keys) < 3:
+                raise RuntimeError("transient")
+            return {"ok": True}
+
+        manager = make_manager(tmp_path, flaky, max_attempts=3)
+        manager.start_workers()
+        job_id = await manager.submit_job([{"query": "x"}], idempotency_key="req-1")
+
+        assert await wait_for(lambda: is_finished(manager, job_id))
+        assert manager.get_job(job_id).status == JobStatus.COMPLETED
+        assert keys == ["req-1:0"] * 3
+        await manager.stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_fail_workflow(self, tmp_path):
+        async def broken(spec, key):
+            raise RuntimeError("boom")
+
+        manager = make_manager(tmp_path, broken, max_attempts=2)
+        manager.start_workers()
+        job_id = await manager.submit_job([{"query": "x"}])
+
+        assert await wait_for(lambda: is_finished(manager, job_id))
+        job = manager.get_job(job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.workflows[0].error == "boom"
+        assert manager.store.load_items(job_id)[0].attempts == 2
+        await manager.stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_idempotent_submit(self, tmp_path):
+        async def executor(spec, key):
+            return {}
+
+        manager = make_manager(tmp_path, executor)
+        first = await manager.submit_job([{"query": "a"}], idempotency_key="same")
+        second = await manager.submit_job([{"query": "a"}], idempotency_key="same")
+
+        assert first == second
+        assert len(manager.store.load_items(first)) == 1
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self, tmp_path):
+        running, peak = 0, 0
+
+        async def executor(spec, key):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return {}
+
+        manager = make_manager(tmp_path, executor, max_concurrency=3)
+        manager.start_workers()
+        job_id = await manager.submit_job([{"n": n} for n in range(12)])
+
+        assert await wait_for(lambda: is_finished(manager, job_id))
+        assert peak == 3
+        await manager.stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_two_managers_share_a_job(self, tmp_path):
+        async def executor(spec, key):
+            await asyncio.sleep(0.005)
+            return {"n": spec["n"]}
+
+        # Two processes (separate connections) working on the same database
+        first = make_manager(tmp_path, executor, max_concurrency=3)
+        second = make_manager(tmp_path, executor, max_concurrency=3)
+        second._owner_prefix = "other-host:2"
+        first.start_workers()
+        second.start_workers()
+        job_id = await first.submit_job([{"n": n} for n in range(20)])
+
+        assert await wait_for(lambda: first.store.load_job(job_id).status == JobStatus.COMPLETED)
+        job = second.store.load_job(job_id)
+        assert job.completed_workflows == 20 and len(job.workflows) == 20
+        assert {item.lease_owner for item in first.store.load_items(job_id)} == {None}
+        await first.stop_workers()
+        await second.stop_workers()
+
+
+class TestRecovery:
+    """Test resuming jobs after a restart."""
+
+    @pytest.mark.asyncio
+    async def test_restart_resumes_remaining_workflows(self, tmp_path):
+        db_path = str(tmp_path / "batch.db")
+        store = SQLiteJobStore(db_path)
+        calls = []
+
+        async def executor(spec, key):
+            calls.append(spec["n"])
+            return {"n": spec["n"]}
+
+        # First process: submit, finish one workflow, crash while holding another lease
+        first = BatchJobManager(store=store, executor=executor)
+        job_id = await first.submit_job([{"n": n} for n in range(3)])
+        now = time.time()
+        done = store.claim_item("old-host:1:0", now + 60, now)
+        store.complete_item(done.item_id, "old-host:1:0", {"n": 0}, now)
+        store.claim_item("old-host:1:0", now - 1, now)  # lease already expired
+
+        # Second process on the same database
+        restarted = BatchJobManager(store=SQLiteJobStore(db_path), executor=executor, poll_interval=0.05)
+        assert await restarted.recover() == 1
+        assert restarted.get_job(job_id).completed_workflows == 1
+
+        restarted.start_workers()
+        assert await wait_for(lambda: is_finished(restarted, job_id))
+
+        assert sorted(calls) == [1, 2]
+        assert restarted.get_job(job_id).completed_workflows == 3
+        assert {item.status for item in restarted.store.load_items(job_id)} == {ITEM_COMPLETED}
+        await restarted.stop_workers()
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_in_flight_work(self, tmp_path):
+        started = asyncio.Event()
+
+        async def slow(spec, key):
+            started.set()
+            await asyncio.sleep(10)
+
+        manager = make_manager(tmp_path, slow, max_concurrency=1)
+        manager.start_workers()
+        job_id = await manager.submit_job([{"n": 0}])
+        await asyncio.wait_for(started.wait(), timeout=5)
+
+        await manager.stop_workers()
+
+        item = manager.store.load_items(job_id)[0]
+        assert item.status == ITEM_PENDING
+        assert item.lease_owner is None
+
+    @pytest.mark.asyncio
+    async def test_lost_worker_exhausts_attempts(self, tmp_path):
+        manager = make_manager(tmp_path, None, max_attempts=2)
+        job_id = await manager.submit_job([{"n": 0}])
+        store = manager.store
+
+        # Two workers in a row crash holding the lease (claimed with an already-expired lease)
+        now = time.time()
+        for attempt in (1, 2):
+            item = store.claim_item(f"dead-host:{attempt}:0", now - 1, now, max_attempts=2)
+            assert item.status == "running" and item.attempts == attempt
+
+        item = store.claim_item("live-host:3:0", now + 60, now, max_attempts=2)
+        assert item.status == ITEM_FAILED and item.lease_owner is None
+        assert "after 2 attempts" in item.error
+        assert store.claim_item("live-host:3:0", now + 60, now, max_attempts=2) is None
+
+        job = store.sync_job(job_id, now)
+        assert job.status == JobStatus.FAILED and job.failed_workflows == 1
@@ -0,0 +1,220 @@
+"""
+Unit tests for the local GEO full-text (FTS5/BM25) index.
+
+Tests cover:
+- Inserts and text updates keep the index in sync
+- BM25 ranks title matches above summary matches
+- NCBI-style queries are sanitized into safe MATCH expressions
+- Databases created before the index existed are backfilled
+- SearchOrchestrator serves local results only when NCBI fails, honouring its field filters
+- A slow NCBI falls back to the local index at local_index_deadline
+"""
+
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from omics_oracle_v2.core.config import SearchSettings
+from omics_oracle_v2.lib.pipelines.storage.models import GEODataset
+from omics_oracle_v2.lib.pipelines.storage.unified_db import (UnifiedDatabase, fts_match_query,
+                                                              split_field_filters)
+from omics_oracle_v2.lib.query_processing.optimization.analyzer import QueryAnalyzer
+from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
+from omics_oracle_v2.lib.search_orchestration import SearchOrchestrator
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = UnifiedDatabase(tmp_path / "omics.db")
+    db.insert_geo_dataset(GEODataset(
+        geo_id="GSE100001", title="Single-cell atlas of breast cancer", summary="Tumour heterogeneity.",
+        organism="Homo sapiens", platform="GPL24676",
+    ))
+    db.insert_geo_dataset(GEODataset(
+        geo_id="GSE100002", title="Mouse liver fibrosis", summary="Compared with breast tissue controls.",
+        organism="Mus musculus", platform="GPL21103",
+    ))
+    db.insert_geo_dataset(GEODataset(geo_id="GSE100003", title="Arabidopsis root development"))
+    return db
+
+
+class TestIndex:
+    """Test index sync and BM25 ranking."""
+
+    def test_search_ranks_title_matches_first(self, db):
+        results = db.search_geo_datasets("breast")
+
+        assert [d.geo_id for d, _ in results] == ["GSE100001", "GSE100002"]
+        assert results[0][1] > results[1][1]
+
+    def test_terms_are_anded(self, db):
+        assert [d.geo_id for d, _ in db.search_geo_datasets("breast cancer")] == ["GSE100001"]
+        assert [d.geo_id for d, _ in db.search_geo_datasets("breast liver")] == ["GSE100002"]
+
+    def test_updates_and_organism_filter(self, db):
+        db.insert_geo_dataset(GEODataset(geo_id="GSE100003", title="Arabidopsis drought response"))
+
+        assert db.search_geo_datasets("root") == []
+        assert [d.geo_id for d, _ in db.search_geo_datasets("drought")] == ["GSE100003"]
+        assert [d.geo_id for d, _ in db.search_geo_datasets("breast", organism="mus")] == ["GSE100002"]
+
+    def test_progress_updates_do_not_reindex(self, db):
+        with db.get_connection() as conn:
+            conn.execute("UPDATE geo_datasets SET pdfs_downloaded = 3 WHERE geo_id = 'GSE100001'")
+            conn.commit()
+
+        assert db.search_geo_datasets("atlas")[0][0].pdfs_downloaded == 3
+
+    def test_match_query_sanitizing(self, db):
+        assert fts_match_query('"breast cancer"[Title] AND tumour') == '"breast cancer" AND "tumour"'
+        assert fts_match_query("AND ( ) *") is None
+        # FTS syntax characters never reach MATCH unquoted
+        assert db.search_geo_datasets('breast" cancer:*') != []
+
+    def test_split_field_filters(self):
+        assert split_field_filters('"breast cancer"[Title] AND "Homo sapiens"[Organism]') == (
+            '"breast cancer"',
+            "Homo sapiens",
+        )
+        assert split_field_filters("liver fibrosis") == ("liver fibrosis", None)
+        # Filters the local index cannot honour
+        assert split_field_filters('cancer AND "expression profiling"[DataSet Type]') is None
+        assert split_field_filters("breast OR lung") is None
+        assert split_field_filters("mouse[Organism] AND human[Organism]") is None
+
+    def test_backfills_existing_rows(self, tmp_path, db):
+        with sqlite3.connect(db.db_path) as conn:
+            conn.execute("DROP TABLE geo_datasets_fts")
+
+        reopened = UnifiedDatabase(db.db_path)
+
+        assert reopened.fts_enabled
+        assert [d.geo_id for d, _ in reopened.search_geo_datasets("fibrosis")] == ["GSE100002"]
+
+
+class FailingGEOClient:
+    async def search(self, query, max_results=100):
+        raise RuntimeError("429 Too Many Requests")
+
+
+class FakeGEOClient:
+    def __init__(self, geo_ids=("GSE100001", "GSE200000")):
+        self.geo_ids = list(geo_ids)
+
+    async def search(self, query, max_results=100):
+        await asyncio.sleep(0.1)  # NCBI round trip
+        return SimpleNamespace(geo_ids=self.geo_ids)
+
+    async def get_metadata_fast(self, geo_id):
+        return GEOSeriesMetadata(geo_id=geo_id, title=f"{geo_id} breast cancer", sample_count=12)
+
+
+class SlowGEOClient(FakeGEOClient):
+    """Answers the ID search after `search_delay`, each E-Summary after `fetch_delay`."""
+
+    def __init__(self, search_delay=0.0, fetch_delay=0.0):
+        super().__init__()
+        self.search_delay = search_delay
+        self.fetch_delay = fetch_delay
+
+    async def search(self, query, max_results=100):
+        await asyncio.sleep(self.search_delay)
+        return SimpleNamespace(geo_ids=self.geo_ids)
+
+    async def get_metadata_fast(self, geo_id):
+        await asyncio.sleep(self.fetch_delay)
+        return await super().get_metadata_fast(geo_id)
+
+
+def make_orchestrator(db, geo_client, **settings):
+    orchestrator = SearchOrchestrator.__new__(SearchOrchestrator)
+    orchestrator.config = SearchSettings(enable_cache=False, **settings)
+    orchestrator.cache = None
+    orchestrator.coordinator = SimpleNamespace(db=db)
+    orchestrator.query_analyzer = QueryAnalyzer()
+    orchestrator.query_optimizer = None
+    orchestrator.geo_client = geo_client
+    orchestrator.geo_query_builder = SimpleNamespace(build_query=lambda query, mode: query)
+    orchestrator.pubmed_client = None
+    orchestrator.openalex_client = None
+    return orchestrator
+
+
+class TestLocalSource:
+    """Test the local index as a SearchOrchestrator GEO source."""
+
+    @pytest.mark.asyncio
+    async def test_serves_local_results_when_ncbi_fails(self, db):
+        result = await make_orchestrator(db, FailingGEOClient()).search(
+            "breast", search_type="geo", use_cache=False, max_geo_results=5
+        )
+
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001", "GSE100002"]
+        assert result.metadata["degraded"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_honours_organism_filter(self, db):
+        orchestrator = make_orchestrator(db, FailingGEOClient())
+
+        result = await orchestrator.search(
+            'breast AND "Mus musculus"[Organism]', search_type="geo", use_cache=False
+        )
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100002"]
+
+        result = await orchestrator.search(
+            'breast AND "gse"[Entry Type]', search_type="geo", use_cache=False
+        )
+        assert result.geo_datasets == []
+        assert not result.metadata["degraded"]
+
+    @pytest.mark.asyncio
+    async def test_ncbi_answer_is_not_mixed_with_local_rows(self, db):
+        events = [
+            event async for event in make_orchestrator(db, FakeGEOClient()).search_stream(
+                "breast", search_type="geo", use_cache=False
+            )
+        ]
+        result = events[-1].result
+
+        assert {e.source for e in events if e.type == "geo"} == {"geo"}
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001", "GSE200000"]
+        assert result.geo_datasets[0].sample_count == 12
+        assert result.metadata["local_index_count"] == 0
+        assert not result.metadata["degraded"]
+        # Newly discovered datasets are persisted, and so become searchable locally
+        assert db.get_geo_dataset("GSE200000") is not None
+        assert db.search_geo_datasets("GSE200000")
+
+    @pytest.mark.asyncio
+    async def test_no_ncbi_hits_is_not_degraded(self, db):
+        result = await make_orchestrator(db, FakeGEOClient(geo_ids=[])).search(
+            "breast", search_type="geo", use_cache=False
+        )
+
+        assert result.geo_datasets == []
+        assert not result.metadata["degraded"]
+
+    @pytest.mark.asyncio
+    async def test_slow_ncbi_search_falls_back_at_deadline(self, db):
+        orchestrator = make_orchestrator(db, SlowGEOClient(search_delay=5), local_index_deadline=0.2)
+
+        result = await asyncio.wait_for(
+            orchestrator.search("breast", search_type="geo", use_cache=False), timeout=2
+        )
+
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001", "GSE100002"]
+        assert result.metadata["degraded"]
+
+    @pytest.mark.asyncio
+    async def test_slow_ncbi_fetches_fall_back_to_returned_ids(self, db):
+        orchestrator = make_orchestrator(db, SlowGEOClient(fetch_delay=5), local_index_deadline=0.2)
+
+        result = await asyncio.wait_for(
+            orchestrator.search("breast", search_type="geo", use_cache=False), timeout=2
+        )
+
+        # Only IDs NCBI returned are taken from the local index
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001"]
+        assert result.metadata["local_index_count"] == 1
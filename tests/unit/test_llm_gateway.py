@@ -0,0 +1,195 @@
+"""
+Unit tests for the async LLM gateway.
+
+Tests cover:
+- Identical in-flight prompts share one provider call
+- Per-model concurrency and cost budgets
+- Streaming yields chunks and caches the full response
+- The stub provider is deterministic and drives AnalysisService offline
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from omics_oracle_v2.api.helpers import llm_gateway
+from omics_oracle_v2.api.helpers.llm_gateway import (LLMBudgetExceeded, LLMGateway, LLMProvider, LLMRequest,
+                                                     ModelBudget, StubProvider)
+from omics_oracle_v2.core.exceptions import AIError
+
+
+class FakeCache:
+    """Stands in for RedisCache.get/set (values are JSON round-tripped)."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return json.loads(self.store[key]) if key in self.store else None
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = json.dumps(value)
+        return True
+
+
+class GatedProvider(LLMProvider):
+    """Counts calls and concurrency; each call waits for the gate."""
+
+    name = "gated"
+
+    def __init__(self, text="analysis text"):
+        self.text = text
+        self.gate = asyncio.Event()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def complete(self, request):
+        return "".join([chunk async for chunk in self.stream(request)])
+
+    async def stream(self, request):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.gate.wait()
+            for word in self.text.split(" "):
+                yield word + " "
+        finally:
+            self.active -= 1
+
+
+class TestSingleFlight:
+    """Test deduplication of identical in-flight prompts."""
+
+    @pytest.mark.asyncio
+    async def test_identical_prompts_share_one_call(self):
+        provider = GatedProvider()
+        gateway = LLMGateway(provider, cache=FakeCache())
+
+        tasks = [asyncio.create_task(gateway.complete(LLMRequest(prompt="same"))) for _ in range(5)]
+        await asyncio.sleep(0)
+        provider.gate.set()
+
+        assert await asyncio.gather(*tasks) == ["analysis text"] * 5
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_joined_callers(self):
+        class FailingProvider(GatedProvider):
+            async def complete(self, request):
+                await self.gate.wait()
+                raise RuntimeError("upstream 500")
+
+        provider = FailingProvider()
+        gateway = LLMGateway(provider)
+        tasks = [asyncio.create_task(gateway.complete(LLMRequest(prompt="same"))) for _ in range(3)]
+        await asyncio.sleep(0)
+        provider.gate.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, AIError) for r in results)
+        assert gateway._inflight == {}
+
+
+class TestBudgets:
+    """Test per-model concurrency and cost budgets."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limited_per_model(self):
+        provider = GatedProvider()
+        gateway = LLMGateway(provider, max_concurrency=2)
+
+        tasks = [asyncio.create_task(gateway.complete(LLMRequest(prompt=f"p{i}"))) for i in range(5)]
+        tasks.append(asyncio.create_task(gateway.complete(LLMRequest(prompt="other", model="gpt-4o"))))
+        await asyncio.sleep(0.01)
+        assert provider.active == 3  # 2 gpt-4 + 1 gpt-4o
+
+        provider.gate.set()
+        await asyncio.gather(*tasks)
+        assert provider.max_active == 3
+
+    @pytest.mark.asyncio
+    async def test_cost_budget_rejects_and_settles(self):
+        provider = StubProvider(tokens=10)
+        budget = ModelBudget(max_cost_usd=0.05)
+        gateway = LLMGateway(provider, budgets={"gpt-4": budget})
+        request = LLMRequest(prompt="x" * 400, max_tokens=500)  # reserves 100*0.03 + 500*0.06 per 1K
+
+        await gateway.complete(request)
+        # Settled to the (short) actual output, so budget remains
+        assert budget.spent_usd < request.estimate_cost()
+
+        await gateway.complete(LLMRequest(prompt="y" * 400, max_tokens=500))
+        with pytest.raises(LLMBudgetExceeded):
+            await gateway.complete(LLMRequest(prompt="z" * 400, max_tokens=10000))
+
+
+class TestStreaming:
+    """Test streaming and caching."""
+
+    @pytest.mark.asyncio
+    async def test_stream_then_cache_hit(self):
+        provider = GatedProvider(text="one two three")
+        provider.gate.set()
+        cache = FakeCache()
+        gateway = LLMGateway(provider, cache=cache)
+        request = LLMRequest(prompt="stream me")
+
+        chunks = [chunk async for chunk in gateway.stream(request)]
+        assert chunks == ["one ", "two ", "three "]
+
+        # Same cache format as call_openai always used
+        assert json.loads(await cache.get(request.cache_key)) == {"response": "one two three", "model": "gpt-4"}
+        assert [chunk async for chunk in gateway.stream(request)] == ["one two three"]
+        assert await gateway.complete(request) == "one two three"
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_stub_is_deterministic(self):
+        request = LLMRequest(prompt="Compare **GSE100001** and GSE100002.", max_tokens=30)
+
+        first = await StubProvider().complete(request)
+        second = "".join([chunk async for chunk in StubProvider().stream(request)])
+
+        assert first == second
+        assert "GSE100001" in first and "GSE100002" in first
+
+
+class TestAnalysisStream:
+    """Test AnalysisService on the stub provider."""
+
+    @pytest.mark.asyncio
+    async def test_tokens_then_complete(self, monkeypatch):
+        from omics_oracle_v2.api.models.responses import DatasetResponse
+        from omics_oracle_v2.api.routes.agents import AIAnalysisRequest
+        from omics_oracle_v2.core.config import Settings
+        from omics_oracle_v2.services.analysis_service import AnalysisService
+
+        monkeypatch.setattr(llm_gateway, "_gateways", {})
+        monkeypatch.setattr(llm_gateway, "_default_cache", lambda: None)
+        settings = Settings()
+        settings.ai.provider = "stub"
+        settings.ai.openai_api_key = None
+        settings.ai.stub_latency = 0
+        settings.ai.stub_token_latency = 0
+
+        dataset = DatasetResponse(
+            geo_id="GSE100001",
+            title="Breast cancer atlas",
+            sample_count=20,
+            relevance_score=0.9,
+            match_reasons=["Title match"],
+            fulltext=[{"pmid": "111", "title": "Atlas", "methods": "m" * 200, "results": "r" * 200}],
+        )
+        request = AIAnalysisRequest(datasets=[dataset], query="breast cancer")
+
+        events = [event async for event in AnalysisService().analyze_datasets_stream(request, settings)]
+
+        tokens = [e["data"]["text"] for e in events if e["event"] == "token"]
+        response = events[-1]["data"]
+        assert len(tokens) > 1
+        assert events[-1]["event"] == "complete"
+        assert response.success and response.analysis == "".join(tokens).strip()
+        assert response.insights == ["GSE100001 is relevant to the query."]
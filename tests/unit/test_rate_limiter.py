@@ -0,0 +1,249 @@
+"""
+Unit tests for the GCRA rate limiting engine and middleware.
+
+Tests cover:
+- Local GCRA: limit, cost, refill, multi-window (binding window reported)
+- Redis path: one script call per check, circuit breaker fallback
+- IdentityCache TTL and LRU
+- RateLimitMiddleware: 429s, headers, cached identity lookups
+"""
+
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from omics_oracle_v2.auth.quota import check_rate_limit
+from omics_oracle_v2.auth.rate_limiter import (
+    CircuitBreaker,
+    GCRAResult,
+    IdentityCache,
+    LocalGCRA,
+    RateLimiter,
+)
+from omics_oracle_v2.core.config import Settings
+from omics_oracle_v2.middleware.rate_limit import RateLimitMiddleware
+
+
+def make_settings(**rate_limit):
+    settings = Settings()
+    for name, value in rate_limit.items():
+        setattr(settings.rate_limit, name, value)
+    return settings
+
+
+class FakeScript:
+    """Stands in for a registered Lua script, running the local mirror."""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+        self._local = LocalGCRA()
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        if self.fail:
+            raise ConnectionError("redis down")
+
+        now, cost = args[0] / 1000, args[1]
+        specs = [(key, args[2 + 2 * i], args[3 + 2 * i] / 1000) for i, key in enumerate(keys)]
+        result = self._local.check(specs, cost, now)
+        flat = [int(result.allowed), int(result.retry_after * 1000)]
+        for remaining, reset_after in result.windows:
+            flat.extend([remaining, int(reset_after * 1000)])
+        return flat
+
+
+class FakeRedis:
+    def __init__(self, script):
+        self.script = script
+
+    def register_script(self, source):
+        return self.script
+
+
+class TestLocalGCRA:
+    """Test the in-process algorithm."""
+
+    def test_allows_limit_then_rejects(self):
+        gcra = LocalGCRA()
+        specs = [("k:hour", 10, 3600)]
+        now = 1000.0
+
+        results = [gcra.check(specs, 1, now) for _ in range(11)]
+
+        assert all(r.allowed for r in results[:10])
+        assert [r.windows[0][0] for r in results[:3]] == [9, 8, 7]
+        assert not results[10].allowed
+        assert results[10].retry_after == pytest.approx(360)
+
+    def test_capacity_refills_continuously(self):
+        gcra = LocalGCRA()
+        specs = [("k:hour", 10, 3600)]
+        for _ in range(10):
+            gcra.check(specs, 1, 1000.0)
+
+        assert not gcra.check(specs, 1, 1000.0 + 359).allowed
+        assert gcra.check(specs, 1, 1000.0 + 360).allowed
+
+    def test_rejected_requests_consume_nothing_in_any_window(self):
+        gcra = LocalGCRA()
+        specs = [("k:hour", 100, 3600), ("k:day", 3, 86400)]
+
+        for _ in range(3):
+            assert gcra.check(specs, 1, 0.0).allowed
+        denied = gcra.check(specs, 1, 0.0)
+
+        assert not denied.allowed
+        assert denied.windows[0][0] == 97
+
+
+class TestRateLimiter:
+    """Test the engine with Redis and local backends."""
+
+    @pytest.mark.asyncio
+    async def test_reports_binding_window(self):
+        settings = make_settings(free_tier_limit_hour=100, free_tier_limit_day=2)
+        limiter = RateLimiter(settings, local_only=True)
+
+        info = await limiter.check("user:1", tier="free")
+        assert info.window == "day"
+        assert info.limit == 2
+        assert info.remaining == 1
+
+        await limiter.check("user:1", tier="free")
+        info = await limiter.check("user:1", tier="free")
+        assert info.quota_exceeded
+        assert info.retry_after > 3600
+
+    @pytest.mark.asyncio
+    async def test_redis_single_round_trip(self):
+        script = FakeScript()
+        limiter = RateLimiter(make_settings(), redis=FakeRedis(script), local_only=False)
+
+        info = await check_rate_limit(user_id=7, ip_address="1.2.3.4", tier="pro", cost=2, limiter=limiter)
+
+        assert len(script.calls) == 1
+        keys, args = script.calls[0]
+        assert keys == ["ratelimit:{user:7}:hour", "ratelimit:{user:7}:day"]
+        assert args[1] == 2
+        assert info.limit == 1000
+        assert info.remaining == 998
+
+    @pytest.mark.asyncio
+    async def test_breaker_skips_redis_after_failures(self):
+        script = FakeScript(fail=True)
+        settings = make_settings(circuit_breaker_failures=2, anonymous_limit_hour=5)
+        limiter = RateLimiter(settings, redis=FakeRedis(script), local_only=False)
+
+        for _ in range(5):
+            info = await limiter.check("ip:1.2.3.4", tier="anonymous")
+            assert not info.quota_exceeded
+
+        assert len(script.calls) == 2
+        assert limiter.breaker.state == "open"
+        assert (await limiter.check("ip:1.2.3.4", tier="anonymous")).quota_exceeded
+
+    @pytest.mark.asyncio
+    async def test_to_info_from_redis_result(self):
+        info = RateLimiter._to_info(
+            ("hour", "day"),
+            [("h", 10, 3600), ("d", 100, 86400)],
+            GCRAResult(allowed=False, retry_after=12.3, windows=[(0, 3600.0), (40, 100.0)]),
+            now=1000.0,
+        )
+        assert info.window == "hour"
+        assert info.retry_after == 13
+        assert info.reset_at == 4600
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_half_open_trial(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        assert not breaker.allow_request()
+
+        time.sleep(0.02)
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # Only one trial at a time
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+
+class TestIdentityCache:
+    """Test credential cache."""
+
+    def test_ttl_and_negative_entries(self):
+        cache = IdentityCache(ttl=60)
+        cache.set("jwt:bad", None)
+        cache.set("jwt:expiring", ("u", "pro"), ttl=0)
+
+        assert cache.get("jwt:bad") == (True, None)
+        assert cache.get("jwt:expiring") == (False, None)
+
+    def test_lru_bound(self):
+        cache = IdentityCache(ttl=60, max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+
+
+class TestRateLimitMiddleware:
+    """Test middleware behavior end to end (local-only engine)."""
+
+    def make_app(self, **rate_limit):
+        settings = make_settings(local_only=True, **rate_limit)
+        app = FastAPI()
+        app.add_middleware(RateLimitMiddleware, settings=settings)
+
+        @app.get("/api/data")
+        async def data():
+            return {"ok": True}
+
+        @app.get("/health")
+        async def health():
+            return {"ok": True}
+
+        return app
+
+    @pytest.mark.asyncio
+    async def test_anonymous_limit_and_headers(self):
+        app = self.make_app(anonymous_limit_hour=2)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get("/api/data")
+            second = await client.get("/api/data")
+            third = await client.get("/api/data")
+            health = await client.get("/health")
+
+        assert first.headers["X-RateLimit-Remaining"] == "1"
+        assert second.headers["X-RateLimit-Remaining"] == "0"
+        assert third.status_code == 429
+        assert int(third.headers["Retry-After"]) > 0
+        assert health.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_identity_lookup_is_cached(self, monkeypatch):
+        app = self.make_app()
+        lookups = []
+
+        async def fake_lookup(self, request, kind, credential):
+            lookups.append((kind, credential))
+            return ("user-1", "pro"), None
+
+        monkeypatch.setattr(RateLimitMiddleware, "_lookup_identity", fake_lookup)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            for _ in range(3):
+                response = await client.get("/api/data", headers={"Authorization": "Bearer token"})
+
+        assert lookups == [("jwt", "token")]
+        assert response.headers["X-RateLimit-Limit"] == "1000"
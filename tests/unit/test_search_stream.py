@@ -0,0 +1,149 @@
+"""
+Unit tests for streaming search.
+
+Tests cover:
+- GEO datasets are emitted before a slow publication source returns
+- search() returns the result carried by the stream's complete event
+- Closing the stream early cancels outstanding sources
+- SearchService stream events carry stable ids and end with the full response
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from omics_oracle_v2.api.models.requests import SearchRequest
+from omics_oracle_v2.core.config import SearchSettings
+from omics_oracle_v2.lib.query_processing.optimization.analyzer import QueryAnalyzer
+from omics_oracle_v2.lib.search_engines.citations.models import Publication, PublicationSource
+from omics_oracle_v2.lib.search_engines.geo.models import GEOSeriesMetadata
+from omics_oracle_v2.lib.search_orchestration import SearchOrchestrator
+from omics_oracle_v2.services import search_service
+from omics_oracle_v2.services.search_service import SearchService
+
+
+class FakeGEOClient:
+    """Returns two datasets; E-Summary lookups are instant."""
+
+    async def search(self, query, max_results=100):
+        return SimpleNamespace(geo_ids=["GSE100001", "GSE100002"])
+
+    async def get_metadata_fast(self, geo_id):
+        return GEOSeriesMetadata(geo_id=geo_id, title=f"{geo_id} breast cancer", summary="", sample_count=12)
+
+
+class SlowPubMedClient:
+    """Blocks until released, so GEO always resolves first."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    def search(self, query, max_results=50):
+        return [
+            Publication(pmid="111", title="Breast cancer atlas", source=PublicationSource.PUBMED),
+            Publication(title="Untracked preprint", source=PublicationSource.PUBMED),
+        ]
+
+
+def make_orchestrator(pubmed=None):
+    orchestrator = SearchOrchestrator.__new__(SearchOrchestrator)
+    orchestrator.config = SearchSettings(enable_cache=False)
+    orchestrator.cache = None
+    orchestrator.coordinator = None
+    orchestrator.query_analyzer = QueryAnalyzer()
+    orchestrator.query_optimizer = None
+    orchestrator.geo_client = FakeGEOClient()
+    orchestrator.geo_query_builder = SimpleNamespace(build_query=lambda query, mode: query)
+    orchestrator.pubmed_client = pubmed
+    orchestrator.openalex_client = None
+
+    if pubmed:
+        search_pubmed = orchestrator._search_pubmed
+
+        async def gated_search(query, max_results):
+            try:
+                await pubmed.release.wait()
+            except asyncio.CancelledError:
+                pubmed.cancelled = True
+                raise
+            return await search_pubmed(query, max_results)
+
+        orchestrator._search_pubmed = gated_search
+    return orchestrator
+
+
+class TestOrchestratorStream:
+    """Test SearchOrchestrator.search_stream()."""
+
+    @pytest.mark.asyncio
+    async def test_geo_events_precede_slow_publications(self):
+        pubmed = SlowPubMedClient()
+        orchestrator = make_orchestrator(pubmed)
+
+        types = []
+        async for event in orchestrator.search_stream("breast cancer", search_type="hybrid", use_cache=False):
+            types.append(event.type)
+            if event.type == "geo" and event.geo_datasets[0].geo_id == "GSE100002":
+                pubmed.release.set()
+            if event.type == "complete":
+                result = event.result
+
+        assert types == ["plan", "geo", "geo", "publications", "complete"]
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001", "GSE100002"]
+        assert result.total_results == 4
+
+    @pytest.mark.asyncio
+    async def test_search_collects_complete_event(self):
+        orchestrator = make_orchestrator()
+
+        result = await orchestrator.search("breast cancer", search_type="geo", use_cache=False)
+
+        assert result.query_type == "geo"
+        assert [d.geo_id for d in result.geo_datasets] == ["GSE100001", "GSE100002"]
+        assert result.publications == []
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_sources(self):
+        pubmed = SlowPubMedClient()
+        stream = make_orchestrator(pubmed).search_stream("breast cancer", search_type="hybrid", use_cache=False)
+
+        async for event in stream:
+            if event.type == "geo":
+                break
+        await stream.aclose()
+
+        assert pubmed.cancelled
+
+
+class TestServiceStream:
+    """Test SearchService.execute_search_stream()."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(search_service, "SearchOrchestrator", lambda config: make_orchestrator(self.pubmed))
+        service = SearchService()
+        service._geo_cache_initialized = True  # no database enrichment
+        return service
+
+    @pytest.mark.asyncio
+    async def test_events_and_collector_agree(self, service):
+        self.pubmed = SlowPubMedClient()
+        self.pubmed.release.set()
+        request = SearchRequest(search_terms=["breast", "cancer"], max_results=10)
+
+        events = [event async for event in service.execute_search_stream(request)]
+        streamed = {(e["event"], e["id"]) for e in events}
+
+        assert events[0]["event"] == "started"
+        assert events[-1]["event"] == "complete"
+        for geo_id in ["GSE100001", "GSE100002"]:
+            assert ("dataset", geo_id) in streamed
+            assert ("dataset_enriched", geo_id) in streamed
+        assert ("publication", "111") in streamed
+        assert ("publication", "pub-1") in streamed
+
+        response = await service.execute_search(request)
+        assert [d.geo_id for d in response.datasets] == [d.geo_id for d in events[-1]["data"].datasets]
+        assert response.publications_count == 2
@@ -0,0 +1,148 @@
+"""
+Unit tests for the header-only SOFT parser.
+
+Tests cover:
+- Series, platform and sample headers match GEOparse parse_GSE
+- Data tables are skipped, including markers split across read blocks
+- GEOSeriesMetadata is built as GEOClient.get_metadata built it from GEOparse
+- The JSON sidecar is written once and replaces later parses
+"""
+
+import gzip
+import io
+
+import pytest
+
+from omics_oracle_v2.lib.search_engines.geo.soft_parser import (_header_lines, load_series_header,
+                                                                parse_soft_headers, sidecar_path)
+
+SOFT = """^DATABASE = GeoMiame
+!Database_name = Gene Expression Omnibus (GEO)
+^SERIES = GSE1001
+!Series_title = Liver regeneration time course
+!Series_summary = Partial hepatectomy in mice.
+!Series_summary = Second summary paragraph.
+!Series_overall_design = 2 time points, 2 replicates
+!Series_status = Public on Mar 01 2020
+!Series_submission_date = Jan 10 2020
+!Series_last_update_date = Mar 05 2021
+!Series_pubmed_id = 31234567
+!Series_contact_name = Ada,,Lovelace
+!Series_supplementary_file = ftp://ftp.ncbi.nlm.nih.gov/geo/series/GSE1nnn/GSE1001/suppl/GSE1001_RAW.tar
+^PLATFORM = GPL1261
+!Platform_title = Affymetrix Mouse Genome 430 2.0 Array
+!Platform_organism = Mus musculus
+!Platform_description = Very long description that is not kept
+#ID = probe set
+#GENE_SYMBOL = gene symbol
+!platform_table_begin
+ID\tGENE_SYMBOL
+1415670_at\tCopg1
+!platform_table_end
+^SAMPLE = GSM2001
+!Sample_title = liver 0h rep1
+!Sample_characteristics_ch1 = tissue: liver
+!Sample_characteristics_ch1 = time: 0h
+#ID_REF = probe set
+#VALUE = RMA signal
+!sample_table_begin
+ID_REF\tVALUE
+1415670_at\t7.1
+!sample_table_end
+^SAMPLE = GSM2002
+!Sample_title = liver 48h rep1
+!Sample_characteristics_ch1 = tissue: liver
+!Sample_characteristics_ch1 = time: 48h
+#ID_REF = probe set
+#VALUE = RMA signal
+!sample_table_begin
+ID_REF\tVALUE
+1415670_at\t8.4
+!sample_table_end
+"""
+
+
+@pytest.fixture
+def soft_path(tmp_path):
+    path = tmp_path / "GSE1001_family.soft.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(SOFT)
+    return path
+
+
+class TestParser:
+    """Test header parsing."""
+
+    def test_matches_geoparse(self, soft_path):
+        geoparse = pytest.importorskip("GEOparse")
+        gse = geoparse.parse_GSE(str(soft_path), open_kwargs={})
+
+        header = parse_soft_headers(soft_path)
+
+        assert header.metadata == gse.metadata
+        assert list(header.platforms) == list(gse.gpls)
+        assert header.platforms["GPL1261"]["organism"] == gse.gpls["GPL1261"].metadata["organism"]
+        assert header.samples == list(gse.gsms)
+        assert header.sample_characteristics["GSM2002"] == gse.gsms["GSM2002"].metadata["characteristics_ch1"]
+
+    def test_tables_are_skipped_across_blocks(self):
+        data = SOFT.encode()
+        expected = [line for line in _header_lines(io.BytesIO(data))]
+
+        for chunk_size in (1, 7, 64):
+            assert list(_header_lines(io.BytesIO(data), chunk_size=chunk_size)) == expected
+        assert b"ID_REF\tVALUE" not in expected and b"!Sample_title = liver 48h rep1" in expected
+
+    def test_series_metadata(self, soft_path):
+        metadata = parse_soft_headers(soft_path).to_series_metadata()
+
+        assert metadata.geo_id == "GSE1001"
+        assert metadata.title == "Liver regeneration time course"
+        assert metadata.summary == "Partial hepatectomy in mice."
+        assert metadata.organism == "Mus musculus"
+        assert metadata.publication_date == "Public on Mar 01 2020"
+        assert (metadata.platform_count, metadata.sample_count) == (1, 2)
+        assert metadata.pubmed_ids == ["31234567"]
+        assert metadata.sample_characteristics["GSM2001"] == ["tissue: liver", "time: 0h"]
+        assert metadata.parse_download_info()[0].file_type == "RAW"
+
+
+class TestSidecar:
+    """Test the metadata-only sidecar."""
+
+    def test_sidecar_replaces_soft_file(self, soft_path):
+        first = load_series_header(soft_path)
+        assert sidecar_path(soft_path).name == "GSE1001_family.meta.json"
+
+        soft_path.unlink()
+        second = load_series_header(soft_path)
+
+        assert second == first
+
+    def test_stale_sidecar_is_reparsed(self, soft_path):
+        sidecar_path(soft_path).write_text('{"version": 0, "geo_id": "GSE1001"}')
+
+        assert load_series_header(soft_path).samples == ["GSM2001", "GSM2002"]
+
+    def test_client_downloads_and_parses_once(self, tmp_path, monkeypatch):
+        from omics_oracle_v2.core.config import GEOSettings
+        from omics_oracle_v2.lib.search_engines.geo import client as client_module
+
+        downloads = []
+
+        def fake_get_geo_file(geo_id, destdir, silent):
+            downloads.append(geo_id)
+            path = tmp_path / "geo" / f"{geo_id}_family.soft.gz"
+            with gzip.open(path, "wt") as f:
+                f.write(SOFT)
+            return str(path), "GSE"
+
+        monkeypatch.setattr(client_module, "get_GEO_file", fake_get_geo_file, raising=False)
+        geo_client = client_module.GEOClient(GEOSettings(cache_dir=tmp_path / "geo"))
+
+        first = geo_client._load_series_header("GSE1001")
+        (tmp_path / "geo" / "GSE1001_family.soft.gz").unlink()  # evicted
+        second = geo_client._load_series_header("GSE1001")
+
+        assert downloads == ["GSE1001"]
+        assert first == second and first.samples == ["GSM2001", "GSM2002"]
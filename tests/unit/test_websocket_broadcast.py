@@ -0,0 +1,193 @@
+"""
+Unit tests for WebSocket broadcast with backpressure.
+
+Tests cover:
+- A slow client does not delay delivery to other clients
+- Progress messages coalesce; stage events are never dropped
+- Clients whose queue fills with undroppable events are disconnected
+- Redis event bus routes channel messages to local connections
+- A reconnect racing the previous connection's unsubscribe stays subscribed
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from omics_oracle_v2.api.event_bus import InMemoryEventBus, RedisEventBus
+from omics_oracle_v2.api.websocket import ClientConnection, ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def wait_for(condition, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        if condition():
+            return True
+        await asyncio.sleep(0.01)
+    return condition()
+
+
+class TestConnectionManager:
+    """Test fan-out through per-connection queues."""
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_stall_others(self):
+        manager = ConnectionManager()
+        slow, fast = FakeWebSocket(delay=5), FakeWebSocket()
+        await manager.connect(slow, "wf")
+        await manager.connect(fast, "wf")
+
+        await asyncio.wait_for(manager.broadcast_stage_start("wf", "search", "SearchAgent"), timeout=0.5)
+
+        assert await wait_for(lambda: len(fast.sent) == 1)
+        assert fast.sent[0]["type"] == "stage_start"
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_progress_coalesces_behind_stage_events(self):
+        connection = ClientConnection(FakeWebSocket(), "wf", max_queue=10)
+
+        connection.enqueue("progress", '{"progress": 10}')
+        connection.enqueue("stage_complete", '{"stage": 1}')
+        connection.enqueue("progress", '{"progress": 50}')
+        connection.enqueue("progress", '{"progress": 90}')
+
+        assert list(connection.queue) == [
+            ("stage_complete", '{"stage": 1}'),
+            ("progress", '{"progress": 90}'),
+        ]
+        assert connection.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_progress_before_events(self):
+        connection = ClientConnection(FakeWebSocket(), "wf", max_queue=2)
+
+        assert connection.enqueue("progress", "p")
+        assert connection.enqueue("stage_start", "a")
+        assert connection.enqueue("stage_complete", "b")
+        assert [t for t, _ in connection.queue] == ["stage_start", "stage_complete"]
+        assert connection.dropped == 1
+
+        assert not connection.enqueue("workflow_complete", "c")
+
+    @pytest.mark.asyncio
+    async def test_stuck_client_is_disconnected(self):
+        manager = ConnectionManager(max_queue=2)
+        stuck = FakeWebSocket(delay=5)
+        await manager.connect(stuck, "wf")
+
+        for stage in range(4):
+            await manager.broadcast_stage_start("wf", f"stage-{stage}", "Agent")
+
+        assert manager.get_connection_count("wf") == 0
+        assert await wait_for(lambda: stuck.closed_with == 1013)
+        await manager.close()
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.inbox = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+        try:
+            return await asyncio.wait_for(self.inbox.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    """Routes publish() to the subscribed pubsub (stands in for another worker)."""
+
+    def __init__(self):
+        self.pubsubs = []
+
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def publish(self, channel, data):
+        for pubsub in self.pubsubs:
+            if channel in pubsub.channels:
+                await pubsub.inbox.put({"type": "message", "channel": channel, "data": data})
+
+
+class TestEventBus:
+    """Test bus implementations."""
+
+    @pytest.mark.asyncio
+    async def test_redis_bus_delivers_across_managers(self):
+        redis = FakeRedis()
+        publisher = ConnectionManager(bus=RedisEventBus(redis))
+        subscriber = ConnectionManager(bus=RedisEventBus(redis))
+        websocket = FakeWebSocket()
+        await subscriber.connect(websocket, "wf-1")
+
+        await publisher.broadcast_progress("wf-1", 42.0, "halfway")
+
+        assert await wait_for(lambda: websocket.sent)
+        assert websocket.sent[0]["progress"] == 42.0
+
+        subscriber.disconnect(websocket, "wf-1")
+        assert await wait_for(lambda: not redis.pubsubs[0].channels)
+        await publisher.close()
+        await subscriber.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_races_unsubscribe(self):
+        redis = FakeRedis()
+        publisher = ConnectionManager(bus=RedisEventBus(redis))
+        subscriber = ConnectionManager(bus=RedisEventBus(redis))
+        first, second = FakeWebSocket(), FakeWebSocket()
+        await subscriber.connect(first, "wf-1")
+
+        # The unsubscribe task only runs after the client has reconnected
+        subscriber.disconnect(first, "wf-1")
+        await subscriber.connect(second, "wf-1")
+        await asyncio.gather(*subscriber._tasks)
+
+        await publisher.broadcast_progress("wf-1", 42.0, "halfway")
+        assert await wait_for(lambda: second.sent)
+        await publisher.close()
+        await subscriber.close()
+
+    @pytest.mark.asyncio
+    async def test_in_memory_bus_ignores_unwatched_workflows(self):
+        manager = ConnectionManager(bus=InMemoryEventBus())
+        websocket = FakeWebSocket()
+        await manager.connect(websocket, "watched")
+
+        await manager.broadcast_progress("other", 10.0, "...")
+        await manager.broadcast_progress("watched", 20.0, "...")
+
+        assert await wait_for(lambda: websocket.sent)
+        assert [m["workflow_id"] for m in websocket.sent] == ["watched"]
+        await manager.close()